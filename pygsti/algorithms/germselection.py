@@ -10,6 +10,9 @@ Functions for selecting a complete set of germs for a GST analysis.
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import contextlib as _contextlib
+import functools as _functools
+import multiprocessing as _mp
 import warnings as _warnings
 
 import numpy as _np
@@ -38,7 +41,7 @@ def find_germs(target_model, randomize=True, randomization_strength=1e-2,
                assume_real=False, float_type=_np.cdouble,
                mode="all-Jac", toss_random_frac=None,
                force_rank_increase=False, save_cevd_cache_filename= None,
-               load_cevd_cache_filename=None, file_compression=False):
+               load_cevd_cache_filename=None, file_compression=False, cevd_cache_memmap_filename=None):
     """
     Generate a germ set for doing GST with a given target model.
 
@@ -182,6 +185,13 @@ def find_germs(target_model, randomize=True, randomization_strength=1e-2,
         Can significantly decrease the storage requirements on disk at the expense of
         some additional computational cost writing and loading the files.
 
+    cevd_cache_memmap_filename : str, optional (default None)
+        When set and using the greedy search algorithm in 'compactEVD' mode, the compact EVD
+        cache is written to this (scratch) file as it is computed and is then accessed via
+        memory-mapping, so that the size of the candidate germ list is limited by disk space
+        rather than memory.  The cache's contents are identical to those computed without
+        memory-mapping.
+
     Returns
     -------
     list of Circuit
@@ -297,6 +307,7 @@ def find_germs(target_model, randomize=True, randomization_strength=1e-2,
             'save_cevd_cache_filename': save_cevd_cache_filename,
             'load_cevd_cache_filename': load_cevd_cache_filename,
             'file_compression': file_compression,
+            'cevd_cache_memmap_filename': cevd_cache_memmap_filename,
             'evd_tol': 1e-10,
             'initial_germ_set_test': True
         }
@@ -2948,7 +2959,7 @@ def drop_random_germs(candidate_list, rand_frac, target_model, keep_bare=True, s
 #compact EVD in order to save on memory.    
 def _compute_bulk_twirled_ddd_compact(model, germs_list, eps,
                                        comm=None, evd_tol=1e-10,  float_type=_np.cdouble,
-                                       printer=None, return_eigs=False):
+                                       printer=None, return_eigs=False, memmap_filename=None):
 
     """
     Calculate the positive squares of the germ Jacobians.
@@ -2991,6 +3002,12 @@ def _compute_bulk_twirled_ddd_compact(model, germs_list, eps,
         If True then additionally return a list of the arrays of eigenvalues for each
         germ's twirled derivative gramian.
 
+    memmap_filename : str, optional
+        When given, the compact forms are written to this (raw binary) file as
+        they are computed and are returned as read-only, memory-mapped arrays,
+        so that they don't need to fit in memory.  The file is overwritten, and
+        must not be removed while the returned arrays are in use.
+
     Returns
     -------
     sqrteU_list : list of numpy ndarrays
@@ -2999,7 +3016,6 @@ def _compute_bulk_twirled_ddd_compact(model, germs_list, eps,
     e_list : ndarray
         list of non-zero eigenvalue arrays for each germ.
     """
-       
     #TODO: Figure out how to pipe in a comm object to parallelize some of this with MPI.
        
     sqrteU_list=[]
@@ -3012,79 +3028,76 @@ def _compute_bulk_twirled_ddd_compact(model, germs_list, eps,
     if len(model.preps) > 0 or len(model.povms) > 0:
         model = _remove_spam_vectors(model)
         # This function assumes model has no spam elements so `lookup` below
-    
-    if printer is not None:
-        printer.log('Generating compact EVD Cache',1)
-        
+
+    #When memory-mapping, the compact forms are written to a file as they are computed
+    # (only their shapes are kept in memory) and then accessed via memory-mapped views.
+    dtype = _np.dtype(float_type)
+    spilled_shapes = []
+    spill_file = open(memmap_filename, 'wb') if (memmap_filename is not None) else None
+
+    printer = _baseobjs.VerbosityPrinter.create_printer(printer if (printer is not None) else 0)
+    printer.log('Generating compact EVD Cache',1)
+    try:
         with printer.progress_logging(1):
-    
             for i, germ in enumerate(germs_list):
-            
                 printer.show_progress(iteration=i, total=len(germs_list), bar_length=25)
-                    
+
                 twirledDeriv = _twirled_deriv(model, germ, eps, float_type) / len(germ)
-                #twirledDerivDaggerDeriv = _np.tensordot(_np.conjugate(twirledDeriv),
-                #                                        twirledDeriv, (0, 0))
-                twirledDerivDerivDagger = twirledDeriv@(twirledDeriv.conj().T) 
-                                                        
-                #now take twirledDerivDerivDagger and construct its compact EVD.
-                e, U= compact_EVD(twirledDerivDerivDagger, evd_tol)
-                
-                #now connect this to the compact EVD of twirledDerivDaggerDeriv
-                #using the definition of the left and right singular
-                #vectors of a matrix.
-                #Multiply U by twirledDeriv.conj().T and rescale the columns
-                #by the corresponding singular value, i.e. the sqrt of the
-                #eigenvalue. Use some broadcasting for fast rescaling.
-                U_remapped= ((twirledDeriv.conj().T)@U)/_np.sqrt(e.reshape((1,len(e))))
-                
-                #e, U= compact_EVD_via_SVD(twirledDeriv, evd_tol)
-                
+                sqrteU, e = _compact_twirled_ddd(twirledDeriv, evd_tol)
                 e_list.append(e)
-                
-                #by doing this I am assuming that the matrix is PSD, but since these are all
-                #gramians that should be alright.
-                
-                #I want to use a rank-decomposition, so split the eigenvalues into a pair of diagonal
-                #matrices with the square roots of the eigenvalues on the diagonal and fold those into
-                #the matrix of eigenvectors by left multiplying.
-                
-                sqrteU_list.append( U_remapped@_np.diag(_np.sqrt(e)) )       
-    else: 
-        for i, germ in enumerate(germs_list):
-                
-            twirledDeriv = _twirled_deriv(model, germ, eps, float_type) / len(germ)
-            #twirledDerivDaggerDeriv = _np.tensordot(_np.conjugate(twirledDeriv),
-            #                                        twirledDeriv, (0, 0))
-            twirledDerivDerivDagger = twirledDeriv@(twirledDeriv.conj().T) 
-                                                    
-            #now take twirledDerivDerivDagger and construct its compact EVD.
-            e, U= compact_EVD(twirledDerivDerivDagger, evd_tol)
-            
-            #now connect this to the compact EVD of twirledDerivDaggerDeriv
-            #using the definition of the left and right singular
-            #vectors of a matrix.
-            #Multiply U by twirledDeriv.conj().T and rescale the columns
-            #by the corresponding singular value, i.e. the sqrt of the
-            #eigenvalue. Use some broadcasting for fast rescaling.
-            U_remapped= ((twirledDeriv.conj().T)@U)/_np.sqrt(e.reshape((1,len(e))))
-            #e, U= compact_EVD_via_SVD(twirledDeriv, evd_tol)
-            
-            e_list.append(e)
-            
-            #by doing this I am assuming that the matrix is PSD, but since these are all
-            #gramians that should be alright.
-            
-            #I want to use a rank-decomposition, so split the eigenvalues into a pair of diagonal
-            #matrices with the square roots of the eigenvalues on the diagonal and fold those into
-            #the matrix of eigenvectors by left multiplying.
-            sqrteU_list.append( U_remapped@_np.diag(_np.sqrt(e)) )  
-           
+                if spill_file is not None:
+                    sqrteU = _np.ascontiguousarray(sqrteU, dtype=dtype)
+                    sqrteU.tofile(spill_file)
+                    spilled_shapes.append(sqrteU.shape)
+                else:
+                    sqrteU_list.append(sqrteU)
+    finally:
+        if spill_file is not None:
+            spill_file.close()
+
+    if memmap_filename is not None:
+        sizes = [nrows * ncols for nrows, ncols in spilled_shapes]
+        spilled = _np.memmap(memmap_filename, dtype=dtype, mode='r', shape=(sum(sizes),)) \
+            if sum(sizes) > 0 else _np.zeros(0, dtype)  # (can't memory-map an empty file)
+        offset = 0
+        for shape, size in zip(spilled_shapes, sizes):
+            sqrteU_list.append(spilled[offset:offset + size].reshape(shape))
+            offset += size
+
     if return_eigs:
         return sqrteU_list, e_list
     else:
         return sqrteU_list
-    
+
+
+def _compact_twirled_ddd(twirled_deriv, evd_tol=1e-10):
+    """
+    Compute the compact (rank-decomposed) form of a germ's twirled-derivative gramian.
+
+    Returns `(sqrteU, e)`, where `e` holds the non-zero eigenvalues of
+    `twirled_deriv.conj().T @ twirled_deriv` and `sqrteU @ sqrteU.conj().T`
+    equals this gramian.  This is the reduction performed for each germ by
+    :func:`_compute_bulk_twirled_ddd_compact`.
+    """
+    #take twirledDerivDerivDagger and construct its compact EVD.
+    e, U = compact_EVD(twirled_deriv @ (twirled_deriv.conj().T), evd_tol)
+
+    #now connect this to the compact EVD of twirledDerivDaggerDeriv
+    #using the definition of the left and right singular
+    #vectors of a matrix.
+    #Multiply U by twirledDeriv.conj().T and rescale the columns
+    #by the corresponding singular value, i.e. the sqrt of the
+    #eigenvalue. Use some broadcasting for fast rescaling.
+    U_remapped = ((twirled_deriv.conj().T) @ U) / _np.sqrt(e.reshape((1, len(e))))
+
+    #by doing this I am assuming that the matrix is PSD, but since these are all
+    #gramians that should be alright.
+
+    #I want to use a rank-decomposition, so split the eigenvalues into a pair of diagonal
+    #matrices with the square roots of the eigenvalues on the diagonal and fold those into
+    #the matrix of eigenvectors by left multiplying.
+    return U_remapped @ _np.diag(_np.sqrt(e)), e
+
 #New function for computing the compact eigenvalue decompostion of a matrix.
 #Assumes that we are working with a diagonalizable matrix, no safety checks made.
 
@@ -3564,7 +3577,8 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
                             float_type= _np.cdouble, 
                             mode="all-Jac", force_rank_increase=False,
                             save_cevd_cache_filename=None, load_cevd_cache_filename=None,
-                            file_compression=False, evd_tol=1e-10, initial_germ_set_test=True):
+                            file_compression=False, evd_tol=1e-10, initial_germ_set_test=True,
+                            num_processes=1, cevd_cache_memmap_filename=None):
     """
     Greedy algorithm starting with 0 germs.
 
@@ -3673,6 +3687,21 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
         be expensive) if the user has reason to believe this initial set won't be AC. Most of the time
         this initial set won't be.
 
+    num_processes : int, optional
+        The number of (local) worker processes used to score the candidate germs
+        of each greedy iteration in parallel.  Only used when `mode == 'compactEVD'`,
+        in which case the workers share the (read-only) compact EVD cache and the
+        current iteration's update cache.  The selected germs are identical to those
+        of the serial (`num_processes == 1`) search, including how ties are broken.
+        Worker processes are usually started by forking, which is unsafe within MPI
+        processes, so this shouldn't be combined with a multi-processor `comm` (a
+        warning is issued if it is).
+
+    cevd_cache_memmap_filename : str, optional
+        Only used when `mode == 'compactEVD'`.  When given, the compact EVD cache is written to
+        this (scratch) file as it is computed and is accessed via memory-mapping, so that it
+        need not fit in memory.
+
     Returns
     -------
     list
@@ -3801,7 +3830,7 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
     # Dict of keyword arguments passed to compute_score_non_AC that don't
     # change from call to call
     nonAC_kwargs = {
-        'score_fn': lambda x: _scoring.list_score(x, score_func=score_func),
+        'score_fn': _functools.partial(_scoring.list_score, score_func=score_func),  # picklable, for workers
         'threshold_ac': threshold,
         'num_nongauge_params': numNonGaugeParams,
         'op_penalty': op_penalty,
@@ -3830,9 +3859,12 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
                 twirledDerivDaggerDerivList=[list(cevd_cache.values())]
             
         else:
+            if cevd_cache_memmap_filename is not None and len(model_list) > 1:
+                raise ValueError('Memory-mapping the compactEVD cache requires a single model.')
             twirledDerivDaggerDerivList = \
                 [_compute_bulk_twirled_ddd_compact(model, germs_list, tol,
-                                                   evd_tol=evd_tol, float_type=float_type, printer=printer)
+                                                   evd_tol=evd_tol, float_type=float_type, printer=printer,
+                                                   memmap_filename=cevd_cache_memmap_filename)
              for model in model_list]
              
             if save_cevd_cache_filename is not None:
@@ -3967,6 +3999,17 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
         initN=None
         first_outer_iter_log= True
     
+    # The pool of worker processes used to score candidate germs is created once, before the greedy
+    # loop, so that the (read-only) compact EVD cache is only handed to each worker a single time.
+    # It's terminated when `exit_stack` is closed after the loop (or garbage collected if the search fails).
+    exit_stack = _contextlib.ExitStack()
+    scoring_pool = None
+    if mode == "compactEVD" and num_processes > 1:
+        if comm is not None and comm.Get_size() > 1:
+            _warnings.warn("Using worker processes (num_processes > 1) within MPI processes is unsafe,"
+                           " as forking MPI processes isn't supported by many MPI implementations.")
+        scoring_pool = exit_stack.enter_context(_candidate_scoring_pool(num_processes, twirledDerivDaggerDerivList))
+
     while _np.any(weights == 0):
         if first_outer_iter_log:
             printer.log("Outer iteration: %d germs" %
@@ -3988,7 +4031,7 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
         bestDDDs = None
         bestGermScore = _scoring.CompositeScore(1.0e100, 0, None)  # lower is better
         iBestCandidateGerm = None
-        
+    
         if mode=="compactEVD":
             #calculate the update cache for each element of currentDDDList 
             printer.log('Creating update cache.')
@@ -3998,6 +4041,17 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
             currentDDDList_update_cache = [construct_update_cache(currentDDD, evd_tol=evd_tol) for currentDDD in currentDDDList]
             #the return value of the update cache is a tuple with the elements
             #(e, U, projU)    
+
+        candidateScores = None  # precomputed scores of loc_candidateIndices (when scoring in parallel)
+        if mode == "compactEVD" and num_processes > 1:
+            printer.log('Scoring %d candidate germs using %d processes.'
+                        % (len(loc_candidateIndices), num_processes), 3)
+            score_kwargs = nonAC_kwargs.copy()
+            score_kwargs.update({'num_params': Np, 'force_rank_increase': force_rank_increase})
+            candidateScores = _score_candidate_germs_compactevd_parallel(
+                scoring_pool, num_processes, loc_candidateIndices, currentDDDList_update_cache,
+                [len(germ) for germ in goodGerms], germLengths, score_func, initN, score_kwargs)
+
         with printer.progress_logging(2):
             for i, candidateGermIdx in enumerate(loc_candidateIndices):
                 printer.show_progress(i, len(loc_candidateIndices),
@@ -4008,16 +4062,16 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
 
                 # Loop over all models
                 testDDDs = []
-                
+            
                 if mode == "all-Jac":
                     # Loop over all models
                     for k, currentDDD in enumerate(currentDDDList):
                         testDDD = currentDDD.copy()
-                    
+                
                         #just get cached value of deriv-dagger-deriv
                         derivDaggerDeriv = twirledDerivDaggerDerivList[k][candidateGermIdx]
                         testDDD += derivDaggerDeriv
-                        
+                    
                         nonAC_kwargs['germ_lengths'] = \
                         _np.array([len(germ) for germ in
                                    (goodGerms + [germs_list[candidateGermIdx]])])
@@ -4025,17 +4079,17 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
                                     partial_deriv_dagger_deriv=testDDD[None, :, :], init_n=initN,
                                     **nonAC_kwargs))
                         testDDDs.append(testDDD)  # save in case this is a keeper
-                
+            
                 elif mode == "single-Jac":
                     # Loop over all models
                     for k, currentDDD in enumerate(currentDDDList):
                         testDDD = currentDDD.copy()
-                        
+                    
                         #compute value of deriv-dagger-deriv
                         model = model_list[k]
                         testDDD += _compute_twirled_ddd(
                             model, germs_list[candidateGermIdx], tol, float_type=float_type)
-                            
+                        
                         nonAC_kwargs['germ_lengths'] = \
                         _np.array([len(germ) for germ in
                                    (goodGerms + [germs_list[candidateGermIdx]])])
@@ -4043,29 +4097,22 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
                                     partial_deriv_dagger_deriv=testDDD[None, :, :], init_n=initN,
                                     **nonAC_kwargs))
                         testDDDs.append(testDDD)  # save in case this is a keeper
-                    
+                
                 elif mode == "compactEVD":
-                    # Loop over all models
-                    for k, update_cache in enumerate(currentDDDList_update_cache):
-                    
+                    if candidateScores is not None:
+                        worstScore = candidateScores[i]
+                    else:
                         nonAC_kwargs['germ_lengths'] = \
                             _np.array([len(germ) for germ in
                                        (goodGerms + [germs_list[candidateGermIdx]])])
                         nonAC_kwargs['num_params']=Np
                         nonAC_kwargs['force_rank_increase']= force_rank_increase
+
+                        worstScore = _score_candidate_germ_compactevd(
+                            currentDDDList_update_cache,
+                            [germ_updates[candidateGermIdx] for germ_updates in twirledDerivDaggerDerivList],
+                            score_func, initN, nonAC_kwargs)
                         
-                        
-                        if score_func=="worst":
-                            worstScore = max(worstScore, compute_composite_germ_set_score_compactevd(
-                                                current_update_cache= update_cache,
-                                                germ_update=twirledDerivDaggerDerivList[k][candidateGermIdx], 
-                                                init_n=initN, **nonAC_kwargs))
-                        elif score_func=="all":
-                            worstScore = max(worstScore, compute_composite_germ_set_score_low_rank_trace(
-                                                current_update_cache= update_cache,
-                                                germ_update=twirledDerivDaggerDerivList[k][candidateGermIdx], 
-                                                init_n=initN, **nonAC_kwargs))
-                            
                 # Take the score for the current germ to be its worst score
                 # over all the models.
                 germScore = worstScore
@@ -4073,13 +4120,13 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
                 if germScore < bestGermScore:
                     bestGermScore = germScore
                     iBestCandidateGerm = candidateGermIdx
-                    
+                
                     #If we are using the modes "all-Jac" or "single-Jac" then we will
                     #have been appending to testDDD throughout the process and can just set
                     #bestDDDs to testDDDs
                     if mode == "all-Jac" or mode == "single-Jac":
                         bestDDDs = testDDDs
-                    
+                
                     elif mode == "compactEVD":
                         #if compact EVD mode then we'll avoid reconstructing the J^T J matrix
                         #unless the germ is the current best.
@@ -4115,8 +4162,84 @@ def find_germs_breadthfirst_greedy(model_list, germs_list, randomize=True,
             printer.log("Added %s to final germs (%s)" %
                         (germs_list[iBestCandidateGerm].str, str(bestGermScore)), 2)
 
+    exit_stack.close()
+
     return goodGerms
-    
+
+
+def _score_candidate_germ_compactevd(update_caches, germ_updates, score_func, init_n, score_kwargs):
+    """
+    Score a candidate germ against every model using low-rank updates.
+
+    Returns the worst (largest) of the per-model scores of adding the germ whose
+    compact EVD factors are `germ_updates` to the germ sets described by `update_caches`.
+    """
+    worstScore = _scoring.CompositeScore(-1.0e100, 0, None)  # worst of all models
+    for update_cache, germ_update in zip(update_caches, germ_updates):
+        if score_func == "worst":
+            worstScore = max(worstScore, compute_composite_germ_set_score_compactevd(
+                current_update_cache=update_cache, germ_update=germ_update, init_n=init_n, **score_kwargs))
+        elif score_func == "all":
+            worstScore = max(worstScore, compute_composite_germ_set_score_low_rank_trace(
+                current_update_cache=update_cache, germ_update=germ_update, init_n=init_n, **score_kwargs))
+    return worstScore
+
+
+# The read-only compact EVD cache, set once in each worker process of a candidate-scoring pool
+_worker_germ_updates_list = None
+
+
+@_contextlib.contextmanager
+def _candidate_scoring_pool(num_processes, germ_updates_list):
+    """
+    A pool of `num_processes` workers for scoring candidate germs, initialized with the compact EVD cache.
+
+    The pool is terminated upon exiting the context.
+    """
+    pool = _mp.Pool(num_processes, initializer=_init_candidate_scoring_worker, initargs=(germ_updates_list,))
+    try:
+        yield pool
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _init_candidate_scoring_worker(germ_updates_list):
+    global _worker_germ_updates_list
+    _worker_germ_updates_list = germ_updates_list
+
+
+def _score_candidate_germs_compactevd_worker(candidate_indices, update_caches, good_germ_lengths, germ_lengths,
+                                             score_func, init_n, score_kwargs):
+    scores = []
+    for candidate_idx in candidate_indices:
+        score_kwargs['germ_lengths'] = _np.array(list(good_germ_lengths) + [germ_lengths[candidate_idx]])
+        scores.append(_score_candidate_germ_compactevd(
+            update_caches, [germ_updates[candidate_idx] for germ_updates in _worker_germ_updates_list],
+            score_func, init_n, score_kwargs))
+    return scores
+
+
+def _score_candidate_germs_compactevd_parallel(pool, num_processes, candidate_indices, update_caches,
+                                               good_germ_lengths, germ_lengths, score_func, init_n, score_kwargs):
+    """
+    Score candidate germs (see :func:`_score_candidate_germ_compactevd`) using a pool of processes.
+
+    The workers of `pool` must have been initialized with the compact EVD cache by
+    :func:`_init_candidate_scoring_worker`, so only the current iteration's update
+    caches and scoring arguments are sent to them.  The candidates are split into
+    contiguous chunks, one per worker.  The returned list holds the score of each
+    element of `candidate_indices`, in order, so that the best germ can be selected
+    exactly as in the serial case.
+    """
+    chunks = [chunk for chunk in _np.array_split(_np.asarray(candidate_indices), num_processes) if len(chunk) > 0]
+    if len(chunks) == 0: return []
+    args_list = [(chunk, update_caches, good_germ_lengths, germ_lengths, score_func, init_n, score_kwargs)
+                 for chunk in chunks]
+    chunk_scores = pool.starmap(_score_candidate_germs_compactevd_worker, args_list, chunksize=1)
+    return [score for scores in chunk_scores for score in scores]
+
+
 def compute_composite_germ_set_score_compactevd(current_update_cache, germ_update, 
                                                 score_fn="all", threshold_ac=1e6, init_n=1, model=None,
                                                  partial_germs_list=None, eps=None, num_germs=None,
@@ -16,6 +16,87 @@ import sys as _sys
 
 _debug_record = {}
 
+LABEL_INTERN_TABLE_MAX_SIZE = 1000000  # maximum number of distinct labels held by the label-interning table
+_interned_labels = None  # dictionary of canonical label objects when label interning is enabled; None otherwise
+
+
+def enable_label_interning(enable=True):
+    """
+    Turn on (or off) the interning of labels.
+
+    When label interning is enabled, labels created via :class:`Label`, the
+    circuit parsers and static circuit construction are replaced by a single,
+    canonical object per distinct label.  This reduces the memory used by
+    large numbers of circuits and speeds up label comparisons and dictionary
+    lookups, which succeed on object identity.  Labels are (strongly) held by
+    the interning table until interning is disabled, and no more than
+    `LABEL_INTERN_TABLE_MAX_SIZE` labels are interned.  Only simple labels
+    (without times or arguments) and layer labels composed of them are interned.
+
+    Parameters
+    ----------
+    enable : bool, optional
+        Whether to enable or disable label interning.  Enabling interning when
+        it is already enabled keeps the current table.
+
+    Returns
+    -------
+    None
+    """
+    global _interned_labels
+    if enable:
+        if _interned_labels is None: _interned_labels = {}
+    else:
+        _interned_labels = None
+
+
+def intern_label(lbl):
+    """
+    Get the canonical object for a label when label interning is enabled.
+
+    Parameters
+    ----------
+    lbl : Label
+        The label to intern.
+
+    Returns
+    -------
+    Label
+        The interned label equal to `lbl`, or `lbl` itself if interning is
+        disabled or `lbl` cannot be interned.
+    """
+    if _interned_labels is None: return lbl
+    cls = type(lbl)
+    if cls is LabelStr:
+        if lbl.time != 0.0: return lbl  # LabelStr equality disregards time
+    elif cls is not LabelTup and cls is not LabelTupTup:
+        return lbl  # only intern the simple (and most common) types of labels
+    key = (cls, lbl)
+    ret = _interned_labels.get(key, None)
+    if ret is None:
+        if len(_interned_labels) >= LABEL_INTERN_TABLE_MAX_SIZE: return lbl
+        if cls is LabelTupTup:
+            lbl = tuple.__new__(LabelTupTup, tuple(map(intern_label, lbl)))  # intern components too
+        ret = _interned_labels[key] = lbl
+    return ret
+
+
+def intern_labels(labels):
+    """
+    Intern each of a tuple of labels (see :func:`intern_label`).
+
+    Parameters
+    ----------
+    labels : tuple
+        A tuple of :class:`Label` objects, e.g. the layers of a circuit.
+
+    Returns
+    -------
+    tuple
+    """
+    if _interned_labels is None: return labels
+    return tuple(map(intern_label, labels))
+
 
 class Label(object):
     """
@@ -247,7 +328,8 @@ class LabelTup(Label, tuple):
         # (qubits) that the item/gate acts on are stored as a tuple (because tuples are immutable).
         sslbls = tuple(integerized_sslbls)
         tup = (_sys.intern(name),) + sslbls
-        return tuple.__new__(cls, tup)
+        ret = tuple.__new__(cls, tup)
+        return ret if (_interned_labels is None) else intern_label(ret)
 
     __new__ = tuple.__new__
     #def __new__(cls, tup, time=0.0):
@@ -757,7 +839,8 @@ class LabelStr(Label, str):
         #Type checking
         assert(isinstance(name, str)), "`name` must be a string, but it's '%s'" % str(name)
         assert(isinstance(time, float)), "`time` must be a floating point value, received: " + str(time)
-        return cls.__new__(cls, name, time)
+        ret = cls.__new__(cls, name, time)
+        return ret if (_interned_labels is None) else intern_label(ret)
 
     def __new__(cls, name, time=0.0):
         ret = str.__new__(cls, name)
@@ -938,7 +1021,8 @@ class LabelTupTup(Label, tuple):
         if len(tupOfLabels) > 0:
             assert(max([lbl.time for lbl in tupOfLabels]) == 0.0), \
                 "Cannot create a LabelTupTup containing labels with time != 0"
-        return cls.__new__(cls, tupOfLabels)
+        ret = cls.__new__(cls, tupOfLabels)
+        return ret if (_interned_labels is None) else intern_label(ret)
 
     __new__ = tuple.__new__
 
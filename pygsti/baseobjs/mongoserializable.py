@@ -9,11 +9,16 @@ Defines the MongoSerializable class
 # in compliance with the License.  You may obtain a copy of the License at
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
+import hashlib as _hashlib
 import importlib as _importlib
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 import numpy as _np
 
 _indexinformation_cache = {}  # used to speedup mondodb index_information() queries
 
+BULK_WRITE_BATCH_SIZE = 1000  # maximum number of operations sent in a single bulk_write call
+MAX_IO_THREADS = 8  # maximum number of threads used for concurrent GridFS uploads and downloads
+
 
 class MongoSerializable(object):
     """
@@ -313,7 +318,8 @@ class WriteOpsByCollection(dict):
                 self[k] = []
             self[k].extend(v)
 
-    def add_one_op(self, collection_name, uid, doc, overwrite_existing, mongodb, check_local_ops=True):
+    def add_one_op(self, collection_name, uid, doc, overwrite_existing, mongodb, check_local_ops=True,
+                   content_hash=None):
         """
         Add a single write operation to this dictionary, if one is allowed and needed.
 
@@ -351,6 +357,13 @@ class WriteOpsByCollection(dict):
             you're sure there's no possibility a document with `uid` could have been "written" to
             this `WriteOpsByCollection` since its initialization.
 
+        content_hash : str, optional
+            A hash of the (typically large) content of `doc`, e.g. as computed by
+            :func:`compute_content_hash`.  When given, it is stored in the document's
+            `"content_hash"` field and an existing document with the same hash is left
+            untouched, so that unchanged data is not re-written.  Existing documents are
+            also compared by this hash alone, avoiding the retrieval of their (large) content.
+
         Returns
         -------
         bson.objectid.ObjectId
@@ -366,12 +379,17 @@ class WriteOpsByCollection(dict):
         existing_doc = None
         tried_to_find_existing_doc = False
 
+        #When only a content hash needs to be compared, don't retrieve entire (large) existing documents
+        projection = None if (content_hash is None) else ('_id', 'content_hash')
+        if content_hash is not None:
+            doc['content_hash'] = content_hash
+
         #Get or create an id for the document to be inserted or replaced (or left as is)
         if isinstance(uid, dict):
             if '_id' in uid:
                 doc_id = uid['_id']
             else:
-                existing_doc = _find_one_doc(mongodb, collection_name, uid) #, ('_id',))  # entire doc so can use later
+                existing_doc = _find_one_doc(mongodb, collection_name, uid, projection)  # entire doc if no hash
                 if existing_doc is None and check_local_ops:
                     existing_doc = self._find_one_local_doc(collection_name, uid)
                 doc_id = _ObjectId() if (existing_doc is None) else existing_doc['_id']
@@ -383,6 +401,16 @@ class WriteOpsByCollection(dict):
         assert ('_id' not in doc) or (doc['_id'] == doc_id)
         doc['_id'] = doc_id
 
+        if content_hash is not None:
+            if not tried_to_find_existing_doc:
+                existing_doc = mongodb[collection_name].find_one(doc_id, projection)
+                tried_to_find_existing_doc = True
+            if existing_doc is not None and existing_doc.get('content_hash', None) == content_hash:
+                return doc_id  # an identical document already exists => nothing to write
+            if existing_doc is not None and 'content_hash' not in existing_doc and not overwrite_existing:
+                existing_doc = mongodb[collection_name].find_one(doc_id)  # no hash => compare entire doc below
+                existing_doc['content_hash'] = content_hash
+
         if overwrite_existing is True:
             self[collection_name].append(ReplaceOne({'_id': doc_id}, doc, upsert=True))
             #mongodb[collection_name].replace_one(doc_id, doc, upsert=True)  # alt line for DEBUG
@@ -414,16 +442,20 @@ class WriteOpsByCollection(dict):
         Add a GridFS put operation to this dictionary of write operations.
 
         This is a special type of operation for placing large chunks of binary data into a MongoDB.
-        Arguments are similar to :meth:`add_one_op`.
+        Arguments are similar to :meth:`add_one_op`.  A hash of `binary_data` is stored alongside
+        the GridFS file so that re-writing identical data (even when `overwrite_existing=True`)
+        doesn't upload it again.
         """
-        import gridfs as _gridfs
-        fs = _gridfs.GridFS(mongodb, collection=collection_name)
-        if fs.exists(doc_id) and not overwrite_existing:
+        content_hash = compute_content_hash(binary_data)
+        existing_file = mongodb[collection_name + '.files'].find_one({'_id': doc_id}, ('_id', 'content_hash'))
+        if existing_file is not None and (not overwrite_existing
+                                          or existing_file.get('content_hash', None) == content_hash):
             pass  # don't check for equality here -- too slow since this is large data; just don't overwrite
         else:  # either the file doesn't exist or overwrite_existing=True, so write it!
             self.special_ops.append({'type': 'GridFS_put',
                                      'collection_name': collection_name,
                                      'data': binary_data,
+                                     'content_hash': content_hash,
                                      'overwrite_existing': overwrite_existing,
                                      'id': doc_id})
         return doc_id
@@ -437,6 +469,11 @@ class WriteOpsByCollection(dict):
         this object is used for these write operations.  On exit, this dictionary is empty, indicating
         there are no more queued operations.
 
+        GridFS uploads are performed concurrently, using up to `MAX_IO_THREADS` threads, and
+        document writes are sent as `bulk_write` calls of at most `BULK_WRITE_BATCH_SIZE` operations.
+        When no session is used, the bulk writes to different collections are also performed
+        concurrently (sessions cannot be shared between threads).
+
         Parameters
         ----------
         mongodb : pymongo.database.Database
@@ -447,25 +484,37 @@ class WriteOpsByCollection(dict):
         None
         """
         for op_info in self.special_ops:
-            if op_info['type'] == 'GridFS_put':
-                import gridfs as _gridfs
-                fs = _gridfs.GridFS(mongodb, collection=op_info['collection_name'])
-                try:
-                    file_id = fs.put(op_info['data'], _id=op_info['id'])
-                except _gridfs.errors.FileExists as e:
-                    if op_info['overwrite_existing']:
-                        fs.delete(op_info['id'])
-                        file_id = fs.put(op_info['data'], _id=op_info['id'])  # try again
-                    else:
-                        raise e
-
-                assert file_id == op_info['id']
-            else:
+            if op_info['type'] != 'GridFS_put':
                 raise ValueError("Invalid special op:" + str(op_info))
 
-        for collection_name, ops in self.items():
-            if len(ops) > 0:  # bulk_write fails if ops is an empty list
-                mongodb[collection_name].bulk_write(ops, session=self.session)
+        def gridfs_put(op_info):
+            import gridfs as _gridfs
+            fs = _gridfs.GridFS(mongodb, collection=op_info['collection_name'])
+            try:
+                file_id = fs.put(op_info['data'], _id=op_info['id'], content_hash=op_info['content_hash'])
+            except _gridfs.errors.FileExists as e:
+                if op_info['overwrite_existing']:
+                    fs.delete(op_info['id'])
+                    file_id = fs.put(op_info['data'], _id=op_info['id'],
+                                     content_hash=op_info['content_hash'])  # try again
+                else:
+                    raise e
+
+            assert file_id == op_info['id']
+
+        def bulk_write(collection_name):
+            ops = self[collection_name]
+            for i in range(0, len(ops), BULK_WRITE_BATCH_SIZE):
+                mongodb[collection_name].bulk_write(ops[i:i + BULK_WRITE_BATCH_SIZE], session=self.session)
+
+        _run_concurrently(gridfs_put, self.special_ops)
+
+        collection_names = [k for k, ops in self.items() if len(ops) > 0]  # bulk_write fails if ops is empty
+        if self.session is None:
+            _run_concurrently(bulk_write, collection_names)
+        else:
+            for collection_name in collection_names:
+                bulk_write(collection_name)
         self.clear()
         self.special_ops = []
 
@@ -595,6 +644,56 @@ def recursive_compare_str(a, b, a_name='first obj', b_name='second obj', prefix=
     return diff_accum
 
 
+def compute_content_hash(binary_data):
+    """
+    Compute a hash of binary data used to detect unchanged content in a MongoDB database.
+
+    Parameters
+    ----------
+    binary_data : bytes
+        The data to hash.
+
+    Returns
+    -------
+    str
+    """
+    return _hashlib.sha256(binary_data).hexdigest()
+
+
+def read_gridfs_files(mongodb, collection_name, file_ids):
+    """
+    Read the contents of several GridFS files concurrently.
+
+    Parameters
+    ----------
+    mongodb : pymongo.database.Database
+        The MongoDB instance to read from.
+
+    collection_name : str
+        The name of the GridFS collection (bucket) holding the files.
+
+    file_ids : list
+        The `_id` values of the files to read.
+
+    Returns
+    -------
+    list
+        The binary contents of the files, in the order given by `file_ids`.
+    """
+    import gridfs as _gridfs
+    fs = _gridfs.GridFS(mongodb, collection=collection_name)
+    return _run_concurrently(lambda file_id: fs.get(file_id).read(), file_ids)
+
+
+def _run_concurrently(fn, items):
+    """ Apply `fn` to each of `items` using a pool of up to `MAX_IO_THREADS` threads, preserving order """
+    items = list(items)
+    if len(items) <= 1 or MAX_IO_THREADS <= 1:
+        return [fn(item) for item in items]
+    with _ThreadPoolExecutor(max_workers=min(MAX_IO_THREADS, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
 def _find_one_doc(db, collection_name, doc_id, projection=None, error_if_no_doc=False):
     if doc_id is not None and not isinstance(doc_id, dict):
         doc_id = {'_id': doc_id}
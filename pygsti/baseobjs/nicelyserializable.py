@@ -10,7 +10,9 @@ Defines the NicelySerializable class
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import contextlib as _contextlib
 import importlib as _importlib
+import os as _os
 import pathlib as _pathlib
 import json as _json
 import numpy as _np
@@ -20,6 +22,76 @@ from pygsti.baseobjs.mongoserializable import MongoSerializable
 
 class_location_changes = {}  # (module, class) mapping from OLD to NEW locations
 
+_external_array_stores = []  # stack of active _ExternalArrayStore objects (the last one is used)
+
+
+class _ExternalArrayStore(object):
+    """
+    Stores large arrays of a nice serialization as separate ".npy" files.
+
+    While a store is active (see :func:`_using_external_array_store`),
+    :meth:`NicelySerializable._encodemx` writes each dense, non-object array
+    having at least `min_size` elements to a raw-buffer ".npy" file in
+    `directory` and places a small reference dictionary in the serialized
+    (JSON) tree instead of a (potentially huge) nested list.  When decoding,
+    :meth:`NicelySerializable._decodemx` memory-maps referenced files in
+    copy-on-write mode, so array data is only read from disk when accessed.
+
+    Parameters
+    ----------
+    directory : str or Path
+        The directory holding the array files.  Reference paths are relative
+        to this directory.
+
+    subdir : str, optional
+        The name of the sub-directory of `directory` that newly written
+        array files are placed in.
+
+    min_size : int, optional
+        The minimum number of elements for an array to be written to a
+        separate file.  If `None`, no arrays are written (the store is only
+        used for reading).
+    """
+
+    def __init__(self, directory, subdir=None, min_size=None):
+        self.directory = _pathlib.Path(directory)
+        self.subdir = subdir
+        self.min_size = max(min_size, 1) if (min_size is not None) else None
+        self.num_written = 0
+
+    def encode(self, mx):
+        """ Write `mx` to a separate file, returning a reference dict, or `None` if `mx` shouldn't be stored. """
+        if self.min_size is None or mx.size < self.min_size or mx.dtype.kind == 'O':
+            return None
+        relpath = _pathlib.PurePosixPath(self.subdir) / ("%d.npy" % self.num_written) \
+            if (self.subdir is not None) else _pathlib.PurePosixPath("%d.npy" % self.num_written)
+        pth = self.directory / relpath
+        pth.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file and then replace so that any existing memory-mapped file at `pth`
+        # (e.g. from reading in the object being written) remains valid.
+        tmp_pth = pth.with_name(pth.name + '.tmp')
+        with open(str(tmp_pth), 'wb') as f:
+            _np.save(f, _np.ascontiguousarray(mx))
+        _os.replace(str(tmp_pth), str(pth))
+        self.num_written += 1
+        return {'external_npy_array': str(relpath), 'shape': list(mx.shape), 'dtype': mx.dtype.str}
+
+    def decode(self, ref):
+        """ Lazily load the array referred to by reference dict `ref`. """
+        pth = self.directory / ref['external_npy_array']
+        return _np.asarray(_np.load(str(pth), mmap_mode='c'))  # copy-on-write => never modifies file
+
+
+@_contextlib.contextmanager
+def _using_external_array_store(store):
+    """ A context within which `store` is used to encode and decode arrays (see :class:`_ExternalArrayStore`). """
+    _external_array_stores.append(store)
+    try:
+        yield store
+    finally:
+        _external_array_stores.pop()
+
 
 class NicelySerializable(MongoSerializable):
     """
@@ -57,7 +129,7 @@ class NicelySerializable(MongoSerializable):
             else:
                 raise ValueError("Cannot determine format from extension of filename: %s" % str(path))
 
-        with open(str(path), 'r') as f:
+        with open(str(path), 'r') as f, _using_external_array_store(_ExternalArrayStore(_pathlib.Path(path).parent)):
             return cls.load(f, format)
 
     @classmethod
@@ -177,7 +249,7 @@ class NicelySerializable(MongoSerializable):
             #  methods, and we don't want dbcoordinates in DB documents
         return state
 
-    def write(self, path, **format_kwargs):
+    def write(self, path, external_array_min_size=None, **format_kwargs):
         """
         Writes this object to a file.
 
@@ -186,6 +258,14 @@ class NicelySerializable(MongoSerializable):
         path : str or Path
             The name of the file that is written.
 
+        external_array_min_size : int, optional
+            If not `None`, arrays with at least this many elements are written as
+            raw binary ".npy" files within a `<path-stem>_arrays` directory alongside
+            `path` and are referenced from (rather than embedded in) the written file.
+            This makes writing and reading objects containing large arrays (e.g.
+            Hessians) much faster, and such arrays are memory-mapped, i.e. loaded
+            lazily, by :meth:`read`.
+
         format_kwargs : dict, optional
             Additional arguments specific to the format being used.
             For example, the JSON format accepts `indent` as an argument
@@ -195,14 +275,15 @@ class NicelySerializable(MongoSerializable):
         -------
         None
         """
-        from pygsti.io.metadir import _check_jsonable
         if str(path).endswith('.json'):
             format = 'json'
         else:
             raise ValueError("Cannot determine format from extension of filename: %s" % str(path))
 
-        with open(str(path), 'w') as f:
-            self.dump(f, format)
+        path = _pathlib.Path(path)
+        store = _ExternalArrayStore(path.parent, path.stem + '_arrays', external_array_min_size)
+        with open(str(path), 'w') as f, _using_external_array_store(store):
+            self.dump(f, format, **format_kwargs)
 
     def dump(self, f, format='json', **format_kwargs):
         """
@@ -342,7 +423,12 @@ class NicelySerializable(MongoSerializable):
     def _encodemx(cls, mx):
         if mx is None:
             return None
-        elif _sps.issparse(mx):
+
+        if _external_array_stores and not _sps.issparse(mx):
+            ref = _external_array_stores[-1].encode(_np.asarray(mx))
+            if ref is not None: return ref
+
+        if _sps.issparse(mx):
             csr_mx = _sps.csr_matrix(mx)  # convert to CSR and save in this format
             return {'sparse_matrix_type': 'csr',
                     'data': cls._encodemx(csr_mx.data), 'indices': cls._encodemx(csr_mx.indices),
@@ -357,6 +443,11 @@ class NicelySerializable(MongoSerializable):
     def _decodemx(cls, mx):
         if mx is None:
             decoded = None
+        elif isinstance(mx, dict) and 'external_npy_array' in mx:  # then stored in a separate file
+            if not _external_array_stores:
+                raise ValueError("Cannot decode an externally stored array without knowing its location:"
+                                 " use `read` instead of `load` or `loads` to read this object.")
+            decoded = _external_array_stores[-1].decode(mx)
         elif isinstance(mx, dict):  # then a sparse mx
             assert (mx['sparse_matrix_type'] == 'csr')
             data = cls._decodemx(mx['data'])
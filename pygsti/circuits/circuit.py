@@ -15,6 +15,7 @@ import itertools as _itertools
 import warnings as _warnings
 
 import numpy as _np
+from pygsti.baseobjs import label as _label
 from pygsti.baseobjs.label import Label as _Label, CircuitLabel as _CircuitLabel
 
 from pygsti.baseobjs import outcomelabeldict as _ld, _compatibility as _compat
@@ -300,6 +301,10 @@ class Circuit(object):
     """
     default_expand_subcircuits = True
 
+    # Circuits are created in very large numbers, so use a fixed, compact attribute layout
+    __slots__ = ('_labels', '_line_labels', '_occurrence_id', '_compilable_layer_indices_tup', '_static',
+                 '_name', '_str', '_times', 'auxinfo', '_alignmarks', '_hashable_tup', '_hash', '__weakref__')
+
     @classmethod
     def cast(cls, obj):
         """
@@ -601,6 +606,8 @@ class Circuit(object):
 
     def _bare_init(self, labels, line_labels, editable, name='', stringrep=None, occurrence=None,
                    compilable_layer_indices=None):
+        if not editable and _label._interned_labels is not None:
+            labels = _label.intern_labels(labels)
         self._labels = labels
         self._line_labels = line_labels
         self._occurrence_id = occurrence
@@ -613,6 +620,30 @@ class Circuit(object):
         self._times = None  # for FUTURE expansion
         self.auxinfo = {}  # for FUTURE expansion / user metadata
         self._alignmarks = ()  # layer indices *before* which there is an alignment mark
+        self._update_hashable_tup()
+
+    def _update_hashable_tup(self):
+        """
+        Reset the stored `.tup` and hash of this circuit, which static circuits compute only once, when first needed.
+
+        This must be called whenever a member contributing to `.tup` changes.
+        """
+        self._hashable_tup = None
+        self._hash = None
+
+    def __getstate__(self):
+        state = {k: getattr(self, k) for k in self.__slots__ if k != '__weakref__'}
+        state['_hash'] = None  # str hashes differ between processes, so never transfer a computed hash
+        return state
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+        if '_hashable_tup' not in state:  # e.g. circuits pickled by older versions
+            if '_compilable_layer_indices_tup' not in state: self._compilable_layer_indices_tup = ()
+            for k, default in (('_times', None), ('auxinfo', {}), ('_alignmarks', ()), ('_name', '')):
+                if k not in state: setattr(self, k, default)
+            self._update_hashable_tup()
 
     def to_label(self, nreps=1):
         """
@@ -661,6 +692,7 @@ class Circuit(object):
                 self.delete_lines(tuple(removed_not_idling))
         self._line_labels = tuple(value)
         self._str = None  # regenerate string rep (it may have updated)
+        self._update_hashable_tup()
 
     @property
     def name(self):
@@ -686,6 +718,7 @@ class Circuit(object):
         """
         self._occurrence_id = value
         self._str = None  # regenerate string rep (it may have updated)
+        self._update_hashable_tup()
 
     @property
     def layertup(self):
@@ -710,6 +743,13 @@ class Circuit(object):
         -------
         tuple
         """
+        if self._static:
+            if self._hashable_tup is None:
+                self._hashable_tup = self._compute_tup()
+            return self._hashable_tup
+        return self._compute_tup()
+
+    def _compute_tup(self):
         if self._occurrence_id is None:
             if self._line_labels in (('*',), ()):  # No line labels
                 return self.layertup + self._compilable_layer_indices_tup
@@ -733,6 +773,7 @@ class Circuit(object):
     def compilable_layer_indices(self, val):
         self._compilable_layer_indices_tup = ('__CMPLBL__',) + tuple(val) \
             if (val is not None) else ()  # always a tuple, but can be empty.
+        self._update_hashable_tup()
 
     @property
     def compilable_by_layer(self):
@@ -820,7 +861,9 @@ class Circuit(object):
                             " mode in order to hash it.  You should call"
                             " circuit.done_editing() beforehand."))
             self.done_editing()
-        return hash(self.tup)
+        if self._hash is None:
+            self._hash = hash(self.tup)
+        return self._hash
         #if self._line_labels in (('*',),()): #No line labels
         #    return hash(self._labels)
         #else:
@@ -948,7 +991,8 @@ class Circuit(object):
             s += "@" + mylines  # add line labels
         if ntimes >= 1 and expand is False:
             reppedCircuitLbl = self.to_label(nreps=ntimes)
-            return Circuit((reppedCircuitLbl,), self.line_labels, None, not self._static, s, check=False)
+            return Circuit((reppedCircuitLbl,), self.line_labels, None, not self._static, s, check=False,
+                           expand_subcircuits=False)
         else:
             # just adds parens to string rep & copies
             return Circuit(self.layertup * ntimes, self.line_labels, None, not self._static, s, check=False)
@@ -962,6 +1006,10 @@ class Circuit(object):
     def __eq__(self, x):
         if x is None: return False
         if isinstance(x, Circuit):
+            if self is x: return True
+            if self._static and x._static and self._hash is not None and x._hash is not None \
+               and self._hash != x._hash:
+                return False  # different hashes => different circuits
             return self.tup.__eq__(x.tup)
         else:
             return self.layertup == tuple(x)  # equality with non-circuits is just based on *labels*
@@ -1157,7 +1205,7 @@ class Circuit(object):
         lines = self._proc_lines_arg(lines)
         if len(layers) == 0 or len(lines) == 0:
             return Circuit._fastinit(() if self._static else [],
-                                     lines, not self._static) if nonint_layers else None  # zero-area region
+                                     tuple(lines), not self._static) if nonint_layers else None  # zero-area region
 
         ret = []
         if self._static:
@@ -1184,6 +1232,7 @@ class Circuit(object):
         if nonint_layers:
             if not strict: lines = "auto"  # since we may have included lbls on other lines
             # don't worry about string rep for now...
+            if lines != "auto": lines = tuple(lines)
             return Circuit._fastinit(tuple(ret) if self._static else ret, lines, not self._static)
         else:
             return _Label(ret[0])
@@ -4203,6 +4252,7 @@ class Circuit(object):
         if not self._static:
             self._static = True
             self._labels = tuple([_Label(layer_lbl) for layer_lbl in self._labels])
+            self._update_hashable_tup()
 
     def expand_instruments_and_separate_povm(self, model, observed_outcomes=None):
         """
@@ -4249,16 +4299,13 @@ class Circuit(object):
             """
             cir = circuit if start == 0 else circuit[start:]  # for performance, avoid uneeded slicing
             for k, layer_label in enumerate(cir, start=start):
-                components = layer_label.components
-                #instrument_inds = _np.nonzero([model._is_primitive_instrument_layer_lbl(component)
-                #                               for component in components])[0]  # SLOWER than statement below
-                instrument_inds = _np.array([i for i, component in enumerate(components)
-                                             if model._is_primitive_instrument_layer_lbl(component)])
-                if instrument_inds.size > 0:
+                instrument_inds = model._instrument_indices_of_layer(layer_label)  # memoized per layer label
+                if len(instrument_inds) > 0:
                     # This layer contains at least one instrument => recurse with instrument(s) replaced with
                     #  all combinations of their members.
+                    components = layer_label.components
                     component_lookup = {i: comp for i, comp in enumerate(components)}
-                    instrument_members = [model._member_labels_for_instrument(components[i])
+                    instrument_members = [model._memoized_member_labels_for_instrument(components[i])
                                           for i in instrument_inds]  # also components of outcome labels
                     for selected_instrmt_members in _itertools.product(*instrument_members):
                         expanded_layer_lbl = component_lookup.copy()
@@ -4280,10 +4327,18 @@ class Circuit(object):
 
             else:  # no more instruments to process: `cir` contains no instruments => add an expanded circuit
                 assert(circuit not in expanded_circuit_outcomes)  # shouldn't be possible to generate duplicates...
-                elabels = model._effect_labels_for_povm(povm_lbl) if (observed_outcomes is None) \
+                elabels = model._memoized_effect_labels_for_povm(povm_lbl)[0] if (observed_outcomes is None) \
                     else tuple(ootree.keys())
                 outcomes = tuple((running_outcomes + (elabel,) for elabel in elabels))
-                expanded_circuit_outcomes[SeparatePOVMCircuit(circuit, povm_lbl, elabels)] = outcomes
+                expanded_circuit_outcomes[SeparatePOVMCircuit(circuit, povm_lbl, elabels,
+                                                              full_effect_labels(elabels))] = outcomes
+
+        def full_effect_labels(elabels):  # memoized, as these are usually shared by many circuits
+            memo = model._circuit_memo('full-effect-labels')
+            ret = memo.get((povm_lbl, elabels), None)
+            if ret is None:
+                ret = memo[(povm_lbl, elabels)] = [(povm_lbl + "_" + el) for el in elabels]
+            return ret
 
         ootree = create_tree(observed_outcomes) if observed_outcomes is not None else None  # tree of observed outcomes
         # e.g. [('0','00'), ('0','01'), ('1','10')] ==> {'0': {'00': {}, '01': {}}, '1': {'10': {}}}
@@ -4291,16 +4346,16 @@ class Circuit(object):
         if model._has_instruments():
             add_expanded_circuit_outcomes(circuit_without_povm, (), ootree, start=0)
         else:
-            # It may be helpful to cache the set of elabels for a POVM (maybe within the model?) because
-            # currently the call to _effect_labels_for_povm may be a bottleneck.  It's needed, even when we have
-            # observed outcomes, because there may be some observed outcomes that aren't modeled (e.g. leakage states)
+            # The (memoized) set of elabels for the POVM is needed, even when we have observed outcomes,
+            # because there may be some observed outcomes that aren't modeled (e.g. leakage states)
             if observed_outcomes is None:
-                elabels = model._effect_labels_for_povm(povm_lbl)
+                elabels = model._memoized_effect_labels_for_povm(povm_lbl)[0]
             else:
-                possible_lbls = set(model._effect_labels_for_povm(povm_lbl))
+                possible_lbls = model._memoized_effect_labels_for_povm(povm_lbl)[1]
                 elabels = tuple([oo for oo in ootree.keys() if oo in possible_lbls])
             outcomes = tuple(((elabel,) for elabel in elabels))
-            expanded_circuit_outcomes[SeparatePOVMCircuit(circuit_without_povm, povm_lbl, elabels)] = outcomes
+            expanded_circuit_outcomes[SeparatePOVMCircuit(circuit_without_povm, povm_lbl, elabels,
+                                                          full_effect_labels(elabels))] = outcomes
 
         return expanded_circuit_outcomes
 
@@ -4490,20 +4545,24 @@ class SeparatePOVMCircuit(object):
     for this other than practicality - that since almost *all* circuits end with a POVM, holding each
     POVM outcome (effect) separately would be very wasteful.
     """
-    def __init__(self, circuit_without_povm, povm_label, effect_labels):
+    def __init__(self, circuit_without_povm, povm_label, effect_labels, full_effect_labels=None):
         self.circuit_without_povm = circuit_without_povm
         self.povm_label = povm_label
         self.effect_labels = effect_labels
+        self._full_effect_labels = full_effect_labels  # optional precomputed value (can be shared)
 
     @property
     def full_effect_labels(self):
+        if self._full_effect_labels is not None:
+            return self._full_effect_labels
         return [(self.povm_label + "_" + el) for el in self.effect_labels]
 
     def __len__(self):
         return len(self.circuit_without_povm)  # don't count POVM in length, so slicing works as expected
 
     def __getitem__(self, index):
-        return SeparatePOVMCircuit(self.circuit_without_povm[index], self.povm_label, self.effect_labels)
+        return SeparatePOVMCircuit(self.circuit_without_povm[index], self.povm_label, self.effect_labels,
+                                   self._full_effect_labels)
 
     def __lt__(self, other):  # so we can sort a list of SeparatePOVMCircuits
         return self.circuit_without_povm < other.circuit_without_povm
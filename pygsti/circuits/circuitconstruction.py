@@ -657,6 +657,117 @@ def translate_circuits(circuits, alias_dict):
         return new_circuits
 
 
+def _map_layers_of_circuits(circuits, layer_fn, line_labels_fn, memo, fallback_fn):
+    # Apply `layer_fn` once per unique layer label (cached in `memo`) and build static circuits directly
+    # from the mapped layers rather than copying each circuit.  Editable circuits use `fallback_fn`.
+    mapped_line_labels = {}
+    ret = []
+    for c in circuits:
+        if not c._static:
+            ret.append(fallback_fn(c)); continue
+        layers = []
+        for lbl in c._labels:
+            mapped_lbl = memo.get(lbl, None)
+            if mapped_lbl is None:
+                mapped_lbl = memo[lbl] = layer_fn(lbl)
+            layers.append(mapped_lbl)
+        line_labels = c.line_labels
+        if line_labels not in mapped_line_labels:
+            mapped_line_labels[line_labels] = line_labels_fn(line_labels)
+        ret.append(_cir.Circuit._fastinit(tuple(layers), mapped_line_labels[line_labels], False,
+                                          occurrence=c.occurrence))
+    return ret
+
+
+def map_state_space_labels_in_circuits(circuits, mapper, memo=None):
+    """
+    Applies :meth:`Circuit.map_state_space_labels` to each element of `circuits`.
+
+    Each distinct layer label is mapped only once, so relabeling a large list
+    of circuits that share layers amounts to a dictionary lookup per layer rather
+    than a copy of each circuit.
+
+    Parameters
+    ----------
+    circuits : list of Circuits
+        The circuits to relabel.
+
+    mapper : dict or function
+        A dictionary whose keys are the existing line labels and whose values
+        are the new labels, or a function which takes a single (existing line-label)
+        argument and returns a new line-label.
+
+    memo : dict, optional
+        A dictionary of already-mapped layer labels, which is updated by this
+        function.  This can be shared between calls that use the same `mapper`.
+
+    Returns
+    -------
+    list of Circuits
+    """
+    def mapper_func(line_label): return mapper[line_label] \
+        if isinstance(mapper, dict) else mapper(line_label)
+    return _map_layers_of_circuits(circuits, lambda lbl: lbl.map_state_space_labels(mapper_func),
+                                   lambda line_labels: tuple(map(mapper_func, line_labels)),
+                                   {} if (memo is None) else memo,
+                                   lambda c: c.map_state_space_labels(mapper))
+
+
+def replace_gatename_in_circuits(circuits, old_gatename, new_gatename, memo=None):
+    """
+    Applies :meth:`Circuit.replace_gatename` to each element of `circuits`.
+
+    Each distinct layer label is updated only once, and no circuit is copied.
+
+    Parameters
+    ----------
+    circuits : list of Circuits
+        The circuits to update.
+
+    old_gatename : str
+        The gate name to replace.
+
+    new_gatename : str
+        The name to replace `old_gatename` with.
+
+    memo : dict, optional
+        A dictionary of already-updated layer labels, which is updated by this
+        function.  This can be shared between calls that use the same gate names.
+
+    Returns
+    -------
+    list of Circuits
+    """
+    return _map_layers_of_circuits(circuits, lambda lbl: lbl.replace_name(old_gatename, new_gatename),
+                                   lambda line_labels: line_labels,
+                                   {} if (memo is None) else memo,
+                                   lambda c: c.replace_gatename(old_gatename, new_gatename))
+
+
+def delete_idling_lines_in_circuits(circuits, idle_layer_labels=None):
+    """
+    Applies :meth:`Circuit.delete_idling_lines` to each element of `circuits`.
+
+    Circuits without any idling lines are returned as-is instead of being copied.
+
+    Parameters
+    ----------
+    circuits : list of Circuits
+        The circuits to process.
+
+    idle_layer_labels : iterable, optional
+        A list or tuple of layer-labels that should be treated
+        as idle operations, so their presence will not disqualify
+        a line from being "idle".
+
+    Returns
+    -------
+    list of Circuits
+    """
+    return [c.delete_idling_lines(idle_layer_labels) if (not c._static or c.idling_lines(idle_layer_labels))
+            else c for c in circuits]
+
+
 def _compose_alias_dicts(alias_dict_1, alias_dict_2):
     """
     Composes two alias dicts.
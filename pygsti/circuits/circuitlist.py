@@ -112,8 +112,7 @@ class CircuitList(_NicelySerializable):
         from pygsti.io.readers import convert_strings_to_circuits as _convert_strings_to_circuits
         from pygsti.io import stdinput as _stdinput
         std = _stdinput.StdInputParser()
-        circuits = [std.parse_circuit(s, create_subcircuits=_Circuit.default_expand_subcircuits)
-                    for s in state['circuits']]
+        circuits = std.parse_circuits(state['circuits'], create_subcircuits=_Circuit.default_expand_subcircuits)
         circuit_weights = _np.array(state['circuit_weights'], 'd') if (state['circuit_weights'] is not None) else None
         op_label_aliases = _convert_strings_to_circuits(state['op_label_aliases'])
         circuit_rules = _convert_strings_to_circuits(state['circuit_rules'])
@@ -50,7 +50,7 @@ message.
 
 try:
     # Import cython implementation if it's been built...
-    from .fastcircuitparser import parse_circuit, parse_label
+    from .fastcircuitparser import parse_circuit, parse_circuits, parse_label
 except ImportError:
     # ... If not, fall back to the python implementation, with a warning.
     import os as _os
@@ -59,7 +59,7 @@ except ImportError:
     if 'PYGSTI_NO_CYTHON_WARNING' not in _os.environ:
         _warnings.warn(warn_msg)
 
-    from .slowcircuitparser import parse_circuit, parse_label
+    from .slowcircuitparser import parse_circuit, parse_circuits, parse_label
 
 
 from pygsti.baseobjs import label as _lbl
@@ -235,7 +235,27 @@ class CircuitParser(object):
         implementation, if available. Otherwise, the slower native
         python implementation will be used.
         """
-        return parse_circuit(code, create_subcircuits, integerize_sslbls)
+        if _lbl._interned_labels is None:
+            return parse_circuit(code, create_subcircuits, integerize_sslbls)
+        layer_labels, line_labels, occurrence_id, compilable_indices = \
+            parse_circuit(code, create_subcircuits, integerize_sslbls)
+        return _lbl.intern_labels(layer_labels), line_labels, occurrence_id, compilable_indices
+
+    def parse_many(self, codes, create_subcircuits=True, integerize_sslbls=True):
+        """ Parse a list of circuit strings
+
+        Returns a list of the tuples :meth:`parse` would return for each
+        element of `codes`.  When not in "ply" mode, all the strings are parsed
+        by a single call to the (Cython, if available) parser, which memoizes
+        repeated substrings across the batch.
+        """
+        if self.mode == "ply":
+            return [self.parse(code, create_subcircuits) for code in codes]
+        results = parse_circuits(codes, create_subcircuits, integerize_sslbls)
+        if _lbl._interned_labels is None:
+            return results
+        return [(_lbl.intern_labels(layer_labels), line_labels, occurrence_id, compilable_indices)
+                for layer_labels, line_labels, occurrence_id, compilable_indices in results]
 
     @property
     def lookup(self):
@@ -47,6 +47,28 @@ def _to_int_or_strip(x):
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
 def parse_circuit(unicode code, bool create_subcircuits, bool integerize_sslbls):
+    return _parse_circuit(code, create_subcircuits, integerize_sslbls, None)
+
+
+def parse_circuits(codes, bool create_subcircuits, bool integerize_sslbls):
+    # Parse many circuit strings at once.  Parenthesized/bracketed groups and simple labels
+    # are memoized (by substring) across the whole batch, so repeated fiducials and germs are
+    # parsed only once and share the same label objects; identical strings share one result.
+    cdef dict memo = {}
+    cdef dict parsed = {}
+    results = []
+    for code in codes:
+        result = parsed.get(code, None)
+        if result is None:
+            result = _parse_circuit(code, create_subcircuits, integerize_sslbls, memo)
+            parsed[code] = result
+        results.append(result)
+    return results
+
+
+@cython.boundscheck(False) # turn off bounds-checking for entire function
+@cython.wraparound(False)  # turn off negative index wrapping for entire function
+cdef _parse_circuit(unicode code, bool create_subcircuits, bool integerize_sslbls, dict memo):
     if '@' in code:  # format:  <string>@<line_labels>
         code, *extras = code.split(u'@')
         labels = extras[0].strip(u"( )")  # remove opening and closing parenthesis
@@ -85,7 +107,7 @@ def parse_circuit(unicode code, bool create_subcircuits, bool integerize_sslbls)
 
         #print "TOP at:",code[i:]
         lbls_list,i,segment, marker_inds = get_next_lbls(code, i, end, create_subcircuits, integerize_sslbls,
-                                                         segment, interlayer_marker)
+                                                         segment, interlayer_marker, memo)
         interlayer_marker_inds.extend([len(result) + k for k in marker_inds])
         result.extend(lbls_list)
         #print "Labels = ",result
@@ -109,7 +131,7 @@ def parse_label(unicode code, bool integerize_sslbls=True):
     interlayer_marker = u''  # matches nothing - no interlayer markerg
 
     lbls_list, _, _, _ = get_next_lbls(code, 0, len(code), create_subcircuits, integerize_sslbls,
-                                       segment, interlayer_marker)
+                                       segment, interlayer_marker, None)
     if len(lbls_list) != 1:
         raise ValueError("Invalid label, could not parse: '%s'" % str(code))
     return lbls_list[0]
@@ -118,26 +140,40 @@ def parse_label(unicode code, bool integerize_sslbls=True):
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
 cdef get_next_lbls(unicode s, INT start, INT end, bool create_subcircuits, bool integerize_sslbls, INT segment,
-                   unicode interlayer_marker):
+                   unicode interlayer_marker, dict memo):
 
     cdef INT i
     cdef INT k
     cdef INT exponent
     cdef INT offset
     cdef INT last
+    cdef INT group_end
 
     if s[start] == u"(":
-        i = start+1
-        lbls_list = []; interlayer_marker_inds = []
-        while i < end and s[i] != u")":
-            if s[i] == interlayer_marker:
-                interlayer_marker_inds.append(len(lbls_list) - 1); i += 1
-                if i == end or s[i] == u")": break
-            lbls,i,segment,_ = get_next_lbls(s,i,end, create_subcircuits, integerize_sslbls, segment,
-                                           interlayer_marker)  # don't recursively look for interlayer markers
-            lbls_list.extend(lbls)
-        if i == end: raise ValueError("mismatched parenthesis")
-        i += 1
+        cached = None
+        if memo is not None:
+            group_end = find_group_end(s, start, end, u"(", u")")
+            key = (s[start:group_end], segment, interlayer_marker)
+            cached = memo.get(key, None)
+
+        if cached is not None:
+            lbls_list, segment, interlayer_marker_inds = cached
+            lbls_list = list(lbls_list); interlayer_marker_inds = list(interlayer_marker_inds)
+            i = group_end
+        else:
+            i = start+1
+            lbls_list = []; interlayer_marker_inds = []
+            while i < end and s[i] != u")":
+                if s[i] == interlayer_marker:
+                    interlayer_marker_inds.append(len(lbls_list) - 1); i += 1
+                    if i == end or s[i] == u")": break
+                lbls,i,segment,_ = get_next_lbls(s,i,end, create_subcircuits, integerize_sslbls, segment,
+                                               interlayer_marker, memo)  # don't recursively look for interlayer markers
+                lbls_list.extend(lbls)
+            if i == end: raise ValueError("mismatched parenthesis")
+            i += 1
+            if memo is not None and i == group_end:
+                memo[key] = (tuple(lbls_list), segment, tuple(interlayer_marker_inds))
         exponent, i = parse_exponent(s,i,end)
 
         if exponent != 1 and len(interlayer_marker_inds) > 0:
@@ -158,35 +194,47 @@ cdef get_next_lbls(unicode s, INT start, INT end, bool create_subcircuits, bool
             return lbls_list * exponent, i, segment, interlayer_marker_inds
 
     elif s[start] == u"[":  #layer
-        i = start+1
-        lbls_list = []
-        while i < end and s[i] != u"]":
-            #lbls,i,segment = get_next_simple_lbl(s,i,end, integerize_sslbls, segment)  #ONLY SIMPLE LABELS in [] (no parens)
-            lbls,i,segment,_ = get_next_lbls(s,i,end, create_subcircuits, integerize_sslbls, segment,
-                                           interlayer_marker)  # but don't actually look for marker
-            lbls_list.extend(lbls)
-        if i == end: raise ValueError("mismatched parenthesis")
-        i += 1
-        exponent, i = parse_exponent(s,i,end)
-
-        if len(lbls_list) == 0:
-            to_exponentiate = _lbl.LabelTupTup( () )
-        elif len(lbls_list) > 1:
-            time = max([l.time for l in lbls_list])
-            to_exponentiate = _lbl.LabelTupTup(tuple(lbls_list)) if (time == 0.0) \
-                else _lbl.LabelTupTupWithTime(tuple(lbls_list), time)  # create a layer label - a label of the labels within square brackets
+        cached = None
+        if memo is not None:
+            group_end = find_group_end(s, start, end, u"[", u"]")
+            key = (s[start:group_end], segment)
+            cached = memo.get(key, None)
+
+        if cached is not None:
+            to_exponentiate, segment = cached
+            i = group_end
         else:
-            to_exponentiate = lbls_list[0]
+            i = start+1
+            lbls_list = []
+            while i < end and s[i] != u"]":
+                lbls,i,segment,_ = get_next_lbls(s,i,end, create_subcircuits, integerize_sslbls, segment,
+                                               interlayer_marker, memo)  # but don't actually look for marker
+                lbls_list.extend(lbls)
+            if i == end: raise ValueError("mismatched parenthesis")
+            i += 1
+
+            if len(lbls_list) == 0:
+                to_exponentiate = _lbl.LabelTupTup( () )
+            elif len(lbls_list) > 1:
+                time = max([l.time for l in lbls_list])
+                # create a layer label - a label of the labels within square brackets
+                to_exponentiate = _lbl.LabelTupTup(tuple(lbls_list)) if (time == 0.0) \
+                    else _lbl.LabelTupTupWithTime(tuple(lbls_list), time)
+            else:
+                to_exponentiate = lbls_list[0]
+            if memo is not None and i == group_end:
+                memo[key] = (to_exponentiate, segment)
+        exponent, i = parse_exponent(s,i,end)
         return [to_exponentiate] * exponent, i, segment, ()
 
     else:
-        lbls,i,segment = get_next_simple_lbl(s,start,end, integerize_sslbls, segment)
+        lbls,i,segment = get_next_simple_lbl(s,start,end, integerize_sslbls, segment, memo)
         exponent, i = parse_exponent(s,i,end)
         return lbls*exponent, i, segment, ()
 
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
-cdef get_next_simple_lbl(unicode s, INT start, INT end, bool integerize_sslbls, INT segment):
+cdef get_next_simple_lbl(unicode s, INT start, INT end, bool integerize_sslbls, INT segment, dict memo):
     cdef INT  i
     cdef INT last
     cdef Py_UCS4 c
@@ -286,17 +334,49 @@ cdef get_next_simple_lbl(unicode s, INT start, INT end, bool integerize_sslbls,
     else:
         time = 0.0
 
+    if memo is not None:
+        key = s[start:i]
+        lbl = memo.get(key, None)
+        if lbl is not None:
+            return [lbl], i, segment
+
     if len(args) == 0:
         if len(sslbls) == 0:
-            return [_lbl.LabelStr(name, time)], i, segment
+            lbl = _lbl.LabelStr(name, time)
         elif time == 0.0:
-            return [_lbl.LabelTup((name,) + tuple(sslbls))], i, segment
+            lbl = _lbl.LabelTup((name,) + tuple(sslbls))
         else:
-            return [_lbl.LabelTupWithTime((name,) + tuple(sslbls), time)], i, segment
+            lbl = _lbl.LabelTupWithTime((name,) + tuple(sslbls), time)
     else:
-        return [_lbl.LabelTupWithArgs((name, 2 + len(args)) + tuple(args) + tuple(sslbls), time)], i, segment
+        lbl = _lbl.LabelTupWithArgs((name, 2 + len(args)) + tuple(args) + tuple(sslbls), time)
+
+    if memo is not None:
+        memo[key] = lbl
+    return [lbl], i, segment
     #return _Label(name,sslbls,time,args), i
 
+
+@cython.boundscheck(False) # turn off bounds-checking for entire function
+@cython.wraparound(False)  # turn off negative index wrapping for entire function
+cdef INT find_group_end(unicode s, INT start, INT end, Py_UCS4 opener, Py_UCS4 closer):
+    # index just past the `closer` matching the `opener` at s[start] (or `end` if unmatched)
+    cdef INT i = start
+    cdef INT depth = 0
+    cdef Py_UCS4 c
+    while i < end:
+        c = s[i]
+        if c == u'{':  # {...} gate names may contain parentheses
+            while i < end and s[i] != u'}':
+                i += 1
+        elif c == opener:
+            depth += 1
+        elif c == closer:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return end
+
 @cython.boundscheck(False) # turn off bounds-checking for entire function
 @cython.wraparound(False)  # turn off negative index wrapping for entire function
 cdef parse_exponent(unicode s, INT i, INT end):
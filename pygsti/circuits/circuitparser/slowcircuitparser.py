@@ -16,6 +16,24 @@ def _to_int_or_strip(x):
 
 
 def parse_circuit(code, create_subcircuits=True, integerize_sslbls=True):
+    return _parse_circuit(code, create_subcircuits, integerize_sslbls, None)
+
+
+def parse_circuits(codes, create_subcircuits=True, integerize_sslbls=True):
+    # Parse many circuit strings at once.  Parenthesized/bracketed groups and simple labels
+    # are memoized (by substring) across the whole batch, so repeated fiducials and germs are
+    # parsed only once and share the same label objects; identical strings share one result.
+    memo = {}; parsed = {}
+    results = []
+    for code in codes:
+        result = parsed.get(code, None)
+        if result is None:
+            result = parsed[code] = _parse_circuit(code, create_subcircuits, integerize_sslbls, memo)
+        results.append(result)
+    return results
+
+
+def _parse_circuit(code, create_subcircuits, integerize_sslbls, memo):
     if '@' in code:  # format:  <string>@<line_labels>[@<occurrence_id>]
         code, *extras = code.split('@')
         labels = extras[0].strip("( )")  # remove opening and closing parenthesis
@@ -50,7 +68,7 @@ def parse_circuit(code, create_subcircuits=True, integerize_sslbls=True):
             if i == end: break
 
         lbls_list, i, segment, marker_inds = _get_next_lbls(code, i, end, create_subcircuits, integerize_sslbls,
-                                                            segment, interlayer_marker)
+                                                            segment, interlayer_marker, memo)
         interlayer_marker_inds.extend([len(result) + k for k in marker_inds])
         result.extend(lbls_list)
 
@@ -71,27 +89,40 @@ def parse_label(code, integerize_sslbls=True):
     interlayer_marker = u''  # matches nothing - no interlayer markerg
 
     lbls_list, _, _, _ = _get_next_lbls(code, 0, len(code), create_subcircuits, integerize_sslbls,
-                                        segment, interlayer_marker)
+                                        segment, interlayer_marker, None)
     if len(lbls_list) != 1:
         raise ValueError("Invalid label, could not parse: '%s'" % str(code))
     return lbls_list[0]
 
 
-def _get_next_lbls(s, start, end, create_subcircuits, integerize_sslbls, segment, interlayer_marker):
+def _get_next_lbls(s, start, end, create_subcircuits, integerize_sslbls, segment, interlayer_marker, memo=None):
     if s[start] == "(":
-        i = start + 1
-        lbls_list = []; interlayer_marker_inds = []
-        while i < end and s[i] != ")":
-            if s[i] == interlayer_marker:
-                interlayer_marker_inds.append(len(lbls_list) - 1); i += 1
-                if i == end or s[i] == ")": break
-
-            lbls, i, segment, _ = _get_next_lbls(s, i, end, create_subcircuits, integerize_sslbls, segment,
-                                                 interlayer_marker)  # don't recursively look for interlayer markers
-            lbls_list.extend(lbls)
-
-        if i == end: raise ValueError("mismatched parenthesis")
-        i += 1
+        cached = None
+        if memo is not None:
+            group_end = _find_group_end(s, start, end, "(", ")")
+            key = (s[start:group_end], segment, interlayer_marker)
+            cached = memo.get(key, None)
+
+        if cached is not None:
+            lbls_list, segment, interlayer_marker_inds = cached
+            lbls_list = list(lbls_list); interlayer_marker_inds = list(interlayer_marker_inds)
+            i = group_end
+        else:
+            i = start + 1
+            lbls_list = []; interlayer_marker_inds = []
+            while i < end and s[i] != ")":
+                if s[i] == interlayer_marker:
+                    interlayer_marker_inds.append(len(lbls_list) - 1); i += 1
+                    if i == end or s[i] == ")": break
+
+                lbls, i, segment, _ = _get_next_lbls(s, i, end, create_subcircuits, integerize_sslbls, segment,
+                                                     interlayer_marker, memo)  # don't recursively look for markers
+                lbls_list.extend(lbls)
+
+            if i == end: raise ValueError("mismatched parenthesis")
+            i += 1
+            if memo is not None and i == group_end:
+                memo[key] = (tuple(lbls_list), segment, tuple(interlayer_marker_inds))
         exponent, i = _parse_exponent(s, i, end)
 
         if exponent != 1 and len(interlayer_marker_inds) > 0:
@@ -112,34 +143,46 @@ def _get_next_lbls(s, start, end, create_subcircuits, integerize_sslbls, segment
             return lbls_list * exponent, i, segment, interlayer_marker_inds
 
     elif s[start] == "[":  # layer
-        i = start + 1
-        lbls_list = []
-        while i < end and s[i] != "]":
-            lbls, i, segment, _ = _get_next_lbls(s, i, end, create_subcircuits, integerize_sslbls, segment,
-                                                 interlayer_marker)  # but don't actually look for marker
-            lbls_list.extend(lbls)
-        if i == end: raise ValueError("mismatched parenthesis")
-        i += 1
-        exponent, i = _parse_exponent(s, i, end)
-
-        if len(lbls_list) == 0:
-            to_exponentiate = _lbl.LabelTupTup(())
-        elif len(lbls_list) > 1:
-            time = max([l.time for l in lbls_list])
-            # create a layer label - a label of the labels within square brackets
-            to_exponentiate = _lbl.LabelTupTup(tuple(lbls_list)) if (time == 0.0) \
-                else _lbl.LabelTupTupWithTime(tuple(lbls_list), time)
+        cached = None
+        if memo is not None:
+            group_end = _find_group_end(s, start, end, "[", "]")
+            key = (s[start:group_end], segment)
+            cached = memo.get(key, None)
+
+        if cached is not None:
+            to_exponentiate, segment = cached
+            i = group_end
         else:
-            to_exponentiate = lbls_list[0]
+            i = start + 1
+            lbls_list = []
+            while i < end and s[i] != "]":
+                lbls, i, segment, _ = _get_next_lbls(s, i, end, create_subcircuits, integerize_sslbls, segment,
+                                                     interlayer_marker, memo)  # but don't actually look for marker
+                lbls_list.extend(lbls)
+            if i == end: raise ValueError("mismatched parenthesis")
+            i += 1
+
+            if len(lbls_list) == 0:
+                to_exponentiate = _lbl.LabelTupTup(())
+            elif len(lbls_list) > 1:
+                time = max([l.time for l in lbls_list])
+                # create a layer label - a label of the labels within square brackets
+                to_exponentiate = _lbl.LabelTupTup(tuple(lbls_list)) if (time == 0.0) \
+                    else _lbl.LabelTupTupWithTime(tuple(lbls_list), time)
+            else:
+                to_exponentiate = lbls_list[0]
+            if memo is not None and i == group_end:
+                memo[key] = (to_exponentiate, segment)
+        exponent, i = _parse_exponent(s, i, end)
         return [to_exponentiate] * exponent, i, segment, ()
 
     else:
-        lbls, i, segment = _get_next_simple_lbl(s, start, end, integerize_sslbls, segment)
+        lbls, i, segment = _get_next_simple_lbl(s, start, end, integerize_sslbls, segment, memo)
         exponent, i = _parse_exponent(s, i, end)
         return lbls * exponent, i, segment, ()
 
 
-def _get_next_simple_lbl(s, start, end, integerize_sslbls, segment):
+def _get_next_simple_lbl(s, start, end, integerize_sslbls, segment, memo=None):
     i = start
     c = s[i]
     if segment == 0 and s[i:i + 3] == 'rho':
@@ -225,15 +268,43 @@ def _get_next_simple_lbl(s, start, end, integerize_sslbls, segment):
     else:
         time = 0.0
 
+    if memo is not None:
+        key = s[start:i]
+        lbl = memo.get(key, None)
+        if lbl is not None:
+            return [lbl], i, segment
+
     if len(args) == 0:
         if len(sslbls) == 0:
-            return [_lbl.LabelStr(name, time)], i, segment
+            lbl = _lbl.LabelStr(name, time)
         elif time == 0.0:
-            return [_lbl.LabelTup((name,) + tuple(sslbls))], i, segment
+            lbl = _lbl.LabelTup((name,) + tuple(sslbls))
         else:
-            return [_lbl.LabelTupWithTime((name,) + tuple(sslbls), time)], i, segment
+            lbl = _lbl.LabelTupWithTime((name,) + tuple(sslbls), time)
     else:
-        return [_lbl.LabelTupWithArgs((name, 2 + len(args)) + tuple(args) + tuple(sslbls), time)], i, segment
+        lbl = _lbl.LabelTupWithArgs((name, 2 + len(args)) + tuple(args) + tuple(sslbls), time)
+
+    if memo is not None:
+        memo[key] = lbl
+    return [lbl], i, segment
+
+
+def _find_group_end(s, start, end, opener, closer):
+    """ Index just past the `closer` matching the `opener` at `s[start]` (or `end` if unmatched) """
+    i = start; depth = 0
+    while i < end:
+        c = s[i]
+        if c == '{':  # {...} gate names may contain parentheses
+            while i < end and s[i] != '}':
+                i += 1
+        elif c == opener:
+            depth += 1
+        elif c == closer:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return end
 
 
 def _parse_exponent(s, i, end):
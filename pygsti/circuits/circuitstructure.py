@@ -90,8 +90,9 @@ class CircuitPlaquette(_NicelySerializable):
         from pygsti.io import stdinput as _stdinput
         from pygsti.io.readers import convert_strings_to_circuits as _convert_strings_to_circuits
         std = _stdinput.StdInputParser()
-        elements = {tuple(ij): std.parse_circuit(s, create_subcircuits=not _Circuit.default_expand_subcircuits)
-                    for ij, s in state['elements']}
+        circuits = std.parse_circuits([s for _, s in state['elements']],
+                                      create_subcircuits=not _Circuit.default_expand_subcircuits)
+        elements = {tuple(ij): c for (ij, _), c in zip(state['elements'], circuits)}
 
         return cls(elements, state['num_rows'], state['num_cols'], None, None)
         # Note: parent structure pipes in op_label_aliases & circuit_rules here, so we don't serialize it
@@ -468,20 +469,30 @@ class GermFiducialPairPlaquette(FiducialPairPlaquette):
         A list of `(find,replace)` 2-tuples which specify string replacement
         rules.  Both `find` and `replace` are tuples of operation labels
         (or `Circuit` objects).
+
+    expand_germ_power : bool or "default", optional
+        When `False`, the base circuit holds the germ power as a single
+        :class:`CircuitLabel` layer, i.e. `(germ)^power`, instead of `power`
+        explicit copies of the germ (see :meth:`Circuit.repeat`).  `"default"`
+        means to use the value of `Circuit.default_expand_subcircuits`.
     """
 
-    def __init__(self, germ, power, fidpairs, num_rows=None, num_cols=None, op_label_aliases=None, circuit_rules=None):
+    def __init__(self, germ, power, fidpairs, num_rows=None, num_cols=None, op_label_aliases=None, circuit_rules=None,
+                 expand_germ_power="default"):
         """
         Create a new GermFiducialPairPlaquette.
         """
         self.germ = germ
         self.power = power
-        super().__init__(germ**power, fidpairs, num_rows, num_cols, op_label_aliases, circuit_rules)
+        self.expand_germ_power = expand_germ_power
+        base = germ.repeat(power, expand_germ_power) if power > 1 else germ.repeat(power)
+        super().__init__(base, fidpairs, num_rows, num_cols, op_label_aliases, circuit_rules)
 
     def _to_nice_serialization(self):  # memo holds already serialized objects
         state = super()._to_nice_serialization()
         state.update({'germ': self.germ.str,
                       'power': self.power,
+                      'expand_germ_power': self.expand_germ_power,
                       'fiducial_pairs': [(ij_key, fidpair[0].str, fidpair[1].str)
                                          for ij_key, fidpair in self.fidpairs.items()]
                       })
@@ -495,7 +506,8 @@ class GermFiducialPairPlaquette(FiducialPairPlaquette):
         fidpairs = {tuple(ij): (std.parse_circuit(prepfid, create_subcircuits=not _Circuit.default_expand_subcircuits),
                                 std.parse_circuit(measfid, create_subcircuits=not _Circuit.default_expand_subcircuits))
                     for ij, prepfid, measfid in state['fiducial_pairs']}
-        return cls(germ, state['power'], fidpairs, state['num_rows'], state['num_cols'], None, None)
+        return cls(germ, state['power'], fidpairs, state['num_rows'], state['num_cols'], None, None,
+                   state.get('expand_germ_power', "default"))
         # Note: parent calls _post_from_nice_serialization_init so we don't serialize op_label_aliases and circuit_rules
 
     def _post_from_nice_serialization_init(self, op_label_aliases, circuit_rules):
@@ -528,7 +540,8 @@ class GermFiducialPairPlaquette(FiducialPairPlaquette):
         updated_fidpairs = _collections.OrderedDict([(coords, (P(prep), P(meas)))
                                                      for coords, (prep, meas) in self.fidpairs.items()])
         return GermFiducialPairPlaquette(P(self.germ), self.power, updated_fidpairs,
-                                         self.num_rows, self.num_cols, updated_aliases)
+                                         self.num_rows, self.num_cols, updated_aliases,
+                                         expand_germ_power=self.expand_germ_power)
 
     def expand_aliases(self, ds_filter=None):
         """
@@ -549,7 +562,8 @@ class GermFiducialPairPlaquette(FiducialPairPlaquette):
         """
         #find & replace aliased operation labels with their expanded form
         new_germ = self.germ.replace_layers_with_aliases(self.op_label_aliases)
-        new_base = new_germ ** self.power
+        new_base = new_germ.repeat(self.power, self.expand_germ_power) if self.power > 1 \
+            else new_germ.repeat(self.power)
         new_fidpairs = _collections.OrderedDict()
         for coords, (prep, meas) in self.fidpairs.items():
             prep2 = prep.replace_layers_with_aliases(self.op_label_aliases)
@@ -557,7 +571,7 @@ class GermFiducialPairPlaquette(FiducialPairPlaquette):
             if ds_filter is None or prep2 + new_base + meas2 in ds_filter:
                 new_fidpairs[coords] = (prep2, meas2)
         return GermFiducialPairPlaquette(new_germ, self.power, new_fidpairs, self.num_rows, self.num_cols,
-                                         op_label_aliases=None)
+                                         op_label_aliases=None, expand_germ_power=self.expand_germ_power)
 
     def truncate(self, circuits_to_keep, keep_rows_cols=False):
         """
@@ -585,7 +599,8 @@ class GermFiducialPairPlaquette(FiducialPairPlaquette):
             if c in circuits_to_keep:
                 fidpairs[(i, j)] = self.fidpairs[(i, j)]
         num_rows, num_cols = (self.num_rows, self.num_cols) if keep_rows_cols else (None, None)
-        return GermFiducialPairPlaquette(self.germ, self.power, fidpairs, num_rows, num_cols, self.op_label_aliases)
+        return GermFiducialPairPlaquette(self.germ, self.power, fidpairs, num_rows, num_cols, self.op_label_aliases,
+                                         expand_germ_power=self.expand_germ_power)
 
     def copy(self):
         """
@@ -597,7 +612,7 @@ class GermFiducialPairPlaquette(FiducialPairPlaquette):
         """
         aliases = _copy.deepcopy(self.op_label_aliases) if (self.op_label_aliases is not None) else None
         return GermFiducialPairPlaquette(self.germ, self.power, self.fidpairs.copy(), self.num_rows, self.num_cols,
-                                         aliases)
+                                         aliases, expand_germ_power=self.expand_germ_power)
 
     def summary_label(self):
         if len(self.germ) == 0 or self.power == 0:
@@ -752,8 +767,8 @@ class PlaquetteGridCircuitStructure(_CircuitList):
         for p in plaquettes.values():
             p._post_from_nice_serialization_init(op_label_aliases, circuit_rules)
 
-        additional_circuits = [std.parse_circuit(s, create_subcircuits=not _Circuit.default_expand_subcircuits)
-                               for s in state['additional_circuits']]
+        additional_circuits = std.parse_circuits(state['additional_circuits'],
+                                                 create_subcircuits=not _Circuit.default_expand_subcircuits)
         circuit_weights = ({std.parse_circuit(s, create_subcircuits=not _Circuit.default_expand_subcircuits): weight
                            for s, weight in state['circuit_weights'].items()}
                            if (state['circuit_weights'] is not None) else None)
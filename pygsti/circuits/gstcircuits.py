@@ -271,7 +271,7 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
                                keep_fraction=1, keep_seed=None, include_lgst=True,
                                op_label_aliases=None, circuit_rules=None,
                                dscheck=None, action_if_missing="raise", germ_length_limits=None,
-                               verbosity=0):
+                               expand_germ_powers="default", verbosity=0):
     """
     Create a set of long-sequence GST circuit lists (including structure).
 
@@ -397,6 +397,15 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
         then the germ `('Gx',)` is only repeated using max-lengths of 1, 2,
         and 4 (whereas other germs use all the values in `max_length_list`).
 
+    expand_germ_powers : bool or "default", optional
+        When `False`, each (well-defined) germ power is held as a single
+        :class:`CircuitLabel` layer, i.e. `(germ)^power`, rather than as `power`
+        explicit copies of the germ.  Such compact circuits take much less memory
+        for long sequences, the matrix forward simulator computes their germ
+        powers (and derivatives) by repeated squaring, and they can be used
+        with data sets whose circuits are expanded.  `"default"` means to use
+        the value of `Circuit.default_expand_subcircuits`.
+
     verbosity : int, optional
         The level of output to print to stdout.
 
@@ -428,8 +437,12 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
         return filtered_circuits
 
     def add_to_plaquettes(pkey_dict, plaquette_dict, base_circuit, maxlen, germ, power,
-                          fidpair_indices, ds, missing_list):
+                          fidpair_indices, ds, missing_list, expanded_circuits):
         """ Only create a new plaquette for a new base circuit; otherwise add to existing """
+        if expanded_circuits is not None:  # drop compact circuits that are equivalent to existing ones
+            fidpair_indices = [(i, j) for i, j in fidpair_indices
+                               if _register_expanded(prep_fiducials[i] + base_circuit + meas_fiducials[j],
+                                                     expanded_circuits)]
         if ds is not None:
             inds_to_remove = []
             for k, (i, j) in enumerate(fidpair_indices):
@@ -454,7 +467,7 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
                                               op_label_aliases, circuit_rules)
             else:
                 plaq = _GermFiducialPairPlaquette(germ, power, fidpairs, len(meas_fiducials), len(prep_fiducials),
-                                                  op_label_aliases, circuit_rules)
+                                                  op_label_aliases, circuit_rules, expand_germ_powers)
             plaquette_dict[base_circuit] = plaq
         else:
             #Add to existing plaquette (assume we don't need to change number of rows/cols of plaquette)
@@ -471,7 +484,8 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
             else:
                 plaquette_dict[base_circuit] = _GermFiducialPairPlaquette(germ, power, new_fidpairs,
                                                                           len(meas_fiducials), len(prep_fiducials),
-                                                                          op_label_aliases, circuit_rules)
+                                                                          op_label_aliases, circuit_rules,
+                                                                          expand_germ_powers)
 
     printer = _VerbosityPrinter.create_printer(verbosity)
     if germ_length_limits is None: germ_length_limits = {}
@@ -518,6 +532,8 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
             fidPairDict = None
 
     truncFn = _get_trunc_function(trunc_scheme)
+    compact_germ_powers = not (_Circuit.default_expand_subcircuits if expand_germ_powers == "default"
+                               else expand_germ_powers)
 
     line_labels = germs[0].line_labels if len(germs) > 0 \
         else (prep_fiducials + meas_fiducials)[0].line_labels   # if an empty germ list, base line_labels off fiducials
@@ -531,6 +547,7 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
         running_plaquettes = _collections.OrderedDict()  # keep consistent ordering in produced circuit list.
         running_unindexed = []
         running_maxLens = []
+        running_expanded_circuits = {} if compact_germ_powers else None
 
     lsgst_structs = []  # list of circuit structures to return
     missing_list = []  # keep track of missing data if dscheck is given
@@ -552,11 +569,13 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
             plaquettes = running_plaquettes
             maxLens = running_maxLens
             unindexed = running_unindexed
+            expanded_circuits = running_expanded_circuits
         else:  # create a new cs for just this maxLen
             pkey = {}  # base-circuit => (maxlength, germ) key for final plaquette dict
             plaquettes = _collections.OrderedDict()
             maxLens = [maxLen]
             unindexed = []
+            expanded_circuits = {} if compact_germ_powers else None
 
         if maxLen == 0:
             # Special LGST case
@@ -566,8 +585,10 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
                 #Add LGST circuits as an empty-germ plaquette (and as unindexed circuits to include everything)
                 #Note: no FPR on LGST strings
                 add_to_plaquettes(pkey, plaquettes, empty_germ, maxLen, empty_germ, 1,
-                                  allPossiblePairs, dscheck, missing_list)
+                                  allPossiblePairs, dscheck, missing_list, expanded_circuits)
                 unindexed.extend(filter_ds(lgst_list, dscheck, missing_lgst))  # overlap w/plaquettes ok (removed later)
+                if expanded_circuits is not None:
+                    for c in lgst_list: _register_expanded(c, expanded_circuits)
             #Typical case of germs repeated to maxLen using r_fn
             for ii, germ in enumerate(germs):
                 if germ == empty_germ: continue  # handled specially above
@@ -585,6 +606,8 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
 
                 if power == 0 and len(germ) != 0:
                     continue
+                if power is not None and power > 1:
+                    germ_power = germ.repeat(power, expand_germ_powers)  # compact unless expanding germ powers
 
                 # Switch on fidpair dicts with germ or (germ, L) keys
                 key = germ
@@ -621,7 +644,7 @@ def create_lsgst_circuit_lists(op_label_src, prep_fiducials, meas_fiducials, ger
                          sorted(rndm.choice(nPairs, nPairsToKeep, replace=False))]
 
                 add_to_plaquettes(pkey, plaquettes, germ_power, maxLen, germ, power,
-                                  fiducialPairsThisIter, dscheck, missing_list)
+                                  fiducialPairsThisIter, dscheck, missing_list, expanded_circuits)
 
         if nest:
             # pinch off a copy of variables that were left as the running variables above
@@ -920,6 +943,38 @@ def create_elgst_experiment_list(op_label_src, germ_list, max_length_list,
                               include_lgst)[-1]
 
 
+def _register_expanded(circuit, expanded_circuits):
+    """
+    Record `circuit` in `expanded_circuits` unless an equivalent but different circuit is already there.
+
+    Circuits holding compact germ powers (:class:`CircuitLabel` layers) are different
+    dictionary keys than their expanded equivalents, so this is used to avoid including
+    the same physical circuit twice.
+
+    Parameters
+    ----------
+    circuit : Circuit
+        The circuit to register.
+
+    expanded_circuits : dict
+        A dictionary mapping the hash of each registered circuit's expanded form to a
+        list of the registered circuits with that hash.  Updated in place.
+
+    Returns
+    -------
+    bool
+        `False` if an equivalent circuit that is not equal to `circuit` was already
+        registered, `True` otherwise.
+    """
+    expanded = circuit.expand_subcircuits()
+    registered = expanded_circuits.setdefault(hash(expanded), [])
+    for c in registered:
+        if c == circuit: return True
+        if c.expand_subcircuits() == expanded: return False
+    registered.append(circuit)
+    return True
+
+
 def _get_trunc_function(trunc_scheme):
     if trunc_scheme == "whole germ powers":
         r_fn = _gsc.repeat_with_max_length
@@ -23,6 +23,7 @@ from collections import defaultdict as _defaultdict
 import numpy as _np
 
 from pygsti.circuits import circuit as _cir
+from pygsti.baseobjs.label import CircuitLabel as _CircuitLabel
 from pygsti.baseobjs import outcomelabeldict as _ld, _compatibility as _compat
 from pygsti.baseobjs.mongoserializable import MongoSerializable as _MongoSerializable
 from pygsti.tools import NamedDict as _NamedDict
@@ -998,6 +999,7 @@ class DataSet(_MongoSerializable):
 
         # uuid for efficient hashing (set when done adding data or loading from file)
         self.uuid = None
+        self._expanded_keys = {}  # compact circuit => expanded key cache (not saved/loaded from disk)
 
         #Optionally load from a file
         if file_to_load_from is not None:
@@ -1129,6 +1131,67 @@ class DataSet(_MongoSerializable):
         else:
             self.cnt_cache = None
 
+    @classmethod
+    def _create_static_view(cls, oli_data, time_data, rep_data, circuit_indices, outcome_label_indices,
+                            collision_action="aggregate", comment=None, aux_info=None):
+        """
+        Create a static DataSet that shares (does not copy or validate) the given arrays and index dictionaries.
+
+        This is used by containers like :class:`MultiDataSet` that already hold
+        validated, static-format data for many data sets over the same circuits,
+        so that handing out a member DataSet doesn't require rebuilding its
+        circuit index or re-checking its outcome indices.  The caller is responsible
+        for ensuring that the circuit index keys are :class:`Circuit` objects whose
+        values are slices into the given 1D arrays, and that none of the shared
+        objects are modified while the returned DataSet is in use.
+
+        Parameters
+        ----------
+        oli_data, time_data, rep_data : numpy.ndarray
+            1D outcome-label-index, time-stamp, and repetition-count arrays
+            (`rep_data` may be `None`).
+
+        circuit_indices : OrderedDict
+            Maps :class:`Circuit` objects to slices into the data arrays.  Shared, not copied.
+
+        outcome_label_indices : OrderedDict
+            Maps outcome labels to outcome indices.  Shared, not copied.
+
+        collision_action : {"aggregate","overwrite","keepseparate"}
+            The collision action of the returned data set.
+
+        comment : string, optional
+            A comment string.
+
+        aux_info : defaultdict, optional
+            Per-circuit auxiliary information.  Shared, not copied.
+
+        Returns
+        -------
+        DataSet
+        """
+        ds = cls.__new__(cls)
+        _MongoSerializable.__init__(ds)
+        ds.uuid = None
+        ds.cirIndex = circuit_indices
+        ds.olIndex = outcome_label_indices
+        ds.olIndex_max = max(outcome_label_indices.values()) if len(outcome_label_indices) > 0 else -1
+        ds.ol = _OrderedDict([(i, ol) for (ol, i) in outcome_label_indices.items()])
+        ds.oliData = oli_data
+        ds.timeData = time_data
+        ds.repData = rep_data
+        ds.bStatic = True
+        ds.collisionAction = collision_action
+        ds.comment = comment
+        ds.ffdata = {}
+        ds.oliType = Oindex_type
+        ds.timeType = Time_type
+        ds.repType = Repcount_type
+        ds.auxInfo = aux_info if (aux_info is not None) else _defaultdict(dict)
+        ds.cnt_cache = _defaultdict(_ld.OutcomeLabelDict)  # rows are cached lazily, as they're accessed
+        ds._expanded_keys = {}
+        return ds
+
     def __iter__(self):
         return self.cirIndex.__iter__()  # iterator over circuits
 
@@ -1152,7 +1215,36 @@ class DataSet(_MongoSerializable):
         """
         if not isinstance(circuit, _cir.Circuit):
             circuit = _cir.Circuit(circuit)
-        return circuit in self.cirIndex
+        return circuit in self.cirIndex or self._expanded_key(circuit) is not None
+
+    def _expanded_key(self, circuit):
+        """
+        Get the key of this data set matching the *expanded* form of `circuit`.
+
+        This lets circuits containing sub-circuit blocks, e.g. compact germ powers
+        created by `Circuit.repeat(n, expand=False)`, access the data taken for
+        their fully expanded equivalents.
+
+        Parameters
+        ----------
+        circuit : Circuit
+            The circuit, which is not itself a key of this data set.
+
+        Returns
+        -------
+        Circuit or None
+            The expanded circuit, or `None` if `circuit` has no sub-circuit blocks
+            or its expanded form isn't a key of this data set either.
+        """
+        expanded = self._expanded_keys.get(circuit, None)
+        if expanded is None:
+            if not any(isinstance(lbl, _CircuitLabel) for lbl in circuit.layertup):
+                return None
+            expanded = circuit.expand_subcircuits()
+        if expanded not in self.cirIndex:
+            return None
+        self._expanded_keys[circuit] = expanded
+        return expanded
 
     def __hash__(self):
         if self.uuid is not None:
@@ -1195,6 +1287,9 @@ class DataSet(_MongoSerializable):
         # needed because name-only Labels don't hash the same as strings
         # so key lookups need to be done at least with tuples of Labels.
         circuit = _cir.Circuit.cast(circuit)
+        if circuit not in self.cirIndex:  # maybe `circuit` is a compact form of one of our keys
+            expanded = self._expanded_key(circuit)
+            if expanded is not None: circuit = expanded
 
         #Note: cirIndex value is either an int (non-static) or a slice (static)
         repData = self.repData[self.cirIndex[circuit]] \
@@ -1406,6 +1501,71 @@ class DataSet(_MongoSerializable):
             nDOF += nOutcomes - 1  # last time stamp
         return nDOF
 
+    def count_arrays(self, circuits, outcome_labels):
+        """
+        Get the (time-aggregated) counts of many circuits and outcomes as arrays.
+
+        This is equivalent to, but much faster than, looking up `self[circuit].counts`
+        for each circuit, as the counts are computed from this data set's internal
+        arrays in bulk.
+
+        Parameters
+        ----------
+        circuits : list of Circuits
+            The circuits to get counts for.  These must be present in this data set.
+
+        outcome_labels : list or tuple
+            The outcome labels to get counts for.  Labels that do not appear in this
+            data set have zero counts.
+
+        Returns
+        -------
+        counts : numpy.ndarray
+            An array of shape `(len(circuits), len(outcome_labels))` giving the count
+            of each outcome for each circuit.
+
+        totals : numpy.ndarray
+            An array of length `len(circuits)` giving the total count of each circuit,
+            summed over *all* of its outcomes (not just those in `outcome_labels`).
+        """
+        row_indices = []
+        for circuit in circuits:
+            circuit = _cir.Circuit.cast(circuit)
+            if circuit not in self.cirIndex:  # maybe `circuit` is a compact form of one of our keys
+                expanded = self._expanded_key(circuit)
+                if expanded is not None: circuit = expanded
+            row_indices.append(self.cirIndex[circuit])
+
+        if self.bStatic:  # row indices are slices into 1D arrays
+            starts = _np.array([slc.start for slc in row_indices], _np.int64)
+            lengths = _np.array([slc.stop - slc.start for slc in row_indices], _np.int64)
+            offsets = _np.cumsum(lengths) - lengths
+            data_indices = _np.arange(_np.sum(lengths)) - _np.repeat(offsets - starts, lengths)
+            oli = self.oliData[data_indices]
+            reps = self.repData[data_indices] if (self.repData is not None) else None
+        else:  # row indices index lists of per-circuit arrays
+            lengths = _np.array([len(self.oliData[i]) for i in row_indices], _np.int64)
+            oli = _np.concatenate([self.oliData[i] for i in row_indices]) if len(row_indices) > 0 \
+                else _np.zeros(0, self.oliType)
+            reps = _np.concatenate([self.repData[i] for i in row_indices]) \
+                if (self.repData is not None and len(row_indices) > 0) else None
+        rows = _np.repeat(_np.arange(len(row_indices)), lengths)
+        weights = reps.astype('d') if (reps is not None) else None
+
+        column_of_oli = _np.full(max(self.olIndex.values(), default=-1) + 1, -1, _np.int64)
+        for j, ol in enumerate(outcome_labels):
+            i = self.olIndex.get(_ld.OutcomeLabelDict.to_outcome(ol), None)
+            if i is not None: column_of_oli[i] = j
+        columns = column_of_oli[oli] if len(oli) > 0 else _np.zeros(0, _np.int64)
+        present = columns >= 0
+
+        ncols = len(outcome_labels)
+        totals = _np.bincount(rows, weights, minlength=len(row_indices)).astype('d')
+        counts = _np.bincount(rows[present] * ncols + columns[present],
+                              weights[present] if (weights is not None) else None,
+                              minlength=len(row_indices) * ncols).astype('d')
+        return counts.reshape((len(row_indices), ncols)), totals
+
     def _collisionaction_update_circuit(self, circuit):
         if not isinstance(circuit, _cir.Circuit):
             circuit = _cir.Circuit(circuit)  # make sure we have a Circuit
@@ -2870,6 +3030,7 @@ class DataSet(_MongoSerializable):
 
         self.collisionAction = state_dict.get('collisionAction', 'aggregate')
         self.uuid = state_dict.get('uuid', None)
+        self._expanded_keys = {}
 
     @_deprecated_fn('write_binary')
     def save(self, file_or_filename):
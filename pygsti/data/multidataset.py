@@ -42,20 +42,7 @@ class _MultiDataSetKVIterator(object):
 
     def __next__(self):
         datasetName = next(self.oliDictIter)
-        oliData = self.multidataset.oliDict[datasetName]
-        timeData = self.multidataset.timeDict[datasetName]
-        if self.multidataset.repDict:
-            repData = self.multidataset.repDict[datasetName]
-        else:
-            repData = None
-
-        ds = _DataSet(oliData, timeData, repData,
-                      circuit_indices=self.multidataset.cirIndex,
-                      outcome_label_indices=self.multidataset.olIndex,
-                      collision_action=self.multidataset.collisionActions[datasetName],
-                      static=True, aux_info=None)
-        ds.auxInfo = self.multidataset.auxInfo  # avoids shallow-copying dict
-        return datasetName, ds
+        return datasetName, self.multidataset[datasetName]
 
     next = __next__
 
@@ -79,20 +66,7 @@ class _MultiDataSetValueIterator(object):
 
     def __next__(self):
         datasetName = next(self.oliDictIter)
-        oliData = self.multidataset.oliDict[datasetName]
-        timeData = self.multidataset.timeDict[datasetName]
-        if self.multidataset.repDict:
-            repData = self.multidataset.repDict[datasetName]
-        else:
-            repData = None
-
-        ds = _DataSet(oliData, timeData, repData,
-                      circuit_indices=self.multidataset.cirIndex,
-                      outcome_label_indices=self.multidataset.olIndex,
-                      collision_action=self.multidataset.collisionActions[datasetName],
-                      static=True, aux_info=None)
-        ds.auxInfo = self.multidataset.auxInfo  # avoids shallow-copying dict
-        return ds
+        return self.multidataset[datasetName]
 
     next = __next__
 
@@ -235,6 +209,9 @@ class MultiDataSet(object):
            a new multi data set object.
         """
 
+        # self._views : dataset names -> static DataSets sharing this object's arrays (see `__getitem__`)
+        self._views = {}
+
         #Optionally load from a file
         if file_to_load_from is not None:
             assert(oli_dict is None and time_dict is None and rep_dict is None
@@ -242,9 +219,10 @@ class MultiDataSet(object):
             self.read_binary(file_to_load_from)
             return
 
-        # self.cirIndex  :  Ordered dictionary where keys = circuits (tuples), values = integer indices into counts
+        # self.cirIndex  :  Ordered dictionary where keys = circuits, values = slices into each dataset's arrays
         if circuit_indices is not None:
-            self.cirIndex = circuit_indices
+            self.cirIndex = _OrderedDict([(opstr if isinstance(opstr, _cir.Circuit) else _cir.Circuit(opstr), slc)
+                                          for opstr, slc in circuit_indices.items()])
         else:
             self.cirIndex = None
 
@@ -338,14 +316,16 @@ class MultiDataSet(object):
         return len(self.oliDict)
 
     def __getitem__(self, dataset_name):  # return a static DataSet
-        repData = self.repDict[dataset_name] if self.repDict else None
-        ds = _DataSet(self.oliDict[dataset_name],
-                      self.timeDict[dataset_name], repData,
-                      circuit_indices=self.cirIndex,
-                      outcome_label_indices=self.olIndex, static=True,
-                      collision_action=self.collisionActions[dataset_name],
-                      aux_info=None)
-        ds.auxInfo = self.auxInfo  # avoids shallow-copying dict
+        # Static DataSets are read-only, so we hand out (and keep) views that share this
+        # object's circuit index, outcome-label index, data arrays, and auxiliary info.
+        ds = self._views.get(dataset_name, None)
+        if ds is None:
+            repData = self.repDict[dataset_name] if self.repDict else None
+            ds = _DataSet._create_static_view(self.oliDict[dataset_name], self.timeDict[dataset_name], repData,
+                                              self.cirIndex, self.olIndex,
+                                              collision_action=self.collisionActions[dataset_name],
+                                              aux_info=self.auxInfo)  # avoids shallow-copying dict
+            self._views[dataset_name] = ds
         return ds
 
     def __setitem__(self, dataset_name, dataset):
@@ -400,6 +380,10 @@ class MultiDataSet(object):
             if datasetName not in self:
                 raise ValueError("No dataset with the name '%s' exists" % datasetName)
 
+        ds = self._aggregate_with_shared_bins(dataset_names)
+        if ds is not None:
+            return ds
+
         #add data for each gate sequence to build up aggregate lists
         gstrSlices = _OrderedDict()
         agg_oli = []; agg_time = []; agg_rep = []; slc_i = 0
@@ -459,6 +443,64 @@ class MultiDataSet(object):
         ds.auxInfo = self.auxInfo  # avoids shallow-copying dict
         return ds
 
+    def _aggregate_with_shared_bins(self, dataset_names):
+        """
+        Aggregate the named datasets by summing their repetition counts, when possible.
+
+        This fast path applies when all the named datasets have identical outcome-index
+        and timestamp arrays (e.g. multiple passes of the same experiment), the circuit
+        index consists of contiguous, in-order slices, and the (time, outcome) bins within
+        each circuit are time-ordered and unique.  In this case the aggregated data set is
+        obtained by an array sum over the dataset (pass) axis and is identical to the one
+        built by the general algorithm in :meth:`datasets_aggregate`.
+
+        Parameters
+        ----------
+        dataset_names : list of strs
+            one or more (existing) dataset names.
+
+        Returns
+        -------
+        DataSet or None
+            `None` if the fast path doesn't apply.
+        """
+        first_oli = self.oliDict[dataset_names[0]]
+        first_time = self.timeDict[dataset_names[0]]
+        for datasetName in dataset_names[1:]:
+            if not (_np.array_equal(self.oliDict[datasetName], first_oli)
+                    and _np.array_equal(self.timeDict[datasetName], first_time)):
+                return None
+
+        nElements = len(first_oli)
+        lengths = []; off = 0
+        for slc in self.cirIndex.values():
+            if slc.start != off or slc.step is not None or slc.stop < slc.start: return None
+            lengths.append(slc.stop - slc.start); off = slc.stop
+        if off != nElements: return None
+
+        if nElements > 0:
+            circuit_ids = _np.repeat(_np.arange(len(lengths)), lengths)
+            same_circuit = circuit_ids[1:] == circuit_ids[:-1]
+            if _np.any(first_time[1:][same_circuit] < first_time[:-1][same_circuit]):
+                return None  # times are not sorted within each circuit
+            sorted_inds = _np.lexsort((first_oli, first_time, circuit_ids))
+            dups = ((circuit_ids[sorted_inds][1:] == circuit_ids[sorted_inds][:-1])
+                    & (first_time[sorted_inds][1:] == first_time[sorted_inds][:-1])
+                    & (first_oli[sorted_inds][1:] == first_oli[sorted_inds][:-1]))
+            if _np.any(dups): return None  # duplicate (time, outcome) bins would need merging
+
+        if self.repDict:
+            agg_rep = _np.sum([self.repDict[datasetName] for datasetName in dataset_names],
+                              axis=0, dtype=self.repType)
+        else:
+            agg_rep = _np.full(nElements, len(dataset_names), self.repType)
+        if nElements == 0 or _np.max(agg_rep) == 1: agg_rep = None  # don't store trivial reps
+
+        return _DataSet._create_static_view(_np.asarray(first_oli, self.oliType).copy(),
+                                            _np.asarray(first_time, self.timeType).copy(), agg_rep,
+                                            self.cirIndex, self.olIndex, aux_info=self.auxInfo)
+        # leave collision_action as default "aggregate"
+
     def add_dataset(self, dataset_name, dataset, update_auxinfo=True):
         """
         Add a DataSet to this MultiDataSet.
@@ -491,6 +533,8 @@ class MultiDataSet(object):
         if self.cirIndex is not None and set(dataset.cirIndex.keys()) != set(self.cirIndex.keys()):
             raise ValueError("Cannot add dataset: circuits do not match")
 
+        self._views.clear()  # data arrays and/or indices may change below, so existing views could become stale
+
         if self.cirIndex is None:
             self.cirIndex = dataset.cirIndex.copy()  # copy b/c we may modify our cirIndex later
 
@@ -501,6 +545,7 @@ class MultiDataSet(object):
         ds_oliData = dataset.oliData  # default - just use dataset's outcome indices as is...
         update_map = {}  # default - no updates needed
         if dataset.olIndex != self.olIndex:
+            self.olIndex = self.olIndex.copy()  # don't modify an index that may be shared with existing views
             next_olIndex = max(self.olIndex.values()) + 1
             for ol, i in dataset.olIndex.items():
                 if ol not in self.olIndex:  # then add a new outcome label
@@ -564,6 +609,7 @@ class MultiDataSet(object):
 
             #sort keys in order of increasing slice-start position (w.r.t. self)
             sorted_cirIndex = sorted(list(self.cirIndex.items()), key=lambda x: x[1].start)
+            self.cirIndex = self.cirIndex.copy()  # don't modify an index that may be shared with existing views
 
             off = 0
             for opstr, slc in sorted_cirIndex:
@@ -654,6 +700,7 @@ class MultiDataSet(object):
         return toPickle
 
     def __setstate__(self, state_dict):
+        self._views = {}
         cirIndexKeys = [cgs.expand() for cgs in state_dict['cirIndexKeys']]
         self.cirIndex = _OrderedDict(list(zip(cirIndexKeys, state_dict['cirIndexVals'])))
         self.olIndex = state_dict['olIndex']
@@ -756,6 +803,7 @@ class MultiDataSet(object):
             f = file_or_filename
 
         state_dict = _pickle.load(f)
+        self._views = {}
 
         def expand(x):
             """ Expand a comproessed circuit """
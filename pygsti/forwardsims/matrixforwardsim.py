@@ -37,6 +37,7 @@ _dummy_profiler = _DummyProfiler()
 _PSMALL = 1e-100
 _DSMALL = 1e-100
 _HSMALL = 1e-100
+_PSMALL_SINGLE = 1e-30  # single-precision products underflow near 1e-38
 
 
 class SimpleMatrixForwardSimulator(_ForwardSimulator):
@@ -667,6 +668,14 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         this can be a 0-, 1- or 2-tuple of integers or `None` values.  A block size of `None`
         means that there should be no division into blocks, and that each block processor
         computes all of its parameter indices at once.
+
+    precision : {"double", "single"}, optional
+        The floating point precision of the product and product-derivative caches used to compute
+        outcome probabilities and their first derivatives.  `"single"` halves the memory used by
+        these caches and roughly doubles the throughput of the underlying matrix products, at the
+        cost of probabilities that are only accurate to about 1e-7.  This can be useful during the
+        early iterations of an optimization (see :class:`CustomLMOptimizer`), which are far from
+        converged anyway.  Hessians and :meth:`bulk_product` always use double precision.
     """
 
     @classmethod
@@ -687,13 +696,29 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         return super()._array_types_for_method(method_name)
 
     def __init__(self, model=None, distribute_by_timestamp=False, num_atoms=None, processor_grid=None,
-                 param_blk_sizes=None):
+                 param_blk_sizes=None, precision="double"):
         super().__init__(model, num_atoms, processor_grid, param_blk_sizes)
         self._mode = "distribute_by_timestamp" if distribute_by_timestamp else "time_independent"
+        self.precision = precision
+
+    @property
+    def precision(self):
+        """
+        The floating point precision (`"double"` or `"single"`) of the product caches.
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, value):
+        if value not in ("double", "single"):
+            raise ValueError("Invalid `precision`: %s" % str(value))
+        self._precision = value
+        self._cache_dtype = 'd' if value == "double" else 'f'
 
     def _to_nice_serialization(self):
         state = super()._to_nice_serialization()
         state.update({'mode': self._mode,
+                      'precision': self._precision,
                       # (don't serialize parent model or processor distribution info)
                       })
         return state
@@ -701,7 +726,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
     @classmethod
     def _from_nice_serialization(cls, state):
         #Note: resets processor-distribution information
-        return cls(None, state['mode'] == "distribute_by_timestamp")
+        return cls(None, state['mode'] == "distribute_by_timestamp", precision=state.get('precision', "double"))
 
     def copy(self):
         """
@@ -711,14 +736,15 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         -------
         MatrixForwardSimulator
         """
-        return MatrixForwardSimulator(self.model)
+        return MatrixForwardSimulator(self.model, precision=self._precision)
 
-    def _compute_product_cache(self, layout_atom_tree, resource_alloc):
+    def _compute_product_cache(self, layout_atom_tree, resource_alloc, dtype='d'):
         """
         Computes an array of operation sequence products (process matrices).
 
         Note: will *not* parallelize computation:  parallelization should be
-        done at a higher level.
+        done at a higher level.  The products are stored using `dtype`, whereas
+        the (logarithmic) scale factors are always double precision.
         """
         dim = self.model.evotype.minimal_dim(self.model.state_space)
 
@@ -729,8 +755,9 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
 
         eval_tree = layout_atom_tree
         cacheSize = len(eval_tree)
-        prodCache = _np.zeros((cacheSize, dim, dim), 'd')
+        prodCache = _np.zeros((cacheSize, dim, dim), dtype)
         scaleCache = _np.zeros(cacheSize, 'd')
+        psmall = _PSMALL if prodCache.dtype == _np.float64 else _PSMALL_SINGLE
 
         for iDest, iRight, iLeft in eval_tree:
 
@@ -755,7 +782,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
             prodCache[iDest] = _np.dot(L, R)
             scaleCache[iDest] = scaleCache[iLeft] + scaleCache[iRight]
 
-            if prodCache[iDest].max() < _PSMALL and prodCache[iDest].min() > -_PSMALL:
+            if prodCache[iDest].max() < psmall and prodCache[iDest].min() > -psmall:
                 nL, nR = max(_nla.norm(L), _np.exp(-scaleCache[iLeft]),
                              1e-300), max(_nla.norm(R), _np.exp(-scaleCache[iRight]), 1e-300)
                 sL, sR = L / nL, R / nR
@@ -771,7 +798,8 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
                                 resource_alloc=None, wrt_slice=None, profiler=None):
         """
         Computes a tree of product derivatives in a linear cache space. Will
-        use derivative columns to parallelize computation.
+        use derivative columns to parallelize computation.  The derivatives
+        are stored using the same data type as `prod_cache`.
         """
 
         if profiler is None: profiler = _dummy_profiler
@@ -829,7 +857,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         ## ------------------------------------------------------------------
 
         tSerialStart = _time.time()
-        dProdCache = _np.zeros((cacheSize,) + deriv_shape)
+        dProdCache = _np.zeros((cacheSize,) + deriv_shape, prod_cache.dtype)
         wrtIndices = _slct.indices(wrt_slice) if (wrt_slice is not None) else None
 
         for iDest, iRight, iLeft in eval_tree:
@@ -1411,7 +1439,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         resource_alloc.check_can_allocate_memory(layout_atom.cache_size * dim**2)  # prod cache
 
         #Fill cache info
-        prodCache, scaleCache = self._compute_product_cache(layout_atom.tree, resource_alloc)
+        prodCache, scaleCache = self._compute_product_cache(layout_atom.tree, resource_alloc, self._cache_dtype)
 
         if not resource_alloc.is_host_leader:
             # (same as "if resource_alloc.host_comm is not None and resource_alloc.host_comm.rank != 0")
@@ -1437,6 +1465,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
             #  to the the element indices when `spamtuple` is used.
             # (Note: *don't* set dest_indices arg = layout.element_slice, as this is already done by caller)
             rho, E = self._rho_e_from_spam_tuple(spam_tuple)
+            rho, E = rho.astype(prodCache.dtype, copy=False), E.astype(prodCache.dtype, copy=False)
             _fas(array_to_fill, [element_indices],
                  self._probs_from_rho_e(rho, E, Gs[tree_indices], scaleVals[tree_indices]))
         _np.seterr(**old_err)
@@ -1444,7 +1473,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
     def _bulk_fill_dprobs_atom(self, array_to_fill, dest_param_slice, layout_atom, param_slice, resource_alloc):
         dim = self.model.evotype.minimal_dim(self.model.state_space)
         resource_alloc.check_can_allocate_memory(layout_atom.cache_size * dim * dim * _slct.length(param_slice))
-        prodCache, scaleCache = self._compute_product_cache(layout_atom.tree, resource_alloc)
+        prodCache, scaleCache = self._compute_product_cache(layout_atom.tree, resource_alloc, self._cache_dtype)
         dProdCache = self._compute_dproduct_cache(layout_atom.tree, prodCache, scaleCache,
                                                   resource_alloc, param_slice)
         if not resource_alloc.is_host_leader:
@@ -1457,6 +1486,7 @@ class MatrixForwardSimulator(_DistributableForwardSimulator, SimpleMatrixForward
         old_err = _np.seterr(over='ignore')
         for spam_tuple, (element_indices, tree_indices) in layout_atom.indices_by_spamtuple.items():
             rho, E = self._rho_e_from_spam_tuple(spam_tuple)
+            rho, E = rho.astype(prodCache.dtype, copy=False), E.astype(prodCache.dtype, copy=False)
             _fas(array_to_fill, [element_indices, dest_param_slice], self._dprobs_from_rho_e(
                 spam_tuple, rho, E, Gs[tree_indices], dGs[tree_indices], scaleVals[tree_indices], param_slice))
 
@@ -12,11 +12,16 @@ Serialization routines to/from a meta.json based directory
 
 import numpy as _np
 import scipy.sparse as _sps
+import contextlib as _contextlib
 import importlib as _importlib
+import itertools as _itertools
 import json as _json
+import os as _os
 import pathlib as _pathlib
 import pickle as _pickle
 import warnings as _warnings
+import weakref as _weakref
+from collections import OrderedDict as _OrderedDict
 
 try:
     from bson.objectid import ObjectId as _ObjectId
@@ -26,9 +31,311 @@ except ImportError:
 from pygsti.io import readers as _load
 from pygsti.io import writers as _write
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
+from pygsti.circuits.circuit import Circuit as _Circuit
+from pygsti.circuits.circuitlist import CircuitList as _CircuitList
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 
 QUICK_LOAD_MAX_SIZE = 10 * 1024  # 10 kilobytes
+EXTERNAL_ARRAY_MIN_SIZE = None  # when an int, 'serialized-object' members store arrays this large in .npy files
+LAZY_LOAD_CACHE_SIZE = 16  # max. number of lazily-loaded members held in memory at once (see `lazy_loading`)
+LAZY_LOAD_TYPES = ('serialized-object', 'numpy-array', 'pickle')  # aux-file types that can be lazily loaded
+CIRCUIT_TABLE_FILENAME = 'circuit_table.npz'  # file (within a root 'edesign' dir) holding a tree's circuit table
+
+_lazy_load_min_size = None  # file size (in bytes) above which members are lazily loaded; set by `lazy_loading`
+
+
+class _LRUCache(object):
+    """
+    A simple least-recently-used cache of at most `LAZY_LOAD_CACHE_SIZE` items.
+    """
+
+    def __init__(self):
+        self._items = _OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        """ Get the value for `key` (which must be present), marking it as most-recently used. """
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key, val):
+        """ Add `key` to this cache, evicting the least-recently used items if needed. """
+        self._items[key] = val
+        self._items.move_to_end(key)
+        while len(self._items) > max(LAZY_LOAD_CACHE_SIZE, 1):
+            self._items.popitem(last=False)
+
+    def discard(self, key):
+        """ Remove `key` from this cache if it's present. """
+        self._items.pop(key, None)
+
+    def clear(self):
+        """ Remove all the items from this cache. """
+        self._items.clear()
+
+
+_lazy_member_cache = _LRUCache()
+_lazy_member_keys = _itertools.count()
+
+
+class LazyAuxMember(object):
+    """
+    A placeholder for an aux-file member that is only loaded (de-serialized) when it's used.
+
+    Attribute access, indexing, iteration, etc., on this object (and `isinstance` checks) are
+    forwarded to the loaded object, which is loaded upon first use.  Loaded objects are held in a
+    module-wide least-recently-used cache of at most `LAZY_LOAD_CACHE_SIZE` objects, so that
+    browsing through large trees of lazily-loaded objects uses a bounded amount of memory.  Note
+    that this means an object that has been evicted from the cache is re-loaded from disk the next
+    time it's used.  Setting or deleting an attribute or item of this placeholder therefore *pins*
+    the loaded object (removes it from the cache and holds it here), so that the modification is
+    kept.  Modifications made through other references to (parts of) the loaded object are not
+    detected, so lazily-loaded members should otherwise be treated as *read-only*.
+
+    Objects of this type are created by :func:`load_meta_based_dir` within a :func:`lazy_loading`
+    context.
+
+    Parameters
+    ----------
+    loader : function
+        A function taking no arguments that loads and returns the member's value.
+    """
+    __slots__ = ('_lazy_key', '_lazy_loader', '_lazy_post_load_fns', '_lazy_pinned', '__weakref__')
+
+    def __init__(self, loader):
+        object.__setattr__(self, '_lazy_key', next(_lazy_member_keys))
+        object.__setattr__(self, '_lazy_loader', loader)
+        object.__setattr__(self, '_lazy_post_load_fns', [])
+        object.__setattr__(self, '_lazy_pinned', None)  # a 1-tuple holding the loaded object once it's pinned
+        _weakref.finalize(self, _lazy_member_cache.discard, self._lazy_key)
+
+    def _lazy_load(self):
+        if self._lazy_pinned is not None:
+            return self._lazy_pinned[0]
+        if self._lazy_key in _lazy_member_cache:
+            return _lazy_member_cache.get(self._lazy_key)
+        val = self._lazy_loader()
+        for fn in self._lazy_post_load_fns:
+            fn(val)
+        _lazy_member_cache.put(self._lazy_key, val)
+        return val
+
+    def _lazy_pin(self):
+        """ Load this member and hold on to it, so that it's never re-loaded (and modifications aren't lost). """
+        val = self._lazy_load()
+        object.__setattr__(self, '_lazy_pinned', (val,))
+        _lazy_member_cache.discard(self._lazy_key)
+        return val
+
+    @property
+    def __class__(self):
+        return self._lazy_load().__class__
+
+    def __getattr__(self, name):
+        return getattr(self._lazy_load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._lazy_pin(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._lazy_pin(), name)
+
+    def __setitem__(self, key, value):
+        self._lazy_pin()[key] = value
+
+    def __delitem__(self, key):
+        del self._lazy_pin()[key]
+
+    def __repr__(self):
+        return repr(self._lazy_load())
+
+    def __str__(self):
+        return str(self._lazy_load())
+
+    def __bool__(self):
+        return bool(self._lazy_load())
+
+    def __hash__(self):
+        return hash(self._lazy_load())
+
+    def __array__(self, *args, **kwargs):
+        return _np.asarray(self._lazy_load()).__array__(*args, **kwargs)
+
+    def __reduce_ex__(self, protocol):
+        return self._lazy_load().__reduce_ex__(protocol)  # so copying & pickling act on the loaded object
+
+
+def _create_forwarding_method(name):
+    def forward(self, *args):
+        return getattr(self._lazy_load(), name)(*args)
+    forward.__name__ = name
+    return forward
+
+
+for _name in ('__len__', '__iter__', '__contains__', '__getitem__', '__call__',
+              '__eq__', '__ne__', '__lt__', '__le__', '__gt__', '__ge__', '__neg__', '__abs__',
+              '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__', '__truediv__', '__rtruediv__',
+              '__matmul__', '__rmatmul__', '__pow__', '__float__', '__int__', '__complex__'):
+    setattr(LazyAuxMember, _name, _create_forwarding_method(_name))
+
+
+@_contextlib.contextmanager
+def lazy_loading(min_size=QUICK_LOAD_MAX_SIZE):
+    """
+    A context within which large aux-file members are loaded lazily.
+
+    Within this context, :func:`load_meta_based_dir` (and so the `from_dir` methods of pyGSTi's
+    experiment design, data, and results objects) returns :class:`LazyAuxMember` placeholders for
+    members of types `LAZY_LOAD_TYPES` whose files are at least `min_size` bytes.  These are loaded
+    when first used (which may be after this context has exited), so that, e.g., the names of the
+    results and estimates within a large results directory can be listed, and a report built from a
+    subset of them, without loading every model and confidence-region factory it contains.
+
+    Parameters
+    ----------
+    min_size : int, optional
+        The minimum size, in bytes, of a member's file for it to be loaded lazily.
+
+    Returns
+    -------
+    None
+    """
+    global _lazy_load_min_size
+    prev_min_size = _lazy_load_min_size
+    _lazy_load_min_size = min_size
+    try:
+        yield
+    finally:
+        _lazy_load_min_size = prev_min_size
+
+
+def _apply_when_loaded(obj, fn):
+    """
+    Call `fn(obj)` now, or if `obj` is a :class:`LazyAuxMember`, each time it's (re-)loaded.
+
+    Parameters
+    ----------
+    obj : object
+        The object, which may be a lazily-loaded placeholder.
+
+    fn : function
+        A function taking the (loaded) object as its only argument.
+
+    Returns
+    -------
+    None
+    """
+    if type(obj) is LazyAuxMember:
+        obj._lazy_post_load_fns.append(fn)
+        if obj._lazy_pinned is not None:
+            fn(obj._lazy_pinned[0])
+        elif obj._lazy_key in _lazy_member_cache:
+            fn(_lazy_member_cache.get(obj._lazy_key))
+    else:
+        fn(obj)
+
+
+class _CircuitTable(object):
+    """
+    A content-addressed table of the unique circuits in an experiment-design tree.
+
+    Circuits are stored in a compact binary (".npz") form: each distinct layer label and
+    line-label tuple is written once, as a string, and each circuit is a sequence of integer
+    layer ids.  The circuit lists of a tree's nodes are then stored as arrays of indices into
+    this table (see :meth:`ExperimentDesign.write`).
+
+    Parameters
+    ----------
+    circuits : iterable, optional
+        The circuits to initially add to the table.
+
+    path : str or Path, optional
+        The ".npz" file this table is written to.
+    """
+
+    def __init__(self, circuits=(), path=None):
+        self.circuits = []
+        self.path = _pathlib.Path(path) if (path is not None) else None
+        self._index = {}
+        for c in circuits: self.add(c)
+
+    def add(self, circuit):
+        """ Add `circuit` to this table (if it isn't already present) and return its index. """
+        key = (circuit, circuit.str)  # Circuit equality ignores label times, but the string doesn't
+        i = self._index.get(key, None)
+        if i is None:
+            i = self._index[key] = len(self.circuits)
+            self.circuits.append(circuit)
+        return i
+
+    def write(self, path=None):
+        """ Write this table to the ".npz" file `path` (by default, this table's `path`). """
+        layer_ids = {}; line_label_ids = {}; extras = {}
+        ids = []; offsets = [0]; circuit_line_label_ids = []
+        for i, c in enumerate(self.circuits):
+            for lbl in c.layertup:
+                # key on the label's string, as label equality ignores times (which are serialized)
+                ids.append(layer_ids.setdefault(str(lbl), (len(layer_ids), lbl))[0])
+            offsets.append(len(ids))
+            circuit_line_label_ids.append(line_label_ids.setdefault(c.line_labels, len(line_label_ids)))
+            if c.occurrence is not None or len(c._compilable_layer_indices_tup) > 0:
+                extras[str(i)] = (c.occurrence, c._compilable_layer_indices_tup[1:])
+
+        layer_strs = [_Circuit((lbl,), expand_subcircuits=False).str for _, lbl in layer_ids.values()]
+        _np.savez(str(path if (path is not None) else self.path), layers=_np.array(layer_strs, dtype=str),
+                  line_labels=_np.array([_json.dumps(list(ll)) for ll in line_label_ids], dtype=str),
+                  layer_ids=_np.array(ids, dtype=_np.int32), offsets=_np.array(offsets, dtype=_np.int64),
+                  line_label_ids=_np.array(circuit_line_label_ids, dtype=_np.int32),
+                  extras=_np.array(_json.dumps(extras)))
+
+    @classmethod
+    def read(cls, path):
+        """ Read a table from the ".npz" file `path`, reusing the last table read if the file is unchanged. """
+        global _last_read_circuit_table
+        path = _pathlib.Path(path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if _last_read_circuit_table is not None and _last_read_circuit_table[0] == key:
+            return _last_read_circuit_table[1]
+
+        with _np.load(str(path)) as f:
+            layers = [_Circuit(s, expand_subcircuits=False).layertup[0] for s in f['layers'].tolist()]
+            line_labels = [tuple(_json.loads(s)) for s in f['line_labels'].tolist()]
+            ids = f['layer_ids'].tolist(); offsets = f['offsets'].tolist()
+            circuit_line_label_ids = f['line_label_ids'].tolist()
+            extras = _json.loads(str(f['extras']))
+
+        ret = cls()
+        for i, (start, end, j) in enumerate(zip(offsets[:-1], offsets[1:], circuit_line_label_ids)):
+            layertup = tuple([layers[k] for k in ids[start:end]])
+            if str(i) in extras:
+                occurrence, compilable_layer_indices = extras[str(i)]
+                c = _Circuit(layertup, line_labels[j], occurrence=occurrence, expand_subcircuits=False,
+                             compilable_layer_indices=tuple(compilable_layer_indices)
+                             if len(compilable_layer_indices) > 0 else None)
+            else:
+                c = _Circuit._fastinit(layertup, line_labels[j], False)
+            ret.circuits.append(c)
+        _last_read_circuit_table = (key, ret)
+        return ret
+
+
+_last_read_circuit_table = None  # (file key, table) of the most recently read table, shared by a tree's nodes
+
+
+def _write_circuits_to_table(root_dir, filenm, circuits, circuit_table):
+    # Add `circuits` to `circuit_table` and write their indices to a separate file
+    _np.save(str(root_dir / (filenm + '_circuit_indices.npy')),
+             _np.array([circuit_table.add(c) for c in circuits], dtype=_np.int64))
+    return {'circuit_table': _os.path.relpath(str(circuit_table.path), str(root_dir)).replace(_os.sep, '/')}
+
+
+def _read_circuits_from_table(root_dir, filenm, metadata):
+    table = _CircuitTable.read(root_dir / metadata['circuit_table'])
+    indices = _np.load(str(root_dir / (filenm + '_circuit_indices.npy')))
+    return [table.circuits[i] for i in indices.tolist()]
 
 
 #Class-name utils...
@@ -180,7 +487,7 @@ def load_meta_based_dir(root_dir, auxfile_types_member='auxfile_types',
         return ret
 
 
-def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
+def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load, allow_lazy=True):
     subtypes = typ.split(':')
     cur_typ = subtypes[0]
     next_typ = ':'.join(subtypes[1:])
@@ -273,6 +580,14 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
         else:
             assert(False), "Should not get here!"
 
+    elif isinstance(metadata, dict) and 'circuit_table' in metadata:  # circuits stored in a circuit table
+        if should_skip_loading(root_dir / (filenm + '_circuit_indices.npy')):
+            val = None
+        else:
+            val = _read_circuits_from_table(root_dir, filenm, metadata)
+            if 'circuit_list_name' in metadata:
+                val = _CircuitList(val, name=metadata['circuit_list_name'])
+
     else:
         #Simple types that just load the given file
         ext = _get_auxfile_ext(cur_typ)
@@ -286,6 +601,9 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
 
         if should_skip_loading(pth):
             val = None  # load 'None' instead of actual data (skip loading this file)
+        elif allow_lazy and cur_typ in LAZY_LOAD_TYPES and _lazy_load_min_size is not None \
+                and pth.stat().st_size >= _lazy_load_min_size:
+            val = LazyAuxMember(lambda: _load_auxfile_member(root_dir, filenm, typ, metadata, False, False)[1])
         elif cur_typ == 'reset':  # 'reset' doesn't write and loads in as None
             val = None  # no file exists for this member
         elif cur_typ == 'text-circuit-list':
@@ -312,7 +630,8 @@ def _load_auxfile_member(root_dir, filenm, typ, metadata, quick_load):
     return True, val  # loading successful - 2nd element is value loaded
 
 
-def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None):
+def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None, external_array_min_size=None,
+                         circuit_table=None):
     """
     Write a dictionary of quantities to a directory.
 
@@ -344,6 +663,18 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
         object is often stored as in the "type" field of meta.json when the_model
         objects .__dict__ is used as `valuedict`.
 
+    external_array_min_size : int, optional
+        Arrays with at least this many elements within members serialized as
+        'serialized-object' aux-files are written to separate binary ".npy" files
+        (see :meth:`NicelySerializable.write`) that are lazily loaded when read back in.
+        If `None`, the value of `pygsti.io.metadir.EXTERNAL_ARRAY_MIN_SIZE` is used,
+        which by default is `None` and disables this behavior.
+
+    circuit_table : _CircuitTable, optional
+        If not None, members serialized as circuit lists are added to this table of
+        unique circuits and stored as indices into it (see :meth:`ExperimentDesign.write`).
+        Writing the table itself is left to the caller.
+
     Returns
     -------
     None
@@ -353,6 +684,8 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
 
     if auxfile_types is None:
         auxfile_types = valuedict['auxfile_types']
+    if external_array_min_size is None:
+        external_array_min_size = EXTERNAL_ARRAY_MIN_SIZE
 
     meta = {}
     if init_meta: meta.update(init_meta)
@@ -370,13 +703,17 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
     #Wait to write meta.json until the end, since
     # aux-types may utilize it too.
 
+    # Load any lazily-loaded members before writing anything, as they may be loaded from the files being written
+    auxvals = {auxnm: _load_lazy_members(valuedict[auxnm]) for auxnm, typ in auxfile_types.items()
+               if typ not in ('none', 'reset')}
+
     for auxnm, typ in auxfile_types.items():
         if typ in ('none', 'reset'):  # these types aren't written at all
             continue
-        val = valuedict[auxnm]
+        val = auxvals[auxnm]
 
         try:
-            auxmeta = _write_auxfile_member(root_dir, auxnm, typ, val)
+            auxmeta = _write_auxfile_member(root_dir, auxnm, typ, val, external_array_min_size, circuit_table)
         except Exception as e:
             _warnings.warn("FAILED to write aux file member %s w/format %s:" % (auxnm, typ))
             raise e
@@ -389,7 +726,23 @@ def write_meta_based_dir(root_dir, valuedict, auxfile_types=None, init_meta=None
         _json.dump(meta, f)
 
 
-def _write_auxfile_member(root_dir, filenm, typ, val):
+def _load_lazy_members(val):
+    """
+    Returns `val` with any :class:`LazyAuxMember` placeholders (within lists and dicts) replaced by their loaded values.
+
+    This is needed before writing values to disk, since a placeholder may load its value from
+    a file that is overwritten (and so first truncated) by the write.
+    """
+    if type(val) is LazyAuxMember:
+        return val._lazy_load()
+    elif type(val) in (list, tuple):
+        return type(val)([_load_lazy_members(v) for v in val])
+    elif type(val) in (dict, _OrderedDict):
+        return type(val)([(k, _load_lazy_members(v)) for k, v in val.items()])
+    return val
+
+
+def _write_auxfile_member(root_dir, filenm, typ, val, external_array_min_size=None, circuit_table=None):
     subtypes = typ.split(':')
     cur_typ = subtypes[0]
     next_typ = ':'.join(subtypes[1:])
@@ -399,7 +752,8 @@ def _write_auxfile_member(root_dir, filenm, typ, val):
             metadata = []
             for i, el in enumerate(val):
                 filenm_so_far = filenm + str(i)
-                meta = _write_auxfile_member(root_dir, filenm_so_far, next_typ, el)
+                meta = _write_auxfile_member(root_dir, filenm_so_far, next_typ, el, external_array_min_size,
+                                             circuit_table)
                 metadata.append(meta)
         else:
             metadata = None
@@ -409,7 +763,8 @@ def _write_auxfile_member(root_dir, filenm, typ, val):
             metadata = {}
             for k, v in val.items():
                 filenm_so_far = filenm + "_" + k
-                meta = _write_auxfile_member(root_dir, filenm_so_far, next_typ, v)
+                meta = _write_auxfile_member(root_dir, filenm_so_far, next_typ, v, external_array_min_size,
+                                             circuit_table)
                 metadata[k] = meta
         else:
             metadata = None
@@ -419,7 +774,8 @@ def _write_auxfile_member(root_dir, filenm, typ, val):
             metadata = []
             for i, (k, v) in enumerate(val.items()):
                 filenm_so_far = filenm + "_kvpair" + str(i)
-                meta = _write_auxfile_member(root_dir, filenm_so_far, next_typ, v)
+                meta = _write_auxfile_member(root_dir, filenm_so_far, next_typ, v, external_array_min_size,
+                                             circuit_table)
                 metadata.append((k, meta))
         else:
             metadata = None
@@ -434,6 +790,12 @@ def _write_auxfile_member(root_dir, filenm, typ, val):
             pass
         elif cur_typ in ('none', 'reset'):  # explicitly don't get written
             pass  # and really we shouldn't ever get here since we short circuit in auxmember loop
+        elif circuit_table is not None and cur_typ == 'text-circuit-list':
+            metadata = _write_circuits_to_table(root_dir, filenm, val, circuit_table)
+        elif circuit_table is not None and cur_typ == 'serialized-object' and type(val) is _CircuitList \
+                and not (val.op_label_aliases or val.circuit_rules or val.circuit_weights is not None):
+            metadata = _write_circuits_to_table(root_dir, filenm, val, circuit_table)
+            metadata['circuit_list_name'] = val.name
         elif cur_typ == 'text-circuit-list':
             _write.write_circuit_list(pth, val)
         elif cur_typ == 'dir-serialized-object':
@@ -443,7 +805,7 @@ def _write_auxfile_member(root_dir, filenm, typ, val):
         elif cur_typ == 'serialized-object':
             assert(isinstance(val, _NicelySerializable)), \
                 "Non-nicely-serializable '%s' object given for a 'serialized-object' auxfile type!" % (str(type(val)))
-            val.write(pth)
+            val.write(pth, external_array_min_size=external_array_min_size)
         elif cur_typ == 'circuit-str-json':
             _write.write_circuit_strings(pth, val)
         elif cur_typ == 'numpy-array':
@@ -505,7 +867,8 @@ def _obj_to_meta_json(obj, dirname):
 
 
 def write_obj_to_meta_based_dir(obj, dirname, auxfile_types_member, omit_attributes=(),
-                                include_attributes=None, additional_meta=None):
+                                include_attributes=None, additional_meta=None, external_array_min_size=None,
+                                circuit_table=None):
     """
     Write the contents of `obj` to `dirname` using a 'meta.json' file and an auxfile-types dictionary.
 
@@ -541,6 +904,13 @@ def write_obj_to_meta_based_dir(obj, dirname, auxfile_types_member, omit_attribu
         A dictionary of additional meta-data to be included in the 'meta.json' file
         (but that isn't an attribute of `obj`).
 
+    external_array_min_size : int, optional
+        Arrays with at least this many elements within 'serialized-object' members
+        are written to separate, lazily-loaded, ".npy" files.  See :func:`write_meta_based_dir`.
+
+    circuit_table : _CircuitTable, optional
+        A table of unique circuits that circuit-list members are written to.  See
+        :func:`write_meta_based_dir`.
 
     Returns
     -------
@@ -569,7 +939,8 @@ def write_obj_to_meta_based_dir(obj, dirname, auxfile_types_member, omit_attribu
         vals = obj.__dict__
         auxtypes = obj.__dict__[auxfile_types_member]
 
-    write_meta_based_dir(dirname, vals, auxtypes, init_meta=meta)
+    write_meta_based_dir(dirname, vals, auxtypes, init_meta=meta, external_array_min_size=external_array_min_size,
+                         circuit_table=circuit_table)
 
 
 def _read_json_or_pkl_files_to_dict(dirname):
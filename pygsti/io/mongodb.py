@@ -26,6 +26,7 @@ from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySeri
 from pygsti.baseobjs.mongoserializable import MongoSerializable as _MongoSerializable
 from pygsti.baseobjs.mongoserializable import RecursiveRemovalSpecification as _RecursiveRemovalSpecification
 from pygsti.baseobjs.mongoserializable import WriteOpsByCollection as _WriteOpsByCollection
+from pygsti.baseobjs.mongoserializable import compute_content_hash as _compute_content_hash
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 
 
@@ -80,7 +81,7 @@ def read_auxtree_from_mongodb(mongodb, collection_name, doc_id, auxfile_types_me
         directly from the main document were serialized.
     """
     doc = mongodb[collection_name].find_one({'_id': doc_id})
-    return read_auxtree_from_mongodb_doc(mongodb, collection_name, doc, auxfile_types_member,
+    return read_auxtree_from_mongodb_doc(mongodb, doc, auxfile_types_member,
                                          ignore_meta, separate_auxfiletypes, quick_load)
 
 
@@ -140,11 +141,18 @@ def read_auxtree_from_mongodb_doc(mongodb, doc, auxfile_types_member='auxfile_ty
         if key in ignore_meta: continue
         ret[key] = val
 
+    #Retrieve all the auxiliary documents referenced by `doc` using one query per collection
+    auxdoc_ids = {}
+    for key, typ in doc[auxfile_types_member].items():
+        if key in ignore_meta: continue
+        _collect_auxdoc_ids(typ, doc.get(key, None), auxdoc_ids)
+    prefetched_docs = _prefetch_auxdocs(mongodb, auxdoc_ids)
+
     for key, typ in doc[auxfile_types_member].items():
         if key in ignore_meta: continue  # don't load -> members items in ignore_meta
 
         bLoaded, val = _load_auxdoc_member(mongodb, key, typ,
-                                           doc.get(key, None), quick_load)
+                                           doc.get(key, None), quick_load, prefetched_docs)
         if bLoaded:
             ret[key] = val
         elif val is True:  # val is value of whether to set value to None
@@ -157,7 +165,47 @@ def read_auxtree_from_mongodb_doc(mongodb, doc, auxfile_types_member='auxfile_ty
         return ret
 
 
-def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
+def _collect_auxdoc_ids(typ, metadata, auxdoc_ids):
+    """ Accumulate the (collection name, id) pairs of the documents an aux-doc member is stored in """
+    subtypes = typ.split(':')
+    cur_typ = subtypes[0]
+    next_typ = ':'.join(subtypes[1:])
+
+    if metadata is None:
+        return
+    elif cur_typ == 'list':
+        for meta in metadata:
+            _collect_auxdoc_ids(next_typ, meta, auxdoc_ids)
+    elif cur_typ == 'dict':
+        for meta in metadata.values():
+            _collect_auxdoc_ids(next_typ, meta, auxdoc_ids)
+    elif cur_typ == 'fancykeydict':
+        for _, meta in metadata:
+            _collect_auxdoc_ids(next_typ, meta, auxdoc_ids)
+    elif cur_typ == 'text-circuit-list':
+        auxdoc_ids.setdefault(metadata['collection_name'], []).extend(metadata['ids'])
+    elif cur_typ in ('dir-serialized-object', 'partialdir-serialized-object', 'serialized-object',
+                     'circuit-str-json', 'numpy-array', 'json', 'pickle'):
+        auxdoc_ids.setdefault(metadata['collection_name'], []).append(metadata['id'])
+
+
+def _prefetch_auxdocs(mongodb, auxdoc_ids, batch_size=1000):
+    """ Retrieve documents by collection name & id in batches, returning a dict keyed by (collection, id) """
+    prefetched = {}
+    for collection_name, ids in auxdoc_ids.items():
+        for i in range(0, len(ids), batch_size):
+            for aux_doc in mongodb[collection_name].find({'_id': {'$in': ids[i:i + batch_size]}}):
+                prefetched[collection_name, aux_doc['_id']] = aux_doc
+    return prefetched
+
+
+def _find_auxdoc(mongodb, collection_name, doc_id, prefetched_docs):
+    if prefetched_docs is not None and (collection_name, doc_id) in prefetched_docs:
+        return prefetched_docs[collection_name, doc_id]
+    return mongodb[collection_name].find_one(doc_id)
+
+
+def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load, prefetched_docs=None):
     from pymongo import ASCENDING, DESCENDING
     subtypes = typ.split(':')
     cur_typ = subtypes[0]
@@ -176,7 +224,7 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
             for i, meta in enumerate(metadata):
                 membernm_so_far = member_name + str(i)
                 bLoaded, el = _load_auxdoc_member(mongodb, membernm_so_far,
-                                                  next_typ, meta, quick_load)
+                                                  next_typ, meta, quick_load, prefetched_docs)
                 if bLoaded:
                     val.append(el)
                 else:
@@ -192,7 +240,7 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
                 membernm_so_far = member_name + "_" + k
                 meta = metadata.get(k, None)
                 bLoaded, v = _load_auxdoc_member(mongodb, membernm_so_far,
-                                                 next_typ, meta, quick_load)
+                                                 next_typ, meta, quick_load, prefetched_docs)
                 if bLoaded:
                     val[k] = v
                 else:
@@ -207,7 +255,7 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
             for i, (k, meta) in enumerate(keymeta_pairs):
                 membernm_so_far = member_name + "_kvpair" + str(i)
                 bLoaded, el = _load_auxdoc_member(mongodb, membernm_so_far,
-                                                  next_typ, meta, quick_load)
+                                                  next_typ, meta, quick_load, prefetched_docs)
                 if bLoaded:
                     if isinstance(k, list): k = tuple(k)  # convert list-type keys -> tuples
                     val[k] = el
@@ -232,47 +280,46 @@ def _load_auxdoc_member(mongodb, member_name, typ, metadata, quick_load):
             # value was None and we do nothing here
             val = None
         elif cur_typ == 'text-circuit-list':
-            coll = mongodb[metadata['collection_name']]
             circuit_doc_ids = metadata['ids']
 
             circuit_strs = []
             for circuit_doc_id in circuit_doc_ids:
-                cdoc = coll.find_one(circuit_doc_id)
+                cdoc = _find_auxdoc(mongodb, metadata['collection_name'], circuit_doc_id, prefetched_docs)
                 circuit_strs.append(cdoc['circuit_str'])
             val = _load.convert_strings_to_circuits(circuit_strs)
 
         elif cur_typ == 'dir-serialized-object':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = _find_auxdoc(mongodb, metadata['collection_name'], metadata['id'], prefetched_docs)
             val = _MongoSerializable.from_mongodb_doc(mongodb, metadata['collection_name'],
                                                       obj_doc, quick_load=quick_load)
 
         elif cur_typ == 'partialdir-serialized-object':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = _find_auxdoc(mongodb, metadata['collection_name'], metadata['id'], prefetched_docs)
             val = _MongoSerializable.from_mongodb_doc(mongodb, metadata['collection_name'],
                                                       obj_doc, quick_load=quick_load, load_data=False)
 
         elif cur_typ == 'serialized-object':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = _find_auxdoc(mongodb, metadata['collection_name'], metadata['id'], prefetched_docs)
             val = _MongoSerializable.from_mongodb_doc(mongodb, metadata['collection_name'], obj_doc)
 
         elif cur_typ == 'circuit-str-json':
-            obj_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            obj_doc = _find_auxdoc(mongodb, metadata['collection_name'], metadata['id'], prefetched_docs)
             val = _load.convert_strings_to_circuits(obj_doc['circuit_str_json'])
 
         elif typ == 'numpy-array':
-            array_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            array_doc = _find_auxdoc(mongodb, metadata['collection_name'], metadata['id'], prefetched_docs)
             if array_doc is not None:
                 assert(array_doc['auxdoc_type'] == cur_typ)
                 val = _pickle.loads(array_doc['numpy_array_data'])
 
         elif typ == 'json':
-            json_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            json_doc = _find_auxdoc(mongodb, metadata['collection_name'], metadata['id'], prefetched_docs)
             if json_doc is not None:
                 assert(json_doc['auxdoc_type'] == cur_typ)
                 val = json_doc['json_data']
 
         elif typ == 'pickle':
-            pkl_doc = mongodb[metadata['collection_name']].find_one(metadata['id'])
+            pkl_doc = _find_auxdoc(mongodb, metadata['collection_name'], metadata['id'], prefetched_docs)
             if pkl_doc is not None:
                 assert(pkl_doc['auxdoc_type'] == cur_typ)
                 val = _pickle.loads(pkl_doc['pickle_data'])
@@ -730,9 +777,11 @@ def _write_auxdoc_member(mongodb, write_ops, parent_collection_name, parent_id,
         elif cur_typ == 'numpy-array':
             member_id = {'parent_collection': parent_collection_name, 'parent': parent_id, 'member_name': member_name}
             val_doc = member_id.copy()
+            data = _pickle.dumps(val, protocol=2)
             val_doc.update({'auxdoc_type': cur_typ,
-                            'numpy_array_data': _Binary(_pickle.dumps(val, protocol=2), subtype=128)})
-            val_id = write_ops.add_one_op('pygsti_arrays', member_id, val_doc, overwrite_existing, mongodb)
+                            'numpy_array_data': _Binary(data, subtype=128)})
+            val_id = write_ops.add_one_op('pygsti_arrays', member_id, val_doc, overwrite_existing, mongodb,
+                                          content_hash=_compute_content_hash(data))
             metadata = {'collection_name': 'pygsti_arrays', 'id': val_id}
 
         elif typ == 'json':
@@ -747,9 +796,11 @@ def _write_auxdoc_member(mongodb, write_ops, parent_collection_name, parent_id,
         elif typ == 'pickle':
             member_id = {'parent_collection': parent_collection_name, 'parent': parent_id, 'member_name': member_name}
             val_doc = member_id.copy()
+            data = _pickle.dumps(val, protocol=2)
             val_doc.update({'auxdoc_type': cur_typ,
-                            'pickle_data': _Binary(_pickle.dumps(val, protocol=2), subtype=128)})
-            val_id = write_ops.add_one_op('pygsti_pickle_data', member_id, val_doc, overwrite_existing, mongodb)
+                            'pickle_data': _Binary(data, subtype=128)})
+            val_id = write_ops.add_one_op('pygsti_pickle_data', member_id, val_doc, overwrite_existing, mongodb,
+                                          content_hash=_compute_content_hash(data))
             metadata = {'collection_name': 'pygsti_pickle_data', 'id': val_id}
         else:
             raise ValueError("Invalid aux-file type: %s" % typ)
@@ -10,8 +10,10 @@ Functions for loading GST objects from text files.
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import hashlib as _hashlib
 import os as _os
 import pathlib as _pathlib
+import pickle as _pickle
 import warnings as _warnings
 import json as _json
 
@@ -23,6 +25,8 @@ from pygsti import circuits as _circuits
 from pygsti import data as _data
 from pygsti.tools.legacytools import deprecate as _deprecated_fn
 
+DATASET_CACHE_VERSION = 2  # version of the format used by read_dataset's incremental cache files
+
 
 @_deprecated_fn('read_dataset')
 def load_dataset(filename, cache=False, collision_action="aggregate",
@@ -49,11 +53,14 @@ def read_dataset(filename, cache=False, collision_action="aggregate",
         The name of the file
 
     cache : bool, optional
-        When set to True, a pickle file with the name filename + ".cache"
-        is searched for and loaded instead of filename if it exists
-        and is newer than filename.  If no cache file exists or one
-        exists but it is older than filename, a cache file will be
-        written after loading from filename.
+        When set to True, a cache file with the name filename + ".cache"
+        holding the already-parsed data (in binary form) is used to avoid
+        re-parsing filename.  The cache records how much of filename it
+        holds along with a checksum of that part of the file.  If the file
+        hasn't changed the cached data is returned; if lines have only been
+        appended to it, just the new lines are parsed and added to the cached
+        data.  Otherwise filename is parsed in its entirety.  The cache file
+        is (re-)written whenever it is out of date.
 
     collision_action : {"aggregate", "keepseparate"}
         Specifies how duplicate circuits should be handled.  "aggregate"
@@ -63,10 +70,7 @@ def read_dataset(filename, cache=False, collision_action="aggregate",
     record_zero_counts : bool, optional
         Whether zero-counts are actually recorded (stored) in the returned
         DataSet.  If False, then zero counts are ignored, except for potentially
-        registering new outcome labels.  When reading from a cache file
-        (using `cache==True`) this argument is ignored: the presence of zero-
-        counts is dictated by the value of `record_zero_counts` when the cache file
-        was created.
+        registering new outcome labels.
 
     ignore_zero_count_lines : bool, optional
         Whether circuits for which there are no counts should be ignored
@@ -103,30 +107,37 @@ def read_dataset(filename, cache=False, collision_action="aggregate",
         bToStdout = (printer.verbosity > 0 and printer.filename is None)
 
         if cache:
-            #bReadCache = False
             cache_filename = filename + ".cache"
-            if _os.path.exists(cache_filename) and \
-               _os.path.getmtime(filename) < _os.path.getmtime(cache_filename):
-                try:
+            parse_options = {'collision_action': collision_action, 'record_zero_counts': record_zero_counts,
+                             'ignore_zero_count_lines': ignore_zero_count_lines, 'with_times': with_times}
+            file_size = _os.path.getsize(filename)
+            cached = _read_dataset_cache(cache_filename, filename, parse_options)
+            parser = _stdinput.StdInputParser()
+
+            if cached is not None:
+                cached_ds, cached_offset, cached_lines, checksum = cached
+                if cached_offset == file_size:
                     printer.log("Reading from cache file: %s" % cache_filename)
-                    ds = _data.DataSet(file_to_load_from=cache_filename)
-                    return ds
-                except: print("WARNING: Failed to load from cache file")  # pragma: no cover
+                    cached_ds.done_adding_data()
+                    return cached_ds
+                printer.log("Reading from cache file: %s and parsing %d appended bytes"
+                            % (cache_filename, file_size - cached_offset))
             else:
-                printer.log("Cache file not found or is tool old -- one will"
+                printer.log("Cache file not found or out of date -- one will "
                             + "be created after loading is completed")
-
-            # otherwise must use standard dataset file format
-            parser = _stdinput.StdInputParser()
-            ds = parser.parse_datafile(filename, bToStdout,
-                                       collision_action=collision_action,
-                                       record_zero_counts=record_zero_counts,
-                                       ignore_zero_count_lines=ignore_zero_count_lines,
-                                       with_times=with_times)
-
-            printer.log("Writing cache file (to speed future loads): %s"
-                        % cache_filename)
-            ds.save(cache_filename)
+                cached_ds, cached_offset, cached_lines, checksum = None, 0, 0, _hashlib.sha256()
+
+            def write_cache(dataset, complete_offset, complete_lines):
+                # The final circuit's data may continue in appended lines, so only the data before it is cached
+                if cached_ds is None or complete_offset > cached_offset:
+                    printer.log("Writing cache file (to speed future loads): %s"
+                                % cache_filename)
+                    _write_dataset_cache(cache_filename, dataset, complete_offset, complete_lines,
+                                         checksum.hexdigest(), parse_options)
+
+            ds, _, _ = parser._parse_datafile(filename, bToStdout, dataset=cached_ds, start_offset=cached_offset,
+                                              start_line=cached_lines, checksum=checksum, prefix_callback=write_cache,
+                                              **parse_options)
         else:
             # otherwise must use standard dataset file format
             parser = _stdinput.StdInputParser()
@@ -138,6 +149,70 @@ def read_dataset(filename, cache=False, collision_action="aggregate",
         return ds
 
 
+def _file_checksum(filename, num_bytes):
+    """ A sha256 hash object holding the checksum of the first `num_bytes` bytes of a file """
+    checksum = _hashlib.sha256()
+    with open(filename, 'rb') as f:
+        remaining = num_bytes
+        while remaining > 0:
+            chunk = f.read(min(remaining, 2**24))
+            if len(chunk) == 0: break
+            checksum.update(chunk)
+            remaining -= len(chunk)
+    return checksum
+
+
+def _read_dataset_cache(cache_filename, filename, parse_options):
+    """
+    Read an incremental data set cache file written by :func:`_write_dataset_cache`.
+
+    Returns `(dataset, offset, num_lines, checksum)` if the cache file exists, was created
+    using `parse_options` and holds the data of an unchanged initial part (the first `offset`
+    bytes and `num_lines` lines) of `filename`.  `dataset` is non-static, so that data may be
+    added to it, and `checksum` is a sha256 hash object of the first `offset` bytes of
+    `filename`.  Otherwise returns `None`.
+    """
+    if not _os.path.exists(cache_filename):
+        return None
+    try:
+        with open(cache_filename, 'rb') as f:
+            cache_info = _pickle.load(f)
+            if not isinstance(cache_info, dict) or cache_info.get('cache_version', None) != DATASET_CACHE_VERSION \
+               or cache_info['parse_options'] != parse_options \
+               or cache_info['offset'] > _os.path.getsize(filename):
+                return None  # cache is of an older format, for different options, or for a shorter file
+            checksum = _file_checksum(filename, cache_info['offset'])
+            if cache_info['checksum'] != checksum.hexdigest():
+                return None  # the cached part of the file has changed
+            ds = _data.DataSet()
+            ds.read_binary(f)
+    except Exception:
+        _warnings.warn("Failed to load from cache file %s" % cache_filename)
+        return None
+    return ds, cache_info['offset'], cache_info['num_lines'], checksum
+
+
+def _write_dataset_cache(cache_filename, dataset, offset, num_lines, checksum, parse_options):
+    """
+    Write an incremental data set cache file.
+
+    The cache file holds `dataset`, the (non-static) parsed data of the first `offset` bytes
+    (and `num_lines` lines) of a data set file, in DataSet's binary format preceded by a header
+    recording `offset`, `num_lines`, `parse_options` and `checksum`, the hex digest of a sha256
+    checksum of the parsed part of the file.
+    """
+    cache_info = {'cache_version': DATASET_CACHE_VERSION,
+                  'parse_options': parse_options,
+                  'offset': offset,
+                  'num_lines': num_lines,
+                  'checksum': checksum}
+    tmp_filename = cache_filename + ".tmp"
+    with open(tmp_filename, 'wb') as f:
+        _pickle.dump(cache_info, f)
+        dataset.write_binary(f)
+    _os.replace(tmp_filename, cache_filename)  # so an interrupted write never leaves a corrupt cache file
+
+
 @_deprecated_fn('read_multidataset')
 def load_multidataset(filename, cache=False, collision_action="aggregate",
                       record_zero_counts=True, verbosity=1):
@@ -365,6 +440,21 @@ def convert_strings_to_circuits(obj):
     from pygsti.circuits import Circuit as _Circuit
     std = _stdinput.StdInputParser()
 
+    def _collect_strs(x, strs):
+        if isinstance(x, (list, tuple)):
+            for el in (x[1:] if (len(x) > 0 and x[0] == 'dict_items') else x):
+                _collect_strs(el, strs)
+        elif isinstance(x, dict):
+            for k, v in x.items():
+                _collect_strs(k, strs); _collect_strs(v, strs)
+        elif isinstance(x, str):
+            strs.append(x)
+        return strs
+
+    #Parse all the strings in a single (bulk) call, then substitute them back into `obj`
+    strs = _collect_strs(obj, [])
+    circuits = dict(zip(strs, std.parse_circuits(strs, create_subcircuits=not _Circuit.default_expand_subcircuits)))
+
     def _replace_strs_with_circuits(x):
         if isinstance(x, (list, tuple)):
             if len(x) > 0 and x[0] == 'dict_items':  # then convert this list into a dictionary
@@ -374,7 +464,7 @@ def convert_strings_to_circuits(obj):
         if isinstance(x, dict):  # this case isn't written anymore - just to read old-format files (TODO REMOVE LATER)
             return {_replace_strs_with_circuits(k): _replace_strs_with_circuits(v) for k, v in x.items()}
         if isinstance(x, str):
-            return std.parse_circuit(x, create_subcircuits=not _Circuit.default_expand_subcircuits)
+            return circuits[x]
         return x
 
     return _replace_strs_with_circuits(obj)
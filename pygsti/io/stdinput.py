@@ -120,20 +120,74 @@ class StdInputParser(object):
         if circuit is None:  # wasn't in cache
             layer_tuple, line_lbls, occurrence_id, compilable_indices = \
                 self.parse_circuit_raw(s, lookup, create_subcircuits)
-            if line_lbls is None:  # if there are no line labels then we need to use "auto" and do a full init
-                circuit = _Circuit(layer_tuple, stringrep=s, line_labels="auto",
-                                   expand_subcircuits=False, check=False, occurrence=occurrence_id,
-                                   compilable_layer_indices=compilable_indices)
-                #Note: never expand subcircuits since parse_circuit_raw already does this w/create_subcircuits arg
-            else:
-                circuit = _Circuit._fastinit(layer_tuple, line_lbls, editable=False,
-                                             name='', stringrep=s, occurrence=occurrence_id,
-                                             compilable_layer_indices=compilable_indices)
+            circuit = self._create_circuit(s, layer_tuple, line_lbls, occurrence_id, compilable_indices)
 
             if self.use_global_parse_cache:
                 _global_parse_cache[create_subcircuits][s] = circuit
         return circuit
 
+    def parse_circuits(self, strings, lookup=None, create_subcircuits=True, line_labels="auto"):
+        """
+        Parse many circuits from a list of strings.
+
+        This is equivalent to calling :meth:`parse_circuit` on each string but
+        is much faster for large lists: all the strings are parsed in a single call
+        to the underlying (Cython) parser, which parses each distinct string once and
+        memoizes repeated substrings (e.g. fiducials and germ powers) so that the
+        resulting circuits share their label objects.
+
+        Parameters
+        ----------
+        strings : iterable
+            The strings to parse.
+
+        lookup : dict, optional
+            A dictionary with keys == reflbls and values == tuples of operation labels
+            which can be used for substitutions using the S<reflbl> syntax.
+
+        create_subcircuits : bool, optional
+            Whether to create sub-circuit-labels when parsing
+            string representations or to just expand these into non-subcircuit
+            labels.
+
+        line_labels : iterable, optional
+            The line labels used to initialize circuits whose strings don't
+            specify any.  If `'auto'`, then line labels are taken to be the
+            list of all state-space labels present in each circuit's layers.
+
+        Returns
+        -------
+        list of Circuits
+            The parsed circuits, in the same order as `strings`.
+        """
+        if lookup is None:
+            lookup = dict()
+        strings = list(strings)
+        use_cache = self.use_global_parse_cache and line_labels == "auto"  # cache assumes "auto" behavior
+        circuits = _global_parse_cache[create_subcircuits] if use_cache else dict()
+        to_parse = [s for s in dict.fromkeys(strings) if s not in circuits]  # unique & un-cached, in order
+
+        self._circuit_parser.lookup = lookup
+        parsed = self._circuit_parser.parse_many(to_parse, create_subcircuits)
+        for s, (layer_tuple, line_lbls, occurrence_id, compilable_indices) in zip(to_parse, parsed):
+            circuits[s] = self._create_circuit(s, layer_tuple, line_lbls, occurrence_id, compilable_indices,
+                                               line_labels)
+        return [circuits[s] for s in strings]
+
+    @staticmethod
+    def _create_circuit(s, layer_tuple, line_lbls, occurrence_id, compilable_indices, default_line_labels="auto"):
+        """ Create a static :class:`Circuit` from the parsed pieces of its string representation `s` """
+        if line_lbls is None and default_line_labels != "auto":
+            line_lbls = default_line_labels
+        if line_lbls is None:  # if there are no line labels then we need to use "auto" and do a full init
+            return _Circuit(layer_tuple, stringrep=s, line_labels="auto",
+                            expand_subcircuits=False, check=False, occurrence=occurrence_id,
+                            compilable_layer_indices=compilable_indices)
+            #Note: never expand subcircuits since parse_circuit_raw already does this w/create_subcircuits arg
+        return _Circuit._fastinit(layer_tuple, line_lbls, editable=False,
+                                  name='', stringrep=s, occurrence=occurrence_id,
+                                  compilable_layer_indices=compilable_indices)
+
     def parse_circuit_raw(self, s, lookup=None, create_subcircuits=True):
         """
         Parse a circuit's constituent pieces from a string.
@@ -313,30 +367,10 @@ class StdInputParser(object):
         list of Circuits
             The circuits read from the file.
         """
-        circuit_list = []
         with open(filename, 'r') as stringfile:
-            for line in stringfile:
-                line = line.strip()
-                if len(line) == 0 or line[0] == '#': continue
-                if line_labels == "auto":
-                    # can be cached, and cache assumes "auto" behavior
-                    circuit = self.parse_circuit(line, {}, create_subcircuits)
-                else:
-                    layer_lbls, parsed_line_lbls, occurrence_id, compilable_indices = \
-                        self.parse_circuit_raw(line, {}, create_subcircuits)
-                    if parsed_line_lbls is None:
-                        parsed_line_lbls = line_labels  # default to the passed-in argument
-                        #nlines = num_lines
-                    #else: nlines = None  # b/c we've got a valid line_lbls
-                    circuit = _Circuit._fastinit(layer_lbls, parsed_line_lbls, editable=False,
-                                                 name='', stringrep=line.strip(), occurrence=occurrence_id,
-                                                 compilable_layer_indices=compilable_indices)
-                    #circuit = _Circuit(layer_lbls, stringrep=line.strip(),
-                    #                        line_labels=parsed_line_lbls, num_lines=nlines,
-                    #                        expand_subcircuits=False, check=False, occurrence=occurrence_id)
-                    ##Note: never expand subcircuits since parse_circuit_raw already does this w/create_subcircuits arg
-                circuit_list.append(circuit)
-        return circuit_list
+            lines = [line.strip() for line in stringfile]
+        lines = [line for line in lines if len(line) > 0 and line[0] != '#']
+        return self.parse_circuits(lines, {}, create_subcircuits, line_labels)
 
     def parse_dictfile(self, filename):
         """
@@ -402,6 +436,51 @@ class StdInputParser(object):
         DataSet
             A static DataSet object.
         """
+        dataset, _, _ = self._parse_datafile(filename, show_progress, collision_action, record_zero_counts,
+                                             ignore_zero_count_lines, with_times)
+        return dataset
+
+    def _parse_datafile(self, filename, show_progress=True, collision_action="aggregate", record_zero_counts=True,
+                        ignore_zero_count_lines=True, with_times="auto", dataset=None, start_offset=0,
+                        start_line=0, checksum=None, prefix_callback=None):
+        """
+        Parse (part of) a data set file, possibly adding its data to an existing DataSet.
+
+        Arguments are the same as for :meth:`parse_datafile` with the following additions.
+
+        Parameters
+        ----------
+        dataset : DataSet, optional
+            A *non-static* data set to add the parsed data to.  If None, a new
+            data set is created from the file's preamble.
+
+        start_offset : int, optional
+            The byte offset at which to begin reading data lines.  This should be
+            the start of a line that begins a new circuit (the preamble is always read).
+
+        start_line : int, optional
+            The line number of the line at `start_offset`, used in messages.
+
+        checksum : hashlib hash object, optional
+            A hash of the first `start_offset` bytes of the file, which is updated
+            with the bytes of the file up to `complete_offset` (see below).
+
+        prefix_callback : function, optional
+            If not None, called as `prefix_callback(dataset, complete_offset, complete_lines)`
+            when `dataset` (still non-static) holds the data of exactly the fully-parsed
+            circuit records, i.e. before the data of any final record that may be extended
+            by lines appended to the file is added.
+
+        Returns
+        -------
+        dataset : DataSet
+            The (now static) data set containing the parsed data.
+        complete_offset : int
+            The byte offset just past the last fully-parsed circuit record, i.e. one that
+            cannot be extended by data appended to the file.  Parsing may resume here.
+        complete_lines : int
+            The number of lines preceding `complete_offset`.
+        """
 
         #Parse preamble -- lines beginning with # or ## until first non-# line
         preamble_directives = {}
@@ -467,20 +546,28 @@ class StdInputParser(object):
             _os.chdir(orig_cwd)
 
         #Read data lines of data file
-        dataset = _DataSet(outcome_labels=outcomeLabels, collision_action=collision_action,
-                           comment="\n".join(preamble_comments))
+        if dataset is None:
+            dataset = _DataSet(outcome_labels=outcomeLabels, collision_action=collision_action,
+                               comment="\n".join(preamble_comments))
 
-        if dbID is not None:
-            dataset._dbcoordinates = (_DataSet.collection_name, dbID)
+            if dbID is not None:
+                dataset._dbcoordinates = (_DataSet.collection_name, dbID)
 
         if outcome_labels_specified_in_preamble and (fixed_column_outcome_labels is not None):
             fixed_column_outcome_indices = [dataset.olIndex[ol] for ol in fixed_column_outcome_labels]
         else:
             fixed_column_outcome_indices = None
 
+        def read_lines(datafile):  # yields (line, byte offset after line) for lines after start_offset
+            datafile.seek(start_offset)
+            offset = start_offset
+            for raw_line in datafile:
+                offset += len(raw_line)
+                yield raw_line, offset
+
         nLines = 0
-        with open(filename, 'r') as datafile:
-            nLines = sum(1 for line in datafile)
+        with open(filename, 'rb') as datafile:
+            nLines = sum(1 for line in read_lines(datafile))
         nSkip = int(nLines / 100.0)
         if nSkip == 0: nSkip = 1
 
@@ -505,6 +592,58 @@ class StdInputParser(object):
                                 % (filename, i_line, comment))
             return commentDict
 
+        def add_count_line(circuit, valueList, commentDict, labels_only=False):
+            if 'BAD' in valueList:  # entire line is known to be BAD => no data for this circuit
+                oliArray = _np.zeros(0, dataset.oliType)
+                countArray = _np.zeros(0, dataset.repType)
+            else:
+                if fixed_column_outcome_labels is not None:
+                    if outcome_labels_specified_in_preamble:
+                        outcome_indices, count_values = \
+                            zip(*[(oli, v) for (oli, v) in zip(fixed_column_outcome_indices, valueList)
+                                  if v != '--'])  # drop "empty" sentinels
+                    else:
+                        outcome_labels, count_values = \
+                            zip(*[(nm, v) for (nm, v) in zip(fixed_column_outcome_labels, valueList)
+                                  if v != '--'])  # drop "empty" sentinels
+                        dataset.add_outcome_labels(outcome_labels, update_ol=False)
+                        outcome_indices = [dataset.olIndex[ol] for ol in outcome_labels]
+
+                else:  # assume valueList is a list of (outcomeLabel, count) tuples -- see parse_dataline
+                    outcome_labels, count_values = zip(*valueList) if len(valueList) else ([], [])
+                    if not outcome_labels_specified_in_preamble:
+                        dataset.add_outcome_labels(outcome_labels, update_ol=False)
+                    outcome_indices = [dataset.olIndex[ol] for ol in outcome_labels]
+
+                if labels_only: return  # an ignored zero-count line, which still registers its outcome labels
+
+                # When reading in time-independent data (all at a single time), order (sort)
+                # the counts according to outcome index to make it easier to compare datarows.
+                assert len(set(outcome_indices)) == len(outcome_indices), "Duplicate fixed column!"
+                if len(outcome_indices) > 0:  # sort count values by outcome index unless there aren't any
+                    outcome_indices, count_values = zip(*sorted(zip(outcome_indices, count_values)))
+
+                oliArray = _np.array(outcome_indices, dataset.oliType)
+                countArray = _np.array(count_values, dataset.repType)
+
+            #Call this low-level function for performance, so need to construct outcome *index* arrays above
+            dataset.add_count_arrays(circuit, oliArray, countArray,
+                                     record_zero_counts=record_zero_counts, aux=commentDict)
+
+        # When a `prefix_callback` is given, the data of the lines after `complete_offset` is only added to
+        # `dataset` (and these lines are only hashed into `checksum`) once their circuit record is complete.
+        pending_adds = []; pending_lines = []
+
+        def add_data(add_fn, *args, **kwargs):
+            if prefix_callback is None: add_fn(*args, **kwargs)
+            else: pending_adds.append((add_fn, args, kwargs))
+
+        def complete_pending():
+            for add_fn, args, kwargs in pending_adds: add_fn(*args, **kwargs)
+            if checksum is not None:
+                for raw_line in pending_lines: checksum.update(raw_line)
+            pending_adds.clear(); pending_lines.clear()
+
         last_circuit = last_commentDict = None
 
         #REMOVE DEBUG
@@ -512,11 +651,19 @@ class StdInputParser(object):
         #comm = MPI.COMM_WORLD
         #debug_circuit_elements = 0; debug_test_simple_dict = {}; circuit_bytes = 0; sizeof_bytes = 0
 
-        with open(filename, 'r') as inputfile:
-            for (iLine, line) in enumerate(inputfile):
-                if iLine % nSkip == 0 or iLine + 1 == nLines: display_progress(iLine + 1, nLines, filename)
-
-                line = line.strip()
+        complete_offset, complete_lines = start_offset, start_line
+        line_end_offset, line_is_terminated = start_offset, True
+        with open(filename, 'rb') as inputfile:
+            for (iLine, (raw_line, line_end_offset)) in enumerate(read_lines(inputfile), start=start_line):
+                if looking_for == "circuit_line" and line_is_terminated:  # all previous lines are fully processed
+                    complete_offset, complete_lines = line_end_offset - len(raw_line), iLine
+                    complete_pending()
+                if checksum is not None: pending_lines.append(raw_line)
+                line_is_terminated = raw_line.endswith(b'\n')
+                if (iLine - start_line) % nSkip == 0 or iLine - start_line + 1 == nLines:
+                    display_progress(iLine - start_line + 1, nLines, filename)
+
+                line = raw_line.decode('utf-8').strip()
                 if '#' in line:
                     i = line.index('#')
                     dataline, comment = line[:i], line[i + 1:]
@@ -534,8 +681,8 @@ class StdInputParser(object):
                         # section), so add it with zero counts (if we don't ignore it), and look for next circuit.
                         looking_for = "circuit_line"
                         if ignore_zero_count_lines is False and last_circuit is not None:
-                            dataset.add_count_list(last_circuit, [], [], aux=last_commentDict,
-                                                   record_zero_counts=record_zero_counts, update_ol=False, unsafe=True)
+                            add_data(dataset.add_count_list, last_circuit, [], [], aux=last_commentDict,
+                                     record_zero_counts=record_zero_counts, update_ol=False, unsafe=True)
 
                 if looking_for == "circuit_line":
                     if len(dataline) == 0: continue
@@ -554,43 +701,19 @@ class StdInputParser(object):
                                           "'with_times=True'") % (filename, iLine))
 
                     if with_times is False or len(valueList) > 0:
-                        if 'BAD' in valueList:  # entire line is known to be BAD => no data for this circuit
-                            oliArray = _np.zeros(0, dataset.oliType)
-                            countArray = _np.zeros(0, dataset.repType)
+                        if 'BAD' in valueList:
                             count_values = []
+                        elif fixed_column_outcome_labels is not None:
+                            count_values = [v for v in valueList if v != '--']  # drop "empty" sentinels
                         else:
-                            if fixed_column_outcome_labels is not None:
-                                if outcome_labels_specified_in_preamble:
-                                    outcome_indices, count_values = \
-                                        zip(*[(oli, v) for (oli, v) in zip(fixed_column_outcome_indices, valueList)
-                                              if v != '--'])  # drop "empty" sentinels
-                                else:
-                                    outcome_labels, count_values = \
-                                        zip(*[(nm, v) for (nm, v) in zip(fixed_column_outcome_labels, valueList)
-                                              if v != '--'])  # drop "empty" sentinels
-                                    dataset.add_outcome_labels(outcome_labels, update_ol=False)
-                                    outcome_indices = [dataset.olIndex[ol] for ol in outcome_labels]
-
-                            else:  # assume valueList is a list of (outcomeLabel, count) tuples -- see parse_dataline
-                                outcome_labels, count_values = zip(*valueList) if len(valueList) else ([], [])
-                                if not outcome_labels_specified_in_preamble:
-                                    dataset.add_outcome_labels(outcome_labels, update_ol=False)
-                                outcome_indices = [dataset.olIndex[ol] for ol in outcome_labels]
-
-                            # When reading in time-independent data (all at a single time), order (sort)
-                            # the counts according to outcome index to make it easier to compare datarows.
-                            assert len(set(outcome_indices)) == len(outcome_indices), "Duplicate fixed column!"
-                            if len(outcome_indices) > 0:  # sort count values by outcome index unless there aren't any
-                                outcome_indices, count_values = zip(*sorted(zip(outcome_indices, count_values)))
-
-                            oliArray = _np.array(outcome_indices, dataset.oliType)
-                            countArray = _np.array(count_values, dataset.repType)
+                            count_values = [v for (ol, v) in valueList]
 
                         if all([(abs(v) < 1e-9) for v in count_values]):
                             if ignore_zero_count_lines is True:
                                 if not ('BAD' in valueList):  # supress "no data" warning for known-bad circuits
                                     s = circuit.str if len(circuit.str) < 40 else circuit.str[0:37] + "..."
                                     warnings.append("Dataline for circuit '%s' has zero counts and will be ignored" % s)
+                                    add_data(add_count_line, circuit, valueList, commentDict, labels_only=True)
                                 continue  # skip lines in dataset file with zero counts (no experiments done)
                             else:
                                 #if not bBad:
@@ -600,9 +723,7 @@ class StdInputParser(object):
                                 # fill_in_empty_dataset_with_fake_data).
                                 pass
 
-                        #Call this low-level function for performance, so need to construct outcome *index* arrays above
-                        dataset.add_count_arrays(circuit, oliArray, countArray,
-                                                 record_zero_counts=record_zero_counts, aux=commentDict)
+                        add_data(add_count_line, circuit, valueList, commentDict)
                     else:
                         current_item.clear()
                         current_item['circuit'] = circuit
@@ -615,12 +736,11 @@ class StdInputParser(object):
                         #add current item & look for next one
                         # Note: if last line was just a circuit (without any following data lines)
                         # then current_item will only have 'circuit' & 'aux' keys, so we need to use .get(...) below
-                        dataset.add_raw_series_data(current_item['circuit'], current_item.get('outcomes', []),
-                                                    current_item.get('times', []),
-                                                    current_item.get('repetitions', None),
-                                                    record_zero_counts=record_zero_counts,
-                                                    aux=current_item.get('aux', None),
-                                                    update_ol=False)  # for performance - to this once at the end.
+                        add_data(dataset.add_raw_series_data, current_item['circuit'],
+                                 current_item.get('outcomes', []), current_item.get('times', []),
+                                 current_item.get('repetitions', None), record_zero_counts=record_zero_counts,
+                                 aux=current_item.get('aux', None),
+                                 update_ol=False)  # for performance - to this once at the end.
                         current_item.clear()
                         looking_for = "circuit_line"
                     else:
@@ -640,6 +760,13 @@ class StdInputParser(object):
                             raise ValueError("Invalid circuit data-line prefix: '%s'" % parts[0])
 
         #REMOVE print("Rank %d DONE load loop.  circuit bytes = %g" % (comm.rank, circuit_bytes))
+        if looking_for == "circuit_line" and line_is_terminated:
+            complete_offset, complete_lines = line_end_offset, start_line + nLines
+            complete_pending()
+        if prefix_callback is not None:
+            dataset.update_ol()
+            prefix_callback(dataset, complete_offset, complete_lines)
+            for add_fn, args, kwargs in pending_adds: add_fn(*args, **kwargs)  # the final, incomplete, record
         if looking_for in ("circuit_data", "circuit_data_or_line") and current_item:
             #add final circuit info (no blank line at end of file)
             dataset.add_raw_series_data(current_item['circuit'], current_item.get('outcomes', []),
@@ -652,7 +779,7 @@ class StdInputParser(object):
             _warnings.warn('\n'.join(warnings))  # to be displayed at end, after potential progress updates
 
         dataset.done_adding_data()
-        return dataset
+        return dataset, complete_offset, complete_lines
 
     def parse_multidatafile(self, filename, show_progress=True,
                             collision_action="aggregate", record_zero_counts=True, ignore_zero_count_lines=True):
@@ -211,6 +211,7 @@ class CircuitOutcomeProbabilityArrayLayout(_NicelySerializable):
             elindices, outcomes = zip(*sorted_tuples)  # sorted by elindex so we make slices whenever possible
             self._outcomes[i_unique] = tuple(outcomes)
             self._element_indices[i_unique] = _slct.list_to_slice(elindices, array_ok=True)
+        self._index_arrays = None  # array-valued lookup tables, computed when needed (see _compute_index_arrays)
 
 #    def hotswap_circuits(self, circuits, unique_complete_circuits=None):
 #        self.circuits = circuits if isinstance(circuits, _CircuitList) else _CircuitList(circuits)
@@ -744,6 +745,82 @@ class CircuitOutcomeProbabilityArrayLayout(_NicelySerializable):
         unique_circuit_index = self._to_unique[index]
         return self._element_indices[unique_circuit_index], self._outcomes[unique_circuit_index]
 
+    def circuit_element_counts(self):
+        """
+        The number of elements and the first element index of every circuit in this layout.
+
+        Returns
+        -------
+        num_elements : numpy.ndarray
+            An integer array of length `self.num_circuits` giving the number of elements
+            (computed outcomes) of each circuit in `self.circuits`.
+
+        first_elements : numpy.ndarray
+            An integer array of length `self.num_circuits` giving the smallest element
+            index of each circuit, or `-1` for circuits without any elements.
+        """
+        arrays = self._compute_index_arrays()
+        return arrays['circuit_num_elements'], arrays['circuit_first_elements']
+
+    def element_circuit_indices(self):
+        """
+        The circuit each element of this layout belongs to.
+
+        Returns
+        -------
+        numpy.ndarray
+            An integer array of length `len(self)` whose i-th value is the index (into
+            `self.circuits`) of the circuit corresponding to the i-th element.  When a
+            circuit appears multiple times in `self.circuits` the first index is used.
+        """
+        return self._compute_index_arrays()['element_circuits']
+
+    def element_outcome_indices(self):
+        """
+        The outcome of each element of this layout, as an index into a table of outcome labels.
+
+        Returns
+        -------
+        outcome_labels : tuple
+            The distinct outcome labels of this layout.
+
+        element_outcomes : numpy.ndarray
+            An integer array of length `len(self)` whose i-th value is the index into
+            `outcome_labels` of the outcome corresponding to the i-th element.
+        """
+        arrays = self._compute_index_arrays()
+        return arrays['outcome_labels'], arrays['element_outcomes']
+
+    def _compute_index_arrays(self):
+        """ Builds (once) the array-valued lookup tables returned by :meth:`circuit_element_counts`, etc. """
+        if getattr(self, '_index_arrays', None) is not None:
+            return self._index_arrays
+
+        num_unique = len(self._unique_circuits)
+        unique_num_elements = _np.zeros(num_unique, _np.int64)
+        unique_first_elements = _np.full(num_unique, -1, _np.int64)
+        element_unique = _np.empty(self._size, _np.int64)
+        element_outcomes = _np.empty(self._size, _np.int64)
+        outcome_lookup = {}
+        for i_unique, elindices in self._element_indices.items():
+            elindices = _slct.to_array(elindices)
+            element_unique[elindices] = i_unique
+            element_outcomes[elindices] = [outcome_lookup.setdefault(ol, len(outcome_lookup))
+                                           for ol in self._outcomes[i_unique]]
+            unique_num_elements[i_unique] = len(elindices)
+            if len(elindices) > 0: unique_first_elements[i_unique] = elindices[0]  # elindices are sorted
+
+        to_unique = _np.array([self._to_unique[i] for i in range(len(self.circuits))], _np.int64)
+        first_circuit_of_unique = _np.full(num_unique, -1, _np.int64)
+        first_circuit_of_unique[to_unique[::-1]] = _np.arange(len(to_unique) - 1, -1, -1)  # 1st occurrence wins
+
+        self._index_arrays = {'circuit_num_elements': unique_num_elements[to_unique],
+                              'circuit_first_elements': unique_first_elements[to_unique],
+                              'element_circuits': first_circuit_of_unique[element_unique],
+                              'element_outcomes': element_outcomes,
+                              'outcome_labels': tuple(outcome_lookup.keys())}
+        return self._index_arrays
+
     def __iter__(self):
         for circuit, i in self._unique_circuit_index.items():
             for element_index, outcome in zip(self._element_indices[i], self._outcomes[i]):
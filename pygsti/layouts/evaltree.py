@@ -28,13 +28,38 @@ def _walk_subtree(treedict, indx, running_inds):
         _walk_subtree(treedict, iRight, running_inds)
 
 
+def _germ_power_layertups(germ_powers):
+    # layer-tuples of germ^(2^j) for all 2^j <= max-power, so any germ^L can be built from O(log L) of these
+    ret = []
+    for germ, max_power in germ_powers.items():
+        germ = germ.layertup if isinstance(germ, _Circuit) else tuple(germ)
+        if len(germ) == 0 or max_power < 2: continue
+        p = 1
+        while p <= max_power:
+            ret.append(germ * p)
+            p *= 2
+    return ret
+
+
 class EvalTree(list):
     @classmethod
-    def create(cls, circuits_to_evaluate):  # a class method instead of __init__ because we inherit from list
+    def create(cls, circuits_to_evaluate, germ_powers=None):  # a class method instead of __init__ b/c we inherit list
         """
         Note: circuits_to_evaluate can be either a list or an integer-keyed dict (for faster lookups), as we
         only take its length and index it.
 
+        Parameters
+        ----------
+        circuits_to_evaluate : list or dict
+            The circuits (or layer-label tuples) to evaluate.
+
+        germ_powers : dict, optional
+            A dictionary whose keys are germs (:class:`Circuit` objects or tuples of layer labels) and
+            whose values are the maximum power each germ is raised to within `circuits_to_evaluate`.
+            When given, scratch entries for germ^(2^j) are added to the tree (each computed by squaring
+            the previous one) so that circuits containing a long germ power are built from O(log L)
+            products instead of relying on shorter powers of the germ being present in the list.
+
         Returns
         -------
         eval_tree : list
@@ -61,16 +86,28 @@ class EvalTree(list):
 
         #Process circuits in order of length, so that we always place short strings
         # in the right place (otherwise assert stmt below can fail)
+        # Synthetic germ-power circuits are given "indices" >= num_circuits and are placed in scratch space.
+        # They're processed after any real circuits of the same length, and skipped if already present.
+        num_circuits = len(circuits_to_evaluate)
+        germ_power_tups = _germ_power_layertups(germ_powers) if germ_powers else []
         indices_sorted_by_circuit_len = \
-            sorted(list(range(len(circuits_to_evaluate))),
-                   key=lambda i: len(circuits_to_evaluate[i]))
+            sorted(list(range(num_circuits + len(germ_power_tups))),
+                   key=lambda i: (len(circuits_to_evaluate[i]), 0) if i < num_circuits
+                   else (len(germ_power_tups[i - num_circuits]), 1))
 
-        next_scratch_index = len(circuits_to_evaluate)
+        next_scratch_index = num_circuits
+        num_germ_power_entries = 0
         for k in indices_sorted_by_circuit_len:
 
-            circuit = circuits_to_evaluate[k]
-            layertup = circuit.layertup if isinstance(circuit, _Circuit) else circuit
-            L = len(circuit)
+            if k < num_circuits:
+                circuit = circuits_to_evaluate[k]
+                layertup = circuit.layertup if isinstance(circuit, _Circuit) else circuit
+            else:
+                layertup = germ_power_tups[k - num_circuits]
+                if layertup in evalDict.get(len(layertup), ()): continue  # already computed
+                k = next_scratch_index; next_scratch_index += 1
+                num_germ_power_entries += 1
+            L = len(layertup)
 
             #Single gate (or zero-gate) computations are assumed to be atomic, and be computed independently.
             #  These labels serve as the initial values, and each operation sequence is assumed to be a tuple of
@@ -177,7 +214,7 @@ class EvalTree(list):
                 #nBites += 1
 
         if len(circuits_to_evaluate) > 0:
-            test_ratios = (100, 10, 3); ratio = len(eval_tree) / len(circuits_to_evaluate)
+            test_ratios = (100, 10, 3); ratio = (len(eval_tree) - num_germ_power_entries) / len(circuits_to_evaluate)
             for test_ratio in test_ratios:
                 if ratio >= test_ratio and len(circuits_to_evaluate) > 1:  # no warning for 1-circuit case
                     _warnings.warn(("Created an evaluation tree that is inefficient: tree-size > %d * #circuits !\n"
@@ -11,6 +11,7 @@ Defines the MatrixCOPALayout class.
 #***************************************************************************************************
 
 import collections as _collections
+import itertools as _itertools
 
 import numpy as _np
 
@@ -18,10 +19,35 @@ from pygsti.layouts.distlayout import DistributableCOPALayout as _DistributableC
 from pygsti.layouts.distlayout import _DistributableAtom
 from pygsti.layouts.evaltree import EvalTree as _EvalTree
 from pygsti.circuits.circuitlist import CircuitList as _CircuitList
+from pygsti.circuits.circuitstructure import GermFiducialPairPlaquette as _GermFiducialPairPlaquette
+from pygsti.circuits.circuitstructure import PlaquetteGridCircuitStructure as _PlaquetteGridCircuitStructure
+from pygsti.baseobjs.label import CircuitLabel as _CircuitLabel
 from pygsti.tools import listtools as _lt
 from pygsti.tools import slicetools as _slct
 
 
+def _germ_powers_by_circuit(circuits):
+    # circuit => (germ layer-tuple, power), from the germ-power plaquettes of a circuit structure
+    germ_powers_by_circuit = {}
+    if not isinstance(circuits, _PlaquetteGridCircuitStructure):
+        return germ_powers_by_circuit
+    for _, plaq in circuits.iter_plaquettes():
+        if isinstance(plaq, _GermFiducialPairPlaquette) and plaq.power > 1:
+            germ = plaq.germ.layertup
+            for _, _, circuit in plaq:
+                germ_powers_by_circuit[circuit] = (germ, plaq.power)
+    return germ_powers_by_circuit
+
+
+def _update_germ_powers_from_subcircuits(circuit, germ_powers):
+    # repeated sub-circuit layers (e.g. compact germ powers) give germ-power structure directly
+    for lbl in circuit.layertup:
+        if isinstance(lbl, _CircuitLabel) and lbl.reps > 1:
+            germ = tuple(lbl.components)
+            if any([isinstance(l, _CircuitLabel) for l in germ]): continue  # nested - skip
+            germ_powers[germ] = max(lbl.reps, germ_powers.get(germ, 0))
+
+
 class _MatrixCOPALayoutAtom(_DistributableAtom):
     """
     The atom ("atomic unit") for dividing up the element dimension in a :class:`MatrixCOPALayout`.
@@ -65,10 +91,17 @@ class _MatrixCOPALayoutAtom(_DistributableAtom):
     dataset : DataSet
         The dataset, used to include only observed circuit outcomes in this atom
         and therefore the parent layout.
+
+    circuit_germ_powers : list, optional
+        A list parallel to `unique_complete_circuits` of `(germ, power)` tuples (the germ as a
+        layer-tuple) or `None`, giving the germ power each circuit is built from.  The germs of
+        this atom's circuits are used to add repeated-squaring germ-power scratch entries to
+        its evaluation tree.  Germ powers given as repeated sub-circuit labels within the
+        circuits are detected automatically.
     """
 
     def __init__(self, unique_complete_circuits, unique_nospam_circuits, circuits_by_unique_nospam_circuits,
-                 ds_circuits, group, helpful_scratch, model, dataset):
+                 ds_circuits, group, helpful_scratch, model, dataset, circuit_germ_powers=None):
 
         #Note: group gives unique_nospam_circuits indices, which circuits_by_unique_nospam_circuits
         # turns into "unique complete circuit" indices, which the layout via it's to_unique can map
@@ -79,8 +112,8 @@ class _MatrixCOPALayoutAtom(_DistributableAtom):
                 nospam_c = unique_nospam_circuits[i]
                 for unique_i in circuits_by_unique_nospam_circuits[nospam_c]:  # "unique" circuits: add SPAM to nospam_c
                     observed_outcomes = None if (dataset is None) else dataset[ds_circuits[unique_i]].unique_outcomes
-                    expc_outcomes = unique_complete_circuits[unique_i].expand_instruments_and_separate_povm(
-                        model, observed_outcomes)
+                    expc_outcomes = model._memoized_expanded_circuit_outcomes(unique_complete_circuits[unique_i],
+                                                                              observed_outcomes)
                     #Note: unique_complete_circuits may have duplicates (they're only unique *pre*-completion)
 
                     for sep_povm_c, outcomes in expc_outcomes.items():  # for each expanded cir from unique_i-th circuit
@@ -121,14 +154,27 @@ class _MatrixCOPALayoutAtom(_DistributableAtom):
         expanded_nospam_circuits_plus_scratch = _collections.OrderedDict(
             [(i, cir) for i, cir in enumerate(expanded_nospam_circuit_outcomes_plus_scratch.keys())])
 
+        germ_powers = {}  # only the germs of this atom's circuits, so other atoms' germ powers aren't computed
+        if circuit_germ_powers is not None:
+            for i in _itertools.chain(group, helpful_scratch):
+                for unique_i in circuits_by_unique_nospam_circuits[unique_nospam_circuits[i]]:
+                    if circuit_germ_powers[unique_i] is not None:
+                        germ, power = circuit_germ_powers[unique_i]
+                        germ_powers[germ] = max(power, germ_powers.get(germ, 0))
+
         double_expanded_nospam_circuits_plus_scratch = _collections.OrderedDict()
+        subcircuit_expansions = model._circuit_memo('subcircuit-expansions')  # reused by later layouts
         for i, cir in expanded_nospam_circuits_plus_scratch.items():
-            cir = cir.copy(editable=True)
-            cir.expand_subcircuits()  # expand sub-circuits for a more efficient tree
-            cir.done_editing()
-            double_expanded_nospam_circuits_plus_scratch[i] = cir
-
-        self.tree = _EvalTree.create(double_expanded_nospam_circuits_plus_scratch)
+            _update_germ_powers_from_subcircuits(cir, germ_powers)
+            expanded_cir = subcircuit_expansions.get(cir, None)
+            if expanded_cir is None:
+                expanded_cir = cir.copy(editable=True)
+                expanded_cir.expand_subcircuits()  # expand sub-circuits for a more efficient tree
+                expanded_cir.done_editing()
+                subcircuit_expansions[cir] = expanded_cir
+            double_expanded_nospam_circuits_plus_scratch[i] = expanded_cir
+
+        self.tree = _EvalTree.create(double_expanded_nospam_circuits_plus_scratch, germ_powers)
         #print("Atom tree: %d circuits => tree of size %d" % (len(expanded_nospam_circuits), len(self.tree)))
 
         self._num_nonscratch_tree_items = len(expanded_nospam_circuits)  # put this in EvalTree?
@@ -302,6 +348,9 @@ class MatrixCOPALayout(_DistributableCOPALayout):
             else:
                 circuits_by_unique_nospam_circuits[nospam_c] = [i]
         unique_nospam_circuits = list(circuits_by_unique_nospam_circuits.keys())
+        germ_powers_by_circuit = _germ_powers_by_circuit(circuits)
+        circuit_germ_powers = [germ_powers_by_circuit.get(c, None) for c in unique_circuits] \
+            if germ_powers_by_circuit else None
 
         # Split circuits into groups that will make good subtrees (all procs do this)
         max_sub_tree_size = None  # removed from being an argument (unused)
@@ -338,7 +387,7 @@ class MatrixCOPALayout(_DistributableCOPALayout):
             group, helpful_scratch_group = args
             return _MatrixCOPALayoutAtom(unique_complete_circuits, unique_nospam_circuits,
                                          circuits_by_unique_nospam_circuits, ds_circuits,
-                                         group, helpful_scratch_group, model, dataset)
+                                         group, helpful_scratch_group, model, dataset, circuit_germ_powers)
 
         super().__init__(circuits, unique_circuits, to_unique, unique_complete_circuits,
                          _create_atom, list(zip(groups, helpful_scratch)), num_tree_processors,
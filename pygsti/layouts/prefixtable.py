@@ -49,7 +49,8 @@ class PrefixTable(object):
         circuits_to_evaluate_fastlookup = {i: cir for i, cir in enumerate(circuits_to_evaluate)}
         circuits_to_sort_by = [cir.circuit_without_povm if isinstance(cir, _SeparatePOVMCircuit) else cir
                                for cir in circuits_to_evaluate]  # always Circuits - not SeparatePOVMCircuits
-        sorted_circuits_to_sort_by = sorted(list(enumerate(circuits_to_sort_by)), key=lambda x: x[1])
+        sorted_circuits_to_sort_by = sorted(list(enumerate(circuits_to_sort_by)),
+                                            key=lambda x: x[1].tup)  # same order as Circuit.__lt__, but faster
         sorted_circuits_to_evaluate = [(i, circuits_to_evaluate_fastlookup[i]) for i, _ in sorted_circuits_to_sort_by]
 
         distinct_line_labels = set([cir.line_labels for cir in circuits_to_sort_by])
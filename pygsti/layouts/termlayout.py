@@ -56,8 +56,8 @@ class _TermCOPALayoutAtom(_DistributableAtom):
         expanded_circuit_outcomes_by_unique = _collections.OrderedDict()
         expanded_circuit_outcomes = _collections.OrderedDict()
         for i in group:
-            observed_outcomes = None if (dataset is None) else dataset[ds_circuits[i]].outcomes
-            d = unique_complete_circuits[i].expand_instruments_and_separate_povm(model, observed_outcomes)
+            observed_outcomes = None if (dataset is None) else dataset[ds_circuits[i]].unique_outcomes
+            d = model._memoized_expanded_circuit_outcomes(unique_complete_circuits[i], observed_outcomes)
             expanded_circuit_outcomes_by_unique[i] = d
             expanded_circuit_outcomes.update(d)
 
@@ -216,23 +216,13 @@ class RepeatedOp(_LinearOperator):
             Array of derivatives with shape (dimension^2, num_params)
         """
         mx = self.repeated_op.to_dense(on_space='minimal')
-
-        mx_powers = {0: _np.identity(self.dim, 'd'), 1: mx}
-        for i in range(2, self.num_repetitions):
-            mx_powers[i] = _np.dot(mx_powers[i - 1], mx)
-
         dmx = _np.transpose(self.repeated_op.deriv_wrt_params(wrt_filter))  # (num_params, dim^2)
-        dmx.shape = (dmx.shape[0], self.dim, self.dim)  # set shape for multiplication below
+        dmx = dmx.reshape((dmx.shape[0],) + mx.shape)  # set shape for multiplication below
 
-        deriv = _np.zeros((self.dim, dmx.shape[0], self.dim), 'd')
-        for k in range(1, self.num_repetitions + 1):
-            #deriv += mx_powers[k-1] * dmx * mx_powers[self.num_repetitions-k]
-            deriv += _np.dot(mx_powers[k - 1], _np.dot(dmx, mx_powers[self.num_repetitions - k]))
-            #        (D,D) * ((P,D,D) * (D,D)) => (D,D) * (P,D,D) => (D,P,D)
-
-        deriv = _np.moveaxis(deriv, 1, 2)
-        deriv = deriv.reshape((self.dim**2, deriv.shape[2]))
-        return deriv
+        #Compute mx^n and its derivative by repeated squaring, so this takes O(log(n)) products
+        # using the product rule: d(A*B) = dA*B + A*dB
+        _, deriv = _matrix_power_and_deriv(mx, dmx, self.num_repetitions)  # deriv.shape == (P,D,D)
+        return deriv.reshape((deriv.shape[0], mx.shape[0] * mx.shape[1])).T
 
     def to_memoized_dict(self, mmg_memo):
         """Create a serializable dict with references to other objects in the memo.
@@ -270,3 +260,39 @@ class RepeatedOp(_LinearOperator):
     def _oneline_contents(self):
         """ Summarizes the contents of this object in a single line.  Does not summarize submembers. """
         return "repeats %d times" % self.num_repetitions
+
+
+def _matrix_power_and_deriv(mx, dmx, n):
+    """
+    Compute `mx^n` and its derivative using repeated squaring.
+
+    Parameters
+    ----------
+    mx : numpy.ndarray
+        A (D,D) square matrix.
+
+    dmx : numpy.ndarray
+        A (P,D,D) array of the derivatives of `mx` with respect to P parameters.
+
+    n : int
+        The (non-negative) power.
+
+    Returns
+    -------
+    power : numpy.ndarray
+        The (D,D) matrix `mx^n`.
+    deriv : numpy.ndarray
+        The (P,D,D) array of derivatives of `mx^n`.
+    """
+    result = _np.identity(mx.shape[0], mx.dtype)
+    dresult = _np.zeros(dmx.shape, _np.result_type(mx, dmx))
+    base, dbase = mx, dmx
+    while n > 0:
+        if n & 1:
+            dresult = _np.matmul(dresult, base) + _np.matmul(result, dbase)
+            result = _np.dot(result, base)
+        n >>= 1
+        if n > 0:
+            dbase = _np.matmul(dbase, base) + _np.matmul(base, dbase)
+            base = _np.dot(base, base)
+    return result, dresult
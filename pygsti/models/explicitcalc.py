@@ -553,7 +553,18 @@ class ExplicitOpModelCalc(object):
         dPG[:, 0:nParams] = self.deriv_wrt_params()
         return dPG
 
-    def nongauge_and_gauge_spaces(self, item_weights=None, non_gauge_mix_mx=None):
+    def gauge_space(self):
+        """
+        Constructs a basis for the gauge directions in parameter space.
+
+        Unlike :meth:`nongauge_and_gauge_spaces`, this does not construct the
+        (non-gauge) complement of the gauge space.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of shape `(nParams, nGaugeDirections)` whose columns span the gauge space.
+        """
         nParams = self.Np
         dPG = self._buildup_dpg()
 
@@ -562,6 +573,10 @@ class ExplicitOpModelCalc(object):
         gauge_space = nullsp[0:nParams, :]  # take upper (gate-param-segment) of vectors for basis
         # of subspace intersection in gate-parameter space
         #Note: gauge_space is (nParams)x(nullSpaceDim==gaugeSpaceDim)
+        return gauge_space
+
+    def nongauge_and_gauge_spaces(self, item_weights=None, non_gauge_mix_mx=None):
+        gauge_space = self.gauge_space()
 
         # Build final non-gauge space by getting a mx of column vectors
         # orthogonal (w.r.t. some metric) to the cols of gauge_space:
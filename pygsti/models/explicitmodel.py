@@ -574,6 +574,20 @@ class ExplicitOpModel(_mdl.OpModel):
         """
         return self._excalc().deriv_wrt_params()
 
+    def compute_gauge_space(self):
+        """
+        Construct a basis for the gauge directions in this model's parameter space.
+
+        This is cheaper than :meth:`compute_nongauge_and_gauge_spaces` when the
+        non-gauge space isn't needed, as the complement of the gauge space isn't built.
+
+        Returns
+        -------
+        numpy array
+            An array of shape `(num_params, n_gauge_directions)` whose columns span the gauge space.
+        """
+        return self._excalc().gauge_space()
+
     def compute_nongauge_and_gauge_spaces(self, item_weights=None, non_gauge_mix_mx=None):
         """
         TODO: docstring
@@ -34,6 +34,7 @@ from pygsti.tools import slicetools as _slct
 from pygsti.tools import matrixtools as _mt
 
 MEMLIMIT_FOR_NONGAUGE_PARAMS = None
+CIRCUIT_MEMO_MAX_SIZE = 100000  # max. number of items held in each category of an OpModel's circuit memos
 
 
 class Model(_NicelySerializable):
@@ -409,6 +410,24 @@ class Model(_NicelySerializable):
         return circuit
 
 
+class _CircuitMemo(_collections.OrderedDict):
+    """
+    A least-recently-used dictionary of at most `CIRCUIT_MEMO_MAX_SIZE` items (see :meth:`OpModel._circuit_memo`).
+    """
+
+    def get(self, key, default=None):
+        """ Get the value for `key` (or `default` if it's absent), marking it as most-recently used. """
+        if key not in self: return default
+        self.move_to_end(key)
+        return self[key]
+
+    def __setitem__(self, key, val):
+        super().__setitem__(key, val)
+        self.move_to_end(key)
+        while len(self) > max(CIRCUIT_MEMO_MAX_SIZE, 1):
+            self.popitem(last=False)
+
+
 class OpModel(Model):
     """
     A Model that contains operators (i.e. "members"), having a container structure.
@@ -473,6 +492,7 @@ class OpModel(Model):
 
         self._layer_rules = layer_rules if (layer_rules is not None) else _LayerRules()
         self._opcaches = {}  # dicts of non-primitive operations (organized by derived class)
+        self._circuit_memos = {}  # memoized circuit completion & expansion data (see _circuit_memo)
         self._need_to_rebuild = True  # whether we call _rebuild_paramvec() in to_vector() or num_params()
         self.dirty = False  # indicates when objects and _paramvec may be out of sync
         self.sim = simulator  # property setter does nontrivial initialization (do this *last*)
@@ -480,9 +500,15 @@ class OpModel(Model):
         self._reinit_opcaches()
         self.fogi_store = None
 
+    def __getstate__(self):
+        state_dict = self.__dict__.copy()
+        del state_dict['_circuit_memos']  # memoized data can be large and is recomputed as needed
+        return state_dict
+
     def __setstate__(self, state_dict):
         self.__dict__.update(state_dict)
         self._sim.model = self  # ensure the simulator's `model` is set to self (usually == None in serialization)
+        self._circuit_memos = {}
 
     ##########################################
     ## Get/Set methods
@@ -699,6 +725,7 @@ class OpModel(Model):
     def _mark_for_rebuild(self, modified_obj=None):
         #re-initialze any members that also depend on the updated parameters
         self._need_to_rebuild = True
+        self._circuit_memos = {}  # members may have been added, so circuit completion/expansion may change
 
         # Specifically, we need to re-allocate indices for every object that
         # contains a reference to the modified one.  Previously all modelmembers
@@ -884,6 +911,7 @@ class OpModel(Model):
         """ Resizes self._paramvec and updates gpindices & parent members as needed,
             and will initialize new elements of _paramvec, but does NOT change
             existing elements of _paramvec (use _update_paramvec for this)"""
+        self._circuit_memos = {}  # members may have been removed, so circuit completion/expansion may change
         w = self._model_paramvec_to_ops_paramvec(self._paramvec)
         Np = len(w)  # NOT self.num_params since the latter calls us!
         wl = self._paramlbls
@@ -1145,6 +1173,27 @@ class OpModel(Model):
         outcomes = circuit.expand_instruments_and_separate_povm(self)  # dict w/keys=sep-povm-circuits, vals=outcomes
         return tuple(_itertools.chain(*outcomes.values()))  # concatenate outputs from all sep-povm-circuits
 
+    def compute_num_outcomes(self, circuit):
+        """
+        The number of outcomes of `circuit`, given by it's existing or implied POVM label.
+
+        Parameters
+        ----------
+        circuit : Circuit
+            The circuit to simplify
+
+        Returns
+        -------
+        int
+        """
+        if circuit._static:
+            memo = self._circuit_memo('num-outcomes')
+            num_outcomes = memo.get(circuit, None)
+            if num_outcomes is None:
+                num_outcomes = memo[circuit] = len(self.circuit_outcomes(circuit))
+            return num_outcomes
+        return len(self.circuit_outcomes(circuit))
+
     def split_circuit(self, circuit, erroron=('prep', 'povm'), split_prep=True, split_povm=True):
         """
         Splits a circuit into prep_layer + op_layers + povm_layer components.
@@ -1228,6 +1277,16 @@ class OpModel(Model):
         Circuit
             Possibly the same object as `circuit`, if no additions are needed.
         """
+        if circuit._static:
+            memo = self._circuit_memo('complete-circuits')
+            completed = memo.get(circuit, None)
+            if completed is None:
+                completed = memo[circuit] = self._complete_circuit(circuit)
+                memo[completed] = completed  # a complete circuit completes to itself
+            return completed
+        return self._complete_circuit(circuit)
+
+    def _complete_circuit(self, circuit):
         prep_lbl_to_prepend = None
         povm_lbl_to_append = None
 
@@ -1364,6 +1423,120 @@ class OpModel(Model):
         """ Useful for short-circuiting circuit expansion """
         return len(self._primitive_instrument_label_dict) > 0
 
+    def _circuit_memo(self, category):
+        """
+        A dictionary for memoizing circuit completion and expansion data of a given category.
+
+        These dictionaries are reset whenever this model's members are added or removed,
+        since this can change, e.g., the default SPAM layers or the available POVMs.  Each
+        holds at most `CIRCUIT_MEMO_MAX_SIZE` items, discarding the least-recently used ones,
+        and they are not copied or pickled along with the model.
+
+        Parameters
+        ----------
+        category : str
+            The kind of data memoized, e.g. `"complete-circuits"`.
+
+        Returns
+        -------
+        OrderedDict
+        """
+        memo = self._circuit_memos.get(category, None)
+        if memo is None:
+            memo = self._circuit_memos[category] = _CircuitMemo()
+        return memo
+
+    def _memoized_effect_labels_for_povm(self, povm_lbl):
+        """
+        Memoized version of :meth:`_effect_labels_for_povm` that also returns the set of effect labels.
+
+        Parameters
+        ----------
+        povm_lbl : Label
+            POVM label.
+
+        Returns
+        -------
+        elabels : tuple
+        elabel_set : frozenset
+        """
+        memo = self._circuit_memo('povm-effect-labels')
+        ret = memo.get(povm_lbl, None)
+        if ret is None:
+            elabels = tuple(self._effect_labels_for_povm(povm_lbl))
+            ret = memo[povm_lbl] = (elabels, frozenset(elabels))
+        return ret
+
+    def _memoized_member_labels_for_instrument(self, inst_lbl):
+        """
+        Memoized version of :meth:`_member_labels_for_instrument`.
+
+        Parameters
+        ----------
+        inst_lbl : Label
+            Instrument label.
+
+        Returns
+        -------
+        tuple
+        """
+        memo = self._circuit_memo('instrument-members')
+        ret = memo.get(inst_lbl, None)
+        if ret is None:
+            ret = memo[inst_lbl] = tuple(self._member_labels_for_instrument(inst_lbl))
+        return ret
+
+    def _instrument_indices_of_layer(self, layer_lbl):
+        """
+        The (memoized) indices of the components of `layer_lbl` that are primitive instruments.
+
+        Parameters
+        ----------
+        layer_lbl : Label
+            Circuit layer label.
+
+        Returns
+        -------
+        tuple
+        """
+        memo = self._circuit_memo('instrument-layer-indices')
+        ret = memo.get(layer_lbl, None)
+        if ret is None:
+            ret = memo[layer_lbl] = tuple([i for i, component in enumerate(layer_lbl.components)
+                                           if self._is_primitive_instrument_layer_lbl(component)])
+        return ret
+
+    def _memoized_expanded_circuit_outcomes(self, circuit, observed_outcomes=None):
+        """
+        Memoized version of :meth:`Circuit.expand_instruments_and_separate_povm`.
+
+        Layouts for a growing sequence of circuit lists (e.g. the iterations of
+        long-sequence GST) expand the same circuits over and over, so the expansion
+        of each (static) circuit is computed once and reused.  The returned dictionary
+        is shared and must not be modified.
+
+        Parameters
+        ----------
+        circuit : Circuit
+            The circuit to expand.
+
+        observed_outcomes : list, optional
+            The *unique* observed outcome labels of `circuit`, or `None` to use
+            all possible outcomes.
+
+        Returns
+        -------
+        OrderedDict
+        """
+        if not circuit._static:
+            return circuit.expand_instruments_and_separate_povm(self, observed_outcomes)
+        key = (circuit, None if (observed_outcomes is None) else tuple(observed_outcomes))
+        memo = self._circuit_memo('expanded-circuit-outcomes')
+        ret = memo.get(key, None)
+        if ret is None:
+            ret = memo[key] = circuit.expand_instruments_and_separate_povm(self, observed_outcomes)
+        return ret
+
     def _default_primitive_prep_layer_lbl(self):
         """
         Gets the default state prep label.
@@ -1589,6 +1762,7 @@ class OpModel(Model):
         self._clean_paramvec()  # make sure _paramvec is valid before copying (necessary?)
         copy_into._need_to_rebuild = True  # copy will have all gpindices = None, etc.
         copy_into._opcaches = {}  # don't copy opcaches
+        copy_into._circuit_memos = {}
         super(OpModel, self)._init_copy(copy_into, memo)
 
     def _post_copy(self, copy_into, memo):
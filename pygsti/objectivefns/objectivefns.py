@@ -10,12 +10,14 @@ Defines objective-function objects
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import collections as _collections
 import itertools as _itertools
 import sys as _sys
 import time as _time
 import pathlib as _pathlib
 
 import numpy as _np
+import scipy.sparse as _sps
 
 from pygsti import tools as _tools
 from pygsti.layouts.distlayout import DistributableCOPALayout as _DistributableCOPALayout
@@ -25,6 +27,11 @@ from pygsti.baseobjs.resourceallocation import ResourceAllocation as _ResourceAl
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 
+try:
+    from pygsti.tools import fastcalc as _fastcalc
+except ImportError:
+    _fastcalc = None
+
 
 def _objfn(objfn_cls, model, dataset, circuits=None,
            regularization=None, penalties=None, op_label_aliases=None,
@@ -673,6 +680,72 @@ class RawObjectiveFunction(ObjectiveFunction):
         dlsvec = self.dlsvec(probs, counts, total_counts, freqs, intermediates)
         return dlsvec, lsvec
 
+    def fill_lsvec(self, lsvec, probs, counts, total_counts, freqs):
+        """
+        Compute the least-squares vector of the objective function into an existing array.
+
+        Derived classes may override this method with a fused kernel that avoids
+        the temporary arrays created by :meth:`lsvec`.
+
+        Parameters
+        ----------
+        lsvec : numpy.ndarray
+            The 1D array to fill, of length equal to that of each other array argument.
+
+        probs : numpy.ndarray
+            Array of probability values.
+
+        counts : numpy.ndarray
+            Array of count values.
+
+        total_counts : numpy.ndarray
+            Array of total count values.
+
+        freqs : numpy.ndarray
+            Array of frequency values.  This should always equal `counts / total_counts`
+            but is supplied separately to increase performance.
+
+        Returns
+        -------
+        None
+        """
+        lsvec[:] = self.lsvec(probs, counts, total_counts, freqs)
+
+    def fill_dlsvec_and_lsvec(self, dlsvec, lsvec, probs, counts, total_counts, freqs):
+        """
+        Compute the least-squares vector and its derivatives into existing arrays.
+
+        This is the in-place analogue of :meth:`dlsvec_and_lsvec`.  Derived classes
+        may override this method with a fused kernel that computes both quantities
+        in a single pass.
+
+        Parameters
+        ----------
+        dlsvec : numpy.ndarray
+            The 1D array to fill with least-squares-vector derivatives.
+
+        lsvec : numpy.ndarray
+            The 1D array to fill with least-squares-vector values.
+
+        probs : numpy.ndarray
+            Array of probability values.
+
+        counts : numpy.ndarray
+            Array of count values.
+
+        total_counts : numpy.ndarray
+            Array of total count values.
+
+        freqs : numpy.ndarray
+            Array of frequency values.  This should always equal `counts / total_counts`
+            but is supplied separately to increase performance.
+
+        Returns
+        -------
+        None
+        """
+        dlsvec[:], lsvec[:] = self.dlsvec_and_lsvec(probs, counts, total_counts, freqs)
+
     def hterms(self, probs, counts, total_counts, freqs, intermediates=None):
         """
         Compute the 2nd derivatives of the terms of this objective function.
@@ -885,6 +958,7 @@ class ModelDatasetCircuitsStore(object):
         self.firsts = None
         self.indicesOfCircuitsWithOmittedData = None
         self.dprobs_omitted_rowsum = None
+        self.omitted_rowsum_mx = None
 
         self.time_dependent = False  # indicates whether the data should be treated as time-resolved
 
@@ -940,21 +1014,53 @@ class ModelDatasetCircuitsStore(object):
         """
         if self.firsts is None or force:
             # FUTURE: add any tracked memory? self.resource_alloc.add_tracked_memory(...)
-            self.firsts = []; self.indicesOfCircuitsWithOmittedData = []
-            for i, c in enumerate(self.circuits):
-                indices = _slct.to_array(self.layout.indices_for_index(i))
-                lklen = _slct.length(self.layout.indices_for_index(i))
-                if 0 < lklen < self.model.compute_num_outcomes(c):
-                    self.firsts.append(indices[0])
-                    self.indicesOfCircuitsWithOmittedData.append(i)
-            if len(self.firsts) > 0:
-                self.firsts = _np.array(self.firsts, 'i')
-                self.indicesOfCircuitsWithOmittedData = _np.array(self.indicesOfCircuitsWithOmittedData, 'i')
+            num_elements, first_elements = self.layout.circuit_element_counts()
+            candidates = _np.nonzero(num_elements > 0)[0]
+            num_outcomes = _np.array([self.model.compute_num_outcomes(self.circuits[i]) for i in candidates],
+                                     _np.int64)  # Note: memoized by the model
+            omitted = candidates[num_elements[candidates] < num_outcomes]
+
+            if len(omitted) > 0:
+                self.firsts = _np.array(first_elements[omitted], 'i')
+                self.indicesOfCircuitsWithOmittedData = _np.array(omitted, 'i')
                 self.dprobs_omitted_rowsum = _np.empty((len(self.firsts), self.nparams), 'd')
+                self.omitted_rowsum_mx = self._create_rowsum_mx(omitted)
                 #if printer: printer.log("SPARSE DATA: %d of %d rows have sparse data" %
                 #                        (len(self.firsts), len(self.circuits)))
             else:
                 self.firsts = None  # no omitted probs
+                self.omitted_rowsum_mx = None
+
+    def _create_rowsum_mx(self, circuit_indices):
+        """
+        Create a sparse matrix that sums, for each given circuit, the rows of an element-indexed array.
+
+        Parameters
+        ----------
+        circuit_indices : numpy.ndarray
+            Indices into `self.circuits`.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            A matrix of shape `(len(circuit_indices), self.nelements)`.  Its dot product with
+            an array of probabilities (or probability derivatives) gives the sum of these over
+            the elements of each circuit.
+        """
+        element_circuits = self.layout.element_circuit_indices()
+        _, first_elements = self.layout.circuit_element_counts()
+        owners = element_circuits[first_elements[circuit_indices]]  # first occurrences of duplicated circuits
+
+        #Gather the elements of each owner circuit by stable-sorting the elements by their circuit index
+        order = _np.argsort(element_circuits, kind='stable')
+        owner_lengths = _np.bincount(element_circuits, minlength=len(self.circuits))
+        owner_starts = _np.cumsum(owner_lengths) - owner_lengths
+        lengths = owner_lengths[owners]
+        offsets = _np.cumsum(lengths) - lengths
+        positions = _np.arange(_np.sum(lengths)) - _np.repeat(offsets - owner_starts[owners], lengths)
+        rows = _np.repeat(_np.arange(len(circuit_indices)), lengths)
+        return _sps.csr_matrix((_np.ones(len(rows), 'd'), (rows, order[positions])),
+                               shape=(len(circuit_indices), self.nelements))
 
     def add_count_vectors(self, force=False):
         """
@@ -969,18 +1075,26 @@ class ModelDatasetCircuitsStore(object):
             # Note: in distributed case self.layout only holds *local* quantities (e.g.
             # the .ds_circuits are a subset of all the circuits and .nelements is the local
             # number of elements).
-            counts = _np.empty(self.nelements, 'd')
-            totals = _np.empty(self.nelements, 'd')
-
-            for (i, circuit) in enumerate(self.ds_circuits):
-                cnts = self.dataset[circuit].counts
-                totals[self.layout.indices_for_index(i)] = sum(cnts.values())  # dataset[opStr].total
-                counts[self.layout.indices_for_index(i)] = [cnts.get(x, 0) for x in self.layout.outcomes_for_index(i)]
-
-            if self.circuits.circuit_weights is not None:
-                for i in range(len(self.ds_circuits)):  # multiply N's by weights
-                    counts[self.layout.indices_for_index(i)] *= self.circuits.circuit_weights[i]
-                    totals[self.layout.indices_for_index(i)] *= self.circuits.circuit_weights[i]
+            element_circuits = self.layout.element_circuit_indices()
+            outcome_labels, element_outcomes = self.layout.element_outcome_indices()
+            owners = _np.unique(element_circuits)  # the circuits (1st occurrences) that have elements
+            owner_counts, owner_totals = self.dataset.count_arrays([self.ds_circuits[i] for i in owners],
+                                                                   outcome_labels)
+            owner_rows = _np.empty(len(self.circuits), _np.int64)
+            owner_rows[owners] = _np.arange(len(owners))
+
+            counts = owner_counts[owner_rows[element_circuits], element_outcomes]
+            totals = owner_totals[owner_rows[element_circuits]]
+
+            if self.circuits.circuit_weights is not None:  # multiply N's by weights
+                # Note: elements of a circuit that appears more than once are scaled by the weight of each occurrence
+                num_elements, first_elements = self.layout.circuit_element_counts()
+                has_elements = num_elements > 0
+                weights = _np.ones(len(self.circuits), 'd')
+                _np.multiply.at(weights, element_circuits[first_elements[has_elements]],
+                                _np.asarray(self.circuits.circuit_weights, 'd')[has_elements])
+                counts *= weights[element_circuits]
+                totals *= weights[element_circuits]
 
             self.counts = counts
             self.total_counts = totals
@@ -1825,6 +1939,73 @@ class RawChi2Function(RawObjectiveFunction):
         weights = self._weights(probs, freqs, total_counts)
         return weights + (probs - freqs) * self._dweights(probs, freqs, weights)
 
+    def fill_lsvec(self, lsvec, probs, counts, total_counts, freqs):
+        """
+        Compute the least-squares vector of the objective function into an existing array.
+
+        Parameters
+        ----------
+        lsvec : numpy.ndarray
+            The 1D array to fill, of length equal to that of each other array argument.
+
+        probs : numpy.ndarray
+            Array of probability values.
+
+        counts : numpy.ndarray
+            Array of count values.
+
+        total_counts : numpy.ndarray
+            Array of total count values.
+
+        freqs : numpy.ndarray
+            Array of frequency values.  This should always equal `counts / total_counts`
+            but is supplied separately to increase performance.
+
+        Returns
+        -------
+        None
+        """
+        if not self._fused_kernels_available():
+            return super().fill_lsvec(lsvec, probs, counts, total_counts, freqs)
+        _fastcalc.fused_chi2_lsvec(lsvec, None, probs, freqs, total_counts, self.min_prob_clip_for_weighting)
+
+    def fill_dlsvec_and_lsvec(self, dlsvec, lsvec, probs, counts, total_counts, freqs):
+        """
+        Compute the least-squares vector and its derivatives into existing arrays.
+
+        Parameters
+        ----------
+        dlsvec : numpy.ndarray
+            The 1D array to fill with least-squares-vector derivatives.
+
+        lsvec : numpy.ndarray
+            The 1D array to fill with least-squares-vector values.
+
+        probs : numpy.ndarray
+            Array of probability values.
+
+        counts : numpy.ndarray
+            Array of count values.
+
+        total_counts : numpy.ndarray
+            Array of total count values.
+
+        freqs : numpy.ndarray
+            Array of frequency values.  This should always equal `counts / total_counts`
+            but is supplied separately to increase performance.
+
+        Returns
+        -------
+        None
+        """
+        if not self._fused_kernels_available():
+            return super().fill_dlsvec_and_lsvec(dlsvec, lsvec, probs, counts, total_counts, freqs)
+        _fastcalc.fused_chi2_lsvec(lsvec, dlsvec, probs, freqs, total_counts, self.min_prob_clip_for_weighting)
+
+    def _fused_kernels_available(self):
+        # the fused kernels hard-code the `sqrt(N / max(p, min_prob_clip_for_weighting))` weights of this class
+        return _fastcalc is not None and type(self)._weights is RawChi2Function._weights
+
     def hlsvec(self, probs, counts, total_counts, freqs, intermediates=None):
         """
         Compute the 2nd derivatives of the least-squares vector of this objective function.
@@ -3024,6 +3205,99 @@ class RawPoissonPicDeltaLogLFunction(RawObjectiveFunction):
 
         return lsvec
 
+    def fill_lsvec(self, lsvec, probs, counts, total_counts, freqs):
+        """
+        Compute the least-squares vector of the objective function into an existing array.
+
+        Parameters
+        ----------
+        lsvec : numpy.ndarray
+            The 1D array to fill, of length equal to that of each other array argument.
+
+        probs : numpy.ndarray
+            Array of probability values.
+
+        counts : numpy.ndarray
+            Array of count values.
+
+        total_counts : numpy.ndarray
+            Array of total count values.
+
+        freqs : numpy.ndarray
+            Array of frequency values.  This should always equal `counts / total_counts`
+            but is supplied separately to increase performance.
+
+        Returns
+        -------
+        None
+        """
+        if _fastcalc is None:
+            return super().fill_lsvec(lsvec, probs, counts, total_counts, freqs)
+        self._fill_fused(None, lsvec, probs, counts, total_counts, freqs)
+
+    def fill_dlsvec_and_lsvec(self, dlsvec, lsvec, probs, counts, total_counts, freqs):
+        """
+        Compute the least-squares vector and its derivatives into existing arrays.
+
+        Parameters
+        ----------
+        dlsvec : numpy.ndarray
+            The 1D array to fill with least-squares-vector derivatives.
+
+        lsvec : numpy.ndarray
+            The 1D array to fill with least-squares-vector values.
+
+        probs : numpy.ndarray
+            Array of probability values.
+
+        counts : numpy.ndarray
+            Array of count values.
+
+        total_counts : numpy.ndarray
+            Array of total count values.
+
+        freqs : numpy.ndarray
+            Array of frequency values.  This should always equal `counts / total_counts`
+            but is supplied separately to increase performance.
+
+        Returns
+        -------
+        None
+        """
+        if _fastcalc is None:
+            return super().fill_dlsvec_and_lsvec(dlsvec, lsvec, probs, counts, total_counts, freqs)
+        self._fill_fused(dlsvec, lsvec, probs, counts, total_counts, freqs)
+
+    def _fill_fused(self, dlsvec, lsvec, probs, counts, total_counts, freqs):
+        """ Runs the single-pass kernel equivalent to :meth:`lsvec` (and :meth:`dlsvec` when `dlsvec` is given) """
+        if self.regtype not in ('pfratio', 'minp'):
+            raise ValueError("Invalid regularization type: %s" % self.regtype)
+        pfratio = (self.regtype == 'pfratio')
+
+        # the logarithms are computed by numpy, as in :meth:`terms`, so that the (roundoff-dominated) terms near
+        # a perfect fit, and the zero-clipping of them, match the NumPy implementation exactly
+        freqs_nozeros = _np.where(counts == 0, 1.0, freqs)
+        if pfratio:
+            x = probs / freqs_nozeros
+            log_pos = _np.log(_np.where(x < self.x0, self.x0, x))
+            log_freqs = None
+        else:
+            log_pos = _np.log(_np.where(probs < self.min_p, self.min_p, probs))
+            log_freqs = _np.log(freqs_nozeros)
+
+        min_term = _fastcalc.fused_poisson_pic_lsvec(
+            lsvec, dlsvec, probs, counts, total_counts, freqs, log_pos, log_freqs, pfratio,
+            0.0 if pfratio else self.min_p, self.x0 if pfratio else 0.0, self.x1 if pfratio else 0.0,
+            self.radius is not None, self.radius if (self.radius is not None) else self.fmin)
+
+        if min_term < 0.0:
+            #Negative terms are clipped to zero before regularization, so it was the regularization that caused this
+            if self.regtype == 'minp':
+                raise ValueError(("Regularization => negative terms!  Is min_prob_clip (%g) too large? "
+                                  "(it should be smaller than the smallest frequency)") % self.min_p)
+            else:
+                raise ValueError("Regularization => negative terms!")
+
     def dterms(self, probs, counts, total_counts, freqs, intermediates=None):
         """
         Compute the derivatives of the terms of this objective function.
@@ -4273,6 +4547,8 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
            + ('e', 'e', 'epp', 'epp', 'PP')
         if method_name == 'hessian': return fsim._array_types_for_method('_iter_atom_hprobs_by_rectangle') + ('PP',)
         if method_name == 'approximate_hessian': return fsim._array_types_for_method('bulk_fill_dprobs') + ('e', 'PP')
+        if method_name == 'approximate_hessian_factors': return fsim._array_types_for_method('bulk_fill_dprobs') \
+           + ('e',)
         return super()._array_types_for_method(method_name, fsim)
 
     @classmethod
@@ -4281,8 +4557,8 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         # (not-intermediate). These are filled in other routines and *not* included in
         # the output of _array_types_for_method since these are *not* allocated in methods.
         array_types = ('e',) * 4  # self.probs + 3x add_count_vectors
-        if any([x in ('dlsvec', 'dterms', 'dpercircuit', 'jacobian', 'approximate_hessian', 'hessian')
-                for x in method_names]):
+        if any([x in ('dlsvec', 'dterms', 'dpercircuit', 'jacobian', 'approximate_hessian',
+                      'approximate_hessian_factors', 'hessian') for x in method_names]):
             array_types += ('ep',)
 
         # array types for methods
@@ -4321,6 +4597,10 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         self.add_count_vectors()  # allocates 3x 'E' arrays
         self.add_omitted_freqs()  # sets self.first and more
 
+        #Memo of the probabilities (and their derivatives) at recently evaluated parameter vectors
+        self._evaluation_memo = _collections.OrderedDict()  # (quantity, paramvec bytes) => array copies
+        self.set_evaluation_memo_limits()
+
     def __del__(self):
         # Reset the allocated memory to the value it had in __init__, effectively releasing the allocations made there.
         self.resource_alloc.reset(allocated_memory=self.initial_allocated_memory)
@@ -4328,6 +4608,118 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         self.layout.free_local_array(self.obj)
         self.layout.free_local_array(self.jac)
 
+    def set_evaluation_memo_limits(self, max_probs=4, max_dprobs=0):
+        """
+        Set how many probability and probability-derivative arrays are memoized.
+
+        Evaluating this objective function at a parameter vector it has recently been
+        evaluated at (e.g. by :meth:`fn` and then :meth:`terms` at a best-fit point)
+        reuses the memoized circuit outcome probabilities (and their derivatives) instead
+        of recomputing them.  The least recently used arrays are discarded first.  Memoized
+        arrays are counted as tracked memory of this objective function's resource allocation.
+
+        Parameters
+        ----------
+        max_probs : int, optional
+            The maximum number of probability vectors to memoize.  Zero disables
+            the memoization of probabilities.
+
+        max_dprobs : int, optional
+            The maximum number of probability-derivative (jacobian-sized) arrays to
+            memoize.  Since these arrays can be large, and optimizers rarely evaluate
+            derivatives at the same point twice, this is zero (disabled) by default.
+            Callers that compute several derivative-based quantities at the same
+            point should enable it.
+
+        Returns
+        -------
+        None
+        """
+        self._evaluation_memo_limits = {'probs': max_probs, 'dprobs': max_dprobs}
+        self.clear_evaluation_memo()
+
+    def clear_evaluation_memo(self):
+        """
+        Discard all memoized probabilities and probability derivatives.
+
+        This must be called if the model's outcome probabilities change in a way
+        that is not captured by its parameter vector, e.g. when the model's
+        forward simulator or members are replaced.
+
+        Returns
+        -------
+        None
+        """
+        for k in list(self._evaluation_memo.keys()):
+            self._forget_evaluation(k)
+
+    def _forget_evaluation(self, key):
+        arrays = self._evaluation_memo.pop(key)
+        self.resource_alloc.add_tracked_memory(-sum([a.size for a in arrays if a is not None]))
+
+    def _memoize_evaluation(self, quantity, paramvec_key, arrays):
+        # All processors memoize the same keys (so that they agree on what is recomputed), but only
+        # processors that own (or lead the owners of) the given arrays hold copies of them.
+        limit = self._evaluation_memo_limits[quantity]
+        if limit <= 0: return
+        if (quantity, paramvec_key) in self._evaluation_memo:
+            self._forget_evaluation((quantity, paramvec_key))
+        keys = [k for k in self._evaluation_memo if k[0] == quantity]
+        for k in keys[0:len(keys) - limit + 1]:  # make room for the new arrays, least recently used first
+            self._forget_evaluation(k)
+
+        num_elements = sum([a.size for a in arrays if a is not None])
+        if self.resource_alloc.mem_limit is not None:
+            # Memoizing is optional, so skip it (on all processors) rather than exceed the memory limit
+            try:
+                self.resource_alloc.check_can_allocate_memory(num_elements)
+                num_too_big = 0
+            except MemoryError:
+                num_too_big = 1
+            if self.resource_alloc.allreduce_sum_simple(num_too_big) > 0: return
+
+        self.resource_alloc.add_tracked_memory(num_elements)
+        self._evaluation_memo[(quantity, paramvec_key)] = tuple([(a.copy() if (a is not None) else None)
+                                                                 for a in arrays])
+
+    def _fill_probs(self, paramvec):
+        """
+        Fill `self.probs` with the (unclipped) probabilities at `paramvec`, which is already set in the model.
+        """
+        key = _np.ascontiguousarray(paramvec, 'd').tobytes()
+        unit_ralloc = self.layout.resource_alloc('atom-processing')
+        memoized = self._evaluation_memo.get(('probs', key), None)
+        if memoized is not None:
+            self._evaluation_memo.move_to_end(('probs', key))
+            if unit_ralloc.is_host_leader:
+                self.probs[:] = memoized[0]
+            unit_ralloc.host_comm_barrier()
+        else:
+            self.model.sim.bulk_fill_probs(self.probs, self.layout)  # syncs shared mem
+            self._memoize_evaluation('probs', key, (self.probs if unit_ralloc.is_host_leader else None,))
+
+    def _fill_dprobs(self, dprobs, paramvec):
+        """
+        Fill `dprobs` and `self.probs` with the (unclipped) probabilities and their derivatives at `paramvec`.
+        """
+        key = _np.ascontiguousarray(paramvec, 'd').tobytes()
+        atom_ralloc = self.layout.resource_alloc('atom-processing')
+        param_ralloc = self.layout.resource_alloc('param-processing')
+        memoized = self._evaluation_memo.get(('dprobs', key), None)
+        if memoized is not None:
+            self._evaluation_memo.move_to_end(('dprobs', key))
+            if atom_ralloc.is_host_leader:
+                self.probs[:] = memoized[0]
+            if param_ralloc.is_host_leader:
+                dprobs[:, :] = memoized[1]
+            atom_ralloc.host_comm_barrier()
+            param_ralloc.host_comm_barrier()
+        else:
+            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)
+            probs = self.probs if atom_ralloc.is_host_leader else None
+            self._memoize_evaluation('dprobs', key, (probs, dprobs if param_ralloc.is_host_leader else None))
+            self._memoize_evaluation('probs', key, (probs,))
+
     #Model-based regularization and penalty support functions
     def set_penalties(self, regularize_factor=0, cptp_penalty_factor=0, spam_penalty_factor=0,
                       errorgen_penalty_factor=0, forcefn_grad=None, shift_fctr=100,
@@ -4561,9 +4953,11 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         -------
         numpy.ndarray
         """
-        omitted_probs = 1.0 - _np.array([probs[self.layout.indices_for_index(i)].sum()
-                                         for i in self.indicesOfCircuitsWithOmittedData])
-        return self.raw_objfn.zero_freq_terms(self.total_counts[self.firsts], omitted_probs)
+        return self.raw_objfn.zero_freq_terms(self.total_counts[self.firsts], self._omitted_probs(probs))
+
+    def _omitted_probs(self, probs):
+        """ The total probability of the outcomes omitted from each circuit with omitted data. """
+        return 1.0 - self.omitted_rowsum_mx.dot(probs)
 
     def _update_lsvec_for_omitted_probs(self, lsvec, probs):
         """
@@ -4630,9 +5024,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
             array of length equal to the number of circuits with omitted
             contributions.
         """
-        omitted_probs = 1.0 - _np.array([_np.sum(probs[self.layout.indices_for_index(i)])
-                                         for i in self.indicesOfCircuitsWithOmittedData])
-        return self.raw_objfn.zero_freq_dterms(self.total_counts[self.firsts], omitted_probs)
+        return self.raw_objfn.zero_freq_dterms(self.total_counts[self.firsts], self._omitted_probs(probs))
 
     def _update_dterms_for_omitted_probs(self, dterms, probs, dprobs_omitted_rowsum):
         # terms => terms + zerofreqfn(omitted)
@@ -4706,14 +5098,23 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         # so dterms = 2 * lsvec * dlsvec, and
         #    new_dlsvec = 0.5 / sqrt(...) * (2 * lsvec * dlsvec + dzerofreqfn(omitted) * domitted)
 
+        omitted_probs = self._omitted_probs(probs)
+        first_total_counts = self.total_counts[self.firsts]
+        omitted_terms = self.raw_objfn.zero_freq_terms(first_total_counts, omitted_probs)
+        omitted_dterms = self.raw_objfn.zero_freq_dterms(first_total_counts, omitted_probs)
+
+        if _fastcalc is not None:  # update each `firsts` row of dlsvec in a single pass
+            _fastcalc.fused_omitted_dlsvec_update(dlsvec, self.firsts, lsvec, omitted_terms, omitted_dterms,
+                                                  dprobs_omitted_rowsum)
+            return
+
         lsvec_firsts = lsvec[self.firsts]
-        updated_lsvec = _np.sqrt(lsvec_firsts**2 + self._omitted_prob_first_terms(probs))
+        updated_lsvec = _np.sqrt(lsvec_firsts**2 + omitted_terms)
         updated_lsvec = _np.where(updated_lsvec == 0, 1.0, updated_lsvec)  # avoid 0/0 where lsvec & deriv == 0
 
         # dlsvec => 0.5 / updated_lsvec * (2 * lsvec * dlsvec + dzerofreqfn(omitted) * domitted) memory efficient:
         dlsvec[self.firsts] *= (lsvec_firsts / updated_lsvec)[:, None]
-        dlsvec[self.firsts] -= ((0.5 / updated_lsvec) * self._omitted_prob_first_dterms(probs))[:, None] \
-            * dprobs_omitted_rowsum
+        dlsvec[self.firsts] -= ((0.5 / updated_lsvec) * omitted_dterms)[:, None] * dprobs_omitted_rowsum
 
     def _clip_probs(self):
         """ Clips the potentially shared-mem self.probs according to self.prob_clip_interval """
@@ -4774,7 +5175,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         shared_mem_leader = unit_ralloc.is_host_leader
 
         with self.resource_alloc.temporarily_track_memory(self.nelements):  # 'e' (lsvec)
-            self.model.sim.bulk_fill_probs(self.probs, self.layout)  # syncs shared mem
+            self._fill_probs(paramvec)  # syncs shared mem
             self._clip_probs()  # clips self.probs in place w/shared mem sync
 
             if oob_check:  # Only used for termgap cases
@@ -4782,9 +5183,10 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
                     raise ValueError("Out of bounds!")  # signals LM optimizer
 
             if shared_mem_leader:
-                lsvec_no_penalty = self.raw_objfn.lsvec(self.probs, self.counts, self.total_counts, self.freqs)
-                lsvec[:] = _np.concatenate((lsvec_no_penalty, self._lspenaltyvec(paramvec))) \
-                    if self._process_penalties else lsvec_no_penalty
+                self.raw_objfn.fill_lsvec(lsvec[0:self.nelements], self.probs, self.counts, self.total_counts,
+                                          self.freqs)
+                if self._process_penalties:
+                    lsvec[self.nelements:] = self._lspenaltyvec(paramvec)
 
         if self.firsts is not None and shared_mem_leader:
             self._update_lsvec_for_omitted_probs(lsvec, self.probs)
@@ -4825,7 +5227,7 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         shared_mem_leader = unit_ralloc.is_host_leader
 
         with self.resource_alloc.temporarily_track_memory(self.nelements):  # 'e' (terms)
-            self.model.sim.bulk_fill_probs(self.probs, self.layout)
+            self._fill_probs(paramvec)
             self._clip_probs()  # clips self.probs in place w/shared mem sync
 
             if shared_mem_leader:
@@ -4886,17 +5288,18 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
             #wrtSlice = resource_alloc.jac_slice if (resource_alloc.jac_distribution_method == "columns") \
             #           else slice(0, self.model.num_params)
 
-            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)  # wrtSlice)
+            self._fill_dprobs(dprobs, paramvec)  # wrtSlice)
             self._clip_probs()  # clips self.probs in place w/shared mem sync
 
             if shared_mem_leader:
                 if self.firsts is not None:
-                    for ii, i in enumerate(self.indicesOfCircuitsWithOmittedData):
-                        self.dprobs_omitted_rowsum[ii, :] = _np.sum(dprobs[self.layout.indices_for_index(i), :], axis=0)
+                    self.dprobs_omitted_rowsum[:, :] = self.omitted_rowsum_mx.dot(dprobs)
 
                 #if shared_mem_leader:  # Note: no need for barrier directly below as barrier further down suffices
-                dg_dprobs, lsvec = self.raw_objfn.dlsvec_and_lsvec(self.probs, self.counts, self.total_counts,
-                                                                   self.freqs)
+                dg_dprobs = _np.empty(self.nelements, 'd')
+                lsvec = _np.empty(self.nelements, 'd')
+                self.raw_objfn.fill_dlsvec_and_lsvec(dg_dprobs, lsvec, self.probs, self.counts, self.total_counts,
+                                                     self.freqs)
                 dprobs *= dg_dprobs[:, None]
                 # (nelements,N) * (nelements,1)   (N = dim of vectorized model)
                 # this multiply also computes jac, which is just dprobs
@@ -4955,13 +5358,12 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         shared_mem_leader = unit_ralloc.is_host_leader
 
         with self.resource_alloc.temporarily_track_memory(2 * self.nelements):  # 'e' (dg_dprobs, lsvec)
-            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)
+            self._fill_dprobs(dprobs, paramvec)
             self._clip_probs()  # clips self.probs in place w/shared mem sync
 
             if shared_mem_leader:
                 if self.firsts is not None:
-                    for ii, i in enumerate(self.indicesOfCircuitsWithOmittedData):
-                        self.dprobs_omitted_rowsum[ii, :] = _np.sum(dprobs[self.layout.indices_for_index(i), :], axis=0)
+                    self.dprobs_omitted_rowsum[:, :] = self.omitted_rowsum_mx.dot(dprobs)
 
                 #if shared_mem_leader:  # Note: barrier below work suffices for this condition too
                 dprobs *= self.raw_objfn.dterms(self.probs, self.counts, self.total_counts, self.freqs)[:, None]
@@ -5084,11 +5486,12 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
         #shared_mem_leader = unit_ralloc.is_host_leader
 
         if paramvec is not None: self.model.from_vector(paramvec)
+        else: paramvec = self.model.to_vector()
         dprobs = self.jac[0:self.nelements, :]  # avoid mem copying: use jac mem for dprobs
 
         # 'e', 'pp' (d2g_dprobs2, einsum result )
         with self.resource_alloc.temporarily_track_memory(self.nelements + self.nparams**2):
-            self.model.sim.bulk_fill_dprobs(dprobs, self.layout, self.probs)
+            self._fill_dprobs(dprobs, paramvec)
             self._clip_probs()  # clips self.probs in place w/shared mem sync
 
             d2g_dprobs2 = self.raw_objfn.hterms(self.probs, self.counts, self.total_counts, self.freqs)  # [:,None,None]
@@ -5100,6 +5503,44 @@ class TimeIndependentMDCObjectiveFunction(MDCObjectiveFunction):
 
         return self._gather_hessian(hessian)  # `hessian` is just the part of the (approximate) Hessian this proc "owns"
 
+    def approximate_hessian_factors(self, paramvec=None):
+        """
+        Compute the factors of the approximate Hessian given by :meth:`approximate_hessian`.
+
+        The approximate Hessian equals `dprobs.T @ diag(weights) @ dprobs`, where `dprobs`
+        is the Jacobian of the circuit outcome probabilities and `weights` holds the second
+        derivatives of this objective function's terms with respect to those probabilities.
+        Keeping these factors separate allows Hessian-vector products to be computed at a
+        cost of `O(nElements * nParams)` without forming the `(nParams, nParams)` Hessian.
+
+        Parameters
+        ----------
+        paramvec : numpy.ndarray, optional
+            The vector of (model) parameters to evaluate the objective function at.
+            If `None`, then the model's current parameter vector is used (held internally).
+
+        Returns
+        -------
+        dprobs : numpy.ndarray
+            The local portion of the `(nElements, nParams)` Jacobian, distributed
+            according to this objective function's layout (an `"ep"`-type array).
+        weights : numpy.ndarray
+            The local portion of the `(nElements,)` weights (an `"e"`-type array).
+        """
+        if self.firsts is not None:
+            raise NotImplementedError("Hessian factors not implemented for sparse data (yet)")
+
+        if paramvec is not None: self.model.from_vector(paramvec)
+        else: paramvec = self.model.to_vector()
+        dprobs = self.jac[0:self.nelements, :]  # avoid mem copying: use jac mem for dprobs
+
+        self._fill_dprobs(dprobs, paramvec)
+        self._clip_probs()  # clips self.probs in place w/shared mem sync
+        d2g_dprobs2 = self.raw_objfn.hterms(self.probs, self.counts, self.total_counts, self.freqs)
+
+        # factors stay distributed - Hessian-vector products can be summed from the local rows
+        return dprobs.copy(), d2g_dprobs2.copy()  # copy so results don't share memory w/this object
+
     def hessian(self, paramvec=None):
         """
         Compute the Hessian of this objective function.
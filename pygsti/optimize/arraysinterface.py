@@ -533,6 +533,31 @@ class UndistributedArraysInterface(ArraysInterface):
         """
         jtj[:, :] = _np.dot(j.T, j)
 
+    def broyden_update_jac(self, j, global_dx, df):
+        """
+        Apply a Broyden rank-one update to a Jacobian matrix in place.
+
+        Updates `j` to `j + outer(df - dot(j, dx), dx) / dot(dx, dx)`, the smallest change
+        to `j` that makes it consistent with an observed change `df` in the objective
+        function vector resulting from the step `dx`.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`).  Updated in place.
+
+        global_dx : numpy.ndarray
+            The global (full) parameter-vector step.
+
+        df : numpy.ndarray or LocalNumpyArray
+            The change in the objective function vector (type `e`).
+
+        Returns
+        -------
+        None
+        """
+        j += _np.outer(df - _np.dot(j, global_dx), global_dx / _np.dot(global_dx, global_dx))
+
     def allocate_jtj_shared_mem_buf(self):
         """
         Allocate scratch space to be used for repeated calls to :meth:`fill_jtj`.
@@ -1216,6 +1241,48 @@ class DistributedArraysInterface(ArraysInterface):
         """
         self.layout.fill_jtj(j, jtj, shared_mem_buf)
 
+    def broyden_update_jac(self, j, global_dx, df):
+        """
+        Apply a Broyden rank-one update to a Jacobian matrix in place.
+
+        Updates `j` to `j + outer(df - dot(j, dx), dx) / dot(dx, dx)`, the smallest change
+        to `j` that makes it consistent with an observed change `df` in the objective
+        function vector resulting from the step `dx`.
+
+        Parameters
+        ----------
+        j : numpy.ndarray or LocalNumpyArray
+            Jacobian matrix (type `ep`).  Updated in place.
+
+        global_dx : numpy.ndarray
+            The global (full) parameter-vector step.
+
+        df : numpy.ndarray or LocalNumpyArray
+            The change in the objective function vector (type `e`).
+
+        Returns
+        -------
+        None
+        """
+        param_ralloc = self.layout.resource_alloc('param-processing')  # acts on (element, param) blocks
+        atom_ralloc = self.layout.resource_alloc('atom-processing')  # acts on (element,) blocks
+        local_dx = global_dx[self.layout.global_param_slice]
+
+        # dot(j, dx) must be summed over the parameter slices of the processors working on this atom
+        if atom_ralloc.comm is None:
+            j_dx = _np.dot(j, local_dx)
+        else:
+            scratch, scratch_shm = _smt.create_shared_ndarray(atom_ralloc, (j.shape[0],), 'd')
+            atom_ralloc.comm.barrier()  # wait for scratch to be ready
+            atom_ralloc.allreduce_sum(scratch, _np.dot(j, local_dx), unit_ralloc=param_ralloc)
+            j_dx = scratch.copy()
+            atom_ralloc.comm.barrier()  # don't free scratch too early
+            _smt.cleanup_shared_ndarray(scratch_shm)
+
+        if param_ralloc.is_host_leader:  # only the "leader" modifies shared mem
+            j += _np.outer(df - j_dx, local_dx / _np.dot(global_dx, global_dx))
+        param_ralloc.host_comm_barrier()
+
     def allocate_jtj_shared_mem_buf(self):
         """
         Allocate scratch space to be used for repeated calls to :meth:`fill_jtj`.
@@ -139,6 +139,64 @@ def fmax_cg(f, x0, maxiters=100, tol=1e-8, dfdx_and_bdflag=None, xopt=None):
     return solution
 
 
+def conjugate_gradient_solve(apply_a, b, rtol=1e-10, maxiter=None):
+    """
+    Solve the linear system `A x = b` using the conjugate-gradient (CG) method.
+
+    `A` must be symmetric and positive semi-definite, and is only accessed
+    through matrix-vector products, so it never needs to be stored.  When `A`
+    is singular and `b` lies in its range, the solution found (starting from
+    `x = 0`) is the minimum-norm one, i.e. `pinv(A) @ b`.
+
+    Parameters
+    ----------
+    apply_a : function
+        A function taking a 1D numpy array `v` and returning `A @ v`.
+
+    b : numpy array
+        The right-hand side vector.
+
+    rtol : float, optional
+        Relative tolerance for convergence: iterations stop once the residual
+        norm `|b - A x|` falls below `rtol * |b|`.
+
+    maxiter : int, optional
+        Maximum iterations.  If None, then `len(b)` is used, which is where
+        exact arithmetic would guarantee convergence.
+
+    Returns
+    -------
+    scipy.optimize.Result object
+        Includes members 'x', 'nit', 'success', and 'message'.
+    """
+    if maxiter is None: maxiter = len(b)
+
+    x = _np.zeros(len(b), 'd')
+    r = _np.array(b, 'd')  # residual, b - A x
+    p = r.copy()
+    rr = _np.dot(r, r)
+    threshold = rtol**2 * rr
+
+    k = 0; message = "Maximum iterations exceeded"
+    while rr > threshold and k < maxiter:
+        Ap = apply_a(p)
+        pAp = _np.dot(p, Ap)
+        if pAp <= 0:  # direction lies in A's null space (b not in range of A, up to roundoff)
+            message = "Search direction has non-positive curvature"; break
+        alpha = rr / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        last_rr, rr = rr, _np.dot(r, r)
+        p = r + (rr / last_rr) * p
+        k += 1
+
+    solution = _optResult()
+    solution.x = x; solution.nit = k
+    solution.success = bool(rr <= threshold)
+    solution.message = "Converged" if solution.success else message
+    return solution
+
+
 # Minimize g(s), given (s1,g1=g(s1)) as a starting point and guess, s2 for minimum
 def _maximize_1d(g, s1, s2, g1):
 
@@ -10,6 +10,8 @@ Custom implementation of the Levenberg-Marquardt Algorithm
 # http://www.apache.org/licenses/LICENSE-2.0 or in the LICENSE file in the root pyGSTi directory.
 #***************************************************************************************************
 
+import os as _os
+import pathlib as _pathlib
 import signal as _signal
 import time as _time
 
@@ -18,6 +20,7 @@ import scipy as _scipy
 
 from pygsti.optimize import arraysinterface as _ari
 from pygsti.optimize.customsolve import custom_solve as _custom_solve
+from pygsti.optimize.customsolve import custom_cholesky_solve as _custom_cholesky_solve
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 from pygsti.baseobjs.resourceallocation import ResourceAllocation as _ResourceAllocation
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
@@ -108,6 +111,107 @@ class Optimizer(_NicelySerializable):
         super().__init__()
 
 
+class CustomLMCheckpoint(_NicelySerializable):
+    """
+    The state of a (partially completed) :func:`custom_leastsq` optimization.
+
+    Holds everything needed to resume the optimization from the start of a given outer
+    iteration, and is periodically written to disk when :func:`custom_leastsq` is given
+    a `checkpoint_path`.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        The (global) parameter vector at the start of iteration `iteration`.
+
+    mu : float
+        The damping parameter.
+
+    nu : float
+        The factor by which `mu` is increased when a step is rejected.
+
+    norm_f : float
+        The (last accepted) objective function value, i.e. the sum of squares, at `x`.
+
+    iteration : int
+        The number of outer iterations that have been completed.
+
+    num_elements : int
+        The length of the objective function vector, used to check that a checkpoint
+        corresponds to a given problem.
+
+    jtj : numpy.ndarray, optional
+        The (undamped) approximate Hessian `J^T J` evaluated at `x`, if it was saved.
+    """
+
+    def __init__(self, x, mu, nu, norm_f, iteration, num_elements, jtj=None):
+        super().__init__()
+        self.x = x
+        self.mu = mu
+        self.nu = nu
+        self.norm_f = norm_f
+        self.iteration = iteration
+        self.num_elements = num_elements
+        self.jtj = jtj
+
+    def is_compatible_with(self, num_params, num_elements):
+        """
+        Whether this checkpoint can be used to resume an optimization of the given size.
+
+        Parameters
+        ----------
+        num_params : int
+            The number of (global) parameters being optimized.
+
+        num_elements : int
+            The length of the objective function vector.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self.x) == num_params and self.num_elements == num_elements
+
+    def _to_nice_serialization(self):
+        state = super()._to_nice_serialization()
+        state.update({'x': self._encodemx(self.x),
+                      'mu': self.mu,
+                      'nu': self.nu,
+                      'objective_function_value': self.norm_f,
+                      'iteration': self.iteration,
+                      'number_of_elements': self.num_elements,
+                      'jtj': self._encodemx(self.jtj)
+                      })
+        return state
+
+    @classmethod
+    def _from_nice_serialization(cls, state):
+        return cls(_np.array(cls._decodemx(state['x']), 'd'), state['mu'], state['nu'],
+                   state['objective_function_value'], state['iteration'], state['number_of_elements'],
+                   cls._decodemx(state['jtj']))
+
+    def write(self, path):
+        """
+        Write this checkpoint to a JSON file, replacing any existing file only once writing is complete.
+
+        Parameters
+        ----------
+        path : str or Path
+            The name of the file that is written.  Must end in ".json".
+
+        Returns
+        -------
+        None
+        """
+        path = _pathlib.Path(path)
+        if path.suffix != '.json':
+            raise ValueError("Checkpoint filename must end in '.json': %s" % str(path))
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(str(tmp_path), 'w') as f:
+            self.dump(f, 'json')
+        _os.replace(str(tmp_path), str(path))  # so a preempted write never corrupts an existing checkpoint
+
+
 class CustomLMOptimizer(Optimizer):
     """
     A Levenberg-Marquardt optimizer customized for GST-like problems.
@@ -208,11 +312,48 @@ class CustomLMOptimizer(Optimizer):
         by the objective function's `.terms()` and `.lsvec()` methods (`'normal'` mode) or the
         "per-circuit quantities" computed by the objective function's `.percircuit()` and
         `.lsvec_percircuit()` methods (`'percircuit'` mode).
+
+    linear_solver : {'lu', 'cholesky', 'eigh'}
+        How the damped normal equations are solved.  `'lu'` performs a new (pivoted LU) solve
+        for every trial damping value.  `'cholesky'` does the same using a blocked Cholesky
+        factorization, which is much faster when solving in parallel (see
+        `serial_solve_proc_threshold`).  `'eigh'` computes a symmetric eigendecomposition of the
+        diagonally-scaled JTJ matrix once per Jacobian evaluation and reuses it for every damping
+        value tried, so that rejected steps cost O(n^2) instead of O(n^3).  Only available when
+        `damping_basis == 'diagonal_values'` and `damping_mode != 'adaptive'`.
+
+    jac_refresh_interval : int, optional
+        The maximum number of outer iterations between full Jacobian evaluations.  When greater
+        than 1, iterations following an accepted step may instead use a Broyden (rank-one) update
+        of the previous Jacobian.  A full Jacobian is always recomputed after a step is rejected
+        or before convergence is declared.
+
+    single_precision_rtol : float, optional
+        If not None, and the objective's model uses a :class:`MatrixForwardSimulator`, the
+        optimization is first run with the simulator set to single precision until the relative
+        change in the objective function falls below this value.  The optimization is then
+        continued, from where it left off, in double precision until the usual tolerances
+        (`tol`) are met.  Each stage may use up to `maxiter` iterations.
+
+    checkpoint_path : str or Path, optional
+        If not None, the name of a ".json" file to which a :class:`CustomLMCheckpoint` is written
+        every `checkpoint_interval` outer iterations.  If this file already exists when :meth:`run`
+        is called, and it corresponds to an optimization of the same size, the optimization is
+        resumed from the saved point.  The file is removed once the optimization completes.
+
+    checkpoint_interval : int, optional
+        The number of outer iterations between checkpoint writes.
+
+    checkpoint_jtj : bool, optional
+        Whether the approximate Hessian `J^T J` is saved in each checkpoint.  This can result in
+        large checkpoint files, and isn't needed to resume the optimization.
     """
     def __init__(self, maxiter=100, maxfev=100, tol=1e-6, fditer=0, first_fditer=0, damping_mode="identity",
                  damping_basis="diagonal_values", damping_clip=None, use_acceleration=False,
                  uphill_step_threshold=0.0, init_munu="auto", oob_check_interval=0,
-                 oob_action="reject", oob_check_mode=0, serial_solve_proc_threshold=100, lsvec_mode="normal"):
+                 oob_action="reject", oob_check_mode=0, serial_solve_proc_threshold=100, lsvec_mode="normal",
+                 linear_solver="lu", jac_refresh_interval=1, single_precision_rtol=None,
+                 checkpoint_path=None, checkpoint_interval=1, checkpoint_jtj=False):
 
         super().__init__()
         if isinstance(tol, float): tol = {'relx': 1e-8, 'relf': tol, 'f': 1.0, 'jac': tol, 'maxdx': 1.0}
@@ -234,6 +375,12 @@ class CustomLMOptimizer(Optimizer):
         self.called_objective_methods = ('lsvec', 'dlsvec')  # the objective function methods we use (for mem estimate)
         self.serial_solve_proc_threshold = serial_solve_proc_threshold
         self.lsvec_mode = lsvec_mode
+        self.linear_solver = linear_solver
+        self.jac_refresh_interval = jac_refresh_interval
+        self.single_precision_rtol = single_precision_rtol
+        self.checkpoint_path = str(checkpoint_path) if (checkpoint_path is not None) else None
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_jtj = checkpoint_jtj
 
     def _to_nice_serialization(self):
         state = super()._to_nice_serialization()
@@ -255,7 +402,13 @@ class CustomLMOptimizer(Optimizer):
             'array_types': self.array_types,
             'called_objective_function_methods': self.called_objective_methods,
             'serial_solve_number_of_processors_threshold': self.serial_solve_proc_threshold,
-            'lsvec_mode': self.lsvec_mode
+            'lsvec_mode': self.lsvec_mode,
+            'linear_solver': self.linear_solver,
+            'jacobian_refresh_interval': self.jac_refresh_interval,
+            'single_precision_relative_ftol': self.single_precision_rtol,
+            'checkpoint_path': self.checkpoint_path,
+            'checkpoint_interval': self.checkpoint_interval,
+            'checkpoint_jtj': self.checkpoint_jtj
         })
         return state
 
@@ -276,7 +429,13 @@ class CustomLMOptimizer(Optimizer):
                    oob_action=state['out_of_bounds_action'],
                    oob_check_mode=state['out_of_bounds_check_mode'],
                    serial_solve_proc_threshold=state['serial_solve_number_of_processors_threshold'],
-                   lsvec_mode=state.get('lsvec_mode', 'normal'))
+                   lsvec_mode=state.get('lsvec_mode', 'normal'),
+                   linear_solver=state.get('linear_solver', 'lu'),
+                   jac_refresh_interval=state.get('jacobian_refresh_interval', 1),
+                   single_precision_rtol=state.get('single_precision_relative_ftol', None),
+                   checkpoint_path=state.get('checkpoint_path', None),
+                   checkpoint_interval=state.get('checkpoint_interval', 1),
+                   checkpoint_jtj=state.get('checkpoint_jtj', False))
 
     def run(self, objective, profiler, printer):
 
@@ -320,13 +479,11 @@ class CustomLMOptimizer(Optimizer):
         ari = _ari.DistributedArraysInterface(objective.layout, self.lsvec_mode, nExtra) \
             if isinstance(objective.layout, _DL) else _ari.UndistributedArraysInterface(nEls, nP)
 
-        opt_x, converged, msg, mu, nu, norm_f, f, opt_jtj = custom_leastsq(
-            objective_func, jacobian, x0,
+        leastsq_kwargs = dict(
             max_iter=self.maxiter,
             num_fd_iters=self.fditer,
             f_norm2_tol=self.tol.get('f', 1.0),
             jac_norm_tol=self.tol.get('jac', 1e-6),
-            rel_ftol=self.tol.get('relf', 1e-6),
             rel_xtol=self.tol.get('relx', 1e-8),
             max_dx_scale=self.tol.get('maxdx', 1.0),
             damping_mode=self.damping_mode,
@@ -341,10 +498,54 @@ class CustomLMOptimizer(Optimizer):
             resource_alloc=objective.resource_alloc,
             arrays_interface=ari,
             serial_solve_proc_threshold=self.serial_solve_proc_threshold,
+            linear_solver=self.linear_solver,
+            jac_refresh_interval=self.jac_refresh_interval,
             x_limits=x_limits,
+            checkpoint_path=self.checkpoint_path,
+            checkpoint_interval=self.checkpoint_interval,
+            checkpoint_jtj=self.checkpoint_jtj,
             verbosity=printer - 1, profiler=profiler)
 
+        checkpoint = None
+        if self.checkpoint_path is not None and _os.path.exists(self.checkpoint_path):
+            comm = objective.resource_alloc.comm
+            if comm is None or comm.rank == 0:
+                checkpoint = CustomLMCheckpoint.read(self.checkpoint_path)
+                if not checkpoint.is_compatible_with(nP, ari.global_num_elements()):
+                    printer.warning("Ignoring incompatible optimizer checkpoint: %s" % self.checkpoint_path)
+                    checkpoint = None
+            if comm is not None:
+                checkpoint = comm.bcast(checkpoint, root=0)
+            if checkpoint is not None:
+                printer.log("Resuming optimization from checkpoint (iteration %d): %s"
+                            % (checkpoint.iteration, self.checkpoint_path), 2)
+
+        from ..forwardsims.matrixforwardsim import MatrixForwardSimulator as _MatrixFSim
+        sim = objective.model.sim
+        if self.single_precision_rtol is not None and isinstance(sim, _MatrixFSim) and sim.precision == "double":
+            # Take the (typically many) early, far-from-converged steps with cheaper single-precision
+            # probabilities, then switch back to double precision to finish the optimization.
+            sim.precision = "single"
+            try:
+                x0, _, msg, _, _, _, _, _ = custom_leastsq(
+                    objective_func, jacobian, x0, checkpoint=checkpoint,
+                    rel_ftol=max(self.single_precision_rtol, self.tol.get('relf', 1e-6)), **leastsq_kwargs)
+                checkpoint = None
+                printer.log("Single-precision least squares message = %s" % msg, 2)
+            finally:
+                sim.precision = "double"
+                if hasattr(objective, 'clear_evaluation_memo'):
+                    objective.clear_evaluation_memo()  # memoized values were computed in single precision
+
+        opt_x, converged, msg, mu, nu, norm_f, f, opt_jtj = custom_leastsq(
+            objective_func, jacobian, x0, checkpoint=checkpoint, rel_ftol=self.tol.get('relf', 1e-6),
+            **leastsq_kwargs)
+
         printer.log("Least squares message = %s" % msg, 2)
+        if self.checkpoint_path is not None and converged:
+            comm = objective.resource_alloc.comm
+            if (comm is None or comm.rank == 0) and _os.path.exists(self.checkpoint_path):
+                _os.remove(self.checkpoint_path)  # a completed optimization shouldn't be resumed
         assert(converged), "Failed to converge: %s" % msg
         current_v = objective.model.to_vector()
         if not _np.allclose(current_v, opt_x):  # ensure the last model evaluation was at opt_x
@@ -385,7 +586,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                    damping_clip=None, use_acceleration=False, uphill_step_threshold=0.0,
                    init_munu="auto", oob_check_interval=0, oob_action="reject", oob_check_mode=0,
                    resource_alloc=None, arrays_interface=None, serial_solve_proc_threshold=100,
-                   x_limits=None, verbosity=0, profiler=None):
+                   linear_solver="lu", jac_refresh_interval=1, x_limits=None, checkpoint=None,
+                   checkpoint_path=None, checkpoint_interval=1, checkpoint_jtj=False, verbosity=0, profiler=None):
     """
     An implementation of the Levenberg-Marquardt least-squares optimization algorithm customized for use within pyGSTi.
 
@@ -511,10 +713,41 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
         implementation is more efficient, it's not worth using the parallel version until there
         are many processors to spread the work among.
 
+    linear_solver : {'lu', 'cholesky', 'eigh'}
+        How the damped normal equations `(JTJ + mu*D) dx = -JTf` are solved.  `'lu'` performs
+        a new solve (see `serial_solve_proc_threshold`) for every trial value of mu, as does
+        `'cholesky'`, which uses a distributed blocked Cholesky factorization (see
+        :func:`custom_cholesky_solve`) instead of Gaussian elimination.  `'eigh'`
+        eigendecomposes `D^(-1/2) JTJ D^(-1/2)` once per Jacobian and reuses it for every value
+        of mu, making each rejected step O(n^2) instead of O(n^3).  Requires
+        `damping_basis == 'diagonal_values'` and a non-adaptive `damping_mode`.
+
+    jac_refresh_interval : int, optional
+        The maximum number of outer iterations between calls to `jac_fn`.  When greater than 1,
+        an outer iteration that follows an accepted step updates the previous Jacobian using
+        Broyden's rank-one formula, `J += outer(df - J dx, dx) / |dx|^2`, instead of calling
+        `jac_fn`.  Whenever a step computed with such an updated Jacobian is rejected, or would
+        trigger convergence, the Jacobian is recomputed with `jac_fn` at the same point instead.
+
     x_limits : numpy.ndarray, optional
         A (num_params, 2)-shaped array, holding on each row the (min, max) values for the corresponding
         parameter (element of the "x" vector).  If `None`, then no limits are imposed.
 
+    checkpoint : CustomLMCheckpoint, optional
+        If not None, resume the optimization from this checkpoint.  Its parameter vector and
+        damping parameters are used in place of `x0` and `init_munu`, and its iterations count
+        toward `max_iter`.
+
+    checkpoint_path : str or Path, optional
+        If not None, the name of a ".json" file to which a :class:`CustomLMCheckpoint` is written
+        (by the root processor) every `checkpoint_interval` outer iterations.
+
+    checkpoint_interval : int, optional
+        The number of outer iterations between checkpoint writes.
+
+    checkpoint_jtj : bool, optional
+        Whether written checkpoints include the (undamped) `J^T J` matrix.
+
     verbosity : int, optional
         Amount of detail to print to stdout.
 
@@ -535,10 +768,27 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     printer = _VerbosityPrinter.create_printer(verbosity, comm)
     ari = arrays_interface  # shorthand
 
+    if jac_refresh_interval < 1:
+        raise ValueError("`jac_refresh_interval` must be >= 1")
+    if linear_solver not in ('lu', 'cholesky', 'eigh'):
+        raise ValueError("Invalid `linear_solver`: %s" % str(linear_solver))
+    solve_fn = _custom_cholesky_solve if (linear_solver == 'cholesky') else _custom_solve
+    if linear_solver == 'eigh' and (damping_basis != 'diagonal_values' or damping_mode == 'adaptive'):
+        raise ValueError("`linear_solver='eigh'` requires damping_basis='diagonal_values' and a non-adaptive"
+                         " damping_mode")
+
     # MEM from ..baseobjs.profiler import Profiler
     # MEM debug_prof = Profiler(comm, True)
     # MEM profiler = debug_prof
 
+    if checkpoint_interval < 1:
+        raise ValueError("`checkpoint_interval` must be >= 1")
+    start_iter = 0
+    if checkpoint is not None:
+        x0 = checkpoint.x
+        init_munu = (checkpoint.mu, checkpoint.nu)
+        start_iter = checkpoint.iteration
+
     msg = ""
     converged = False
     global_x = x0.copy()
@@ -569,6 +819,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     if damping_basis == "singular_values":
         Jac_V = ari.allocate_jtj()
 
+    if linear_solver == 'eigh':
+        JTJ_evecs = ari.allocate_jtj()
+        damping_scale = ari.allocate_jtf()
+
     if damping_mode == 'adaptive':
         dx_lst = [ari.allocate_jtf(), ari.allocate_jtf(), ari.allocate_jtf()]
         new_x_lst = [ari.allocate_jtf(), ari.allocate_jtf(), ari.allocate_jtf()]
@@ -616,9 +870,14 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     rawJTJ_scratch = None
     jtj_buf = ari.allocate_jtj_shared_mem_buf()
 
+    jac_is_approximate = False  # whether Jac is a Broyden-updated (rather than computed) Jacobian
+    num_jac_updates = 0  # number of Broyden updates since Jac was last computed
+    broyden_step = None  # (global_dx, df) of the last accepted step, when it can be used to update Jac
+    last_Jac = f_at_x = None
+
     try:
 
-        for k in range(max_iter):  # outer loop
+        for k in range(start_iter, max_iter):  # outer loop
             # assume global_x, x, f, fnorm hold valid values
 
             if len(msg) > 0:
@@ -644,8 +903,14 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
             if profiler: profiler.memory_check("custom_leastsq: begin outer iter")
 
             # unnecessary b/c global_x is already valid: ari.allgather_x(x, global_x)
-            if k >= num_fd_iters:
+            jac_is_approximate = bool(broyden_step is not None and num_jac_updates + 1 < jac_refresh_interval)
+            if jac_is_approximate:
+                Jac = last_Jac  # rank-one update of the last Jacobian in place of a (costly) jac_fn call
+                ari.broyden_update_jac(Jac, broyden_step[0], broyden_step[1])
+                num_jac_updates += 1
+            elif k >= num_fd_iters:
                 Jac = jac_fn(global_x)  # 'EP'-type, but doesn't actually allocate any more mem (!)
+                num_jac_updates = 0
             else:
                 # Note: x holds only number of "fine"-division params - need to use global_x, and
                 # Jac only holds a subset of the derivative and element columns and rows, respectively.
@@ -662,6 +927,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                         fdJac[:, i - pslice.start] = fd
                     #if comm is not None: comm.barrier()  # overkill for shared memory leader host barrier
                 Jac = fdJac
+                num_jac_updates = 0
+            broyden_step = None
 
             #DEBUG: compare with analytic jacobian (need to uncomment num_fd_iters DEBUG line above too)
             #Jac_analytic = jac_fn(x)
@@ -676,7 +943,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                                                                         Jac.nbytes / (1024.0**3)))
             Jnorm = _np.sqrt(ari.norm2_jac(Jac))
             xnorm = _np.sqrt(ari.norm2_x(x))
-            printer.log("--- Outer Iter %d: norm_f = %g, mu=%g, |x|=%g, |J|=%g" % (k, norm_f, mu, xnorm, Jnorm))
+            printer.log("--- Outer Iter %d: norm_f = %g, mu=%g, |x|=%g, |J|=%g%s" % (
+                k, norm_f, mu, xnorm, Jnorm, " (Broyden-updated J)" if jac_is_approximate else ""))
 
             #assert(_np.isfinite(Jac).all()), "Non-finite Jacobian!" # NaNs tracking
             #assert(_np.isfinite(_np.linalg.norm(Jac))), "Finite Jacobian has inf norm!" # NaNs tracking
@@ -691,6 +959,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
 
             ari.fill_jtj(Jac, JTJ, jtj_buf)
             ari.fill_jtf(Jac, f, JTf)  # 'P'-type
+            if jac_refresh_interval > 1:
+                last_Jac = Jac; f_at_x = f.copy()  # f holds obj_fn(global_x) here
 
             if profiler: profiler.add_time("custom_leastsq: dotprods", tm)
             #assert(not _np.isnan(JTJ).any()), "NaN in JTJ!" # NaNs tracking
@@ -739,6 +1009,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                 #                          num_large_svals, len(Jac_s)))
 
             if norm_JTf < jac_norm_tol:
+                if jac_is_approximate:
+                    continue  # confirm convergence using a computed Jacobian (on the next iteration)
                 if oob_check_interval <= 1:
                     msg = "norm(jacobian) is at most %g" % jac_norm_tol
                     converged = True; break
@@ -750,7 +1022,14 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                     mu, nu, norm_f, f[:], spow, _ = best_x_state
                     continue  # can't make use of saved JTJ yet - recompute on nxt iter
 
-            if k == 0:
+            if checkpoint_path is not None and k > start_iter and k % checkpoint_interval == 0:
+                global_JTJ = ari.gather_jtj(JTJ) if checkpoint_jtj else None  # (JTJ is still undamped here)
+                if comm is None or comm.rank == 0:
+                    CustomLMCheckpoint(global_x.copy(), mu, nu, norm_f, k, ari.global_num_elements(),
+                                       global_JTJ).write(checkpoint_path)
+                    printer.log("Wrote optimizer checkpoint (iteration %d) to %s" % (k, str(checkpoint_path)), 3)
+
+            if k == start_iter:
                 if init_munu == "auto":
                     if damping_mode == 'identity':
                         mu = tau * ari.max_x(undamped_JTJ_diag)  # initial damping element
@@ -767,11 +1046,25 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
             else:
                 #on all other iterations, update JTJ of best_x_state if best_x == x, i.e. if we've just evaluated
                 # a previously accepted step that was deemed the best we've seen so far
-                if _np.allclose(x, best_x):
+                if _np.allclose(x, best_x) and not jac_is_approximate:
                     rawJTJ_scratch[:, :] = JTJ[:, :]  # use pre-allocated memory
                     rawJTJ_scratch[idiag] = undamped_JTJ_diag  # no damping; the "raw" JTJ
                     best_x_state = best_x_state[0:5] + (rawJTJ_scratch,)  # update mu,nu,JTJ of initial "best state"
 
+            jtj_eig = None  # (evals, inv_sqrt_scale, evec_coeffs_of_minus_JTf) when linear_solver == 'eigh'
+            if linear_solver == 'eigh':
+                tm = _time.time()
+                if damping_mode == 'identity':
+                    damping_scale[:] = 1.0
+                elif damping_mode == 'JTJ':
+                    damping_scale[:] = dclip(undamped_JTJ_diag)
+                else:  # 'invJTJ'
+                    damping_scale[:] = dclip(1.0 / undamped_JTJ_diag)
+                jtj_eig = _eigh_factor_jtj(JTJ, damping_scale, JTJ_evecs, ari, comm)
+                if jtj_eig is not None:
+                    jtj_eig += (ari.global_svd_dot(JTJ_evecs, jtj_eig[1] * minus_JTf),)
+                if profiler: profiler.add_time("custom_leastsq: eigh factorization", tm)
+
             #determing increment using adaptive damping
             while True:  # inner loop
 
@@ -827,16 +1120,21 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                     success = True
 
                     if damping_basis == 'diagonal_values':
-                        if damping_mode == 'adaptive':
+                        if jtj_eig is not None:
+                            # O(n^2): reuse the eigendecomposition of the (scaled) undamped JTJ
+                            evals, inv_sqrt_scale, evec_coeffs = jtj_eig
+                            ari.fill_dx_svd(JTJ_evecs, evec_coeffs / (evals + mu), dx)
+                            dx *= inv_sqrt_scale
+                        elif damping_mode == 'adaptive':
                             for ii, add_to_diag in enumerate(add_to_diag_lst):
                                 JTJ[idiag] = undamped_JTJ_diag + add_to_diag  # ok if assume fine-param-proc.size == 1
                                 #dx_lst.append(_scipy.linalg.solve(JTJ, -JTf, sym_pos=True))
                                 #dx_lst.append(custom_solve(JTJ, -JTf, resource_alloc))
-                                _custom_solve(JTJ, minus_JTf, dx_lst[ii], ari, resource_alloc,
-                                              serial_solve_proc_threshold)
+                                solve_fn(JTJ, minus_JTf, dx_lst[ii], ari, resource_alloc,
+                                         serial_solve_proc_threshold)
                         else:
                             #dx = _scipy.linalg.solve(JTJ, -JTf, sym_pos=True)
-                            _custom_solve(JTJ, minus_JTf, dx, ari, resource_alloc, serial_solve_proc_threshold)
+                            solve_fn(JTJ, minus_JTf, dx, ari, resource_alloc, serial_solve_proc_threshold)
 
                     elif damping_basis == 'singular_values':
                         #Note: above solves JTJ*x = -JTf => x = inv_JTJ * (-JTf)
@@ -879,7 +1177,13 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                         ari.fill_jtf(Jac, df2, JTdf2)
                         JTdf2 *= -0.5  # keep using JTdf2 memory in solve call below
                         #dx2 = _scipy.linalg.solve(JTJ, -0.5 * JTdf2, sym_pos=True)  # Note: JTJ not init w/'adaptive'
-                        _custom_solve(JTJ, JTdf2, dx2, ari, resource_alloc, serial_solve_proc_threshold)
+                        if jtj_eig is not None:
+                            evals, inv_sqrt_scale, _ = jtj_eig
+                            ari.fill_dx_svd(JTJ_evecs, ari.global_svd_dot(JTJ_evecs, inv_sqrt_scale * JTdf2)
+                                            / (evals + mu), dx2)
+                            dx2 *= inv_sqrt_scale
+                        else:
+                            solve_fn(JTJ, JTdf2, dx2, ari, resource_alloc, serial_solve_proc_threshold)
                         dx1[:] = dx[:]
                         dx += dx2  # add acceleration term to dx
                     except _scipy.linalg.LinAlgError:
@@ -990,6 +1294,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                     #print("DB: new_x = ", new_x)
 
                     if norm_dx < (rel_xtol**2) * norm_x:  # and mu < MU_TOL2:
+                        if jac_is_approximate:
+                            break  # confirm convergence using a computed Jacobian
                         if oob_check_interval <= 1:
                             msg = "Relative change, |dx|/|x|, is at most %g" % rel_xtol
                             converged = True; break
@@ -1146,6 +1452,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
 
                         if dL / norm_f < rel_ftol and dF >= 0 and dF / norm_f < rel_ftol \
                            and dF / dL < 2.0 and accel_ratio <= alpha:
+                            if jac_is_approximate:
+                                break  # confirm convergence using a computed Jacobian
                             if oob_check_interval <= 1:  # (if 0 then no oob checking is done)
                                 msg = "Both actual and predicted relative reductions in the" + \
                                     " sum of squares are at most %g" % rel_ftol
@@ -1201,6 +1509,8 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
                                 mu_factor = max(t, 1.0 / 3.0) if norm_dx > 1e-8 else 0.3
                                 mu *= mu_factor
                                 nu = 2
+                                if jac_refresh_interval > 1:
+                                    broyden_step = (global_new_x - global_x, new_f - f_at_x)
                                 x[:] = new_x[:]; f[:] = new_f[:]; norm_f = norm_new_f
                                 global_x[:] = global_new_x[:]
                                 printer.log("      Accepted%s! gain ratio=%g  mu * %g => %g"
@@ -1234,6 +1544,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
 
                 # if this point is reached, either the linear solve failed
                 # or the error did not reduce.  In either case, reject increment.
+                if jac_is_approximate:
+                    # Don't increase mu based on an updated Jacobian - recompute it (at the same x) instead
+                    printer.log("      Rejected%s!  Recomputing Jacobian." % reject_msg, 2)
+                    break
 
                 #Increase damping (mu), then increase damping factor to
                 # accelerate further damping increases.
@@ -1279,6 +1593,10 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     if damping_basis == "singular_values":
         ari.deallocate_jtj(Jac_V)
 
+    if linear_solver == 'eigh':
+        ari.deallocate_jtj(JTJ_evecs)
+        ari.deallocate_jtf(damping_scale)
+
     if damping_mode == 'adaptive':
         for xx in dx_lst: ari.deallocate_jtf(xx)
         for xx in new_x_lst: ari.deallocate_jtf(xx)
@@ -1311,6 +1629,64 @@ def custom_leastsq(obj_fn, jac_fn, x0, f_norm2_tol=1e-6, jac_norm_tol=1e-6,
     #return solution
 
 
+def _eigh_factor_jtj(jtj, damping_scale, jtj_evecs, ari, comm):
+    """
+    Eigendecompose a diagonally-scaled JTJ matrix for reuse across many damping values.
+
+    Writing the damped normal-equations matrix as `JTJ + mu*D`, with `D = diag(damping_scale)`,
+    we have `JTJ + mu*D = D^(1/2) (W (evals + mu) W^T) D^(1/2)` where `W diag(evals) W^T` is
+    the eigendecomposition of `D^(-1/2) JTJ D^(-1/2)`.  Solving for any `mu` then only requires
+    matrix-vector products with `W`.
+
+    Parameters
+    ----------
+    jtj : numpy.ndarray or LocalNumpyArray
+        The (local, undamped) `jtj`-type matrix.
+
+    damping_scale : numpy.ndarray
+        The (local) `jtf`-type vector of values that the damping parameter multiplies.
+
+    jtj_evecs : numpy.ndarray or LocalNumpyArray
+        A `jtj`-type array that is filled with the eigenvectors `W`.
+
+    ari : ArraysInterface
+        The arrays interface used to gather and scatter `jtj` and `jtf`-type arrays.
+
+    comm : mpi4py.MPI.Comm or None
+        The communicator used by the optimizer.
+
+    Returns
+    -------
+    tuple or None
+        `(evals, inv_sqrt_scale)`, where `evals` is a global array of eigenvalues and `inv_sqrt_scale`
+        is the local `jtf`-type array `1/sqrt(damping_scale)`.  `None` is returned (on all processors)
+        if the decomposition cannot be used, e.g. when `damping_scale` has non-positive elements,
+        in which case the caller should fall back to a direct solve.
+    """
+    global_jtj = ari.gather_jtj(jtj)
+    global_scale = ari.gather_jtf(damping_scale)
+    if comm is None or comm.rank == 0:
+        global_evecs = None
+        if _np.all(_np.isfinite(global_scale)) and _np.all(global_scale > 0):
+            global_inv_sqrt_scale = 1.0 / _np.sqrt(global_scale)
+            try:
+                # the divide-and-conquer driver is several times faster than numpy's default here
+                evals, global_evecs = _scipy.linalg.eigh(global_inv_sqrt_scale[:, None] * global_jtj
+                                                         * global_inv_sqrt_scale[None, :], driver='evd')
+                evals = _np.clip(evals, 0, None)  # JTJ is positive semidefinite
+            except _scipy.linalg.LinAlgError:
+                global_evecs = None
+        if global_evecs is None: evals = None
+        if comm is not None: comm.bcast(evals, root=0)
+    else:
+        evals = comm.bcast(None, root=0)
+
+    if evals is None:
+        return None
+    ari.scatter_jtj(global_evecs if (comm is None or comm.rank == 0) else None, jtj_evecs)
+    return (evals, 1.0 / _np.sqrt(damping_scale))
+
+
 def _hack_dx(obj_fn, x, dx, jac, jtj, jtf, f, norm_f):
     #HACK1
     #if nRejects >= 2:
@@ -165,7 +165,7 @@ def custom_solve(a, b, x, ari, resource_alloc, proc_threshold=100):
         potential_pivot_indices = all_row_indices[potential_pivot_mask]
         ibest_global, ibest_local, h, k = _find_pivot(a, b, icol, potential_pivot_indices, my_row_slice,
                                                       shared_floats, shared_ints, resource_alloc, comm, host_comm,
-                                                      smbuf1, smbuf2, smbuf3, host_index_buf, host_val_buf)
+                                                      smbuf1, smbuf1b, smbuf2, smbuf3, host_index_buf, host_val_buf)
 
         # Step 2: proc that owns best row (holds that row and is root of param-fine comm) broadcasts it
         pivot_row, pivot_b = _broadcast_pivot_row(a, b, ibest_local, h, k, shared_rowb, local_pivot_rowb,
@@ -210,6 +210,155 @@ def custom_solve(a, b, x, ari, resource_alloc, proc_threshold=100):
     return
 
 
+def custom_cholesky_solve(a, b, x, ari, resource_alloc, proc_threshold=100, block_size=256):
+    """
+    Parallel blocked Cholesky solve of a symmetric positive definite system.
+
+    A distributed alternative to :func:`custom_solve` for the (symmetric positive
+    definite) damped normal equations solved by the Levenberg-Marquardt optimizer.
+    Rather than eliminating one pivot column at a time, this routine processes
+    `block_size` columns at once:
+
+    - the (already updated) row block `[a|b][k]` is assembled on every processor - via
+      shared memory on each host and, if there are multiple hosts, a single all-reduce
+      between host leaders.
+    - every processor factors the small diagonal block and solves for the corresponding
+      block row of the Cholesky factor `U` (where `a = U.T @ U`) and of `y = inv(U.T) @ b`.
+    - each processor applies a single matrix-matrix update to the rows of `a|b` it owns.
+
+    Back substitution (`U @ x = y`) then requires one small all-reduce per block.  When
+    there are fewer than `proc_threshold` processors, :func:`custom_solve` is used instead
+    (which gathers the system onto the root processor and calls SciPy).
+
+    Parameters
+    ----------
+    a : LocalNumpyArray
+        A 2D array with the `'jtj'` distribution, holding the rows of the `a` matrix belonging
+        to the current processor.  (This belonging is dictated by the "fine" distribution in
+        a distributed layout.)  This matrix must be symmetric and positive definite.
+
+    b : LocalNumpyArray
+        A 1D array with the `'jtf'` distribution, holding the rows of the `b` vector belonging
+        to the current processor.
+
+    x : LocalNumpyArray
+        A 1D array with the `'jtf'` distribution, holding the rows of the `x` vector belonging
+        to the current processor.  This vector is filled by this function.
+
+    ari : ArraysInterface
+        An object that provides an interface for creating and manipulating data arrays.
+
+    resource_alloc : ResourceAllocation
+        Gives the resources (e.g., processors and memory) available for use.
+
+    proc_threshold : int, optional
+        Below this number of processors this routine defers to :func:`custom_solve`, which
+        uses SciPy's serial solver on the root processor.
+
+    block_size : int, optional
+        The number of columns factored per communication round.
+
+    Returns
+    -------
+    None
+    """
+    comm = resource_alloc.comm
+    if comm is None or isinstance(ari, _UndistributedArraysInterface) \
+       or (comm.size < proc_threshold and a.shape[1] < 10000):
+        return custom_solve(a, b, x, ari, resource_alloc, proc_threshold)
+
+    from mpi4py import MPI
+    host_comm = resource_alloc.host_comm
+    interhost_comm = resource_alloc.interhost_comm
+    n = a.shape[1]
+    my_row_slice = ari.jtf_param_slice()
+    _, owner_host_and_rank_of_global_fine_param_index = ari.param_fine_info()
+
+    # only one of the processors holding a given fine-parameter slice contributes its rows
+    i_own_rows = bool(_slct.length(my_row_slice) > 0
+                      and owner_host_and_rank_of_global_fine_param_index[my_row_slice.start][1] == comm.rank)
+    r0, r1 = (my_row_slice.start, my_row_slice.stop) if i_own_rows else (0, 0)
+
+    #Working copy of the rows of a|b owned by this proc.  Holds the (updated) trailing matrix and,
+    # once a row's block has been factored, the corresponding row of U|y.
+    work = _np.empty((r1 - r0, n + 1), 'd')
+    if i_own_rows:
+        work[:, 0:n] = a
+        work[:, n] = b
+
+    if host_comm is not None:
+        blockbuf, blockbuf_shm = _smt.create_shared_ndarray(resource_alloc, (block_size * (n + 1),), 'd')
+    else:
+        blockbuf, blockbuf_shm = _np.empty(block_size * (n + 1), 'd'), None
+
+    def _assemble_rows(c0, c1, fill_fn, num_cols):
+        # Assemble a (c1-c0, num_cols) block of rows [c0, c1) on all processors; each proc's
+        # owned rows are filled by `fill_fn(block_rows_view, local_row_slice, block_row_slice)`.
+        blk = blockbuf[0:(c1 - c0) * num_cols].reshape((c1 - c0, num_cols))
+        lo, hi = max(c0, r0), min(c1, r1)
+        if host_comm is not None:
+            host_comm.barrier()  # all procs are done reading the previous block
+            if interhost_comm.size > 1:
+                if host_comm.rank == 0: blk.fill(0.0)
+                host_comm.barrier()
+            if lo < hi: fill_fn(blk, slice(lo - r0, hi - r0), slice(lo - c0, hi - c0))
+            host_comm.barrier()
+            if interhost_comm.size > 1:
+                if host_comm.rank == 0: interhost_comm.Allreduce(MPI.IN_PLACE, blk, op=MPI.SUM)
+                host_comm.barrier()
+        else:
+            blk.fill(0.0)
+            if lo < hi: fill_fn(blk, slice(lo - r0, hi - r0), slice(lo - c0, hi - c0))
+            comm.Allreduce(MPI.IN_PLACE, blk, op=MPI.SUM)
+        return blk
+
+    def _fill_trailing_rows(blk, local_rows, block_rows):
+        blk[block_rows, :] = work[local_rows, c0:]
+
+    diag_blocks = []
+    y = _np.empty(n, 'd')
+    try:
+        # Factorization, with forward substitution (y = inv(U.T) b) carried along as an extra column
+        for c0 in range(0, n, block_size):
+            c1 = min(c0 + block_size, n); nb = c1 - c0
+            rowblock = _assemble_rows(c0, c1, _fill_trailing_rows, n + 1 - c0)  # [a|b][c0:c1, c0:]
+
+            try:
+                u_kk = _scipy.linalg.cholesky(rowblock[:, 0:nb], lower=False, check_finite=False)
+            except _scipy.linalg.LinAlgError:
+                raise _scipy.linalg.LinAlgError("Matrix is not positive definite!")  # raised by all procs
+            u_k = _np.empty(rowblock.shape, 'd')  # [U_kk | U_k,trailing | y_k]
+            u_k[:, 0:nb] = u_kk
+            u_k[:, nb:] = _scipy.linalg.solve_triangular(u_kk, rowblock[:, nb:], trans='T', lower=False,
+                                                         check_finite=False)
+            diag_blocks.append(u_kk)
+            y[c0:c1] = u_k[:, -1]
+
+            # store U rows we own, then update our trailing rows: [a|b]_ij -= sum_k U_ki U_kj
+            lo, hi = max(c0, r0), min(c1, r1)
+            if lo < hi: work[lo - r0:hi - r0, c0:] = u_k[lo - c0:hi - c0, :]
+            t0 = max(c1, r0)
+            if t0 < r1:
+                work[t0 - r0:, c1:] -= _np.dot(u_k[:, t0 - c0:r1 - c0].T, u_k[:, nb:])
+
+        # Back substitution: U x = y
+        global_x = _np.empty(n, 'd')
+        for k in reversed(range(len(diag_blocks))):
+            c0 = k * block_size; c1 = min(c0 + block_size, n)
+
+            def _fill_rhs(blk, local_rows, block_rows):
+                blk[block_rows, 0] = _np.dot(work[local_rows, c1:n], global_x[c1:])
+
+            rhs = y[c0:c1] - _assemble_rows(c0, c1, _fill_rhs, 1)[:, 0]
+            global_x[c0:c1] = _scipy.linalg.solve_triangular(diag_blocks[k], rhs, lower=False, check_finite=False)
+    finally:
+        if host_comm is not None:
+            host_comm.barrier()  # make sure no proc is still using the shared block buffer
+            _smt.cleanup_shared_ndarray(blockbuf_shm)
+
+    x[:] = global_x[my_row_slice]
+
+
 def _find_pivot(a, b, icol, potential_pivot_inds, my_row_slice, shared_floats, shared_ints,
                 resource_alloc, comm, host_comm, buf1, buf1b, buf2, buf3, best_host_indices, best_host_vals):
     
@@ -291,7 +440,7 @@ def _find_pivot(a, b, icol, potential_pivot_inds, my_row_slice, shared_floats, s
         # root proc determines best global pivot and broadcasts row# to others (& it's recorded for later)
         if comm.rank == 0:
             k = _np.argmax(best_local_vals)  # winning & by fiat "owning" rank within comm
-            ibest_global = best_local_gindices[k]  # chosen (global) pivot row index
+            ibest_global = best_local_gindices[k, 0]  # chosen (global) pivot row index (a copy, not a view)
             buf2[0] = ibest_global; buf2[1] = k
             comm.Bcast(buf2, root=0)
         else:
@@ -379,7 +528,7 @@ def _back_substitution(a, b, x, pivot_row_indices, my_row_slice, ari, resource_a
     #  If shared memory is used, first do this within the host, then do again for
     #    only inter-host transfers.
     comm = resource_alloc.comm
-    my_host_index = resource_alloc.host_index if (host_comm is not None) else 0
+    my_host_index = resource_alloc.host_index if (host_comm is not None) else comm.rank  # 1 proc per "host"
     my_rank = comm.rank
     param_fine_slices_by_host, owner_host_and_rank_of_global_fine_param_index = ari.param_fine_info()
     for col_host_index, ranks_and_pslices in enumerate(param_fine_slices_by_host):
@@ -21,9 +21,11 @@ import scipy.stats as _stats
 from pygsti import optimize as _opt
 from pygsti import tools as _tools
 from pygsti.models.explicitcalc import P_RANK_TOL
+from pygsti.optimize.customcg import conjugate_gradient_solve as _conjugate_gradient_solve
 from pygsti.baseobjs.nicelyserializable import NicelySerializable as _NicelySerializable
 from pygsti.baseobjs.verbosityprinter import VerbosityPrinter as _VerbosityPrinter
 from pygsti.circuits.circuitlist import CircuitList as _CircuitList
+from pygsti.objectivefns.objectivefns import _objfn
 from pygsti.objectivefns.objectivefns import PoissonPicDeltaLogLFunction as _PoissonPicDeltaLogLFunction
 from pygsti.objectivefns.objectivefns import Chi2Function as _Chi2Function
 from pygsti.objectivefns.objectivefns import FreqWeightedChi2Function as _FreqWeightedChi2Function
@@ -63,7 +65,8 @@ class ConfidenceRegionFactory(_NicelySerializable):
     non-gauge space.
 
     Alternative (non-Hessian-based) means of computing confidence intervals
-    are also available, such as by using so-called "linear reponse error bars".
+    are also available, such as by using so-called "linear reponse error bars"
+    or "Hessian-free error bars".
 
     Parameters
     ----------
@@ -136,6 +139,7 @@ class ConfidenceRegionFactory(_NicelySerializable):
         self.hessian_projection_parameters = _collections.OrderedDict()
         self.inv_hessian_projections = _collections.OrderedDict()
         self.linresponse_gstfit_params = None
+        self.inv_hessian_solver = None
         self.nNonGaugeParams = self.nGaugeParams = None
 
         self.model_lbl = model_lbl
@@ -151,11 +155,15 @@ class ConfidenceRegionFactory(_NicelySerializable):
         if self.linresponse_gstfit_params and "resource_alloc" in self.linresponse_gstfit_params:
             to_pickle['linresponse_gstfit_params'] = self.linresponse_gstfit_params.copy()
             del to_pickle['linresponse_gstfit_params']['resource_alloc']  # one *cannot* pickle Comm objects
+        if self.inv_hessian_solver is not None and self.inv_hessian_solver.layout is not None \
+           and self.inv_hessian_solver.layout.resource_alloc().comm is not None:
+            to_pickle['inv_hessian_solver'] = None  # its distributed factors are only meaningful w/their Comm
 
         return to_pickle
 
     def __setstate__(self, state_dict):
         self.__dict__.update(state_dict)
+        self.__dict__.setdefault('inv_hessian_solver', None)  # for backward compatibility
         self.parent = None  # initialize to None upon unpickling
 
     def _to_nice_serialization(self):
@@ -170,7 +178,8 @@ class ConfidenceRegionFactory(_NicelySerializable):
                       'num_nongauge_params': int(self.nNonGaugeParams) if (self.nNonGaugeParams is not None) else None,
                       'num_gauge_params': int(self.nGaugeParams) if (self.nGaugeParams is not None) else None,
                       #Note: need int(.) casts above because int64 is *not* JSON serializable (?)
-                      #Note: we don't currently serialize self.linresponse_gstfit_params (!)
+                      #Note: we don't currently serialize self.linresponse_gstfit_params
+                      # or self.inv_hessian_solver (!)
                       })
         return state
 
@@ -223,12 +232,14 @@ class ConfidenceRegionFactory(_NicelySerializable):
     @classmethod
     def _create_obj_from_doc_and_mongodb(cls, doc, mongodb):
         if doc['hessian_matrix_id'] is not None:
-            import gridfs as _gridfs
             import pickle as _pickle
-            fs = _gridfs.GridFS(mongodb, collection='pygsti_gridfs')
-            hessian_mx = _pickle.loads(fs.get(doc['hessian_matrix_id']).read())
-            inv_hessian_projections = {proj_lbl: _pickle.loads(fs.get(proj_id).read())
-                                       for proj_lbl, proj_id in doc['inverse_hessian_projection_ids'].items()}
+            from pygsti.baseobjs.mongoserializable import read_gridfs_files as _read_gridfs_files
+            proj_lbls = list(doc['inverse_hessian_projection_ids'].keys())
+            file_ids = [doc['hessian_matrix_id']] + [doc['inverse_hessian_projection_ids'][lbl] for lbl in proj_lbls]
+            file_data = _read_gridfs_files(mongodb, 'pygsti_gridfs', file_ids)  # downloads files concurrently
+            hessian_mx = _pickle.loads(file_data[0])
+            inv_hessian_projections = {proj_lbl: _pickle.loads(data)
+                                       for proj_lbl, data in zip(proj_lbls, file_data[1:])}
         else:
             hessian_mx = None
             inv_hessian_projections = {}
@@ -396,16 +407,27 @@ class ConfidenceRegionFactory(_NicelySerializable):
         MIN_NON_MARK_RADIUS = 1e-8  # must be >= 0
 
         if obj == 'logl':
-            hessian_fn = _tools.logl_approximate_hessian if approximate \
-                else _tools.logl_hessian
-            hessian = hessian_fn(model, dataset, circuit_list,
-                                 minProbClip, probClipInterval, radius,
-                                 comm=comm, mem_limit=mem_limit, verbosity=vb,
-                                 op_label_aliases=aliases)
+            if approximate:
+                # The approximate Hessian and the jacobian both need the probability derivatives at `model`'s
+                # parameters, so compute them with one objective function that memoizes these derivatives.
+                objective = _objfn(_PoissonPicDeltaLogLFunction, model, dataset, circuit_list,
+                                   {'min_prob_clip': minProbClip, 'radius': radius},
+                                   {'prob_clip_interval': probClipInterval}, aliases, comm, mem_limit,
+                                   ('approximate_hessian', 'jacobian'), (), None, vb)
+                objective.set_evaluation_memo_limits(max_dprobs=1)
+                hessian = objective.approximate_hessian()  # Note: hessian is only assembled on root processor
+                hessian = -hessian if (comm is None or comm.rank == 0) else None  # objective is max_logl - logl
+                jacobian = objective.layout.allgather_local_array('ep', -objective.jacobian())
+                objective.clear_evaluation_memo()
+            else:
+                hessian = _tools.logl_hessian(model, dataset, circuit_list,
+                                              minProbClip, probClipInterval, radius,
+                                              comm=comm, mem_limit=mem_limit, verbosity=vb,
+                                              op_label_aliases=aliases)
 
-            jacobian = _tools.logl_jacobian(model, dataset, circuit_list,
-                                            minProbClip, probClipInterval, radius,
-                                            comm=comm, mem_limit=mem_limit, verbosity=vb)
+                jacobian = _tools.logl_jacobian(model, dataset, circuit_list,
+                                                minProbClip, probClipInterval, radius,
+                                                comm=comm, mem_limit=mem_limit, verbosity=vb)
 
             nonMarkRadiusSq = max(2 * (_tools.logl_max(model, dataset, circuit_list,
                                                        op_label_aliases=aliases)
@@ -565,11 +587,79 @@ class ConfidenceRegionFactory(_NicelySerializable):
             'objective_function_builder': _copy.deepcopy(builder),
             'resource_alloc': resource_alloc,
         }
+        self.inv_hessian_solver = None  # replaces any Hessian-free error bars
 
         #Count everything as non-gauge? TODO BETTER
         self.nNonGaugeParams = self.model.num_params
         self.nGaugeParams = 0
 
+    def enable_hessian_free_errorbars(self, resource_alloc=None, rtol=1e-10, maxiter=None):
+        """
+        Stores the quantities needed to compute (on-demand) Hessian-free error bars.
+
+        'Hessian-free' mode approximates the Hessian of the final objective function
+        by its Gauss-Newton (Fisher information) form, `D.T @ diag(w) @ D`, which only
+        requires the probability derivatives `D` (see
+        :meth:`TimeIndependentMDCObjectiveFunction.approximate_hessian_factors`).  Each
+        error bar then requires a conjugate-gradient solve, projected onto the non-gauge
+        space, that only uses Hessian-vector products.  Neither the Hessian nor its inverse
+        is ever formed, so this mode is useful when the model has too many parameters to
+        use :meth:`compute_hessian` but solving a GST fit for each error bar (as
+        :meth:`enable_linear_response_errorbars` does) is too expensive.
+
+        The error bars agree with those obtained from :meth:`compute_hessian` with
+        `approximate=True` followed by a 'std' :meth:`project_hessian`, up to the
+        conjugate-gradient tolerance.  Profile-likelihood confidence intervals (the
+        diagonal of the inverse Hessian) are not available in this mode.
+
+        Parameters
+        ----------
+        resource_alloc : ResourceAllocation, optional
+            Allocation used when computing the probability derivatives.
+
+        rtol : float, optional
+            Relative residual tolerance of each conjugate-gradient solve.
+
+        maxiter : int, optional
+            Maximum number of iterations of each conjugate-gradient solve.  If None,
+            the number of model parameters is used.
+
+        Returns
+        -------
+        None
+        """
+        assert(self.parent is not None)  # Estimate
+        assert(self.parent.parent is not None)  # Results
+
+        model = self.parent.models[self.model_lbl]
+        circuit_list = self.parent.parent.circuit_lists[self.circuit_list_lbl]
+        dataset = self.parent.parent.dataset
+        objfn_builder = self.parent.final_objfn_builder
+
+        if not hasattr(objfn_builder.cls_to_build, 'approximate_hessian_factors'):
+            raise ValueError("Unsupported objective function class: " + objfn_builder.cls_to_build.__name__)
+        obj = objfn_builder.cls_to_build.create_from(
+            model=model, dataset=dataset, circuits=circuit_list, resource_alloc=resource_alloc,
+            regularization=objfn_builder.regularization, penalties=objfn_builder.penalties,
+            method_names=('fn', 'approximate_hessian_factors'), **objfn_builder.additional_args)
+        dprobs, weights = obj.approximate_hessian_factors(model.to_vector())
+        fitval = obj.fn()
+        if issubclass(objfn_builder.cls_to_build, _PoissonPicDeltaLogLFunction):
+            fitval *= 2  # objective is max_logl - logl, and radius is computed from 2 * (max_logl - logl)
+
+        gauge_space = model.compute_gauge_space()  # the non-gauge complement isn't needed
+        self.nGaugeParams = gauge_space.shape[1]
+        self.nNonGaugeParams = model.num_params - self.nGaugeParams
+
+        aliases = circuit_list.op_label_aliases if isinstance(circuit_list, _CircuitList) else None
+        ds_circuit_list = _tools.apply_aliases_to_circuits(circuit_list, aliases)
+        nDataParams = dataset.degrees_of_freedom(ds_circuit_list)
+        MIN_NON_MARK_RADIUS = 1e-8  # must be >= 0
+        self.nonMarkRadiusSq = max(fitval - (nDataParams - self.nNonGaugeParams), MIN_NON_MARK_RADIUS)
+
+        self.inv_hessian_solver = _GaussNewtonInverseHessian(dprobs, weights, gauge_space, obj.layout, rtol, maxiter)
+        self.linresponse_gstfit_params = None  # replaces any linear-response error bars
+
     def view(self, confidence_level, region_type='normal',
              hessian_projection_label=None):
         """
@@ -584,8 +674,8 @@ class ConfidenceRegionFactory(_NicelySerializable):
 
         region_type : {'normal', 'non-markovian'}
             The type of confidence regions.  `'normal'` constructs standard
-            intervals based on the inverted Hessian matrix or linear-response
-            optimizations.  `'non-markovian'` attempts to enlarge the intervals
+            intervals based on the inverted Hessian matrix, Hessian-free solves or
+            linear-response optimizations.  `'non-markovian'` attempts to enlarge the intervals
             to account for the badness-of-fit at the current location.
 
         hessian_projection_label : str, optional
@@ -600,6 +690,7 @@ class ConfidenceRegionFactory(_NicelySerializable):
         ConfidenceRegionFactoryView
         """
         inv_hessian_projection = None
+        inv_hessian_solver = None
         linresponse_gstfit_params = None
 
         assert(self.parent is not None)  # Estimate
@@ -613,9 +704,13 @@ class ConfidenceRegionFactory(_NicelySerializable):
             assert(hessian_projection_label in self.inv_hessian_projections.keys()), \
                 "Hessian projection '%s' does not exist!" % hessian_projection_label
             inv_hessian_projection = self.inv_hessian_projections[hessian_projection_label]
+        elif self.inv_hessian_solver is not None:
+            assert(hessian_projection_label is None), \
+                "Must set `hessian_projection_label` to None when using Hessian-free error bars"
+            inv_hessian_solver = self.inv_hessian_solver
         else:
             assert(self.linresponse_gstfit_params is not None), \
-                "Must either compute & project a Hessian matrix or enable linear response parameters"
+                "Must either compute & project a Hessian matrix or enable Hessian-free or linear response error bars"
             assert(hessian_projection_label is None), \
                 "Must set `hessian_projection_label` to None when using linear-response error bars"
             linresponse_gstfit_params = self.linresponse_gstfit_params
@@ -630,7 +725,7 @@ class ConfidenceRegionFactory(_NicelySerializable):
 
         return ConfidenceRegionFactoryView(model, inv_hessian_projection, linresponse_gstfit_params,
                                            confidence_level, nonMarkRadiusSq,
-                                           self.nNonGaugeParams, self.nGaugeParams)
+                                           self.nNonGaugeParams, self.nGaugeParams, inv_hessian_solver)
 
         #TODO: where to move this?
         ##Check that number of gauge parameters reported by model is consistent with confidence region
@@ -814,10 +909,15 @@ class ConfidenceRegionFactoryView(object):
     n_gauge_params : int
         The numbers of gauge parameters.  This could be computed from `model`
         but can be passed in to save compuational time.
+
+    inv_hessian_solver : object, optional
+        An object whose `solve(v)` method applies the inverse of the non-gauge-projected
+        Hessian to the vector `v`.  Used for Hessian-free error bars, in which case
+        `inv_projected_hessian` should be None.
     """
 
     def __init__(self, model, inv_projected_hessian, mlgst_params, confidence_level,
-                 non_mark_radius_sq, n_non_gauge_params, n_gauge_params):
+                 non_mark_radius_sq, n_non_gauge_params, n_gauge_params, inv_hessian_solver=None):
         """
         Creates a new ConfidenceRegionFactoryView.
 
@@ -855,6 +955,11 @@ class ConfidenceRegionFactoryView(object):
         n_non_gauge_params, n_gauge_params : int
             The numbers of non-gauge and gauge parameters, respectively.  These could be
             computed from `model` but they're passed in to save compuational time.
+
+        inv_hessian_solver : object, optional
+            An object whose `solve(v)` method applies the inverse of the non-gauge-projected
+            Hessian to the vector `v`.  Used for Hessian-free error bars, in which case
+            `inv_projected_hessian` should be None.
         """
 
         # Scale projected Hessian for desired confidence level => quadratic form for confidence region assume hessian
@@ -884,6 +989,7 @@ class ConfidenceRegionFactoryView(object):
 
             # save quadratic form Q s.t. xT*Q*x = 1 gives confidence region using C1, i.e. a
             #  region appropriate for generating 1-D confidence intervals.
+            self._invRegionQuadcFormScale = C1
             if inv_projected_hessian is not None:
                 self.invRegionQuadcForm = inv_projected_hessian * C1
             else:
@@ -902,9 +1008,9 @@ class ConfidenceRegionFactoryView(object):
 
             # save quadratic form Q s.t. xT*Q*x = 1 gives confidence region using C1, i.e. a
             #  region appropriate for generating 1-D confidence intervals.
+            self._invRegionQuadcFormScale = C1 / _np.sqrt(n_non_gauge_params)  # *worst case* non-mark. region...
             if inv_projected_hessian is not None:
-                self.invRegionQuadcForm = inv_projected_hessian * C1
-                self.invRegionQuadcForm /= _np.sqrt(n_non_gauge_params)  # make a *worst case* non-mark. region...
+                self.invRegionQuadcForm = inv_projected_hessian * self._invRegionQuadcFormScale
             else:
                 self.invRegionQuadcForm = None
 
@@ -920,6 +1026,8 @@ class ConfidenceRegionFactoryView(object):
                            " cannot be interpreted as standard error bars."
                            " Proceed with caution!")
 
+        self.invHessianSolver = inv_hessian_solver  # applies inv_projected_hessian w/out forming it
+
         #Store list of profile-likelihood confidence intervals
         #  which == sqrt(diagonal els) of invRegionQuadcForm
         if self.invRegionQuadcForm is not None:
@@ -1105,7 +1213,7 @@ class ConfidenceRegionFactoryView(object):
             return self._compute_df_from_grad_f(grad_f, f0, return_fn_val, verbosity)
 
     def _compute_df_from_grad_f(self, grad_f, f0, return_fn_val, verbosity):
-        if self.invRegionQuadcForm is None:
+        if self.invRegionQuadcForm is None and self.invHessianSolver is None:
             df = self._compute_df_from_grad_f_linresponse(
                 grad_f, f0, verbosity)
         else:
@@ -1158,6 +1266,12 @@ class ConfidenceRegionFactoryView(object):
 
         return delta
 
+    def _apply_inv_region_quadc_form(self, v):
+        """ Computes `invRegionQuadcForm @ v`, using `invHessianSolver` when there's no matrix """
+        if self.invRegionQuadcForm is not None:
+            return _np.dot(self.invRegionQuadcForm, v)
+        return self.invHessianSolver.solve(v) * self._invRegionQuadcFormScale
+
     def _compute_df_from_grad_f_hessian(self, grad_f, f0, verbosity):
         """
         Internal function which computes error bars given an function value
@@ -1180,11 +1294,11 @@ class ConfidenceRegionFactoryView(object):
             #arg = _np.dot(gradFdag, _np.dot(self.invRegionQuadcForm, grad_f))
             #print "HERE: taking sqrt(abs(%s))" % arg
 
-            df = _np.sqrt(abs(_np.dot(gradFdag, _np.dot(self.invRegionQuadcForm, grad_f))))
+            df = _np.sqrt(abs(_np.dot(gradFdag, self._apply_inv_region_quadc_form(grad_f))))
         elif isinstance(f0, complex):
             gradFdag = _np.transpose(grad_f)  # conjugate?
-            df = _np.sqrt(abs(_np.dot(gradFdag.real, _np.dot(self.invRegionQuadcForm, grad_f.real)))) \
-                + 1j * _np.sqrt(abs(_np.dot(gradFdag.imag, _np.dot(self.invRegionQuadcForm, grad_f.imag))))
+            df = _np.sqrt(abs(_np.dot(gradFdag.real, self._apply_inv_region_quadc_form(grad_f.real)))) \
+                + 1j * _np.sqrt(abs(_np.dot(gradFdag.imag, self._apply_inv_region_quadc_form(grad_f.imag))))
         else:
             fDims = len(f0.shape)
             grad_f = _np.rollaxis(grad_f, 0, 1 + fDims)  # roll parameter axis to be the last index, preceded by f-shape
@@ -1193,24 +1307,25 @@ class ConfidenceRegionFactoryView(object):
             if f0.dtype == _np.dtype("complex"):  # real and imaginary parts separately
                 if fDims == 0:  # same as float case above
                     gradFdag = _np.transpose(grad_f)  # conjugate?
-                    df = _np.sqrt(abs(_np.dot(gradFdag.real, _np.dot(self.invRegionQuadcForm, grad_f.real)))) \
-                        + 1j * _np.sqrt(abs(_np.dot(gradFdag.imag, _np.dot(self.invRegionQuadcForm, grad_f.imag))))
+                    df = _np.sqrt(abs(_np.dot(gradFdag.real, self._apply_inv_region_quadc_form(grad_f.real)))) \
+                        + 1j * _np.sqrt(abs(_np.dot(gradFdag.imag, self._apply_inv_region_quadc_form(grad_f.imag))))
                 elif fDims == 1:
                     for i in range(f0.shape[0]):
                         gradFdag = _np.transpose(grad_f[i])  # conjugate?
-                        df[i] = (_np.sqrt(abs(_np.dot(gradFdag.real, _np.dot(self.invRegionQuadcForm, grad_f[i].real))))
+                        df[i] = (_np.sqrt(abs(_np.dot(gradFdag.real,
+                                                      self._apply_inv_region_quadc_form(grad_f[i].real))))
                                  + 1j * _np.sqrt(abs(_np.dot(gradFdag.imag,
-                                                             _np.dot(self.invRegionQuadcForm, grad_f[i].imag)))))
+                                                             self._apply_inv_region_quadc_form(grad_f[i].imag)))))
                 elif fDims == 2:
                     for i in range(f0.shape[0]):
                         for j in range(f0.shape[1]):
                             gradFdag = _np.transpose(grad_f[i, j])  # conjugate?
                             df[i, j] = _np.sqrt(abs(_np.dot(
                                 gradFdag.real,
-                                _np.dot(self.invRegionQuadcForm, grad_f[i, j].real)))) \
+                                self._apply_inv_region_quadc_form(grad_f[i, j].real)))) \
                                 + 1j * \
-                                _np.sqrt(abs(_np.dot(gradFdag.imag, _np.dot(
-                                    self.invRegionQuadcForm, grad_f[i, j].imag))))
+                                _np.sqrt(abs(_np.dot(gradFdag.imag, self._apply_inv_region_quadc_form(
+                                    grad_f[i, j].imag))))
                 else:
                     raise ValueError("Unsupported number of dimensions returned by fnOfOp or fnOfModel: %d" % fDims)
 
@@ -1222,16 +1337,16 @@ class ConfidenceRegionFactoryView(object):
                     #arg = _np.dot(gradFdag, _np.dot(self.invRegionQuadcForm, grad_f))
                     #print "HERE2: taking sqrt(abs(%s))" % arg
 
-                    df = _np.sqrt(abs(_np.dot(gradFdag, _np.dot(self.invRegionQuadcForm, grad_f))))
+                    df = _np.sqrt(abs(_np.dot(gradFdag, self._apply_inv_region_quadc_form(grad_f))))
                 elif fDims == 1:
                     for i in range(f0.shape[0]):
                         gradFdag = _np.conjugate(_np.transpose(grad_f[i]))
-                        df[i] = _np.sqrt(abs(_np.dot(gradFdag, _np.dot(self.invRegionQuadcForm, grad_f[i]))))
+                        df[i] = _np.sqrt(abs(_np.dot(gradFdag, self._apply_inv_region_quadc_form(grad_f[i]))))
                 elif fDims == 2:
                     for i in range(f0.shape[0]):
                         for j in range(f0.shape[1]):
                             gradFdag = _np.conjugate(_np.transpose(grad_f[i, j]))
-                            df[i, j] = _np.sqrt(abs(_np.dot(gradFdag, _np.dot(self.invRegionQuadcForm, grad_f[i, j]))))
+                            df[i, j] = _np.sqrt(abs(_np.dot(gradFdag, self._apply_inv_region_quadc_form(grad_f[i, j]))))
                 else:
                     raise ValueError("Unsupported number of dimensions returned by fnOfOp or fnOfModel: %d" % fDims)
 
@@ -1239,6 +1354,88 @@ class ConfidenceRegionFactoryView(object):
 
         return df
 
+
+class _GaussNewtonInverseHessian(object):
+    """
+    Applies the inverse of a gauge-projected Gauss-Newton Hessian without forming it.
+
+    The (approximate) Hessian is `dprobs.T @ diag(weights) @ dprobs`.  It is projected
+    onto the complement of `gauge_space` and its pseudo-inverse is applied to vectors by
+    conjugate-gradient solves that only need products with `dprobs` and `dprobs.T`.
+    When `dprobs` is distributed, each processor multiplies by its local block and the
+    results are summed, so the full Jacobian is never gathered onto any one processor.
+
+    Parameters
+    ----------
+    dprobs : numpy.ndarray
+        The (local portion of the) probability Jacobian, of shape `(nElements, nParams)`.
+
+    weights : numpy.ndarray
+        The (local portion of the) second derivatives of the objective function terms
+        with respect to the probabilities, of shape `(nElements,)`.
+
+    gauge_space : numpy.ndarray
+        An array of shape `(nParams, nGaugeParams)` whose columns span the gauge space.
+
+    layout : CircuitOutcomeProbabilityArrayLayout, optional
+        The layout `dprobs` and `weights` are distributed according to.  If None, these
+        arrays are taken to be global.
+
+    rtol : float, optional
+        Relative residual tolerance of each conjugate-gradient solve.
+
+    maxiter : int, optional
+        Maximum iterations of each conjugate-gradient solve.
+    """
+
+    def __init__(self, dprobs, weights, gauge_space, layout=None, rtol=1e-10, maxiter=None):
+        self.dprobs = dprobs
+        self.weights = weights
+        self.gauge_basis = _np.linalg.qr(gauge_space)[0]  # orthonormal basis for gauge space
+        self.layout = layout
+        self.rtol = rtol
+        self.maxiter = maxiter
+
+    def _project(self, v):
+        return v - _np.dot(self.gauge_basis, _np.dot(self.gauge_basis.T, v))
+
+    def _apply_gauss_newton(self, v):
+        param_slice = getattr(self.layout, 'global_param_slice', None)
+        if param_slice is None:  # dprobs and weights are global
+            return _np.dot(self.dprobs.T, self.weights * _np.dot(self.dprobs, v))
+
+        ralloc = self.layout.resource_alloc()
+        atom_ralloc = self.layout.resource_alloc('atom-processing')  # acts on (element,) blocks
+        param_ralloc = self.layout.resource_alloc('param-processing')  # acts on (element, param) blocks
+
+        # dot(dprobs, v) is summed over the parameter slices of the processors working on this atom
+        dprobs_v = atom_ralloc.allreduce_sum_simple(_np.dot(self.dprobs, v[param_slice]), unit_ralloc=param_ralloc)
+        local_result = _np.zeros(len(v), 'd')
+        local_result[param_slice] = _np.dot(self.dprobs.T, self.weights * dprobs_v)
+        return ralloc.allreduce_sum_simple(local_result, unit_ralloc=param_ralloc)  # sum over atoms & params
+
+    def _apply_hessian(self, v):
+        return self._project(self._apply_gauss_newton(self._project(v)))
+
+    def solve(self, v):
+        """
+        Apply the pseudo-inverse of the projected Hessian to `v`.
+
+        Parameters
+        ----------
+        v : numpy.ndarray
+            A 1D array of length `nParams`.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        result = _conjugate_gradient_solve(self._apply_hessian, self._project(v), self.rtol, self.maxiter)
+        if not result.success:
+            _warnings.warn("Hessian-free error bar solve did not converge (%s) - error bars may be inaccurate."
+                           % result.message)
+        return result.x
+
 #Helper functions
 
 
@@ -82,7 +82,7 @@ class Estimate(_MongoSerializable):
         _MongoSerializable.__init__(ret)
         ret.__dict__.update(_io.load_meta_based_dir(_pathlib.Path(dirname), 'auxfile_types', quick_load=quick_load))
         for crf in ret.confidence_region_factories.values():
-            crf.set_parent(ret)  # re-link confidence_region_factories
+            _io.metadir._apply_when_loaded(crf, lambda c: c.set_parent(ret))  # re-link confidence_region_factories
         return ret
 
     @classmethod
@@ -134,8 +134,9 @@ class GateSetTomographyDesign(_proto.CircuitListsDesign, HasProcessorSpec):
         GateSetTomographyDesign
         """
         mapped_processorspec = self.processor_spec.map_qubit_labels(mapper)
-        mapped_circuits = [c.map_state_space_labels(mapper) for c in self.all_circuits_needing_data]
-        mapped_circuit_lists = [[c.map_state_space_labels(mapper) for c in circuit_list]
+        memo = {}  # share mapped layers between all the circuit lists
+        mapped_circuits = _circuits.map_state_space_labels_in_circuits(self.all_circuits_needing_data, mapper, memo)
+        mapped_circuit_lists = [_circuits.map_state_space_labels_in_circuits(circuit_list, mapper, memo)
                                 for circuit_list in self.circuit_lists]
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         return GateSetTomographyDesign(mapped_processorspec, mapped_circuit_lists, mapped_circuits,
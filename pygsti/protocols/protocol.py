@@ -860,7 +860,7 @@ class ExperimentDesign(_TreeNode, _MongoSerializable):
         for _, sub_design in self._vals.items():
             sub_design._truncate_to_available_data_inplace(dataset)
 
-    def write(self, dirname=None, parent=None):
+    def write(self, dirname=None, parent=None, circuit_table=False):
         """
         Write this experiment design to a directory.
 
@@ -877,6 +877,14 @@ class ExperimentDesign(_TreeNode, _MongoSerializable):
             The parent experiment design, when a parent is writing this
             design as a sub-experiment-design.  Otherwise leave as None.
 
+        circuit_table : bool, optional
+            If True, the circuits of this design and all of its sub-designs are
+            written once, to a single binary table of unique circuits within
+            `dirname/edesign`, and each design's circuit lists are stored as
+            indices into this table.  This makes nested designs (e.g. combined or
+            simultaneous designs) much smaller on disk and faster to load.  (When a
+            design writes its sub-designs, it passes them its table via this argument.)
+
         Returns
         -------
         None
@@ -885,9 +893,15 @@ class ExperimentDesign(_TreeNode, _MongoSerializable):
             dirname = self._loaded_from
             if dirname is None: raise ValueError("`dirname` must be given because there's no default directory")
 
-        _io.write_obj_to_meta_based_dir(self, _pathlib.Path(dirname) / 'edesign', 'auxfile_types')
-
-        self._write_children(dirname)
+        edesign_dir = _pathlib.Path(dirname) / 'edesign'
+        if circuit_table is True:  # this design is the root of the tree of designs using the table
+            table = _io.metadir._CircuitTable(path=edesign_dir / _io.metadir.CIRCUIT_TABLE_FILENAME)
+        else:  # a sub-design is given the table of its parent (or no table)
+            table = circuit_table if circuit_table else None
+        _io.write_obj_to_meta_based_dir(self, edesign_dir, 'auxfile_types', circuit_table=table)
+        self._write_children(dirname, circuit_table=table)
+        if circuit_table is True:
+            table.write()
         self._loaded_from = str(_pathlib.Path(dirname).absolute())  # for future writes
 
     def _add_auxiliary_write_ops_and_update_doc(self, doc, write_ops, mongodb, collection_name,
@@ -1006,7 +1020,7 @@ class ExperimentDesign(_TreeNode, _MongoSerializable):
         -------
         ExperimentDesign
         """
-        mapped_circuits = [c.map_state_space_labels(mapper) for c in self.all_circuits_needing_data]
+        mapped_circuits = _circuits.map_state_space_labels_in_circuits(self.all_circuits_needing_data, mapper)
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         mapped_children = {key: child.map_qubit_labels(mapper) for key, child in self._vals.items()}
         return ExperimentDesign(mapped_circuits, mapped_qubit_labels, mapped_children, self._dirs)
@@ -1192,8 +1206,9 @@ class CircuitListsDesign(ExperimentDesign):
         -------
         CircuitListsDesign
         """
-        mapped_circuits = [c.map_state_space_labels(mapper) for c in self.all_circuits_needing_data]
-        mapped_circuit_lists = [[c.map_state_space_labels(mapper) for c in circuit_list]
+        memo = {}  # share mapped layers between all the circuit lists
+        mapped_circuits = _circuits.map_state_space_labels_in_circuits(self.all_circuits_needing_data, mapper, memo)
+        mapped_circuit_lists = [_circuits.map_state_space_labels_in_circuits(circuit_list, mapper, memo)
                                 for circuit_list in self.circuit_lists]
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         return CircuitListsDesign(mapped_circuit_lists, mapped_circuits, mapped_qubit_labels,
@@ -1398,7 +1413,7 @@ class CombinedExperimentDesign(ExperimentDesign):  # for multiple designs on the
         -------
         CombinedExperimentDesign
         """
-        mapped_circuits = [c.map_state_space_labels(mapper) for c in self.all_circuits_needing_data]
+        mapped_circuits = _circuits.map_state_space_labels_in_circuits(self.all_circuits_needing_data, mapper)
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         mapped_sub_designs = {key: child.map_qubit_labels(mapper) for key, child in self._vals.items()}
         return CombinedExperimentDesign(mapped_sub_designs, mapped_circuits, mapped_qubit_labels, self._dirs)
@@ -1605,7 +1620,7 @@ class SimultaneousExperimentDesign(ExperimentDesign):
         -------
         SimultaneousExperimentDesign
         """
-        mapped_circuits = [c.map_state_space_labels(mapper) for c in self.all_circuits_needing_data]
+        mapped_circuits = _circuits.map_state_space_labels_in_circuits(self.all_circuits_needing_data, mapper)
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         mapped_edesigns = [child.map_qubit_labels(mapper) for child in self._vals.values()]
         return SimultaneousExperimentDesign(mapped_edesigns, mapped_circuits, mapped_qubit_labels)
@@ -1712,7 +1727,7 @@ class FreeformDesign(ExperimentDesign):
         -------
         FreeformDesign
         """
-        mapped_circuits = [c.map_state_space_labels(mapper) for c in self.all_circuits_needing_data]
+        mapped_circuits = _circuits.map_state_space_labels_in_circuits(self.all_circuits_needing_data, mapper)
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         return FreeformDesign(mapped_circuits, mapped_qubit_labels)
 
@@ -250,7 +250,7 @@ class TreeNode(object):
         # #  write_subdir_json = True  # True only for the "master" type that defines the directory keys ('edesign')
         # self.write_children(dirname, write_subdir_json)
 
-    def _write_children(self, dirname, write_subdir_json=True):
+    def _write_children(self, dirname, write_subdir_json=True, **kwargs):
         """
         Writes this node's children to directories beneath `dirname`.
 
@@ -269,6 +269,9 @@ class TreeNode(object):
             and sometimes it's useful to name children with a tuple rather than
             just a string).
 
+        kwargs : dict
+            Additional arguments passed to each child's `write` method.
+
         Returns
         -------
         None
@@ -286,7 +289,7 @@ class TreeNode(object):
             subdir = self._dirs[nm]
             outdir = dirname / subdir
             outdir.mkdir(exist_ok=True)
-            self._vals[nm].write(outdir, parent=self)
+            self._vals[nm].write(outdir, parent=self, **kwargs)
 
     def _add_children_write_ops_and_update_doc(self, doc, write_ops, mongodb, overwrite_existing, **kwargs):
         # Note: this additional args to, e.g. write_to_mongodb
@@ -13,6 +13,7 @@ Volumetric Benchmarking Protocol objects
 import numpy as _np
 
 from pygsti.protocols import protocol as _proto
+from pygsti import circuits as _circuits
 from pygsti.models.oplessmodel import SuccessFailModel as _SuccessFailModel
 from pygsti import tools as _tools
 from pygsti.algorithms import randomcircuit as _rc
@@ -62,7 +63,8 @@ class ByDepthDesign(_proto.CircuitListsDesign):
         -------
         ByDepthDesign
         """
-        mapped_circuit_lists = [[c.map_state_space_labels(mapper) for c in circuit_list]
+        memo = {}  # share mapped layers between all the circuit lists
+        mapped_circuit_lists = [_circuits.map_state_space_labels_in_circuits(circuit_list, mapper, memo)
                                 for circuit_list in self.circuit_lists]
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         return ByDepthDesign(self.depths, mapped_circuit_lists, mapped_qubit_labels, remove_duplicates=False)
@@ -108,9 +110,10 @@ class BenchmarkingDesign(ByDepthDesign):
     def _mapped_circuits_and_idealouts_by_depth(self, mapper):
         """ Used in derived classes """
         mapped_circuits_and_idealouts_by_depth = {}
+        memo = {}  # share mapped layers between all the depths
         for depth, circuit_list, idealout_list in zip(self.depths, self.circuit_lists, self.idealout_lists):
-            mapped_circuits_and_idealouts_by_depth[depth] = \
-                [(c.map_state_space_labels(mapper), iout) for c, iout in zip(circuit_list, idealout_list)]
+            mapped_circuits = _circuits.map_state_space_labels_in_circuits(circuit_list, mapper, memo)
+            mapped_circuits_and_idealouts_by_depth[depth] = list(zip(mapped_circuits, idealout_list))
         return mapped_circuits_and_idealouts_by_depth
 
     def map_qubit_labels(self, mapper):
@@ -128,7 +131,8 @@ class BenchmarkingDesign(ByDepthDesign):
         -------
         ByDepthDesign
         """
-        mapped_circuit_lists = [[c.map_state_space_labels(mapper) for c in circuit_list]
+        memo = {}  # share mapped layers between all the circuit lists
+        mapped_circuit_lists = [_circuits.map_state_space_labels_in_circuits(circuit_list, mapper, memo)
                                 for circuit_list in self.circuit_lists]
         mapped_qubit_labels = self._mapped_qubit_labels(mapper)
         return BenchmarkingDesign(self.depths, mapped_circuit_lists, list(self.idealout_lists),
@@ -14,6 +14,7 @@
 
 import numpy as np
 from libc.stdlib cimport malloc, free
+from libc.math cimport sqrt, log, fabs
 cimport numpy as np
 cimport cython
 
@@ -1305,6 +1306,140 @@ def fast_compose_cliffords(np.ndarray[np.int64_t, ndim=2] s1, np.ndarray[np.int6
     return s, p
 
 
+# Fused objective-function kernels: each computes the least-squares vector (and optionally its derivative with
+# respect to the probabilities) of a raw objective function in a single pass over the layout-sized arrays, writing
+# into caller-supplied buffers.  They mirror the NumPy implementations in pygsti/objectivefns/objectivefns.py.
 
+@cython.cdivision(True) # turn off divide-by-zero checking
+@cython.boundscheck(False) # turn off bounds-checking for entire function
+@cython.wraparound(False)  # turn off negative index wrapping for entire function
+def fused_chi2_lsvec(double[:] lsvec_out, double[:] dlsvec_out,
+                     const double[:] probs, const double[:] freqs, const double[:] total_counts,
+                     double min_prob_clip_for_weighting):
+    cdef INT i
+    cdef INT n = probs.shape[0]
+    cdef double p, cp, w
+    cdef bint fill_deriv = dlsvec_out is not None
+
+    for i in range(n):
+        p = probs[i]
+        cp = p if p > min_prob_clip_for_weighting else min_prob_clip_for_weighting
+        w = sqrt(total_counts[i] / cp)
+        lsvec_out[i] = (p - freqs[i]) * w
+        if fill_deriv:
+            if p < min_prob_clip_for_weighting:
+                dlsvec_out[i] = w
+            else:
+                dlsvec_out[i] = w - (p - freqs[i]) * 0.5 * w / cp
 
 
+@cython.cdivision(True) # turn off divide-by-zero checking
+@cython.boundscheck(False) # turn off bounds-checking for entire function
+@cython.wraparound(False)  # turn off negative index wrapping for entire function
+def fused_poisson_pic_lsvec(double[:] lsvec_out, double[:] dlsvec_out,
+                            const double[:] probs, const double[:] counts,
+                            const double[:] total_counts, const double[:] freqs,
+                            const double[:] log_pos, const double[:] log_freqs,
+                            bint pfratio, double min_p, double x0, double x1,
+                            bint harsh_zero_freq, double zero_freq_param):
+    # Returns the minimum term value so the caller can raise an error when regularization yields negative terms.
+    # `log_pos` holds log(max(x, x0)) ('pfratio') or log(max(p, min_p)) ('minp') and `log_freqs` holds log(f)
+    # (with zero frequencies replaced by 1), both computed by numpy: terms near a perfect fit are differences of
+    # nearly-equal values, so these are evaluated exactly as the NumPy implementation does.
+    cdef INT i
+    cdef INT n = probs.shape[0]
+    cdef double p, c, N, f, x, pos, c0, c1, t, d, ls, dx
+    cdef double min_term = 0.0
+    cdef double zf_c1 = 0.0
+    cdef double zf_p0 = 0.0
+    cdef double a = zero_freq_param
+    cdef bint fill_deriv = dlsvec_out is not None
+
+    if not harsh_zero_freq:  # `zero_freq_param` is fmin
+        zf_c1 = (0.5 / zero_freq_param) * 1.0 / (x1 * x1)
+        zf_p0 = 1.0 / zf_c1
+
+    for i in range(n):
+        p = probs[i]
+        c = counts[i]
+        N = total_counts[i]
+        f = freqs[i] if c != 0 else 1.0
+        x = p / f
+
+        if c == 0:  # special handling for zero-frequency terms
+            if harsh_zero_freq:
+                if p >= a:
+                    t = N * p
+                    d = N
+                else:
+                    t = N * ((-1.0 / (3 * a * a)) * (p * p * p) + (p * p) / a + a / 3.0)
+                    d = N * ((-1.0 / (a * a)) * (p * p) + 2 * p / a)
+            else:
+                if p > zf_p0:
+                    t = N * p
+                    d = N
+                else:
+                    t = N * (zf_c1 * (p * p))
+                    d = N * (2 * zf_c1 * p)
+        elif pfratio:
+            pos = x0 if x < x0 else x
+            c0 = c * (1 - 1 / x1)
+            c1 = 0.5 * c / (x1 * x1)
+            t = -c * (1.0 - pos + log_pos[i])
+            if t < 0: t = 0.0
+            if x < x0:
+                dx = x - x0
+                t = t + c0 * dx + c1 * (dx * dx)
+                d = (c0 + 2 * c1 * dx) / f
+            else:
+                d = N * (-1 / pos + 1)
+        else:
+            pos = min_p if p < min_p else p
+            c0 = N - c / min_p
+            c1 = 0.5 * c / (min_p * min_p)
+            t = c * (log_freqs[i] - 1.0) - c * log_pos[i] + N * pos
+            if t < 0: t = 0.0
+            if p < min_p:
+                dx = p - min_p
+                t = t + c0 * dx + c1 * (dx * dx)
+                d = c0 + 2 * c1 * dx
+            else:
+                d = N - c / pos
+
+        if t < 0:
+            if t < min_term: min_term = t
+            ls = 0.0
+        else:
+            ls = sqrt(t)
+
+        if pfratio and fabs(x - 1) < 1e-6:  # post-sqrt 1st order taylor patch for x near 1.0
+            ls = sqrt(c) * fabs(x - 1) / sqrt(2.0)
+
+        lsvec_out[i] = ls
+        if fill_deriv:
+            dlsvec_out[i] = 0.0 if ls < 1e-100 else 0.5 / ls * d
+
+    return min_term
+
+
+@cython.cdivision(True) # turn off divide-by-zero checking
+@cython.boundscheck(False) # turn off bounds-checking for entire function
+@cython.wraparound(False)  # turn off negative index wrapping for entire function
+def fused_omitted_dlsvec_update(double[:, :] dlsvec, const int[:] firsts, const double[:] lsvec,
+                                const double[:] omitted_terms, const double[:] omitted_dterms,
+                                const double[:, :] dprobs_omitted_rowsum):
+    # Updates the rows of a least-squares jacobian that carry omitted-probability contributions, in place.
+    cdef INT k, j, irow
+    cdef INT nfirsts = firsts.shape[0]
+    cdef INT ncols = dlsvec.shape[1]
+    cdef double ls, updated_ls, scale, offset
+
+    for k in range(nfirsts):
+        irow = firsts[k]
+        ls = lsvec[irow]
+        updated_ls = sqrt(ls * ls + omitted_terms[k])
+        if updated_ls == 0: updated_ls = 1.0  # avoid 0/0 where lsvec & deriv == 0
+        scale = ls / updated_ls
+        offset = 0.5 / updated_ls * omitted_dterms[k]
+        for j in range(ncols):
+            dlsvec[irow, j] = dlsvec[irow, j] * scale - offset * dprobs_omitted_rowsum[k, j]
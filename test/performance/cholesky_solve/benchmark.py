@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Compares `custom_solve` (distributed Gaussian elimination) with `custom_cholesky_solve`
+(distributed blocked Cholesky) on the `jtj`-distributed arrays used by the LM optimizer.
+
+Run via, e.g.: mpiexec -np 8 python benchmark.py [num_params] [block_size] [shared]
+
+Adding `shared` uses shared memory between the processors on each host (set
+PYGSTI_MAX_HOST_PROCS to emulate multiple hosts on a single machine).
+"""
+import sys
+import time
+
+import numpy as np
+from mpi4py import MPI
+
+import pygsti
+from pygsti.modelpacks import smq2Q_XYICNOT as std
+from pygsti.optimize import arraysinterface as _ari
+from pygsti.optimize.customsolve import custom_solve, custom_cholesky_solve
+
+comm = MPI.COMM_WORLD
+num_params = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+block_size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+use_shared_mem = 'shared' in sys.argv[3:]
+num_repeats = 3
+
+# Only the parameter distribution of the layout is used: make a model with >= num_params parameters
+mdl = std.target_model('full')
+while mdl.num_params < num_params:
+    mdl.operations[('Gextra%d' % len(mdl.operations),)] = mdl.operations[('Gxpi2', 0)].copy()
+resource_alloc = pygsti.baseobjs.ResourceAllocation(comm)
+if use_shared_mem: resource_alloc.build_hostcomms()
+layout = mdl.sim.create_layout(std.create_gst_experiment_design(1).all_circuits_needing_data,
+                               resource_alloc=resource_alloc, array_types=('ep', 'jtj'), verbosity=0)
+ari = _ari.DistributedArraysInterface(layout, 'normal')
+nP = mdl.num_params
+
+# A random symmetric positive definite system, identical on all procs
+rng = np.random.default_rng(1234)
+jac = rng.standard_normal((nP + 10, nP))
+global_a = jac.T @ jac + np.eye(nP)
+global_b = rng.standard_normal(nP)
+x_exact = np.linalg.solve(global_a, global_b)
+
+a = ari.allocate_jtj(); b = ari.allocate_jtf(); x = ari.allocate_jtf()
+ari.scatter_jtj(global_a if comm.rank == 0 else None, a)
+ari.scatter_jtf(global_b if comm.rank == 0 else None, b)
+global_x = np.empty(nP, 'd')
+
+for name, solve in [('custom_solve', lambda: custom_solve(a, b, x, ari, resource_alloc, proc_threshold=1)),
+                    ('custom_cholesky_solve', lambda: custom_cholesky_solve(a, b, x, ari, resource_alloc,
+                                                                            proc_threshold=1,
+                                                                            block_size=block_size))]:
+    times = []
+    for _ in range(num_repeats):
+        comm.barrier(); t0 = time.time()
+        solve()
+        comm.barrier(); times.append(time.time() - t0)
+    ari.allgather_x(x, global_x)
+    if comm.rank == 0:
+        print("%s: nprocs=%d shared=%s nparams=%d  best time = %.3fs  |x - x_exact| = %.2g"
+              % (name, comm.size, use_shared_mem, nP, min(times), np.linalg.norm(global_x - x_exact)))
+
+ari.deallocate_jtj(a); ari.deallocate_jtf(b); ari.deallocate_jtf(x)
+layout = None  # free shared memory before python shuts down the shared memory "system"
@@ -0,0 +1,17 @@
+#!/bin/bash
+
+# Runs the linear-solver benchmark over a range of processor counts, e.g.: ./run.sh 1000 256
+# Ensure that the correct Python environment (with mpi4py) is set before running.
+
+NUM_PARAMS=${1:-1000}
+BLOCK_SIZE=${2:-256}
+
+export OPENBLAS_NUM_THREADS=1
+export OMP_NUM_THREADS=1
+export MKL_NUM_THREADS=1
+
+for NUM_PROCS in 1 2 4 8 16 32 64; do
+  mpirun -np ${NUM_PROCS} python ./benchmark.py ${NUM_PARAMS} ${BLOCK_SIZE} &> ${NUM_PROCS}.out
+  mpirun -np ${NUM_PROCS} python ./benchmark.py ${NUM_PARAMS} ${BLOCK_SIZE} shared &> ${NUM_PROCS}_shared.out
+done
+grep -h "solve:" *.out
@@ -53,6 +53,31 @@ class ParallelTest(object):
 
             assert np.allclose(best_params_serial, best_params_parallel)
 
+    def test_hessian_free_errorbars(self):
+        comm = self.ralloc.comm
+
+        exp_design = std.get_gst_experiment_design(2)
+        mdl_datagen = std.target_model().depolarize(op_noise=0.1, spam_noise=0.01)
+        ds = pygsti.data.simulate_data(mdl_datagen, exp_design, 1000, seed=1234, comm=None)
+        data = pygsti.protocols.ProtocolData(exp_design, ds)
+        results = pygsti.protocols.GateSetTomography(std.target_model("full TP"), gaugeopt_suite=None,
+                                                     verbosity=0).run(data, comm=None, disable_checkpointing=True)
+        est = results.estimates["GateSetTomography"]
+
+        ConfidenceRegionFactory = pygsti.protocols.confidenceregionfactory.ConfidenceRegionFactory
+        crfact_serial = ConfidenceRegionFactory(est, 'final iteration estimate', 'final')
+        crfact_serial.enable_hessian_free_errorbars()
+        crfact_parallel = ConfidenceRegionFactory(est, 'final iteration estimate', 'final')
+        crfact_parallel.enable_hessian_free_errorbars(resource_alloc=self.ralloc)
+
+        # the probability Jacobian stays distributed
+        if comm is not None and comm.size > 1:
+            assert crfact_parallel.inv_hessian_solver.dprobs.size < crfact_serial.inv_hessian_solver.dprobs.size
+
+        # every rank must be able to apply the inverse Hessian
+        v = np.random.RandomState(1234).random_sample(est.models['final iteration estimate'].num_params)
+        assert np.allclose(crfact_serial.inv_hessian_solver.solve(v), crfact_parallel.inv_hessian_solver.solve(v))
+
     def test_MPI_probs(self):
         comm = self.ralloc.comm
 
@@ -127,7 +152,40 @@ class ParallelTest(object):
         parallel, pscale = mdl.sim.bulk_dproduct(gstrs, scale=True, resource_alloc=self.ralloc)
         assert(np.linalg.norm(serial_scl*sscale[:,None,None,None] -
                               parallel*pscale[:,None,None,None]) < 1e-6)
-    
+
+    def test_cholesky_solve(self):
+        from pygsti.optimize import arraysinterface as _ari
+        from pygsti.optimize.customsolve import custom_solve, custom_cholesky_solve
+        comm = self.ralloc.comm
+
+        # Only the parameter distribution of the layout is used
+        mdl = std.target_model('full')
+        layout = mdl.sim.create_layout(std.create_gst_experiment_design(1).all_circuits_needing_data,
+                                       resource_alloc=self.ralloc, array_types=('ep', 'jtj'), verbosity=0)
+        ari = _ari.DistributedArraysInterface(layout, 'normal')
+        nP = mdl.num_params
+
+        # A random symmetric positive definite system, identical on all procs
+        rng = np.random.default_rng(1234)
+        jac = rng.standard_normal((nP + 10, nP))
+        global_a = jac.T @ jac + np.eye(nP)
+        global_b = rng.standard_normal(nP)
+
+        a = ari.allocate_jtj(); b = ari.allocate_jtf(); x = ari.allocate_jtf()
+        ari.scatter_jtj(global_a if comm is None or comm.rank == 0 else None, a)
+        ari.scatter_jtf(global_b if comm is None or comm.rank == 0 else None, b)
+        lu_x = np.empty(nP, 'd'); cholesky_x = np.empty(nP, 'd')
+
+        custom_solve(a, b, x, ari, self.ralloc, proc_threshold=1)
+        ari.allgather_x(x, lu_x)
+        # a small block size so the system spans several blocks
+        custom_cholesky_solve(a, b, x, ari, self.ralloc, proc_threshold=1, block_size=8)
+        ari.allgather_x(x, cholesky_x)
+        assert(np.linalg.norm(cholesky_x - lu_x) < 1e-8 * np.linalg.norm(lu_x))
+        assert(np.linalg.norm(cholesky_x - np.linalg.solve(global_a, global_b)) < 1e-8 * np.linalg.norm(lu_x))
+
+        ari.deallocate_jtj(a); ari.deallocate_jtf(b); ari.deallocate_jtf(x)
+
     def test_objfn_generator(self):
         params = [
             ("map", "logl", 1), ("map", "logl", 4),
@@ -362,6 +362,46 @@ class TestHessianMethods(BaseTestCase):
 
         #TODO: assert values of df & f0 ??
 
+    def test_hessian_free_confidenceRegion(self):
+        edesign = proto.CircuitListsDesign([pygsti.circuits.CircuitList(circuit_struct)
+                                            for circuit_struct in self.gss])
+        data = proto.ProtocolData(edesign, self.ds)
+        res = proto.ModelEstimateResults(data, proto.StandardGST(modes="full TP"))
+
+        builder = pygsti.objectivefns.PoissonPicDeltaLogLFunction.builder()
+        res.add_estimate(
+            proto.estimate.Estimate.create_gst_estimate(
+                res, stdxyi.target_model(), stdxyi.target_model(),
+                [self.model] * len(self.maxLengthList), parameters={'final_objfn_builder': builder}),
+            estimate_key="default"
+        )
+        est = res.estimates['default']
+
+        #Reference: approximate (Gauss-Newton) Hessian, projected & inverted explicitly
+        est.add_confidence_region_factory('final iteration estimate', 'final')
+        cfctry = est.create_confidence_region_factory('final iteration estimate', 'final')
+        cfctry.compute_hessian(approximate=True)
+        cfctry.project_hessian('std')
+
+        hf_cfctry = proto.confidenceregionfactory.ConfidenceRegionFactory(est, 'final iteration estimate', 'final')
+        self.assertFalse(hf_cfctry.can_construct_views())
+        hf_cfctry.enable_hessian_free_errorbars()
+        self.assertTrue(hf_cfctry.can_construct_views())
+        self.assertFalse(hf_cfctry.has_hessian)
+        self.assertEqual(hf_cfctry.nNonGaugeParams, cfctry.nNonGaugeParams)
+        self.assertEqual(hf_cfctry.nGaugeParams, cfctry.nGaugeParams)
+        self.assertEqual(hf_cfctry.nNonGaugeParams, cfctry.nNonGaugeParams)
+        self.assertAlmostEqual(hf_cfctry.nonMarkRadiusSq, cfctry.nonMarkRadiusSq, places=5)
+        with self.assertRaises(AssertionError):
+            hf_cfctry.view(95.0, 'normal', 'std')  # no Hessian projections in Hessian-free mode
+
+        FnObj = gsf.modelfn_factory(lambda mdl: np.array(mdl.operations['Gx']))(self.model)
+        for region_type in ('normal', 'non-markovian'):
+            df = cfctry.view(95.0, region_type).compute_confidence_interval(FnObj)
+            hf_view = hf_cfctry.view(95.0, region_type)
+            self.assertTrue(hf_view.profLCI is None)
+            self.assertArraysAlmostEqual(hf_view.compute_confidence_interval(FnObj), df)
+
     def test_pickle_ConfidenceRegion(self):
         edesign = proto.CircuitListsDesign([pygsti.circuits.CircuitList(circuit_struct)
                                             for circuit_struct in self.gss])
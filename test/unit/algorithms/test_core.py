@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 import pygsti.circuits as pc
@@ -7,6 +9,7 @@ from pygsti.baseobjs import Label
 from pygsti.circuits import Circuit, CircuitList
 from pygsti.objectivefns import Chi2Function, FreqWeightedChi2Function, \
     PoissonPicDeltaLogLFunction
+from pygsti.optimize.customlm import CustomLMCheckpoint
 from . import fixtures
 from ..util import BaseCase
 
@@ -116,6 +119,33 @@ class CoreMC2GSTTester(CoreStdData, BaseCase):
                                             )
         # TODO assert correctness
 
+    def test_do_mc2gst_single_precision_start(self):
+        _, mdl_double = core.run_gst_fit_simple(self.ds, self.mdl_clgst, self.lsgstStrings[-1],
+                                                {'tol': 1e-5}, "chi2", resource_alloc=None)
+        _, mdl_single = core.run_gst_fit_simple(self.ds, self.mdl_clgst, self.lsgstStrings[-1],
+                                                {'tol': 1e-5, 'single_precision_rtol': 1e-2}, "chi2",
+                                                resource_alloc=None)
+        self.assertEqual(mdl_single.sim.precision, "double")
+        self.assertAlmostEqual(mdl_single.frobeniusdist(mdl_double), 0, places=3)
+
+    def test_do_mc2gst_checkpointed(self):
+        _, mdl = core.run_gst_fit_simple(self.ds, self.mdl_clgst, self.lsgstStrings[-1],
+                                         {'tol': 1e-5}, "chi2", resource_alloc=None)
+        with self.temp_path('lm_checkpoint.json') as pth:
+            _, mdl_ckpt = core.run_gst_fit_simple(self.ds, self.mdl_clgst, self.lsgstStrings[-1],
+                                                  {'tol': 1e-5, 'checkpoint_path': pth}, "chi2",
+                                                  resource_alloc=None)
+            self.assertFalse(os.path.exists(pth))  # removed once the optimization completes
+            self.assertAlmostEqual(mdl_ckpt.frobeniusdist(mdl), 0)
+
+            # resume from a checkpoint holding the optimum
+            nEls = sum([len(self.ds[c]) for c in self.lsgstStrings[-1]])
+            CustomLMCheckpoint(mdl.to_vector(), 1.0, 2, 0.0, 3, nEls).write(pth)
+            _, mdl_resumed = core.run_gst_fit_simple(self.ds, self.mdl_clgst, self.lsgstStrings[-1],
+                                                     {'tol': 1e-5, 'checkpoint_path': pth}, "chi2",
+                                                     resource_alloc=None)
+            self.assertAlmostEqual(mdl_resumed.frobeniusdist(mdl), 0, places=4)
+
     def test_do_mc2gst_regularize_factor(self):
         obj_builder = Chi2Function.builder(
             name='chi2',
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import numpy as np
 
 import pygsti.circuits as pc
@@ -7,7 +9,7 @@ from pygsti.algorithms import germselection as germsel
 from pygsti.modelmembers.operations import StaticArbitraryOp
 from . import fixtures
 from pygsti.modelpacks.legacy import std1Q_XYI as std
-from ..util import BaseCase
+from ..util import BaseCase, with_temp_path
 
 _SEED = 2019
 
@@ -346,7 +348,40 @@ class GreedyGermSelectionTester(GermSelectionWithNeighbors, BaseCase):
                                    candidate_germ_counts={3: 'all upto', 4: 10, 5:10, 6:10},
                                    randomize=False, algorithm='greedy', mode='compactEVD',
                                    assume_real=True, float_type=np.double,  verbosity=1)
-                                   
+
+    def test_greedy_low_rank_update_parallel(self):
+        for score_func in ('all', 'worst'):
+            with mock.patch.object(germsel._mp, 'Pool', wraps=germsel._mp.Pool) as mock_pool:
+                germs = [germsel.find_germs(self.target_model, seed=2017,
+                                            candidate_germ_counts={3: 'all upto', 4: 10, 5: 10, 6: 10},
+                                            randomize=False, algorithm='greedy', mode='compactEVD',
+                                            assume_real=True, float_type=np.double, verbosity=0,
+                                            algorithm_kwargs={'score_func': score_func,
+                                                              'num_processes': num_processes})
+                         for num_processes in (1, 3)]
+                mock_pool.assert_called_once()  # one pool of workers for the entire greedy search
+            self.assertEqual(germs[0], germs[1])
+
+    @with_temp_path
+    def test_compact_twirled_ddd_memmapped(self, tmp_path):
+        sqrteU_list, e_list = germsel._compute_bulk_twirled_ddd_compact(
+            self.target_model, self.germ_set, 1e-6, float_type=np.double, return_eigs=True)
+        mapped_sqrteU_list, mapped_e_list = germsel._compute_bulk_twirled_ddd_compact(
+            self.target_model, self.germ_set, 1e-6, float_type=np.double, return_eigs=True, memmap_filename=tmp_path)
+        self.assertEqual(len(mapped_sqrteU_list), len(sqrteU_list))
+        for sqrteU, mapped_sqrteU, e, mapped_e in zip(sqrteU_list, mapped_sqrteU_list, e_list, mapped_e_list):
+            self.assertArraysEqual(mapped_e, e)
+            self.assertArraysEqual(mapped_sqrteU, sqrteU)
+        self.assertIsInstance(mapped_sqrteU_list[0].base, np.memmap)
+
+    @with_temp_path
+    def test_greedy_low_rank_update_memmapped_cache(self, tmp_path):
+        options = dict(candidate_germ_counts={3: 'all upto', 4: 10, 5: 10, 6: 10}, randomize=False,
+                       algorithm='greedy', mode='compactEVD', assume_real=True, float_type=np.double, verbosity=0)
+        germs = germsel.find_germs(self.target_model, seed=2017, **options)
+        mapped_germs = germsel.find_germs(self.target_model, seed=2017, cevd_cache_memmap_filename=tmp_path, **options)
+        self.assertEqual(mapped_germs, germs)
+
     def test_forced_germs_none(self):
         # TODO assert correctness
         #make sure that the germ selection doesn't die with force is None
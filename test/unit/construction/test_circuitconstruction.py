@@ -215,6 +215,28 @@ class CircuitConstructionTester(BaseCase):
         results_trivial = cc.manipulate_circuits([tuple('ABC'), tuple('GHI')], None)  # special case
         self.assertEqual(results_trivial, [tuple('ABC'), tuple('GHI')])
 
+    def test_batched_circuit_transforms(self):
+        circuits = [Circuit("Gx:0Gy:1[Gx:0Gcnot:0:1]", line_labels=(0, 1)),
+                    Circuit("Gx:0Gx:0", line_labels=(0, 1)),
+                    Circuit("Gy:1Gx:0", line_labels=(0, 1), editable=True)]
+        mapper = {0: 'Q2', 1: 'Q3'}
+        memo = {}
+        mapped = cc.map_state_space_labels_in_circuits(circuits, mapper, memo)
+        self.assertEqual(mapped, [c.map_state_space_labels(mapper) for c in circuits])
+        self.assertEqual(mapped[0].line_labels, ('Q2', 'Q3'))
+        self.assertTrue(all([not c._static for c in circuits[2:]]))
+        self.assertEqual(len(memo), 3)  # one entry per unique layer of the static circuits
+        mapped_again = cc.map_state_space_labels_in_circuits(circuits[0:2], lambda q: mapper[q], memo)
+        self.assertEqual(mapped_again, mapped[0:2])
+
+        replaced = cc.replace_gatename_in_circuits(circuits, 'Gx', 'Gz')
+        self.assertEqual(replaced, [c.replace_gatename('Gx', 'Gz') for c in circuits])
+
+        trimmed = cc.delete_idling_lines_in_circuits(circuits)
+        self.assertEqual(trimmed, [c.delete_idling_lines() for c in circuits])
+        self.assertEqual(trimmed[1].line_labels, (0,))
+        self.assertIs(trimmed[0], circuits[0])  # no idling lines => not copied
+
     def test_list_strings_lgst_can_estimate(self):
         model = std.target_model()
         fids = std.fiducials[:3]
@@ -2,7 +2,7 @@ import unittest
 import pytest
 
 from pygsti.modelpacks.legacy import std1Q_XY
-from pygsti.baseobjs import Label
+from pygsti.baseobjs import Label, CircuitLabel
 from pygsti.circuits import Circuit, circuitconstruction as cc, gstcircuits
 from pygsti.data import DataSet
 from ..util import BaseCase
@@ -93,6 +93,28 @@ class StdListTester(BaseCase):
             action_if_missing="drop", verbosity=4)
         self.assertEqual([Circuit(('Gx',))], list(lsgstStructs10[-1]))
 
+    def test_lsgst_lists_compact_germ_powers(self):
+        maxLens = [1, 2, 4, 8]
+        lsgstLists = gstcircuits.create_lsgst_circuit_lists(
+            self.opLabels, self.strs, self.strs, self.germs, maxLens)
+        compactLists = gstcircuits.create_lsgst_circuit_lists(
+            self.opLabels, self.strs, self.strs, self.germs, maxLens, expand_germ_powers=False)
+
+        for lst, compact_lst in zip(lsgstLists, compactLists):
+            self.assertEqual(len(lst), len(compact_lst))  # equivalent circuits aren't repeated
+            self.assertEqual(set(lst), set([c.expand_subcircuits() for c in compact_lst]))
+        self.assertLess(sum(map(len, compactLists[-1])), sum(map(len, lsgstLists[-1])))
+
+        plaq = compactLists[-1].plaquette(8, self.germs[1])
+        self.assertEqual(plaq.base.layertup, (CircuitLabel('', self.germs[1].layertup, None, 4),))
+        self.assertEqual(plaq.base.str, '(GxGy)^4')
+
+        #data sets of expanded circuits can be used with compact circuits
+        ds = DataSet(outcome_labels=['0', '1'])
+        ds.add_count_dict(lsgstLists[-1][-1], {'0': 10, '1': 90})
+        self.assertTrue(compactLists[-1][-1] in ds)
+        self.assertEqual(ds[compactLists[-1][-1]]['0'], 10)
+
     def test_lsgst_experiment_list(self):
         maxLens = [1, 2]
         lsgstExpList = gstcircuits.create_lsgst_circuits(
@@ -55,6 +55,28 @@ class CircuitParserBase():
             with self.assertRaises(ValueError):
                 self.parser.parse_circuit(string, create_subcircuits=True, integerize_sslbls=True)
 
+    def test_parse_circuits(self):
+        strings = [string for string, _ in self.test_cases] + \
+            ["rho0Gx(GxGy)^2GyMdefault", "Gx:0(Gx:0Gy:1)^4Gy:1@(0,1)", "[Gx:0Gy:1](Gx:0Gy:1)^2@(0,1)",
+             "G{a(b)}(Gx)^2", "Gx~Gy(GxGy)^2~Gz", "Gx|Gy(GxGy)^3|Gz"]
+        strings += strings[::-1]  # repeats
+        for create_subcircuits in (True, False):
+            results = self.parser.parse_circuits(strings, create_subcircuits, True)
+            expected = [self.parser.parse_circuit(s, create_subcircuits, True) for s in strings]
+            self.assertEqual(results, expected)
+
+    def test_parse_circuits_shares_labels(self):
+        (layers1, _, _, _), (layers2, _, _, _) = self.parser.parse_circuits(["Gx:0(Gy:0)^2", "Gy:0(Gx:0Gy:0)^4"],
+                                                                          False, True)
+        self.assertIs(layers1[0], layers2[1])
+        self.assertIs(layers1[1], layers2[0])
+
+    def test_parse_circuits_raises_on_syntax_error(self):
+        for string in self.fail_cases:
+            with self.assertRaises(ValueError):
+                self.parser.parse_circuits(["G1G2", string], create_subcircuits=True, integerize_sslbls=True)
+
+
 class SlowParser(CircuitParserBase, BaseCase):
     def setUp(self):
         self.parser = slowcircuitparser
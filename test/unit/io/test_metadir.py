@@ -0,0 +1,92 @@
+import numpy as np
+
+import pygsti
+from pygsti.io import metadir
+from pygsti.modelpacks import smq1Q_XYI as std
+from ..util import BaseCase, with_temp_path
+
+
+class LazyLoadingTester(BaseCase):
+
+    def setUp(self):
+        self.model = std.target_model()
+        self.arrays = {'a': np.arange(20, dtype='d'), 'b': np.ones((3, 3), 'd')}
+        self.orig_cache_size = metadir.LAZY_LOAD_CACHE_SIZE
+
+    def tearDown(self):
+        metadir.LAZY_LOAD_CACHE_SIZE = self.orig_cache_size
+
+    def _write(self, pth):
+        metadir.write_meta_based_dir(pth, {'model': self.model, 'arrays': self.arrays, 'value': 7},
+                                     {'model': 'serialized-object', 'arrays': 'dict:numpy-array'})
+
+    @with_temp_path
+    def test_lazy_members(self, pth):
+        self._write(pth)
+        with metadir.lazy_loading(min_size=0):
+            loaded = metadir.load_meta_based_dir(pth)
+
+        self.assertEqual(loaded['value'], 7)
+        self.assertIs(type(loaded['model']), metadir.LazyAuxMember)
+        self.assertEqual(sorted(loaded['arrays'].keys()), ['a', 'b'])  # names are available without loading
+
+        self.assertTrue(isinstance(loaded['model'], pygsti.models.ExplicitOpModel))
+        self.assertAlmostEqual(loaded['model'].frobeniusdist(self.model), 0)
+        for k, v in self.arrays.items():
+            self.assertArraysAlmostEqual(np.asarray(loaded['arrays'][k]), v)
+        self.assertArraysAlmostEqual(loaded['arrays']['a'] + 1, self.arrays['a'] + 1)
+
+    @with_temp_path
+    def test_lazy_member_eviction(self, pth):
+        self._write(pth)
+        metadir.LAZY_LOAD_CACHE_SIZE = 1
+        with metadir.lazy_loading(min_size=0):
+            loaded = metadir.load_meta_based_dir(pth)
+
+        linked = []
+        metadir._apply_when_loaded(loaded['model'], lambda mdl: linked.append(mdl))
+        self.assertEqual(len(linked), 0)
+
+        loaded['model'].num_params  # loads model
+        self.assertEqual(len(linked), 1)
+        loaded['arrays']['a'].shape  # evicts model
+        self.assertEqual(loaded['model'].num_params, self.model.num_params)  # reloads model
+        self.assertEqual(len(linked), 2)
+
+    @with_temp_path
+    def test_small_members_load_eagerly(self, pth):
+        self._write(pth)
+        with metadir.lazy_loading(min_size=10**9):
+            loaded = metadir.load_meta_based_dir(pth)
+        self.assertIs(type(loaded['model']), pygsti.models.ExplicitOpModel)
+        loaded = metadir.load_meta_based_dir(pth)  # outside of lazy_loading context
+        self.assertIs(type(loaded['arrays']['a']), np.ndarray)
+
+    @with_temp_path
+    def test_lazy_members_written_to_same_dir(self, pth):
+        auxfile_types = {'model': 'serialized-object', 'arrays': 'dict:numpy-array', 'pickled': 'pickle'}
+        metadir.write_meta_based_dir(pth, {'model': self.model, 'arrays': self.arrays, 'pickled': {'x': [1, 2]}},
+                                     auxfile_types)
+        with metadir.lazy_loading(min_size=0):
+            loaded = metadir.load_meta_based_dir(pth)
+        self.assertIs(type(loaded['pickled']), metadir.LazyAuxMember)
+
+        metadir.write_meta_based_dir(pth, loaded, auxfile_types)  # overwrites the files of the lazy members
+        reloaded = metadir.load_meta_based_dir(pth)
+        self.assertAlmostEqual(reloaded['model'].frobeniusdist(self.model), 0)
+        self.assertArraysAlmostEqual(reloaded['arrays']['a'], self.arrays['a'])
+        self.assertEqual(reloaded['pickled'], {'x': [1, 2]})
+
+    @with_temp_path
+    def test_modified_lazy_member_is_pinned(self, pth):
+        metadir.write_meta_based_dir(pth, {'pickled': {'x': [1, 2]}, 'arrays': self.arrays},
+                                     {'pickled': 'pickle', 'arrays': 'dict:numpy-array'})
+        metadir.LAZY_LOAD_CACHE_SIZE = 1
+        with metadir.lazy_loading(min_size=0):
+            loaded = metadir.load_meta_based_dir(pth)
+
+        loaded['pickled']['y'] = 3
+        loaded['arrays']['a'].shape  # would evict an unpinned member
+        loaded['arrays']['b'].shape
+        self.assertEqual(loaded['pickled']['y'], 3)
+        self.assertEqual(sorted(loaded['pickled'].keys()), ['x', 'y'])
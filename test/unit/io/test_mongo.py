@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from ..util import BaseCase
 
 import pygsti
@@ -63,3 +64,85 @@ class MongoDBTester(BaseCase):
 
         self.assertTrue(isinstance(results2.estimates['full TP'].models['target'], pygsti.models.Model))
         results2.remove_me_from_mongodb(self.mydb)
+
+
+try:
+    import mongomock
+    import mongomock.gridfs
+    MONGOMOCK_IMPORTED = True
+except ImportError:
+    mongomock = None
+    MONGOMOCK_IMPORTED = False
+
+
+@unittest.skipUnless(MONGOMOCK_IMPORTED, "mongomock not installed")
+class MongoDBWriteOpsTester(BaseCase):
+
+    def setUp(self):
+        mongomock.gridfs.enable_gridfs_integration()
+        self.mydb = mongomock.MongoClient()["pygsti_unittest_database"]
+
+    def test_batched_bulk_write(self):
+        from pygsti.baseobjs import mongoserializable
+        orig_batch_size = mongoserializable.BULK_WRITE_BATCH_SIZE
+        mongoserializable.BULK_WRITE_BATCH_SIZE = 7
+        try:
+            write_ops = mongoserializable.WriteOpsByCollection()
+            for i in range(20):
+                write_ops.add_one_op('pygsti_test', {'name': 'doc%d' % i}, {'name': 'doc%d' % i, 'value': i},
+                                     False, self.mydb)
+            write_ops.execute(self.mydb)
+        finally:
+            mongoserializable.BULK_WRITE_BATCH_SIZE = orig_batch_size
+        self.assertEqual(self.mydb['pygsti_test'].count_documents({}), 20)
+        self.assertEqual(len(write_ops), 0)
+
+    def test_unchanged_large_members_are_not_rewritten(self):
+        from pygsti.baseobjs import mongoserializable
+        arrays = {'a': np.arange(50, dtype='d'), 'b': np.ones((4, 4), 'd')}
+        doc_id = pygsti.io.write_auxtree_to_mongodb(self.mydb, 'pygsti_test', None, {'arrays': arrays},
+                                                    {'arrays': 'dict:numpy-array'})
+
+        write_ops = mongoserializable.WriteOpsByCollection()
+        doc = {'_id': doc_id}
+        pygsti.io.mongodb.add_auxtree_write_ops_and_update_doc(doc, write_ops, self.mydb, 'pygsti_test',
+                                                               {'arrays': arrays}, {'arrays': 'dict:numpy-array'},
+                                                               overwrite_existing=True)
+        self.assertEqual(len(write_ops.get('pygsti_arrays', [])), 0)  # identical arrays => nothing to write
+
+        arrays['b'] = 2 * arrays['b']
+        pygsti.io.mongodb.add_auxtree_write_ops_and_update_doc(doc, write_ops, self.mydb, 'pygsti_test',
+                                                               {'arrays': arrays}, {'arrays': 'dict:numpy-array'},
+                                                               overwrite_existing=True)
+        self.assertEqual(len(write_ops['pygsti_arrays']), 1)  # only the changed array is re-written
+        write_ops.execute(self.mydb)
+
+        loaded = pygsti.io.read_auxtree_from_mongodb(self.mydb, 'pygsti_test', doc_id)
+        self.assertArraysAlmostEqual(loaded['arrays']['a'], arrays['a'])
+        self.assertArraysAlmostEqual(loaded['arrays']['b'], arrays['b'])
+
+    def test_gridfs_puts(self):
+        from pygsti.baseobjs import mongoserializable
+        write_ops = mongoserializable.WriteOpsByCollection()
+        for i in range(5):
+            write_ops.add_gridfs_put_op('pygsti_gridfs', 'file%d' % i, b'data%d' % i, False, self.mydb)
+        write_ops.execute(self.mydb)
+
+        write_ops.add_gridfs_put_op('pygsti_gridfs', 'file0', b'data0', True, self.mydb)
+        self.assertEqual(len(write_ops.special_ops), 0)  # same content => no upload
+        write_ops.add_gridfs_put_op('pygsti_gridfs', 'file1', b'new data', True, self.mydb)
+        self.assertEqual(len(write_ops.special_ops), 1)
+        write_ops.execute(self.mydb)
+
+        contents = mongoserializable.read_gridfs_files(self.mydb, 'pygsti_gridfs', ['file%d' % i for i in range(5)])
+        self.assertEqual(contents, [b'data0', b'new data', b'data2', b'data3', b'data4'])
+
+    def test_data_roundtrip(self):
+        edesign = std.create_gst_experiment_design(2)
+        ds = pygsti.data.simulate_data(std.target_model().depolarize(op_noise=0.03), edesign, 1000, seed=1234)
+        data = pygsti.protocols.ProtocolData(edesign, ds)
+
+        data_id = data.write_to_mongodb(self.mydb)
+        data2 = pygsti.io.read_data_from_mongodb(self.mydb, data_id)
+        self.assertEqual(len(data2.dataset), len(ds))
+        self.assertEqual(len(data2.edesign.all_circuits_needing_data), len(edesign.all_circuits_needing_data))
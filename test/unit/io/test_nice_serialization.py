@@ -1,4 +1,5 @@
 import unittest
+from pathlib import Path
 from ..util import BaseCase, with_temp_path
 import numpy as np
 
@@ -42,6 +43,25 @@ class NiceSerializationTester(BaseCase):
         self.assertTrue(mdl.is_similar(mdl2))
         self.assertTrue(mdl.is_equivalent(mdl2))
 
+    @with_temp_path
+    def test_explicit_model_external_arrays(self, pth):
+        mdl = smq1Q_XYI.target_model()
+        mdl.write(pth + ".json", external_array_min_size=4)
+        self.assertTrue(len(list(Path(pth + "_arrays").glob("*.npy"))) > 0)
+
+        mdl2 = mdl.__class__.read(pth + ".json")
+        self.assertTrue(mdl.frobeniusdist(mdl2) < 1e-6)
+        self.assertTrue(mdl.is_equivalent(mdl2))
+
+        #Loaded arrays are copy-on-write, so modifying and re-writing over the same files is OK
+        mdl2.operations['Gxpi2', 0].from_vector(mdl2.operations['Gxpi2', 0].to_vector())
+        mdl2.write(pth + ".json", external_array_min_size=4)
+        self.assertTrue(mdl.is_equivalent(mdl2.__class__.read(pth + ".json")))
+
+        with open(pth + ".json") as f:
+            with self.assertRaises(ValueError):
+                mdl.__class__.loads(f.read())  # don't know where arrays are
+
     @with_temp_path
     def test_circuit_list(self, pth):
         circuit_plaq = self.gst_design.circuit_lists[0]
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from ..util import BaseCase, with_temp_path
 import pygsti.io as io
@@ -121,3 +122,118 @@ class DataSetLoaderTester(BaseCase):
         self.assertEqual(ds[Circuit('Gc2')].aux['test'], 1)
         self.assertEqual(ds[Circuit('Gc3')].aux['test'], 1)
         self.assertEqual(ds[Circuit('Gc4')].aux['test'], 1)
+
+
+class CircuitListParsingTester(BaseCase):
+
+    def test_parse_circuits(self):
+        std = io.StdInputParser()
+        strings = ["Gx(Gy)^2", "{}", "Gx:0Gy:1@(0,1)", "Gx(Gy)^2", "Gx(Gy)^2@(Q0)"]
+        circuits = std.parse_circuits(strings)
+        self.assertEqual(circuits, [std.parse_circuit(s) for s in strings])
+        self.assertEqual([c.line_labels for c in circuits], [('*',), ('*',), (0, 1), ('*',), ('Q0',)])
+        self.assertTrue(circuits[0] is circuits[3])
+        self.assertTrue(all(c._static for c in circuits))
+
+        circuits = std.parse_circuits(strings[0:3], line_labels=(0, 1))
+        self.assertEqual(circuits[0].line_labels, (0, 1))
+        self.assertEqual(circuits[2].line_labels, (0, 1))
+
+    @with_temp_path
+    def test_read_circuit_list(self, pth):
+        with open(pth, 'w') as f:
+            f.write("# A comment\n"
+                    "Gx(Gy)^2\n"
+                    "\n"
+                    "[Gx:0Gy:1]^2@(0,1)\n")
+        circuits = io.read_circuit_list(pth)
+        self.assertEqual(circuits, [Circuit('Gx(Gy)^2'), Circuit('[Gx:0Gy:1]^2@(0,1)')])
+
+    def test_convert_strings_to_circuits(self):
+        obj = ['dict_items', ("Gx", ("Gy", "GxGy")), ("{}", 3)]
+        converted = io.convert_strings_to_circuits(obj)
+        self.assertEqual(converted, {Circuit('Gx'): (Circuit('Gy'), Circuit('GxGy')), Circuit('{}'): 3})
+
+
+class DataSetCacheTester(BaseCase):
+
+    def assertDataSetsEqual(self, ds1, ds2):
+        self.assertEqual(list(ds1.keys()), list(ds2.keys()))
+        for circuit in ds1.keys():
+            self.assertEqual(ds1[circuit].to_dict(), ds2[circuit].to_dict())
+            self.assertEqual(list(ds1[circuit].time), list(ds2[circuit].time))
+            self.assertEqual(ds1[circuit].aux, ds2[circuit].aux)
+
+    @with_temp_path
+    def test_cache_appended_lines(self, pth):
+        with open(pth, 'w') as f:
+            f.write("## Outcomes = 0, 1\n"
+                    "Gc0 0:10 1:23  # {'test': 1}\n"
+                    "Gc1 0:1 1:1\n")
+        ds = io.read_dataset(pth, cache=True)  # creates cache file
+        self.assertEqual(len(ds), 2)
+        self.assertTrue(ds is not io.read_dataset(pth, cache=True))  # loads from cache file
+
+        with open(pth, 'a') as f:
+            f.write("Gc2 0:43 1:23\n"
+                    "Gc0 0:5 1:5\n")  # aggregated with the first line
+        cached_ds = io.read_dataset(pth, cache=True)  # only appended lines are parsed
+        self.assertDataSetsEqual(cached_ds, io.read_dataset(pth))
+        self.assertEqual(cached_ds[Circuit('Gc0')]['0'], 15)
+        self.assertDataSetsEqual(io.read_dataset(pth, cache=True), cached_ds)
+
+    @with_temp_path
+    def test_cache_appended_timestamped_data(self, pth):
+        with open(pth, 'w') as f:
+            f.write("## Outcomes = 0, 1\n"
+                    "Gc0\n"
+                    "times: 0 1\n"
+                    "outcomes: 0 1\n"
+                    "\n"
+                    "Gc1\n"
+                    "times: 0 1\n"
+                    "outcomes: 1 1\n")  # no trailing blank line => last block may continue
+        io.read_dataset(pth, cache=True)
+
+        with open(pth, 'a') as f:
+            f.write("repetitions: 2 3\n"
+                    "\n"
+                    "Gc2 0:4 1:5\n")
+        cached_ds = io.read_dataset(pth, cache=True)
+        self.assertDataSetsEqual(cached_ds, io.read_dataset(pth))
+        self.assertEqual(cached_ds[Circuit('Gc1')]['1'], 5)
+
+    @with_temp_path
+    def test_cache_unterminated_final_line(self, pth):
+        with open(pth, 'w') as f:
+            f.write("Gc0 0:10 1:23\n"
+                    "Gc1 0:1 2:1")  # no trailing newline => last line may continue
+        parse = io.stdinput.StdInputParser._parse_datafile
+        with mock.patch.object(io.stdinput.StdInputParser, '_parse_datafile', autospec=True,
+                               side_effect=parse) as mock_parse:
+            ds = io.read_dataset(pth, cache=True)
+        self.assertEqual(mock_parse.call_count, 1)  # the cache is written during the single parse
+        self.assertDataSetsEqual(ds, io.read_dataset(pth))
+
+        with open(pth, 'w') as f:
+            f.write("Gc0 0:10 1:23\n"
+                    "Gc1 0:1 1:4\n")  # uncached final line was changed
+        cached_ds = io.read_dataset(pth, cache=True)
+        self.assertDataSetsEqual(cached_ds, io.read_dataset(pth))
+        self.assertEqual(cached_ds.outcome_labels, io.read_dataset(pth).outcome_labels)
+
+    @with_temp_path
+    def test_cache_modified_file(self, pth):
+        with open(pth, 'w') as f:
+            f.write("## Outcomes = 0, 1\n"
+                    "Gc0 0:10 1:23\n")
+        io.read_dataset(pth, cache=True)
+
+        with open(pth, 'w') as f:
+            f.write("## Outcomes = 0, 1\n"
+                    "Gc0 0:11 1:23\n"
+                    "Gc1 0:1 1:1\n")  # prefix has changed => full re-parse
+        ds = io.read_dataset(pth, cache=True)
+        self.assertEqual(ds[Circuit('Gc0')]['0'], 11)
+        self.assertDataSetsEqual(ds, io.read_dataset(pth))
+        self.assertDataSetsEqual(io.read_dataset(pth, cache=True, collision_action="keepseparate"), ds)
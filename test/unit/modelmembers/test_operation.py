@@ -819,3 +819,25 @@ class DepolarizeOpTester(BaseCase):
         rho = create_spam_vector("0", "Q0", Basis.cast("pp", [4]))
         # b/c both X and Y dephasing rates => 0.01 reduction
         self.assertAlmostEqual(float(np.dot(rho.T, np.dot(dop.to_dense(), rho))), 0.98)
+
+
+class RepeatedOpTester(BaseCase):
+    def test_deriv_wrt_params(self):
+        np.random.seed(1234)
+        base = op.FullArbitraryOp(np.identity(4, 'd') + 0.1 * np.random.random((4, 4)))
+        for n in (0, 1, 2, 5, 8):
+            rop = op.RepeatedOp(base, n)
+            self.assertArraysAlmostEqual(rop.to_dense(), np.linalg.matrix_power(base.to_dense(), n))
+
+            #compare with a finite-difference derivative
+            v0 = rop.to_vector(); eps = 1e-6
+            fd_deriv = np.empty((16, rop.num_params), 'd')
+            for k in range(rop.num_params):
+                v = v0.copy(); v[k] += eps
+                rop.from_vector(v); mx_plus = rop.to_dense().flatten()
+                v[k] -= 2 * eps
+                rop.from_vector(v); mx_minus = rop.to_dense().flatten()
+                fd_deriv[:, k] = (mx_plus - mx_minus) / (2 * eps)
+            rop.from_vector(v0)
+            self.assertArraysAlmostEqual(rop.deriv_wrt_params(), fd_deriv, places=5)
+            self.assertArraysAlmostEqual(rop.deriv_wrt_params([1, 5]), rop.deriv_wrt_params()[:, [1, 5]])
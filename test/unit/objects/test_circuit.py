@@ -634,6 +634,34 @@ class CircuitOperationTester(BaseCase):
         c.clear()
         self.assertEqual(c.size, 0)
 
+    def test_hash_tracks_changes(self):
+        c = circuit.Circuit(('Gx', 'Gy'), line_labels=('*',))
+        d = {c: 1}
+        self.assertIs(c.tup, c.tup)  # static circuits compute .tup only once
+
+        c2 = c.copy()
+        c2.occurrence = 1
+        self.assertNotEqual(c2, c)
+        self.assertNotIn(c2, d)
+        c2.occurrence = None
+        self.assertEqual(hash(c2), hash(c))
+        self.assertIn(c2, d)
+
+        c3 = c.copy()
+        c3.compilable_layer_indices = (0,)
+        self.assertNotEqual(c3.tup, c.tup)
+
+    def test_pickle_resets_hash(self):
+        c = circuit.Circuit([Label('Gx', 0), Label('Gy', 1)], line_labels=(0, 1), occurrence=2)
+        h = hash(c)
+        state = c.__getstate__()
+        self.assertIsNone(state['_hash'])  # str hashes are process-dependent, so never pickled
+        c2 = pickle.loads(pickle.dumps(c))
+        self.assertEqual(c2, c)
+        self.assertEqual(hash(c2), h)
+        with self.assertRaises(AttributeError):
+            c.some_new_attribute = 1  # circuits have a fixed (__slots__) layout
+
 
 class CompressedCircuitTester(BaseCase):
     def test_compress_op_label(self):
@@ -185,6 +185,16 @@ class DataSetMethodBase(object):
         with self.assertRaises(KeyError):
             self.ds.truncate([('Gx',), ('Gz',)], missing_action="raise")
 
+    def test_count_arrays(self):
+        circuits = [('Gx',), ('Gy', 'Gy'), ('Gx',)]
+        outcomes = [('1',), ('0',), ('2',)]
+        counts, totals = self.ds.count_arrays(circuits, outcomes)
+        self.assertEqual(counts.shape, (3, 3))
+        for i, c in enumerate(circuits):
+            row = self.ds[c]
+            self.assertArraysAlmostEqual(counts[i], [row.counts.get(ol, 0) for ol in outcomes])
+            self.assertAlmostEqual(totals[i], row.total)
+
     def test_len(self):
         n = len(self.ds)
         # TODO assert correctness
@@ -1,5 +1,8 @@
 import numpy as np
 
+from pygsti.baseobjs import Label
+from pygsti.circuits import Circuit
+from pygsti.layouts.evaltree import EvalTree
 from ..util import BaseCase
 
 
@@ -56,3 +59,38 @@ from ..util import BaseCase
 #    else:
 #        assert(None not in circuits[0:nFinal])
 #        return circuits[0:nFinal]
+
+
+def _replay_tree(tree):
+    # build the layer-tuple computed at each tree index
+    tups = {}
+    for iDest, iLeft, iRight in tree:
+        if iLeft is None:
+            tups[iDest] = () if iRight is None else (iRight,)
+        else:
+            tups[iDest] = tups[iLeft] + tups[iRight]
+    assert(sorted(tups.keys()) == list(range(len(tree))))
+    return tups
+
+
+class EvalTreeTester(BaseCase):
+    def setUp(self):
+        self.germ = Circuit([Label('Gx', 0), Label('Gy', 0)], line_labels=(0,))
+        self.fid = Circuit([Label('Gy', 0)], line_labels=(0,))
+        self.circuits = [self.fid + self.germ.repeat(L) + self.fid for L in (300, 217)]
+        self.circuits.append(Circuit((), line_labels=(0,)))
+
+    def test_create(self):
+        tree = EvalTree.create(self.circuits)
+        tups = _replay_tree(tree)
+        for i, c in enumerate(self.circuits):
+            self.assertEqual(tups[i], c.layertup)
+
+    def test_create_with_germ_powers(self):
+        tree = EvalTree.create(self.circuits, {self.germ: 300})
+        tups = _replay_tree(tree)
+        for i, c in enumerate(self.circuits):
+            self.assertEqual(tups[i], c.layertup)
+        self.assertIn(self.germ.repeat(256).layertup, tups.values())
+        self.assertLess(len(tree), 50)  # O(log L) products per circuit
+        self.assertLess(len(tree), len(EvalTree.create(self.circuits)))
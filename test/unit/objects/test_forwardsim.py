@@ -1,5 +1,6 @@
 # XXX rewrite or remove
 
+import pickle
 from unittest import mock
 
 import numpy as np
@@ -78,6 +79,25 @@ class ForwardSimBase(object):
         self.fwdsim.bulk_fill_dprobs(dmx, self.layout, pr_array_to_fill=pmx)
         # TODO assert correctness
 
+    def test_layouts_of_nested_circuit_lists(self):
+        # a layout built after one for a subset of its circuits reuses the model's memoized expansions
+        circuits = [Circuit(c) for c in [('Gx',), ('Gx', 'Gy'), ('Gx', 'Gy', 'Gy'), ('Gy', 'Gx', 'Gx', 'Gi')]]
+        model = self.model.copy()
+        pickled_size = len(pickle.dumps(model))
+        model.sim.create_layout(circuits[0:2])
+        layout = model.sim.create_layout(circuits)
+        self.assertEqual(len(pickle.dumps(model)), pickled_size)  # memoized expansions aren't pickled
+        fresh_model = self.model.copy()
+        fresh_layout = fresh_model.sim.create_layout(circuits)
+
+        probs = np.empty(layout.num_elements, 'd')
+        fresh_probs = np.empty(fresh_layout.num_elements, 'd')
+        model.sim.bulk_fill_probs(probs, layout)
+        fresh_model.sim.bulk_fill_probs(fresh_probs, fresh_layout)
+        for c in circuits:
+            self.assertEqual(layout.outcomes(c), fresh_layout.outcomes(c))
+            self.assertArraysAlmostEqual(probs[layout.indices(c)], fresh_probs[fresh_layout.indices(c)])
+
     def test_bulk_fill_dprobs_with_block_size(self):
         dmx = np.empty((self.nEls, self.nP), 'd')
         self.fwdsim.bulk_fill_dprobs(dmx, self.layout)
@@ -144,6 +164,37 @@ class MatrixForwardSimTester(ForwardSimBase, BaseCase):
         hgflat = self.fwdsim._hoperation(L('Gx'), flat=True)
         # TODO assert correctness
 
+    def test_compact_germ_power_circuits(self):
+        germ = Circuit(('Gx', 'Gy'))
+        expanded = Circuit(('Gy',)) + germ.repeat(13, expand=True) + Circuit(('Gx',))
+        compact = Circuit(('Gy',)) + germ.repeat(13, expand=False) + Circuit(('Gx',))
+        self.assertEqual(compact.num_layers, 3)
+        self.assertEqual(compact.expand_subcircuits(), expanded)
+
+        probs = self.fwdsim.bulk_probs([expanded, compact])
+        dprobs = self.fwdsim.bulk_dprobs([expanded, compact])
+        for outcome in probs[expanded]:
+            self.assertAlmostEqual(probs[expanded][outcome], probs[compact][outcome])
+            self.assertArraysAlmostEqual(dprobs[expanded][outcome], dprobs[compact][outcome])
+
+    def test_single_precision(self):
+        circuits = [Circuit(('Gx',)), Circuit(('Gx', 'Gy')), Circuit(('Gy',)) + Circuit(('Gx', 'Gy')).repeat(16)]
+        model = self.model.copy()
+        probs = model.sim.bulk_probs(circuits)
+        dprobs = model.sim.bulk_dprobs(circuits)
+
+        model.sim.precision = "single"
+        single_probs = model.sim.bulk_probs(circuits)
+        single_dprobs = model.sim.bulk_dprobs(circuits)
+        for c in circuits:
+            for outcome in probs[c]:
+                self.assertAlmostEqual(single_probs[c][outcome], probs[c][outcome], places=5)
+                self.assertArraysAlmostEqual(single_dprobs[c][outcome], dprobs[c][outcome], places=4)
+        self.assertEqual(model.sim.copy().precision, "single")
+
+        with self.assertRaises(ValueError):
+            model.sim.precision = "half"
+
     #REMOVE
     #def test_hproduct(self):
     #    self.fwdsim.hproduct(Ls('Gx', 'Gx'), flat=True, wrt_filter1=[0, 1], wrt_filter2=[1, 2, 3])
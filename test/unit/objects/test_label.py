@@ -122,3 +122,36 @@ class LabelTester(BaseCase):
             print(' => eval ' + r)
             evald_repr_l = eval(r)
             self.assertEqual(l, evald_repr_l)
+
+
+class LabelInterningTester(BaseCase):
+    def setUp(self):
+        from pygsti.baseobjs import label
+        label.enable_label_interning(False)  # start from an empty table
+        label.enable_label_interning()
+
+    def tearDown(self):
+        from pygsti.baseobjs import label
+        label.enable_label_interning(False)
+
+    def test_labels_are_interned(self):
+        self.assertIs(L('Gx', 0), L(('Gx', 0)))
+        self.assertIs(L('Gx'), L('Gx'))
+        self.assertIsNot(L('Gx', time=1.0), L('Gx'))  # labels with times aren't interned
+        layer = L((('Gx', 0), ('Gy', 1)))
+        self.assertIs(layer, L([L('Gx', 0), L('Gy', 1)]))
+        self.assertIs(layer[0], L('Gx', 0))
+
+    def test_circuit_labels_are_interned(self):
+        c1 = Circuit("Gxpi2:0Gypi2:1[Gxpi2:0Gypi2:1]@(0,1)")
+        c2 = Circuit([('Gxpi2', 0), ('Gypi2', 1), (('Gxpi2', 0), ('Gypi2', 1))], line_labels=(0, 1))
+        self.assertEqual(c1, c2)
+        for l1, l2 in zip(c1, c2):
+            self.assertIs(l1, l2)
+        self.assertIs(c1[0], c1[2][0])
+
+    def test_interning_disabled(self):
+        from pygsti.baseobjs import label
+        label.enable_label_interning(False)
+        self.assertIsNot(L('Gx', 0), L('Gx', 0))
+        self.assertEqual(L('Gx', 0), L('Gx', 0))
@@ -1,7 +1,9 @@
 # XXX rewrite/refactor forward-simulator tests
 
+import itertools
 import pickle
 from contextlib import contextmanager
+from unittest import mock
 
 import sys
 import numpy as np
@@ -681,6 +683,47 @@ class FullModelTester(FullModelBase, StandardMethodBase, BaseCase):
         del mdl.operations['Gnew2']
         # TODO assert correctness
 
+    def test_circuit_completion_memos(self):
+        mdl = self.model.copy()
+        c = Circuit('GxGy', line_labels=('Q0',))
+        completed = mdl.complete_circuit(c)
+        self.assertEqual(completed, Circuit('rho0GxGyMdefault', line_labels=('Q0',)))
+        self.assertIs(mdl.complete_circuit(c), completed)
+        self.assertIs(mdl.complete_circuit(completed), completed)
+
+        mdl.preps['rho1'] = mdl.preps['rho0'].copy()  # no default prep anymore => memos must be reset
+        with self.assertRaises(ValueError):
+            mdl.complete_circuit(c)
+
+    def test_circuit_memos_are_bounded_and_not_pickled(self):
+        mdl = self.model.copy()
+        circuits = [Circuit(('Gx',) * i, line_labels=('Q0',)) for i in range(10)]
+        with mock.patch.object(m, 'CIRCUIT_MEMO_MAX_SIZE', 4):
+            for c in circuits:
+                mdl.complete_circuit(c)
+            self.assertEqual(len(mdl._circuit_memo('complete-circuits')), 4)
+        self.assertIn(circuits[-1], mdl._circuit_memo('complete-circuits'))  # most recently used are kept
+
+        unpickled = pickle.loads(pickle.dumps(mdl))
+        self.assertNotIn('_circuit_memos', mdl.__getstate__())
+        self.assertEqual(unpickled._circuit_memos, {})
+        self.assertEqual(unpickled.complete_circuit(circuits[1]), mdl.complete_circuit(circuits[1]))
+
+    def test_expand_instruments_with_memos(self):
+        mdl = self.model.copy()
+        mdl.instruments['Iz'] = Instrument([('p0', np.identity(4, 'd') / 2), ('p1', np.identity(4, 'd') / 2)])
+        c = Circuit('GxIzGy')
+        expected = {('p0', '0'), ('p0', '1'), ('p1', '0'), ('p1', '1')}
+        for i in range(2):  # 2nd time uses memoized layer & member info
+            expanded = c.expand_instruments_and_separate_povm(mdl)
+            self.assertEqual(set(itertools.chain(*expanded.values())), expected)
+            self.assertEqual([sep_c.full_effect_labels for sep_c in expanded],
+                             [['Mdefault_0', 'Mdefault_1']] * 2)
+
+        mdl.instruments['Iz'] = Instrument([('q', np.identity(4, 'd'))])  # replaced => memos are reset
+        expanded = c.expand_instruments_and_separate_povm(mdl)
+        self.assertEqual(set(itertools.chain(*expanded.values())), {('q', '0'), ('q', '1')})
+
     def test_check_paramvec_raises_on_error(self):
         # XXX is this test needed?  EGN: seems to be a unit test for _check_paramvec, which is good I think.
         self.model._paramvec[:] = 0.0  # mess with paramvec to get error below
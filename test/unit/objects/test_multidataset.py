@@ -1,5 +1,6 @@
 import pickle
 from collections import OrderedDict
+from unittest import mock
 
 import numpy as np
 
@@ -74,6 +75,39 @@ class MultiDataSetMethodBase(object):
         sumDS = self.mds.datasets_aggregate(*keyset)
         # TODO assert correctness
 
+    def test_get_datasets_aggregate_matches_general_merge(self):
+        keyset = self.mds.keys()
+        sumDS = self.mds.datasets_aggregate(*keyset)
+        with mock.patch.object(MultiDataSet, '_aggregate_with_shared_bins', return_value=None):
+            sumDS_general = self.mds.datasets_aggregate(*keyset)
+        self.assertEqual(list(sumDS.keys()), list(sumDS_general.keys()))
+        for circuit in sumDS:
+            self.assertEqual(sumDS[circuit].counts, sumDS_general[circuit].counts)
+        self.assertArraysAlmostEqual(sumDS.oliData, sumDS_general.oliData)
+        self.assertArraysAlmostEqual(sumDS.timeData, sumDS_general.timeData)
+
+    def test_indexing_shares_data(self):
+        ds = self.mds['ds1']
+        self.assertIs(ds, self.mds['ds1'])
+        self.assertIs(ds.cirIndex, self.mds.cirIndex)
+        self.assertIs(ds.oliData, self.mds.oliDict['ds1'])
+        self.assertEqual(ds[('Gx',)].counts, self.mds['ds1'][('Gx',)].counts)
+
+    def test_add_dataset_refreshes_views(self):
+        old_view = self.mds['ds1']
+        old_counts = {c: old_view[c].counts.copy() for c in old_view}
+        ds = DataSet(outcome_labels=['0', '1', '2'])
+        ds.add_count_dict(('Gx',), {'0': 10, '1': 80, '2': 10})
+        ds.add_count_dict(('Gx', 'Gy'), {'0': 20, '1': 80})
+        ds.add_count_dict(('Gy',), {'0': 20, '1': 80})
+        ds.done_adding_data()
+        self.mds['newDS'] = ds
+        self.assertIsNot(self.mds['ds1'], old_view)
+        self.assertEqual(self.mds['newDS'][('Gx',)]['2'], 10)
+        for c, cnts in old_counts.items():
+            self.assertEqual(old_view[c].counts, cnts)  # old views are unaffected
+            self.assertEqual(self.mds['ds1'][c].counts, cnts)
+
     def test_to_string(self):
         mds_str = str(self.mds)
         # TODO assert correctness
@@ -6,6 +6,7 @@ from pygsti.objectivefns.wildcardbudget import PrimitiveOpsWildcardBudget as _Pr
 from . import smqfixtures
 from ..util import BaseCase
 import unittest
+from unittest import mock
 
 
 class ObjectiveFunctionData(object):
@@ -83,6 +84,36 @@ class ObjectiveFunctionBuilderTester(ObjectiveFunctionData, BaseCase):
         self.assertTrue(isinstance(fn, builder.cls_to_build))
 
 
+class ModelDatasetCircuitsStoreTester(ObjectiveFunctionData, BaseCase):
+    """
+    Tests for the count-vector and omitted-frequency setup of ModelDatasetCircuitsStore.
+    """
+
+    def test_count_vectors_and_omitted_freqs(self):
+        circuits = pygsti.circuits.CircuitList(list(self.circuits) + list(self.circuits[0:3]))
+        dataset = pygsti.data.simulate_data(self.model, circuits, 5, seed=2020, record_zero_counts=False)
+        store = _objfns.ModelDatasetCircuitsStore(self.model, dataset, circuits)
+        store.add_count_vectors()
+        store.add_omitted_freqs()
+
+        firsts = []
+        probs = np.random.random(store.nelements)
+        omitted_probs = []
+        for i, circuit in enumerate(store.circuits):
+            indices = store.layout.indices_for_index(i)
+            cnts = store.dataset[store.ds_circuits[i]].counts
+            self.assertArraysAlmostEqual(store.counts[indices],
+                                         [cnts.get(x, 0) for x in store.layout.outcomes_for_index(i)])
+            self.assertArraysAlmostEqual(store.total_counts[indices], sum(cnts.values()))
+            if len(probs[indices]) < self.model.compute_num_outcomes(circuit):
+                firsts.append(pygsti.tools.slicetools.to_array(indices)[0])
+                omitted_probs.append(1.0 - sum(probs[indices]))
+
+        self.assertGreater(len(firsts), 0)
+        self.assertEqual(list(store.firsts), firsts)
+        self.assertArraysAlmostEqual(1.0 - store.omitted_rowsum_mx.dot(probs), omitted_probs)
+
+
 class RawObjectiveFunctionTesterBase(object):
     """
     Tests for methods in the RawObjectiveFunction class.
@@ -139,6 +170,39 @@ class RawObjectiveFunctionTesterBase(object):
                                              places=4)  # compare with finite-difference
                 self.assertArraysAlmostEqual(dterms, 2 * lsvec * dlsvec)  # d(terms) = d(lsvec**2) = 2*lsvec*dlsvec
 
+    def test_fill_lsvec(self):
+        if not self.computes_lsvec:
+            return
+        # many probabilities at or very near a perfect fit, where terms are differences of nearly-equal values
+        rng = np.random.RandomState(2023)
+        near_counts = np.floor(rng.uniform(0, 1000, 2000))
+        near_totalcounts = np.array([1000] * len(near_counts), 'd')
+        near_freqs = near_counts / near_totalcounts
+        near_probs = np.where(rng.uniform(size=len(near_counts)) < 0.5, near_freqs,
+                              near_freqs * (1 + 1e-9 * rng.standard_normal(len(near_counts))))
+
+        data = [(probs, self.counts, self.totalcounts, self.freqs)
+                for probs in (self.probs, self.perfect_probs, self.bad_probs)]
+        data.append((near_probs, near_counts, near_totalcounts, near_freqs))
+        for objfn in self.objfns:
+            for probs, counts, totalcounts, freqs in data:
+                try:
+                    dlsvec_chk, lsvec_chk = objfn.dlsvec_and_lsvec(probs, counts, totalcounts, freqs)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        objfn.fill_lsvec(np.empty(len(probs), 'd'), probs, counts, totalcounts, freqs)
+                    continue
+
+                # lsvec elements where p == f are square roots of roundoff-level terms, hence `places=6`
+                lsvec = np.empty(len(probs), 'd')
+                objfn.fill_lsvec(lsvec, probs, counts, totalcounts, freqs)
+                self.assertArraysAlmostEqual(lsvec, lsvec_chk, places=6)
+
+                dlsvec = np.empty(len(probs), 'd'); lsvec[:] = 0
+                objfn.fill_dlsvec_and_lsvec(dlsvec, lsvec, probs, counts, totalcounts, freqs)
+                self.assertArraysAlmostEqual(lsvec, lsvec_chk, places=6)
+                self.assertArraysAlmostEqual(dlsvec, dlsvec_chk, places=6)
+
     def test_hessian(self):
         for objfn in self.objfns:
             try:
@@ -243,6 +307,9 @@ class RawTVDFunctionTester(RawObjectiveFunctionTesterBase, BaseCase):
     def test_derivative(self):
         self.skipTest("Derivatives for RawTVDFunction aren't implemented yet.")
 
+    def test_fill_lsvec(self):
+        self.skipTest("Derivatives for RawTVDFunction aren't implemented yet.")
+
     def test_hessian(self):
         self.skipTest("Derivatives for RawTVDFunction aren't implemented yet.")
 
@@ -304,6 +371,59 @@ class TimeIndependentMDSObjectiveFunctionTesterBase(ObjectiveFunctionData):
                 self.assertArraysAlmostEqual(dterms / nEls, 2 * lsvec[:, None] * dlsvec / nEls,
                                              places=4)  # each *element* should match to 4 places
 
+    def test_evaluation_memo(self):
+        for objfn in self.objfns:
+            v0 = objfn.model.to_vector()
+            terms0 = objfn.terms(v0).copy()
+            objfn.terms(v0 + 1e-3)
+            with mock.patch.object(objfn.model.sim, 'bulk_fill_probs') as mock_fill:
+                self.assertArraysAlmostEqual(objfn.terms(v0), terms0)  # memoized probabilities are reused
+                mock_fill.assert_not_called()
+
+            objfn.clear_evaluation_memo()
+            with mock.patch.object(objfn.model.sim, 'bulk_fill_probs') as mock_fill:
+                objfn.terms(v0)
+                mock_fill.assert_called_once()
+
+            if self.computes_lsvec:
+                objfn.set_evaluation_memo_limits(max_dprobs=1)  # also forgets the mock-"computed" probabilities
+                try:
+                    dlsvec0 = objfn.dlsvec(v0).copy()
+                except NotImplementedError:
+                    continue  # ok if derivatives are not always implemented
+                lsvec0 = objfn.lsvec(v0 + 1e-3).copy()
+                with mock.patch.object(objfn.model.sim, 'bulk_fill_dprobs') as mock_fill:
+                    self.assertArraysAlmostEqual(objfn.dlsvec(v0), dlsvec0)
+                    mock_fill.assert_not_called()
+                self.assertArraysAlmostEqual(objfn.lsvec(v0 + 1e-3), lsvec0)
+
+                tracked_mem = objfn.resource_alloc.allocated_memory
+                objfn.set_evaluation_memo_limits()  # default: derivatives aren't memoized
+                self.assertLess(objfn.resource_alloc.allocated_memory, tracked_mem)
+                objfn.dlsvec(v0)
+                with mock.patch.object(objfn.model.sim, 'bulk_fill_dprobs') as mock_fill:
+                    objfn.dlsvec(v0)
+                    mock_fill.assert_called_once()
+
+    def test_evaluation_memo_with_tight_mem_limit(self):
+        for objfn in self.objfns:
+            v0 = objfn.model.to_vector()
+            terms0 = objfn.terms(v0).copy()
+            objfn.clear_evaluation_memo()
+
+            ralloc = objfn.resource_alloc
+            orig_mem_limit, tracked_mem = ralloc.mem_limit, ralloc.allocated_memory
+            ralloc.mem_limit = tracked_mem + 8 * objfn.nelements  # enough to evaluate terms, but not to memoize
+            try:
+                self.assertArraysAlmostEqual(objfn.terms(v0), terms0)
+                with mock.patch.object(objfn.model.sim, 'bulk_fill_probs',
+                                       wraps=objfn.model.sim.bulk_fill_probs) as mock_fill:
+                    self.assertArraysAlmostEqual(objfn.terms(v0), terms0)
+                    mock_fill.assert_called_once()  # nothing was memoized
+                self.assertEqual(ralloc.allocated_memory, tracked_mem)
+            finally:
+                ralloc.mem_limit = orig_mem_limit
+
     def test_approximate_hessian(self):
         if not self.enable_hessian_tests:
             return  # don't test the hessian for this objective function
@@ -312,6 +432,9 @@ class TimeIndependentMDSObjectiveFunctionTesterBase(ObjectiveFunctionData):
             hessian = objfn.approximate_hessian()
             #TODO: how to verify this hessian?
 
+            dprobs, weights = objfn.approximate_hessian_factors()
+            self.assertTrue(np.allclose(dprobs.T @ (weights[:, None] * dprobs), hessian))
+
     def test_hessian(self):
         if not self.enable_hessian_tests:
             return  # don't test the hessian for this objective function
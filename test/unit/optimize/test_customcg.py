@@ -1,3 +1,5 @@
+import numpy as np
+
 from pygsti.optimize import customcg as cg
 from ..util import BaseCase
 
@@ -27,3 +29,17 @@ class CustomCGTester(BaseCase):
         guess = 4.0
         cg._maximize_1d(g, start, guess, g(start))
         # TODO assert correctness
+
+    def test_conjugate_gradient_solve(self):
+        np.random.seed(0)
+        a = np.random.random((6, 4))
+        a = a @ a.T  # symmetric, positive semi-definite & singular (rank 4)
+        b = a @ np.random.random(6)  # in range of a
+
+        result = cg.conjugate_gradient_solve(lambda v: a @ v, b, rtol=1e-12, maxiter=100)
+        self.assertTrue(result.success)
+        self.assertArraysAlmostEqual(result.x, np.linalg.pinv(a) @ b)
+
+        result = cg.conjugate_gradient_solve(lambda v: a @ v, b, maxiter=1)
+        self.assertFalse(result.success)
+        self.assertEqual(result.nit, 1)
@@ -18,6 +18,17 @@ def g(x):
 def gjac(x):
     return np.array([2 * x[0]],'d')
 
+# exponential-decay fit: y = a * exp(-b * t) + c, with minimum at (a, b, c) = (2.0, 1.3, 0.5)
+decay_t = np.linspace(0, 4, 30)
+decay_y = 2.0 * np.exp(-1.3 * decay_t) + 0.5
+
+def decay_resid(x):
+    return x[0] * np.exp(-x[1] * decay_t) + x[2] - decay_y
+
+def decay_jac(x):
+    e = np.exp(-x[1] * decay_t)
+    return np.column_stack((e, -x[0] * decay_t * e, np.ones(len(decay_t))))
+
 
 class CustomLMTester(BaseCase):
     def test_custom_leastsq_infinite_objective_fn_norm_at_x0(self):
@@ -41,3 +52,71 @@ class CustomLMTester(BaseCase):
         xf, converged, msg, *_ = lm.custom_leastsq(g, gjac, x0, max_iter=100, arrays_interface=ari,
                                                    x_limits=xlimits)
         self.assertAlmostEqual(xf[0], 1.0)
+
+    def test_custom_leastsq_eigh_linear_solver(self):
+        # Rosenbrock residuals: a problem where many trial steps get rejected
+        def rosen(x):
+            return np.array([10 * (x[1] - x[0]**2), 1 - x[0], 10 * (x[3] - x[2]**2), 1 - x[2]], 'd')
+
+        def rosen_jac(x):
+            return np.array([[-20 * x[0], 10, 0, 0], [-1, 0, 0, 0],
+                             [0, 0, -20 * x[2], 10], [0, 0, -1, 0]], 'd')
+
+        x0 = np.array([-1.2, 1.0, 2.0, -1.0], 'd')
+        for damping_mode in ('identity', 'JTJ', 'invJTJ'):
+            results = {}
+            for solver in ('lu', 'cholesky', 'eigh'):
+                ari = _ari.UndistributedArraysInterface(4, 4)
+                results[solver] = lm.custom_leastsq(rosen, rosen_jac, x0, max_iter=200, f_norm2_tol=1e-16,
+                                                    jac_norm_tol=1e-10, damping_mode=damping_mode,
+                                                    arrays_interface=ari, linear_solver=solver)
+            self.assertArraysAlmostEqual(results['eigh'][0], results['lu'][0])
+            self.assertArraysAlmostEqual(results['cholesky'][0], results['lu'][0])
+            self.assertArraysAlmostEqual(results['eigh'][0], np.ones(4, 'd'), places=4)
+
+        with self.assertRaises(ValueError):
+            lm.custom_leastsq(rosen, rosen_jac, x0, damping_mode='adaptive', linear_solver='eigh',
+                              arrays_interface=_ari.UndistributedArraysInterface(4, 4))
+
+    def test_custom_leastsq_broyden_jacobian_updates(self):
+        num_jac_calls = [0]
+
+        def counted_decay_jac(x):
+            num_jac_calls[0] += 1
+            return decay_jac(x)
+
+        x0 = np.array([1.0, 0.5, 0.0], 'd')
+        calls = {}
+        for interval in (1, 3):
+            num_jac_calls[0] = 0
+            ari = _ari.UndistributedArraysInterface(len(decay_t), 3)
+            xf, converged, msg, *_ = lm.custom_leastsq(decay_resid, counted_decay_jac, x0, max_iter=100,
+                                                       f_norm2_tol=1e-20, jac_norm_tol=1e-12, rel_ftol=1e-14,
+                                                       rel_xtol=1e-14,
+                                                       arrays_interface=ari, jac_refresh_interval=interval)
+            self.assertArraysAlmostEqual(xf, np.array([2.0, 1.3, 0.5]), places=5)
+            calls[interval] = num_jac_calls[0]
+        self.assertLess(calls[3], calls[1])
+
+    def test_custom_leastsq_checkpoint_and_resume(self):
+        x0 = np.array([1.0, 0.5, 0.0], 'd')
+        tols = dict(f_norm2_tol=1e-20, jac_norm_tol=1e-12, rel_ftol=1e-14, rel_xtol=1e-14)
+        xf, *_ = lm.custom_leastsq(decay_resid, decay_jac, x0, max_iter=100, **tols,
+                                   arrays_interface=_ari.UndistributedArraysInterface(len(decay_t), 3))
+
+        with self.temp_path('checkpoint.json') as pth:
+            # an optimization "preempted" after 4 iterations
+            lm.custom_leastsq(decay_resid, decay_jac, x0, max_iter=4, **tols, checkpoint_path=pth,
+                              checkpoint_interval=2, checkpoint_jtj=True,
+                              arrays_interface=_ari.UndistributedArraysInterface(len(decay_t), 3))
+            checkpoint = lm.CustomLMCheckpoint.read(pth)
+            self.assertEqual(checkpoint.iteration, 2)
+            self.assertEqual(checkpoint.jtj.shape, (3, 3))
+            self.assertTrue(checkpoint.is_compatible_with(3, len(decay_t)))
+            self.assertArraysAlmostEqual(checkpoint.norm_f, np.sum(decay_resid(checkpoint.x)**2))
+
+            resumed_xf, converged, *_ = lm.custom_leastsq(
+                decay_resid, decay_jac, x0, max_iter=100, **tols, checkpoint=checkpoint,
+                arrays_interface=_ari.UndistributedArraysInterface(len(decay_t), 3))
+            self.assertTrue(converged)
+            self.assertArraysAlmostEqual(resumed_xf, xf)
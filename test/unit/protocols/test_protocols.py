@@ -43,6 +43,41 @@ class ExperimentDesignTester(BaseCase):
             edesign4 = pygsti.protocols.ExperimentDesign(pygsti.circuits.to_circuits(["Gypi2:0^4"]))
             combined_edesign['four'] = edesign4
             
+    @with_temp_path
+    def test_write_with_circuit_table(self, root_path):
+        circuits_on0 = pygsti.circuits.to_circuits(["{}@(0)", "Gxpi2:0", "Gypi2:0"], line_labels=(0,))
+        circuits_on0b = pygsti.circuits.to_circuits(["Gxpi2:0^2", "Gypi2:0^2"], line_labels=(0,))
+        circuits_on1 = pygsti.circuits.to_circuits(["Gxpi2:1^2", "Gypi2:1Gxpi2:1"], line_labels=(1,))
+        edesign = pygsti.protocols.CombinedExperimentDesign(
+            {'lists': pygsti.protocols.CircuitListsDesign([circuits_on0, circuits_on0b]),
+             'sim': pygsti.protocols.SimultaneousExperimentDesign(
+                 [pygsti.protocols.ExperimentDesign(circuits_on0), pygsti.protocols.ExperimentDesign(circuits_on1)])},
+            qubit_labels=(0, 1))
+        edesign.write(root_path, circuit_table=True)
+        self.assertTrue((pathlib.Path(root_path) / 'edesign' / 'circuit_table.npz').exists())
+
+        loaded = pygsti.io.read_edesign_from_dir(root_path)
+        self.assertEqual(list(loaded.all_circuits_needing_data), list(edesign.all_circuits_needing_data))
+        self.assertEqual([list(l) for l in loaded['lists'].circuit_lists],
+                         [list(l) for l in edesign['lists'].circuit_lists])
+        self.assertEqual(list(loaded['sim'].all_circuits_needing_data),
+                         list(edesign['sim'].all_circuits_needing_data))
+
+    @with_temp_path
+    def test_write_with_circuit_table_keeps_label_times(self, root_path):
+        # labels that differ only in their times compare equal, but must be stored separately
+        timed = pygsti.circuits.Circuit([pygsti.baseobjs.Label('Gx', 0, time=1.5)])
+        untimed = pygsti.circuits.Circuit([pygsti.baseobjs.Label('Gx', 0)])
+        edesign = pygsti.protocols.CombinedExperimentDesign(
+            {'timed': pygsti.protocols.ExperimentDesign([timed]),
+             'untimed': pygsti.protocols.ExperimentDesign([untimed])})
+        edesign.write(root_path, circuit_table=True)
+
+        loaded = pygsti.io.read_edesign_from_dir(root_path)
+        self.assertEqual(loaded['timed'].all_circuits_needing_data[0].str, timed.str)
+        self.assertEqual(loaded['untimed'].all_circuits_needing_data[0].str, untimed.str)
+        self.assertEqual(loaded['timed'].all_circuits_needing_data[0].layertup[0].time, 1.5)
+
     #These might be more "system tests"
     @with_temp_path
     def test_create_edesign_fromdir_single(self, root_path):